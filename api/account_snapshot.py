@@ -0,0 +1,259 @@
+"""
+계정 스냅샷 폴러
+거래소 계정마다 포지션/미체결 주문을 심볼 구분 없이 한 번에 조회해 두고
+봇, 모니터링 위젯, 자동 복원이 같은 스냅샷을 읽는다.
+심볼이 늘어도 인증 요청 수는 주기당 2회로 일정하다.
+계정에 비동기 클라이언트가 있으면 동기 폴러도 코루틴 봇과 같은 비동기 스냅샷을 통해
+조회하므로 계정당 조회는 하나뿐이다.
+"""
+import asyncio
+import threading
+import time
+from typing import Dict, List, Optional
+
+from api.async_loop import async_loop
+from api.ccxt_client import CCXTClient, parse_positions, parse_open_order
+from config.settings import ACCOUNT_SNAPSHOT_INTERVAL
+from utils.logger import logger
+
+
+class AccountSnapshot:
+    """특정 시점의 포지션/미체결 주문 (읽기 전용, version은 갱신마다 1씩 증가)"""
+
+    def __init__(self, version: int, fetched_at: float,
+                 positions: List[Dict], open_orders: List[Dict]):
+        self.version = version
+        self.fetched_at = fetched_at  # 조회 시작 시각 (time.time())
+        self.positions = positions
+        self.open_orders = open_orders
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+    def positions_for(self, symbol: str) -> List[Dict]:
+        return [pos for pos in self.positions if pos['symbol'] == symbol]
+
+    def open_orders_for(self, symbol: str) -> List[Dict]:
+        return [order for order in self.open_orders if order['symbol'] == symbol]
+
+
+class SnapshotPoller:
+    """
+    계정 스냅샷 폴러 (스레드 안전)
+
+    - get(max_age): 스냅샷이 max_age보다 오래됐으면 조회 후 반환 (동시 호출은 한 번만 조회)
+    - acquire()/release(): 사용 중인 소비자가 있는 동안 백그라운드 스레드가 interval마다 갱신
+    - snapshot: 마지막 스냅샷 (I/O 없음, UI 스레드용)
+    - wait_for_update(version): 주어진 버전보다 새 스냅샷이 나올 때까지 대기
+    - source가 있으면 직접 조회하지 않고 같은 계정의 비동기 스냅샷을 공유 루프에서 조회
+    """
+
+    def __init__(self, client: CCXTClient, interval: float = ACCOUNT_SNAPSHOT_INTERVAL,
+                 source: Optional["AsyncSnapshotPoller"] = None):
+        self.client = client
+        self.interval = interval
+        self.name = f"{client.exchange_id}_{'testnet' if client.is_testnet else 'mainnet'}"
+        self._source = source
+        self._snapshot: Optional[AccountSnapshot] = None
+
+        self._version = 0
+        self._refs = 0
+        self._thread: Optional[threading.Thread] = None
+        self._fetch_lock = threading.Lock()  # 조회는 한 번에 하나
+        self._cond = threading.Condition()
+
+        # 심볼 없는 미체결 주문 조회 경고 끄기 (전체 조회가 목적)
+        client.exchange.options['warnOnFetchOpenOrdersWithoutSymbol'] = False
+
+    # ========== 조회 ==========
+
+    @property
+    def snapshot(self) -> Optional[AccountSnapshot]:
+        """마지막 스냅샷 (비동기 스냅샷을 공유하면 코루틴 봇이 조회한 것 포함)"""
+        snapshot = self._snapshot
+        if self._source is not None:
+            shared = self._source.snapshot
+            if shared is not None and (snapshot is None or shared.version > snapshot.version):
+                snapshot = shared
+        return snapshot
+
+    def get(self, max_age: float = None) -> AccountSnapshot:
+        """
+        max_age초 이내 스냅샷 반환 (기본 interval, 0이면 항상 새로 조회)
+
+        조회 실패 시 예외를 그대로 올린다.
+        """
+        if max_age is None:
+            max_age = self.interval
+        requested_at = time.time()
+
+        snapshot = self.snapshot
+        if snapshot is not None and snapshot.age <= max_age:
+            return snapshot
+
+        with self._fetch_lock:
+            # 기다리는 동안 다른 스레드가 요청 이후 시작한 조회로 갱신했으면 그대로 사용
+            snapshot = self.snapshot
+            if snapshot is not None and snapshot.fetched_at >= requested_at - max_age:
+                return snapshot
+            return self._fetch(max_age)
+
+    def _fetch(self, max_age: float) -> AccountSnapshot:
+        if self._source is not None:
+            # 비동기 스냅샷이 동시 조회를 합치므로 코루틴 봇과 요청이 겹치지 않는다
+            snapshot = async_loop.run(self._source.get(max_age))
+        else:
+            fetched_at = time.time()
+            positions = parse_positions(self.client._request('fetch_positions'))
+            open_orders = [parse_open_order(order)
+                           for order in self.client._request('fetch_open_orders')]
+            self._version += 1
+            snapshot = AccountSnapshot(self._version, fetched_at, positions, open_orders)
+
+        with self._cond:
+            self._snapshot = snapshot
+            self._cond.notify_all()
+        return snapshot
+
+    def wait_for_update(self, version: int, timeout: float = None) -> Optional[AccountSnapshot]:
+        """version보다 새 스냅샷 대기 (시간 초과 시 None)"""
+        with self._cond:
+            if not self._cond.wait_for(
+                lambda: self.snapshot is not None and self.snapshot.version > version,
+                timeout
+            ):
+                return None
+            return self.snapshot
+
+    # ========== 백그라운드 갱신 ==========
+
+    def acquire(self):
+        """소비자 등록 (첫 등록 시 갱신 스레드 시작)"""
+        with self._cond:
+            self._refs += 1
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._poll_loop,
+                                                name=f"Snapshot-{self.name}", daemon=True)
+                self._thread.start()
+
+    def release(self):
+        """소비자 해제 (남은 소비자가 없으면 스레드가 다음 주기에 종료)"""
+        with self._cond:
+            self._refs = max(0, self._refs - 1)
+            self._cond.notify_all()
+
+    def _poll_loop(self):
+        logger.info("Snapshot", f"{self.name} 계정 스냅샷 갱신 시작 ({self.interval}초 주기)")
+        failures = 0
+        while True:
+            with self._cond:
+                if self._refs == 0:
+                    break
+            try:
+                self.get()
+                failures = 0
+            except Exception as e:
+                failures += 1
+                logger.warning("Snapshot", f"{self.name} 스냅샷 조회 실패 ({failures}회): {str(e)}")
+
+            # 다음 주기까지 대기 (소비자가 모두 빠지면 바로 종료)
+            with self._cond:
+                self._cond.wait_for(lambda: self._refs == 0, self.interval)
+        logger.info("Snapshot", f"{self.name} 계정 스냅샷 갱신 종료")
+
+
+class AsyncSnapshotPoller:
+    """
+    비동기 클라이언트용 계정 스냅샷 (루프 스레드 전용)
+
+    같은 계정의 코루틴 봇들이 get(max_age)로 공유하며, 동시 호출은 한 번만 조회한다.
+    """
+
+    def __init__(self, client, interval: float = ACCOUNT_SNAPSHOT_INTERVAL):
+        self.client = client
+        self.interval = interval
+        self.snapshot: Optional[AccountSnapshot] = None
+        self._version = 0
+        self._lock: Optional[asyncio.Lock] = None  # 루프 안에서 처음 쓸 때 생성
+
+        client.exchange.options['warnOnFetchOpenOrdersWithoutSymbol'] = False
+
+    async def get(self, max_age: float = None) -> AccountSnapshot:
+        """max_age초 이내 스냅샷 반환 (기본 interval, 0이면 항상 새로 조회)"""
+        if max_age is None:
+            max_age = self.interval
+        requested_at = time.time()
+
+        snapshot = self.snapshot
+        if snapshot is not None and snapshot.age <= max_age:
+            return snapshot
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            snapshot = self.snapshot
+            if snapshot is not None and snapshot.fetched_at >= requested_at - max_age:
+                return snapshot
+
+            fetched_at = time.time()
+            positions, orders = await asyncio.gather(
+                self.client._request('fetch_positions'),
+                self.client._request('fetch_open_orders'),
+            )
+            self._version += 1
+            self.snapshot = AccountSnapshot(self._version, fetched_at, parse_positions(positions),
+                                            [parse_open_order(order) for order in orders])
+            return self.snapshot
+
+
+_pollers: Dict[int, SnapshotPoller] = {}
+_pollers_lock = threading.Lock()
+
+
+def get_snapshot_poller(client: CCXTClient) -> SnapshotPoller:
+    """
+    클라이언트(계정)별 공유 스냅샷 폴러 조회 (없으면 생성)
+
+    계정의 비동기 클라이언트가 있으면 코루틴 봇 런타임과 같은 비동기 스냅샷을 쓴다.
+    """
+    with _pollers_lock:
+        poller = _pollers.get(id(client))
+        if poller is not None and poller.client is client:
+            return poller
+
+    # 비동기 스냅샷 조회도 같은 락을 쓰므로 락 밖에서 찾는다
+    source = _account_async_poller(client)
+    with _pollers_lock:
+        poller = _pollers.get(id(client))
+        if poller is None or poller.client is not client:
+            poller = _pollers[id(client)] = SnapshotPoller(client, source=source)
+        return poller
+
+
+_async_pollers: Dict[int, AsyncSnapshotPoller] = {}
+
+
+def get_async_snapshot_poller(client) -> AsyncSnapshotPoller:
+    """비동기 클라이언트(계정)별 공유 스냅샷 조회 (없으면 생성)"""
+    with _pollers_lock:
+        poller = _async_pollers.get(id(client))
+        if poller is None or poller.client is not client:
+            poller = _async_pollers[id(client)] = AsyncSnapshotPoller(client)
+        return poller
+
+
+def _account_async_poller(client: CCXTClient) -> Optional[AsyncSnapshotPoller]:
+    """동기 클라이언트와 같은 계정의 비동기 스냅샷 (없으면 None)"""
+    from api.exchange_factory import get_exchange_factory
+
+    try:
+        factory = get_exchange_factory()
+        # 팩토리가 관리하는 계정 클라이언트일 때만 (같은 자격증명)
+        if factory.get_client(client.exchange_id, client.is_testnet) is not client:
+            return None
+        async_client = factory.get_async_client(client.exchange_id, client.is_testnet)
+    except Exception as e:
+        logger.warning("Snapshot", f"{client.exchange_id} 비동기 클라이언트 조회 실패: {str(e)}")
+        return None
+    return get_async_snapshot_poller(async_client) if async_client else None
@@ -0,0 +1,568 @@
+"""
+비동기 CCXT 클라이언트
+ccxt.async_support 기반으로 CCXTClient와 같은 메서드를 코루틴으로 제공한다.
+모든 인스턴스가 공유 이벤트 루프 스레드(async_loop)와 aiohttp 세션 풀을 함께 쓴다.
+"""
+import asyncio
+import functools
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import ccxt.async_support as ccxt_async
+
+from api.async_loop import async_loop
+from api.market_cache import get_market_cache
+from api.rate_limiter import get_rate_limiter, request_weight, retry_after_seconds
+from api.ccxt_client import (
+    build_exchange_config, parse_ticker, parse_ohlcv, parse_swap_markets,
+    parse_positions, build_order_params, parse_placed_order, parse_open_order,
+    parse_order_detail, build_tp_sl_params, build_binance_tp_sl, round_order_size,
+    build_limit_order_requests, reconcile_batch_orders
+)
+from config.exchanges import (
+    TIMEFRAMES, get_exchange_info, get_exchange_fee, get_batch_order_limit
+)
+from config.settings import RATE_LIMIT_MAX_RETRIES
+from utils.logger import logger
+from utils.time_helper import time_helper
+
+
+class AsyncCCXTClient:
+    """
+    비동기 CCXT 통합 클라이언트
+
+    - 메서드는 CCXTClient와 이름/인자/반환값이 같은 코루틴
+    - 루프 스레드 안의 코드는 await로 호출
+    - Qt 워커 등 다른 스레드는 sync 파사드로 호출 (client.sync.get_positions(...))
+    """
+
+    def __init__(self, exchange_id: str, api_key: str = "", secret: str = "",
+                 passphrase: str = "", is_testnet: bool = False):
+        """
+        Args:
+            exchange_id: CCXT 거래소 ID (binance, bybit, okx 등)
+            api_key: API 키
+            secret: API 시크릿
+            passphrase: 패스프레이즈 (OKX 등 일부 거래소)
+            is_testnet: 테스트넷 사용 여부
+        """
+        self.exchange_id = exchange_id
+        self.is_testnet = is_testnet
+        self.exchange_info = get_exchange_info(exchange_id)
+
+        self.exchange = self._create_exchange(api_key, secret, passphrase, is_testnet)
+        self._sync = None
+
+        # Rate Limiting (동기 클라이언트와 같은 거래소별 토큰 버킷 공유)
+        self.rate_limiter = get_rate_limiter(exchange_id, is_testnet,
+                                             getattr(self.exchange, 'rateLimit', None))
+
+        # 마켓 정보 (동기 클라이언트와 같은 공유 캐시)
+        self.market_cache = get_market_cache(exchange_id, is_testnet)
+        self._needs_time_sync = self.market_cache.attach(self.exchange) and bool(api_key)
+
+        # 앱 종료 시 거래소 연결 정리
+        async_loop.add_closer(self.close)
+
+        logger.info("CCXT", f"{exchange_id} 비동기 클라이언트 초기화 완료 (testnet={is_testnet})")
+
+    def _create_exchange(self, api_key: str, secret: str, passphrase: str,
+                         is_testnet: bool) -> ccxt_async.Exchange:
+        """ccxt.async_support 거래소 인스턴스 생성 (세션은 첫 요청 때 연결)"""
+        exchange_class = getattr(ccxt_async, self.exchange_id, None)
+        if not exchange_class:
+            raise ValueError(f"지원하지 않는 거래소: {self.exchange_id}")
+
+        config = build_exchange_config(self.exchange_info, api_key, secret,
+                                       passphrase, is_testnet)
+        # 공유 루프/세션 사용 (거래소 인스턴스가 자체 세션을 만들지 않도록)
+        config['asyncio_loop'] = async_loop.loop
+        config['session'] = None
+        return exchange_class(config)
+
+    @property
+    def sync(self) -> "SyncClientFacade":
+        """다른 스레드용 동기 파사드"""
+        if self._sync is None:
+            self._sync = SyncClientFacade(self)
+        return self._sync
+
+    async def _ensure_session(self):
+        """공유 aiohttp 세션 연결"""
+        if self.exchange.session is None:
+            self.exchange.session = await async_loop.http_session()
+
+            # 캐시로 마켓을 채웠으면 load_markets에서 하던 서버 시간차 보정을 따로 한다
+            if self._needs_time_sync and self.exchange.options.get('adjustForTimeDifference'):
+                self._needs_time_sync = False
+                try:
+                    await self._request('load_time_difference')
+                except Exception as e:
+                    logger.warning("CCXT", f"{self.exchange_id} 서버 시간차 보정 실패: {str(e)}")
+
+    async def _request(self, method: str, *args, **kwargs):
+        """거래소 API 호출 (공유 토큰 버킷, 429 시 쿨다운 후 재시도)"""
+        await self._ensure_session()
+        call = getattr(self.exchange, method)
+
+        # 이미 로드된 마켓은 요청 없이 반환 (reload 인자가 없을 때)
+        if method == 'load_markets' and self.exchange.markets and not args:
+            return await call(*args, **kwargs)
+
+        weight = request_weight(self.exchange_id, method, *args)
+        for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+            await self.rate_limiter.acquire_async(weight)
+            try:
+                return await call(*args, **kwargs)
+            except ccxt_async.DDoSProtection:
+                self.rate_limiter.penalize(
+                    retry_after_seconds(getattr(self.exchange, 'last_response_headers', None))
+                )
+                if attempt == RATE_LIMIT_MAX_RETRIES:
+                    raise
+
+    async def close(self):
+        """거래소 인스턴스 정리 (공유 세션은 async_loop가 닫음)"""
+        self.exchange.session = None
+        try:
+            await self.exchange.close()
+        except Exception:
+            pass
+
+    # ========== 연결 테스트 ==========
+
+    async def test_connection(self) -> Tuple[bool, str]:
+        """연결 테스트"""
+        try:
+            await self._request('fetch_time')
+
+            name = self.exchange_info.get('name', self.exchange_id)
+            if self.exchange.apiKey and self.exchange.secret:
+                await self._request('fetch_balance')
+                return True, f"{name} 연동 성공"
+            return True, f"{name} 서버 연결 성공 (API 키 없음)"
+
+        except ccxt_async.AuthenticationError as e:
+            return False, f"API 인증 실패: {str(e)}"
+        except ccxt_async.NetworkError as e:
+            return False, f"네트워크 오류: {str(e)}"
+        except Exception as e:
+            return False, f"연결 테스트 실패: {str(e)}"
+
+    # ========== 계정 관련 ==========
+
+    async def get_balance(self) -> Optional[Dict]:
+        """잔고 조회"""
+        try:
+            return await self._request('fetch_balance')
+        except Exception as e:
+            logger.error("CCXT", f"잔고 조회 실패: {str(e)}")
+            return None
+
+    async def get_usdt_balance(self) -> float:
+        """USDT 잔고 조회"""
+        balance = await self.get_balance()
+        try:
+            if balance:
+                return float(balance.get('USDT', {}).get('free', 0))
+            return 0.0
+        except Exception as e:
+            logger.error("CCXT", f"USDT 잔고 조회 실패: {str(e)}")
+            return 0.0
+
+    # ========== 시장 데이터 ==========
+
+    async def get_ticker(self, symbol: str) -> Optional[Dict]:
+        """현재가 조회"""
+        try:
+            return parse_ticker(await self._request('fetch_ticker', symbol))
+        except Exception as e:
+            logger.error("CCXT", f"현재가 조회 실패 ({symbol}): {str(e)}")
+            return None
+
+    async def get_candles(self, symbol: str, timeframe: str = "1h",
+                          since: int = None, limit: int = 100) -> Optional[List[Dict]]:
+        """캔들 데이터 조회 (CCXTClient.get_candles와 같은 형식)"""
+        try:
+            ohlcv = await self._request(
+                'fetch_ohlcv',
+                symbol=symbol,
+                timeframe=TIMEFRAMES.get(timeframe, timeframe),
+                since=since,
+                limit=limit
+            )
+            return parse_ohlcv(ohlcv)
+        except Exception as e:
+            logger.error("CCXT", f"캔들 조회 실패 ({symbol} {timeframe}): {str(e)}")
+            return None
+
+    async def get_candles_since(self, symbol: str, timeframe: str,
+                                start_time: datetime) -> List[Dict]:
+        """특정 시간(KST) 이후의 모든 캔들 조회 (페이지네이션)"""
+        all_candles = []
+        since_ms = time_helper.kst_to_timestamp(start_time)
+
+        while True:
+            candles = await self.get_candles(symbol, timeframe, since=since_ms, limit=1000)
+            if not candles:
+                break
+
+            all_candles.extend(candles)
+            if len(candles) < 1000:
+                break
+
+            # 마지막 캔들 시간 + 1ms
+            since_ms = candles[-1]['timestamp_ms'] + 1
+
+        return all_candles
+
+    async def get_markets(self) -> List[Dict]:
+        """거래 가능한 마켓 목록 조회"""
+        try:
+            seeded = bool(self.exchange.markets)
+            markets = await self._request('load_markets')
+            if not seeded:
+                self.market_cache.update(markets)
+            return parse_swap_markets(markets)
+        except Exception as e:
+            logger.error("CCXT", f"마켓 조회 실패: {str(e)}")
+            return []
+
+    # ========== 포지션 관련 ==========
+
+    async def get_positions(self, symbol: str = None) -> List[Dict]:
+        """포지션 조회"""
+        try:
+            if symbol:
+                positions = await self._request('fetch_positions', [symbol])
+            else:
+                positions = await self._request('fetch_positions')
+            return parse_positions(positions)
+        except Exception as e:
+            logger.error("CCXT", f"포지션 조회 실패: {str(e)}")
+            return []
+
+    async def set_leverage(self, symbol: str, leverage: int,
+                           margin_mode: str = 'isolated') -> bool:
+        """레버리지 설정"""
+        try:
+            # 마진 모드 설정 (지원하지 않는 거래소는 무시)
+            try:
+                await self._request('set_margin_mode', margin_mode, symbol)
+            except Exception:
+                pass
+
+            await self._request('set_leverage', leverage, symbol)
+            logger.info("CCXT", f"{symbol} 레버리지 {leverage}x 설정 완료")
+            return True
+        except Exception as e:
+            logger.error("CCXT", f"레버리지 설정 실패: {str(e)}")
+            return False
+
+    # ========== 주문 관련 ==========
+
+    async def place_market_order(self, symbol: str, side: str, size: float,
+                                 pos_side: str = None, reduce_only: bool = False,
+                                 params: dict = None) -> Optional[Dict]:
+        """시장가 주문"""
+        try:
+            order = await self._request(
+                'create_market_order',
+                symbol=symbol,
+                side=side,
+                amount=size,
+                params=build_order_params(params, pos_side, reduce_only)
+            )
+            logger.info("CCXT", f"시장가 주문 완료: {symbol} {side} {size}")
+            return parse_placed_order(order, symbol, side, 'market', size)
+        except Exception as e:
+            logger.error("CCXT", f"시장가 주문 실패: {str(e)}")
+            return None
+
+    async def place_limit_order(self, symbol: str, side: str, size: float,
+                                price: float, pos_side: str = None,
+                                reduce_only: bool = False,
+                                params: dict = None) -> Optional[Dict]:
+        """지정가 주문"""
+        try:
+            order = await self._request(
+                'create_limit_order',
+                symbol=symbol,
+                side=side,
+                amount=size,
+                price=price,
+                params=build_order_params(params, pos_side, reduce_only)
+            )
+            logger.info("CCXT", f"지정가 주문 완료: {symbol} {side} {size} @ {price}")
+            return parse_placed_order(order, symbol, side, 'limit', size, price)
+        except Exception as e:
+            logger.error("CCXT", f"지정가 주문 실패: {str(e)}")
+            return None
+
+    async def place_limit_orders(self, orders: List[Dict]) -> List[Optional[Dict]]:
+        """
+        지정가 주문 일괄 생성 (CCXTClient.place_limit_orders와 같은 규칙)
+
+        일괄 주문 미지원 거래소는 개별 주문을 동시에 보낸다.
+        """
+        if not orders:
+            return []
+
+        if not self.exchange.has.get('createOrders'):
+            return list(await asyncio.gather(*(self.place_limit_order(**o) for o in orders)))
+
+        limit = get_batch_order_limit(self.exchange_id)
+        chunks = [orders[start:start + limit] for start in range(0, len(orders), limit)]
+        chunk_results = await asyncio.gather(*(self._place_limit_order_chunk(c) for c in chunks))
+        results = [result for chunk in chunk_results for result in chunk]
+
+        placed = sum(1 for r in results if r)
+        logger.info("CCXT", f"지정가 일괄 주문 완료: {placed}/{len(orders)}건")
+        return results
+
+    async def _place_limit_order_chunk(self, chunk: List[Dict]) -> List[Optional[Dict]]:
+        try:
+            created = await self._request('create_orders', build_limit_order_requests(chunk))
+            return reconcile_batch_orders(chunk, created)
+        except (ccxt_async.NotSupported, ccxt_async.BadRequest) as e:
+            # 요청 형식을 받지 않는 경우만 개별 주문으로 대체 (중복 주문 방지)
+            logger.warning("CCXT", f"일괄 주문 불가, 개별 주문으로 대체: {str(e)}")
+            return list(await asyncio.gather(*(self.place_limit_order(**o) for o in chunk)))
+        except Exception as e:
+            logger.error("CCXT", f"일괄 주문 실패 ({len(chunk)}건): {str(e)}")
+            return [None] * len(chunk)
+
+    async def place_order_with_tp_sl(self, symbol: str, side: str, size: float,
+                                     tp_price: float = None, sl_price: float = None,
+                                     pos_side: str = None) -> Optional[Dict]:
+        """시장가 주문 + TP/SL 설정 (Binance는 TP/SL 별도 주문)"""
+        try:
+            result = await self.place_market_order(
+                symbol=symbol,
+                side=side,
+                size=size,
+                pos_side=pos_side,
+                params=build_tp_sl_params(self.exchange_id, tp_price, sl_price, pos_side)
+            )
+
+            if result and self.exchange_id == 'binance':
+                legs = [('tp', tp_price), ('sl', sl_price)]
+                await asyncio.gather(*(
+                    self._place_binance_tp_sl(symbol, order_type, price, size, pos_side)
+                    for order_type, price in legs if price
+                ))
+
+            return result
+        except Exception as e:
+            logger.error("CCXT", f"TP/SL 주문 실패: {str(e)}")
+            return None
+
+    async def _place_binance_tp_sl(self, symbol: str, order_type: str,
+                                   price: float, size: float, pos_side: str):
+        """Binance TP/SL 주문 (별도 주문)"""
+        try:
+            side, params = build_binance_tp_sl(order_type, price, pos_side)
+            await self._request(
+                'create_order',
+                symbol=symbol,
+                type='market',
+                side=side,
+                amount=size,
+                params=params
+            )
+        except Exception as e:
+            logger.error("CCXT", f"Binance TP/SL 주문 실패: {str(e)}")
+
+    async def cancel_order(self, symbol: str, order_id: str) -> bool:
+        """주문 취소"""
+        try:
+            await self._request('cancel_order', order_id, symbol)
+            logger.info("CCXT", f"주문 취소 완료: {order_id}")
+            return True
+        except Exception as e:
+            logger.error("CCXT", f"주문 취소 실패: {str(e)}")
+            return False
+
+    async def cancel_all_orders(self, symbol: str) -> bool:
+        """모든 주문 취소"""
+        try:
+            await self._request('cancel_all_orders', symbol)
+            logger.info("CCXT", f"모든 주문 취소 완료: {symbol}")
+            return True
+        except Exception as e:
+            logger.error("CCXT", f"주문 전체 취소 실패: {str(e)}")
+            return False
+
+    async def get_open_orders(self, symbol: str = None) -> List[Dict]:
+        """미체결 주문 조회"""
+        try:
+            if symbol:
+                orders = await self._request('fetch_open_orders', symbol)
+            else:
+                orders = await self._request('fetch_open_orders')
+            return [parse_open_order(o) for o in orders]
+        except Exception as e:
+            logger.error("CCXT", f"미체결 주문 조회 실패: {str(e)}")
+            return []
+
+    async def get_order(self, symbol: str, order_id: str) -> Optional[Dict]:
+        """주문 상세 조회"""
+        try:
+            return parse_order_detail(await self._request('fetch_order', order_id, symbol))
+        except Exception as e:
+            logger.error("CCXT", f"주문 조회 실패: {str(e)}")
+            return None
+
+    # ========== 유틸리티 ==========
+
+    async def refresh_markets(self) -> bool:
+        """마켓 정보를 다시 받아 공유 캐시(디스크 포함) 갱신"""
+        try:
+            markets = await self._request('load_markets', True)
+            self.market_cache.update(markets)
+            return True
+        except Exception as e:
+            self.market_cache.release_refresh()
+            logger.error("CCXT", f"{self.exchange_id} 마켓 정보 갱신 실패: {str(e)}")
+            return False
+
+    async def _market_info(self, symbol: str) -> Optional[Dict]:
+        """마켓 요약 조회 (CCXTClient._market_info와 같은 규칙, 갱신은 루프의 별도 태스크)"""
+        cache = self.market_cache
+        info = cache.lookup(symbol)
+        if info is None:
+            if not cache.is_loaded or cache.is_stale():
+                await self.refresh_markets()
+                info = cache.lookup(symbol)
+        elif cache.claim_refresh():
+            self._refresh_task = asyncio.ensure_future(self.refresh_markets())
+        return info
+
+    async def get_min_order_size(self, symbol: str) -> float:
+        """최소 주문 수량 조회"""
+        try:
+            return float((await self._market_info(symbol))['min_amount'])
+        except Exception:
+            return 0.001
+
+    async def get_price_precision(self, symbol: str) -> int:
+        """가격 소수점 자릿수 조회"""
+        try:
+            return int((await self._market_info(symbol))['price_precision'])
+        except Exception:
+            return 2
+
+    async def get_amount_precision(self, symbol: str) -> int:
+        """수량 소수점 자릿수 조회"""
+        try:
+            return int((await self._market_info(symbol))['amount_precision'])
+        except Exception:
+            return 3
+
+    async def get_contract_size(self, symbol: str) -> float:
+        """계약 1개당 기초자산 수량 조회"""
+        try:
+            return float((await self._market_info(symbol))['contract_size'] or 1.0)
+        except Exception:
+            return 1.0
+
+    async def calculate_order_size(self, symbol: str, margin: float,
+                                   leverage: int, price: float) -> float:
+        """주문 수량 계산 (증거금 × 레버리지 / 현재가)"""
+        raw_size = (margin * leverage) / price
+        return round_order_size(raw_size, await self.get_amount_precision(symbol),
+                                await self.get_min_order_size(symbol))
+
+    def get_maker_fee(self) -> float:
+        """메이커 수수료"""
+        return get_exchange_fee(self.exchange_id, 'maker')
+
+    def get_taker_fee(self) -> float:
+        """테이커 수수료"""
+        return get_exchange_fee(self.exchange_id, 'taker')
+
+    # ========== 계정 설정 ==========
+
+    async def get_account_config(self) -> Optional[Dict]:
+        """계정 설정 조회 (포지션 모드, 마진 모드 등)"""
+        try:
+            if self.exchange_id == 'okx':
+                config = await self._request('private_get_account_config')
+                data = config.get('data', [{}])[0] if config.get('data') else {}
+                return {
+                    'acct_lv': data.get('acctLv', '1'),
+                    'pos_mode': data.get('posMode', 'net_mode'),
+                    'greeks_type': data.get('greeksType', ''),
+                }
+            elif self.exchange_id == 'binance':
+                try:
+                    pos_mode = await self._request('fapiPrivateGetPositionSideDual')
+                    return {
+                        'pos_mode': 'long_short_mode' if pos_mode.get('dualSidePosition') else 'net_mode',
+                        'acct_lv': '2'  # Binance는 선물 계정
+                    }
+                except Exception:
+                    return {'pos_mode': 'unknown', 'acct_lv': 'unknown'}
+            elif self.exchange_id == 'bybit':
+                try:
+                    config = await self._request('private_get_v5_account_info')
+                    data = config.get('result', {})
+                    return {
+                        'pos_mode': data.get('unifiedMarginStatus', 'unknown'),
+                        'acct_lv': data.get('marginMode', 'unknown')
+                    }
+                except Exception:
+                    return {'pos_mode': 'unknown', 'acct_lv': 'unknown'}
+            return {'pos_mode': 'unknown', 'acct_lv': 'unknown'}
+
+        except Exception as e:
+            logger.error("CCXT", f"계정 설정 조회 실패: {str(e)}")
+            return None
+
+    async def set_hedge_mode(self) -> bool:
+        """헤지 모드 설정 (롱/숏 동시 보유)"""
+        try:
+            if self.exchange_id == 'okx':
+                await self._request('private_post_account_set_position_mode', {
+                    'posMode': 'long_short_mode'
+                })
+            elif self.exchange_id == 'binance':
+                await self._request('fapiPrivatePostPositionSideDual', {
+                    'dualSidePosition': 'true'
+                })
+            elif self.exchange_id == 'bitget':
+                await self._request('private_post_api_mix_v1_account_setpositionmode', {
+                    'positionMode': 'hedge_mode'
+                })
+            # Bybit는 기본이 헤지 모드
+
+            logger.info("CCXT", f"{self.exchange_id} 헤지 모드 설정 완료")
+            return True
+        except Exception as e:
+            logger.error("CCXT", f"헤지 모드 설정 실패: {str(e)}")
+            return False
+
+
+class SyncClientFacade:
+    """
+    AsyncCCXTClient 동기 파사드
+
+    코루틴 메서드는 공유 루프에서 실행하고 결과까지 대기하므로
+    CCXTClient 자리에 그대로 넘길 수 있다 (Qt 워커 스레드용).
+    """
+
+    def __init__(self, client: AsyncCCXTClient):
+        self._client = client
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._client, name)
+        if not asyncio.iscoroutinefunction(attr):
+            return attr
+
+        @functools.wraps(attr)
+        def call(*args, **kwargs):
+            return async_loop.run(attr(*args, **kwargs))
+
+        # 다음 호출부터는 __getattr__을 거치지 않도록 캐시
+        setattr(self, name, call)
+        return call
@@ -0,0 +1,129 @@
+"""
+공유 asyncio 이벤트 루프 스레드
+비동기 거래소 클라이언트가 하나의 루프와 aiohttp 세션 풀을 함께 사용한다.
+"""
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Awaitable, Callable, List, Optional
+
+from config.settings import (
+    ASYNC_HTTP_POOL_SIZE, ASYNC_HTTP_POOL_PER_HOST, ASYNC_CALL_TIMEOUT
+)
+from utils.logger import logger
+
+
+class AsyncLoopThread:
+    """
+    전용 스레드에서 도는 asyncio 이벤트 루프 (싱글톤 async_loop)
+
+    - run(coro): 다른 스레드에서 코루틴을 실행하고 결과까지 대기 (동기 호출용)
+    - submit(coro): 결과를 기다리지 않고 concurrent.futures.Future 반환
+    - http_session(): 루프 안에서 공유 aiohttp 세션 조회 (연결 풀 공유)
+    - shutdown(): 등록된 정리 작업(거래소 close 등) 실행 후 세션/루프 종료
+    """
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._session = None
+        self._closers: List[Callable[[], Awaitable]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """이벤트 루프 (처음 접근 시 스레드 시작)"""
+        self.start()
+        return self._loop
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def in_loop_thread(self) -> bool:
+        """현재 스레드가 루프 스레드인지 여부"""
+        return self._thread is threading.current_thread()
+
+    def start(self):
+        """루프 스레드 시작 (이미 실행 중이면 무시)"""
+        with self._lock:
+            if self.is_running:
+                return
+            self._loop = asyncio.new_event_loop()
+            started = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run_loop, args=(started,), name="AsyncLoop", daemon=True
+            )
+            self._thread.start()
+            started.wait()
+        logger.info("AsyncLoop", "비동기 이벤트 루프 스레드 시작")
+
+    def _run_loop(self, started: threading.Event):
+        asyncio.set_event_loop(self._loop)
+        self._loop.call_soon(started.set)
+        self._loop.run_forever()
+
+    # ========== 코루틴 실행 ==========
+
+    def submit(self, coro) -> Future:
+        """코루틴을 루프에 예약 (결과는 Future로)"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro, timeout: float = ASYNC_CALL_TIMEOUT):
+        """코루틴 실행 후 결과 반환 (루프 스레드 안에서는 교착되므로 금지)"""
+        if self.in_loop_thread():
+            coro.close()
+            raise RuntimeError("이벤트 루프 스레드에서 동기 호출은 사용할 수 없습니다 (await 사용)")
+        return self.submit(coro).result(timeout)
+
+    # ========== HTTP 세션 ==========
+
+    async def http_session(self):
+        """공유 aiohttp 세션 (루프 안에서 최초 호출 시 생성)"""
+        if self._session is None or self._session.closed:
+            import aiohttp
+
+            connector = aiohttp.TCPConnector(
+                limit=ASYNC_HTTP_POOL_SIZE,
+                limit_per_host=ASYNC_HTTP_POOL_PER_HOST,
+                enable_cleanup_closed=True,
+            )
+            self._session = aiohttp.ClientSession(connector=connector, trust_env=True)
+        return self._session
+
+    # ========== 종료 ==========
+
+    def add_closer(self, closer: Callable[[], Awaitable]):
+        """종료 시 루프에서 실행할 정리 코루틴 함수 등록"""
+        self._closers.append(closer)
+
+    def shutdown(self, timeout: float = 10):
+        """정리 작업 실행 후 세션과 루프 종료"""
+        if not self.is_running:
+            return
+        try:
+            self.run(self._close_all(), timeout)
+        except Exception as e:
+            logger.error("AsyncLoop", f"비동기 리소스 정리 실패: {str(e)}")
+
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+        self._loop.close()
+        self._thread = None
+        logger.info("AsyncLoop", "비동기 이벤트 루프 스레드 종료")
+
+    async def _close_all(self):
+        closers, self._closers = self._closers, []
+        for closer in closers:
+            try:
+                await closer()
+            except Exception as e:
+                logger.error("AsyncLoop", f"정리 작업 실패: {str(e)}")
+
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+# 전역 루프 (처음 사용할 때 시작)
+async_loop = AsyncLoopThread()
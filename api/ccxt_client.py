@@ -2,19 +2,269 @@
 CCXT 통합 클라이언트
 모든 거래소에 대한 공통 인터페이스 제공
 """
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import ccxt
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 from config.exchanges import (
     SUPPORTED_EXCHANGES, TIMEFRAMES, get_exchange_info, 
-    get_exchange_fee, parse_symbol
+    get_exchange_fee, get_batch_order_limit, parse_symbol
 )
+from api.market_cache import get_market_cache
+from api.rate_limiter import get_rate_limiter, request_weight, retry_after_seconds
+from config.settings import RATE_LIMIT_MAX_RETRIES, BATCH_ORDER_MAX_WORKERS
 from utils.logger import logger
 from utils.time_helper import time_helper
 
 
+# ========== 요청/응답 변환 (동기/비동기 클라이언트 공용) ==========
+
+def build_exchange_config(exchange_info: Dict, api_key: str, secret: str,
+                          passphrase: str, is_testnet: bool) -> Dict:
+    """CCXT 거래소 생성 설정"""
+    config = {
+        'apiKey': api_key,
+        'secret': secret,
+        'enableRateLimit': False,  # api/rate_limiter.py 공유 토큰 버킷이 대신 제한
+        'timeout': 30000,  # 30초
+        'options': {
+            'defaultType': 'swap',  # 선물(영구) 거래
+            'adjustForTimeDifference': True,
+        }
+    }
+
+    # 패스프레이즈 필요한 거래소
+    if passphrase and exchange_info.get('requires_passphrase'):
+        config['password'] = passphrase
+
+    # 테스트넷 설정
+    if is_testnet:
+        config['sandbox'] = True
+
+    return config
+
+
+def parse_ticker(ticker: Dict) -> Dict:
+    """현재가 응답 변환"""
+    return {
+        'symbol': ticker['symbol'],
+        'last': ticker['last'],
+        'bid': ticker['bid'],
+        'ask': ticker['ask'],
+        'high': ticker['high'],
+        'low': ticker['low'],
+        'volume': ticker['baseVolume'],
+        'timestamp': ticker['timestamp']
+    }
+
+
+def parse_ohlcv(ohlcv: List[list]) -> List[Dict]:
+    """OHLCV 응답을 캔들 딕셔너리 리스트로 변환"""
+    candles = []
+    for candle in ohlcv or []:
+        ts_ms = candle[0]
+        dt_kst = time_helper.timestamp_to_kst(ts_ms)
+
+        candles.append({
+            'timestamp': time_helper.format_kst(dt_kst),
+            'timestamp_ms': ts_ms,
+            'open': float(candle[1]),
+            'high': float(candle[2]),
+            'low': float(candle[3]),
+            'close': float(candle[4]),
+            'volume': float(candle[5])
+        })
+    return candles
+
+
+def parse_swap_markets(markets: Dict[str, Dict]) -> List[Dict]:
+    """마켓 목록에서 선물(swap) 마켓만 변환"""
+    return [{
+        'symbol': symbol,
+        'base': market.get('base'),
+        'quote': market.get('quote'),
+        'active': market.get('active', True),
+        'type': market.get('type'),
+        'contract': market.get('contract', True)
+    } for symbol, market in markets.items()
+        if market.get('swap') or market.get('future')]
+
+
+def parse_positions(positions: List[Dict]) -> List[Dict]:
+    """포지션 응답 변환 (수량 0이고 진입가 없는 항목 제외)"""
+    result = []
+    for pos in positions:
+        size = abs(float(pos.get('contracts', 0) or pos.get('contractSize', 0) or 0))
+        if size > 0 or pos.get('entryPrice'):
+            result.append({
+                'symbol': pos['symbol'],
+                'side': pos.get('side', 'long'),
+                'size': size,
+                'entry_price': float(pos.get('entryPrice', 0) or 0),
+                'mark_price': float(pos.get('markPrice', 0) or 0),
+                'liquidation_price': float(pos.get('liquidationPrice', 0) or 0),
+                'unrealized_pnl': float(pos.get('unrealizedPnl', 0) or 0),
+                'leverage': int(pos.get('leverage', 1) or 1),
+                'margin_mode': pos.get('marginMode', 'isolated'),
+            })
+    return result
+
+
+def build_order_params(params: dict = None, pos_side: str = None,
+                       reduce_only: bool = False) -> dict:
+    """주문 추가 파라미터 (헤지 모드 방향, 청산 전용)"""
+    order_params = params or {}
+    if pos_side:
+        order_params['posSide'] = pos_side
+    if reduce_only:
+        order_params['reduceOnly'] = True
+    return order_params
+
+
+def parse_placed_order(order: Dict, symbol: str, side: str, order_type: str,
+                       size: float, price: float = 0) -> Dict:
+    """
+    주문 생성 응답 변환
+
+    시장가는 평균 체결가, 지정가는 주문가를 price로 사용한다.
+    """
+    if order_type == 'market':
+        order_price = order.get('average') or order.get('price') or 0
+    else:
+        order_price = order.get('price') or price
+
+    return {
+        'order_id': order.get('id', ''),
+        'symbol': order.get('symbol', symbol),
+        'side': order.get('side', side),
+        'type': order.get('type', order_type),
+        'size': float(order.get('amount') or size),
+        'price': float(order_price),
+        'filled': float(order.get('filled') or 0),
+        'status': order.get('status', 'unknown'),
+        'timestamp': order.get('timestamp', 0)
+    }
+
+
+def build_limit_order_requests(orders: List[Dict]) -> List[Dict]:
+    """지정가 주문 목록을 ccxt create_orders 요청 형식으로 변환"""
+    return [{
+        'symbol': order['symbol'],
+        'type': 'limit',
+        'side': order['side'],
+        'amount': order['size'],
+        'price': order['price'],
+        'params': build_order_params(dict(order.get('params') or {}),
+                                     order.get('pos_side'), order.get('reduce_only', False)),
+    } for order in orders]
+
+
+def reconcile_batch_orders(orders: List[Dict], created: List[Dict]) -> List[Optional[Dict]]:
+    """
+    일괄 주문 응답을 주문별 결과로 맞춤
+
+    응답은 요청 순서와 같으며, 거부된 주문은 id 없이 돌아오므로 None으로 둔다.
+    """
+    results = []
+    for index, order in enumerate(orders):
+        placed = created[index] if index < len(created) else None
+        if placed and placed.get('id'):
+            results.append(parse_placed_order(placed, order['symbol'], order['side'],
+                                              'limit', order['size'], order['price']))
+        else:
+            reason = (placed or {}).get('info') or '응답 없음'
+            logger.error("CCXT", f"일괄 주문 거부: {order['symbol']} {order['side']} "
+                                 f"{order['size']} @ {order['price']} ({reason})")
+            results.append(None)
+    return results
+
+
+def parse_open_order(order: Dict) -> Dict:
+    """미체결 주문 응답 변환"""
+    return {
+        'order_id': order['id'],
+        'symbol': order['symbol'],
+        'side': order['side'],
+        'type': order['type'],
+        'size': float(order.get('amount', 0)),
+        'price': float(order.get('price', 0) or 0),
+        'filled': float(order.get('filled', 0)),
+        'status': order['status'],
+        'timestamp': order.get('timestamp')
+    }
+
+
+def parse_order_detail(order: Dict) -> Dict:
+    """주문 상세 응답 변환 (평균 체결가 포함)"""
+    detail = parse_open_order(order)
+    detail['average'] = float(order.get('average', 0) or 0)
+    return detail
+
+
+def build_tp_sl_params(exchange_id: str, tp_price: float = None,
+                       sl_price: float = None, pos_side: str = None) -> dict:
+    """
+    진입 주문에 붙이는 거래소별 TP/SL 파라미터
+
+    Binance는 별도 주문이 필요하므로 포지션 방향만 담는다.
+    """
+    order_params = {}
+
+    if pos_side:
+        order_params['posSide'] = pos_side
+
+    if exchange_id == 'bybit':
+        if tp_price:
+            order_params['takeProfit'] = {
+                'triggerPrice': tp_price,
+                'type': 'market'
+            }
+        if sl_price:
+            order_params['stopLoss'] = {
+                'triggerPrice': sl_price,
+                'type': 'market'
+            }
+    elif exchange_id == 'okx':
+        attach_algo = {}
+        if tp_price:
+            attach_algo['tpTriggerPx'] = str(tp_price)
+            attach_algo['tpOrdPx'] = '-1'  # 시장가
+        if sl_price:
+            attach_algo['slTriggerPx'] = str(sl_price)
+            attach_algo['slOrdPx'] = '-1'
+        if attach_algo:
+            order_params['attachAlgoOrds'] = [attach_algo]
+
+    return order_params
+
+
+def build_binance_tp_sl(order_type: str, price: float, pos_side: str) -> Tuple[str, dict]:
+    """Binance TP/SL 별도 주문의 (side, params)"""
+    side = 'sell' if pos_side == 'long' else 'buy'
+
+    params = {
+        'stopPrice': price,
+        'reduceOnly': True
+    }
+
+    if pos_side:
+        params['positionSide'] = pos_side.upper()
+
+    if order_type == 'tp':
+        params['type'] = 'TAKE_PROFIT_MARKET'
+    else:
+        params['type'] = 'STOP_MARKET'
+
+    return side, params
+
+
+def round_order_size(raw_size: float, precision: int, min_size: float) -> float:
+    """주문 수량 자릿수 조정 후 최소 수량 보장"""
+    return max(round(raw_size, precision), min_size)
+
+
 class CCXTClient:
     """CCXT 통합 클라이언트"""
     
@@ -32,14 +282,18 @@ class CCXTClient:
         self.is_testnet = is_testnet
         self.exchange_info = get_exchange_info(exchange_id)
         
-        # Rate Limiting
-        self.request_timestamps = []
-        self.rate_limit_per_second = 10
-        self.cooldown_until = 0
-        
         # CCXT 인스턴스 생성
         self.exchange = self._create_exchange(api_key, secret, passphrase, is_testnet)
         
+        # Rate Limiting (같은 거래소의 모든 클라이언트가 공유)
+        self.rate_limiter = get_rate_limiter(exchange_id, is_testnet,
+                                             getattr(self.exchange, 'rateLimit', None))
+        
+        # 마켓 정보 (거래소별 공유 캐시, 있으면 load_markets 요청 생략)
+        self.market_cache = get_market_cache(exchange_id, is_testnet)
+        if self.market_cache.attach(self.exchange) and api_key:
+            self._sync_time_difference()
+        
         logger.info("CCXT", f"{exchange_id} 클라이언트 초기화 완료 (testnet={is_testnet})")
     
     def _create_exchange(self, api_key: str, secret: str, passphrase: str, 
@@ -49,55 +303,46 @@ class CCXTClient:
         if not exchange_class:
             raise ValueError(f"지원하지 않는 거래소: {self.exchange_id}")
         
-        # 기본 설정
-        config = {
-            'apiKey': api_key,
-            'secret': secret,
-            'enableRateLimit': True,
-            'options': {
-                'defaultType': 'swap',  # 선물(영구) 거래
-                'adjustForTimeDifference': True,
-            }
-        }
-        
-        # 패스프레이즈 필요한 거래소
-        if passphrase and self.exchange_info.get('requires_passphrase'):
-            config['password'] = passphrase
-        
-        # 테스트넷 설정
-        if is_testnet:
-            config['sandbox'] = True
-        
-        exchange = exchange_class(config)
-        
-        # 타임아웃 설정
-        exchange.timeout = 30000  # 30초
-        
-        return exchange
+        config = build_exchange_config(self.exchange_info, api_key, secret,
+                                       passphrase, is_testnet)
+        return exchange_class(config)
     
-    def _wait_for_rate_limit(self):
-        """Rate Limit 대기"""
-        current_time = time.time()
+    def _request(self, method: str, *args, **kwargs):
+        """
+        거래소 API 호출 (공유 토큰 버킷으로 제한)
         
-        # Cooldown 체크
-        if current_time < self.cooldown_until:
-            wait_time = self.cooldown_until - current_time
-            logger.warning("CCXT", f"Rate limit cooldown 중... {wait_time:.1f}초 대기")
-            time.sleep(wait_time)
-            current_time = time.time()
+        429 응답이면 Retry-After(없으면 점증 대기)만큼 거래소 전체를 쉬게 한 뒤 재시도한다.
+        """
+        call = getattr(self.exchange, method)
         
-        # 최근 1초 이내 요청 수 체크
-        self.request_timestamps = [
-            ts for ts in self.request_timestamps 
-            if current_time - ts < 1.0
-        ]
+        # 이미 로드된 마켓은 요청 없이 반환 (reload 인자가 없을 때)
+        if method == 'load_markets' and self.exchange.markets and not args:
+            return call(*args, **kwargs)
         
-        if len(self.request_timestamps) >= self.rate_limit_per_second:
-            sleep_time = 1.0 - (current_time - self.request_timestamps[0])
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+        weight = request_weight(self.exchange_id, method, *args)
+        for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+            self.rate_limiter.acquire(weight)
+            try:
+                return call(*args, **kwargs)
+            except ccxt.DDoSProtection:
+                self.rate_limiter.penalize(
+                    retry_after_seconds(getattr(self.exchange, 'last_response_headers', None))
+                )
+                if attempt == RATE_LIMIT_MAX_RETRIES:
+                    raise
+    
+    def _sync_time_difference(self):
+        """
+        서버 시간차 보정
         
-        self.request_timestamps.append(time.time())
+        캐시로 마켓을 채우면 load_markets 안에서 하던 시간차 보정이 생략되므로 따로 한다.
+        """
+        if not self.exchange.options.get('adjustForTimeDifference'):
+            return
+        try:
+            self._request('load_time_difference')
+        except Exception as e:
+            logger.warning("CCXT", f"{self.exchange_id} 서버 시간차 보정 실패: {str(e)}")
     
     # ========== 연결 테스트 ==========
     
@@ -105,11 +350,11 @@ class CCXTClient:
         """연결 테스트"""
         try:
             # 서버 시간 조회 (공개 API)
-            self.exchange.fetch_time()
+            self._request('fetch_time')
             
             # API 키가 있으면 잔고 조회로 인증 테스트
             if self.exchange.apiKey and self.exchange.secret:
-                self.exchange.fetch_balance()
+                self._request('fetch_balance')
                 return True, f"{self.exchange_info.get('name', self.exchange_id)} 연동 성공"
             else:
                 return True, f"{self.exchange_info.get('name', self.exchange_id)} 서버 연결 성공 (API 키 없음)"
@@ -126,8 +371,7 @@ class CCXTClient:
     def get_balance(self) -> Optional[Dict]:
         """잔고 조회"""
         try:
-            self._wait_for_rate_limit()
-            balance = self.exchange.fetch_balance()
+            balance = self._request('fetch_balance')
             return balance
         except Exception as e:
             logger.error("CCXT", f"잔고 조회 실패: {str(e)}")
@@ -150,18 +394,8 @@ class CCXTClient:
     def get_ticker(self, symbol: str) -> Optional[Dict]:
         """현재가 조회"""
         try:
-            self._wait_for_rate_limit()
-            ticker = self.exchange.fetch_ticker(symbol)
-            return {
-                'symbol': ticker['symbol'],
-                'last': ticker['last'],
-                'bid': ticker['bid'],
-                'ask': ticker['ask'],
-                'high': ticker['high'],
-                'low': ticker['low'],
-                'volume': ticker['baseVolume'],
-                'timestamp': ticker['timestamp']
-            }
+            ticker = self._request('fetch_ticker', symbol)
+            return parse_ticker(ticker)
         except Exception as e:
             logger.error("CCXT", f"현재가 조회 실패 ({symbol}): {str(e)}")
             return None
@@ -181,37 +415,18 @@ class CCXTClient:
             캔들 데이터 리스트 [{'timestamp', 'open', 'high', 'low', 'close', 'volume'}, ...]
         """
         try:
-            self._wait_for_rate_limit()
-            
             # CCXT 타임프레임 변환
             ccxt_timeframe = TIMEFRAMES.get(timeframe, timeframe)
             
-            ohlcv = self.exchange.fetch_ohlcv(
+            ohlcv = self._request(
+                'fetch_ohlcv',
                 symbol=symbol,
                 timeframe=ccxt_timeframe,
                 since=since,
                 limit=limit
             )
             
-            if not ohlcv:
-                return []
-            
-            candles = []
-            for candle in ohlcv:
-                ts_ms = candle[0]
-                dt_kst = time_helper.timestamp_to_kst(ts_ms)
-                
-                candles.append({
-                    'timestamp': time_helper.format_kst(dt_kst),
-                    'timestamp_ms': ts_ms,
-                    'open': float(candle[1]),
-                    'high': float(candle[2]),
-                    'low': float(candle[3]),
-                    'close': float(candle[4]),
-                    'volume': float(candle[5])
-                })
-            
-            return candles
+            return parse_ohlcv(ohlcv)
             
         except Exception as e:
             logger.error("CCXT", f"캔들 조회 실패 ({symbol} {timeframe}): {str(e)}")
@@ -247,32 +462,17 @@ class CCXTClient:
             
             # 마지막 캔들 시간 + 1ms
             since_ms = candles[-1]['timestamp_ms'] + 1
-            
-            # Rate limit
-            time.sleep(0.1)
         
         return all_candles
     
     def get_markets(self) -> List[Dict]:
         """거래 가능한 마켓 목록 조회"""
         try:
-            self._wait_for_rate_limit()
-            self.exchange.load_markets()
-            
-            markets = []
-            for symbol, market in self.exchange.markets.items():
-                # 선물(swap) 마켓만 필터링
-                if market.get('swap') or market.get('future'):
-                    markets.append({
-                        'symbol': symbol,
-                        'base': market.get('base'),
-                        'quote': market.get('quote'),
-                        'active': market.get('active', True),
-                        'type': market.get('type'),
-                        'contract': market.get('contract', True)
-                    })
-            
-            return markets
+            seeded = bool(self.exchange.markets)
+            markets = self._request('load_markets')
+            if not seeded:
+                self.market_cache.update(markets)
+            return parse_swap_markets(markets)
             
         except Exception as e:
             logger.error("CCXT", f"마켓 조회 실패: {str(e)}")
@@ -283,30 +483,12 @@ class CCXTClient:
     def get_positions(self, symbol: str = None) -> List[Dict]:
         """포지션 조회"""
         try:
-            self._wait_for_rate_limit()
-            
             if symbol:
-                positions = self.exchange.fetch_positions([symbol])
+                positions = self._request('fetch_positions', [symbol])
             else:
-                positions = self.exchange.fetch_positions()
-            
-            result = []
-            for pos in positions:
-                size = abs(float(pos.get('contracts', 0) or pos.get('contractSize', 0) or 0))
-                if size > 0 or pos.get('entryPrice'):
-                    result.append({
-                        'symbol': pos['symbol'],
-                        'side': pos.get('side', 'long'),
-                        'size': size,
-                        'entry_price': float(pos.get('entryPrice', 0) or 0),
-                        'mark_price': float(pos.get('markPrice', 0) or 0),
-                        'liquidation_price': float(pos.get('liquidationPrice', 0) or 0),
-                        'unrealized_pnl': float(pos.get('unrealizedPnl', 0) or 0),
-                        'leverage': int(pos.get('leverage', 1) or 1),
-                        'margin_mode': pos.get('marginMode', 'isolated'),
-                    })
+                positions = self._request('fetch_positions')
             
-            return result
+            return parse_positions(positions)
             
         except Exception as e:
             logger.error("CCXT", f"포지션 조회 실패: {str(e)}")
@@ -316,16 +498,14 @@ class CCXTClient:
                     margin_mode: str = 'isolated') -> bool:
         """레버리지 설정"""
         try:
-            self._wait_for_rate_limit()
-            
             # 마진 모드 설정 (일부 거래소)
             try:
-                self.exchange.set_margin_mode(margin_mode, symbol)
+                self._request('set_margin_mode', margin_mode, symbol)
             except:
                 pass  # 지원하지 않는 거래소는 무시
             
             # 레버리지 설정
-            self.exchange.set_leverage(leverage, symbol)
+            self._request('set_leverage', leverage, symbol)
             logger.info("CCXT", f"{symbol} 레버리지 {leverage}x 설정 완료")
             return True
             
@@ -353,16 +533,10 @@ class CCXTClient:
             주문 결과
         """
         try:
-            self._wait_for_rate_limit()
-            
-            order_params = params or {}
+            order_params = build_order_params(params, pos_side, reduce_only)
             
-            if pos_side:
-                order_params['posSide'] = pos_side
-            if reduce_only:
-                order_params['reduceOnly'] = True
-            
-            order = self.exchange.create_market_order(
+            order = self._request(
+                'create_market_order',
                 symbol=symbol,
                 side=side,
                 amount=size,
@@ -371,21 +545,7 @@ class CCXTClient:
             
             logger.info("CCXT", f"시장가 주문 완료: {symbol} {side} {size}")
             
-            # 안전한 float 변환
-            avg_price = order.get('average') or order.get('price') or 0
-            filled_amount = order.get('filled') or 0
-            
-            return {
-                'order_id': order.get('id', ''),
-                'symbol': order.get('symbol', symbol),
-                'side': order.get('side', side),
-                'type': order.get('type', 'market'),
-                'size': float(order.get('amount') or size),
-                'filled': float(filled_amount),
-                'price': float(avg_price),
-                'status': order.get('status', 'unknown'),
-                'timestamp': order.get('timestamp', 0)
-            }
+            return parse_placed_order(order, symbol, side, 'market', size)
             
         except Exception as e:
             logger.error("CCXT", f"시장가 주문 실패: {str(e)}")
@@ -411,16 +571,10 @@ class CCXTClient:
             주문 결과
         """
         try:
-            self._wait_for_rate_limit()
-            
-            order_params = params or {}
-            
-            if pos_side:
-                order_params['posSide'] = pos_side
-            if reduce_only:
-                order_params['reduceOnly'] = True
+            order_params = build_order_params(params, pos_side, reduce_only)
             
-            order = self.exchange.create_limit_order(
+            order = self._request(
+                'create_limit_order',
                 symbol=symbol,
                 side=side,
                 amount=size,
@@ -430,24 +584,56 @@ class CCXTClient:
             
             logger.info("CCXT", f"지정가 주문 완료: {symbol} {side} {size} @ {price}")
             
-            filled_amount = order.get('filled') or 0
-            
-            return {
-                'order_id': order.get('id', ''),
-                'symbol': order.get('symbol', symbol),
-                'side': order.get('side', side),
-                'type': order.get('type', 'limit'),
-                'size': float(order.get('amount') or size),
-                'price': float(order.get('price') or price),
-                'filled': float(filled_amount),
-                'status': order.get('status', 'unknown'),
-                'timestamp': order.get('timestamp', 0)
-            }
+            return parse_placed_order(order, symbol, side, 'limit', size, price)
             
         except Exception as e:
             logger.error("CCXT", f"지정가 주문 실패: {str(e)}")
             return None
     
+    def place_limit_orders(self, orders: List[Dict]) -> List[Optional[Dict]]:
+        """
+        지정가 주문 일괄 생성
+        
+        거래소가 일괄 주문(create_orders)을 지원하면 묶음 단위로 보내고,
+        아니면 개별 주문을 동시에 보낸다 (공유 토큰 버킷이 속도 제한).
+        
+        Args:
+            orders: [{'symbol', 'side', 'size', 'price', 'pos_side', 'reduce_only', 'params'}]
+        
+        Returns:
+            입력 순서대로 주문 결과 (실패한 주문은 None)
+        """
+        if not orders:
+            return []
+        
+        if not self.exchange.has.get('createOrders'):
+            return self._place_limit_orders_concurrently(orders)
+        
+        results = []
+        limit = get_batch_order_limit(self.exchange_id)
+        for start in range(0, len(orders), limit):
+            chunk = orders[start:start + limit]
+            try:
+                created = self._request('create_orders', build_limit_order_requests(chunk))
+                results.extend(reconcile_batch_orders(chunk, created))
+            except (ccxt.NotSupported, ccxt.BadRequest) as e:
+                # 요청 형식을 받지 않는 경우만 개별 주문으로 대체 (중복 주문 방지)
+                logger.warning("CCXT", f"일괄 주문 불가, 개별 주문으로 대체: {str(e)}")
+                results.extend(self._place_limit_orders_concurrently(chunk))
+            except Exception as e:
+                logger.error("CCXT", f"일괄 주문 실패 ({len(chunk)}건): {str(e)}")
+                results.extend([None] * len(chunk))
+        
+        placed = sum(1 for r in results if r)
+        logger.info("CCXT", f"지정가 일괄 주문 완료: {placed}/{len(orders)}건")
+        return results
+    
+    def _place_limit_orders_concurrently(self, orders: List[Dict]) -> List[Optional[Dict]]:
+        """개별 지정가 주문 동시 제출 (입력 순서대로 결과)"""
+        workers = min(len(orders), BATCH_ORDER_MAX_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda order: self.place_limit_order(**order), orders))
+    
     def place_order_with_tp_sl(self, symbol: str, side: str, size: float,
                                tp_price: float = None, sl_price: float = None,
                                pos_side: str = None) -> Optional[Dict]:
@@ -457,36 +643,8 @@ class CCXTClient:
         거래소마다 TP/SL 설정 방식이 다르므로 별도 처리
         """
         try:
-            order_params = {}
-            
-            if pos_side:
-                order_params['posSide'] = pos_side
-            
-            # 거래소별 TP/SL 파라미터 설정
-            if self.exchange_id == 'binance':
-                # Binance는 별도 주문 필요
-                pass
-            elif self.exchange_id == 'bybit':
-                if tp_price:
-                    order_params['takeProfit'] = {
-                        'triggerPrice': tp_price,
-                        'type': 'market'
-                    }
-                if sl_price:
-                    order_params['stopLoss'] = {
-                        'triggerPrice': sl_price,
-                        'type': 'market'
-                    }
-            elif self.exchange_id == 'okx':
-                attach_algo = {}
-                if tp_price:
-                    attach_algo['tpTriggerPx'] = str(tp_price)
-                    attach_algo['tpOrdPx'] = '-1'  # 시장가
-                if sl_price:
-                    attach_algo['slTriggerPx'] = str(sl_price)
-                    attach_algo['slOrdPx'] = '-1'
-                if attach_algo:
-                    order_params['attachAlgoOrds'] = [attach_algo]
+            # 거래소별 TP/SL 파라미터 설정 (Binance는 별도 주문)
+            order_params = build_tp_sl_params(self.exchange_id, tp_price, sl_price, pos_side)
             
             # 시장가 주문 실행
             result = self.place_market_order(
@@ -514,22 +672,10 @@ class CCXTClient:
                              price: float, size: float, pos_side: str):
         """Binance TP/SL 주문 (별도 주문)"""
         try:
-            side = 'sell' if pos_side == 'long' else 'buy'
-            
-            params = {
-                'stopPrice': price,
-                'reduceOnly': True
-            }
-            
-            if pos_side:
-                params['positionSide'] = pos_side.upper()
+            side, params = build_binance_tp_sl(order_type, price, pos_side)
             
-            if order_type == 'tp':
-                params['type'] = 'TAKE_PROFIT_MARKET'
-            else:
-                params['type'] = 'STOP_MARKET'
-            
-            self.exchange.create_order(
+            self._request(
+                'create_order',
                 symbol=symbol,
                 type='market',
                 side=side,
@@ -543,8 +689,7 @@ class CCXTClient:
     def cancel_order(self, symbol: str, order_id: str) -> bool:
         """주문 취소"""
         try:
-            self._wait_for_rate_limit()
-            self.exchange.cancel_order(order_id, symbol)
+            self._request('cancel_order', order_id, symbol)
             logger.info("CCXT", f"주문 취소 완료: {order_id}")
             return True
         except Exception as e:
@@ -554,8 +699,7 @@ class CCXTClient:
     def cancel_all_orders(self, symbol: str) -> bool:
         """모든 주문 취소"""
         try:
-            self._wait_for_rate_limit()
-            self.exchange.cancel_all_orders(symbol)
+            self._request('cancel_all_orders', symbol)
             logger.info("CCXT", f"모든 주문 취소 완료: {symbol}")
             return True
         except Exception as e:
@@ -565,24 +709,12 @@ class CCXTClient:
     def get_open_orders(self, symbol: str = None) -> List[Dict]:
         """미체결 주문 조회"""
         try:
-            self._wait_for_rate_limit()
-            
             if symbol:
-                orders = self.exchange.fetch_open_orders(symbol)
+                orders = self._request('fetch_open_orders', symbol)
             else:
-                orders = self.exchange.fetch_open_orders()
-            
-            return [{
-                'order_id': o['id'],
-                'symbol': o['symbol'],
-                'side': o['side'],
-                'type': o['type'],
-                'size': float(o.get('amount', 0)),
-                'price': float(o.get('price', 0) or 0),
-                'filled': float(o.get('filled', 0)),
-                'status': o['status'],
-                'timestamp': o.get('timestamp')
-            } for o in orders]
+                orders = self._request('fetch_open_orders')
+            
+            return [parse_open_order(o) for o in orders]
             
         except Exception as e:
             logger.error("CCXT", f"미체결 주문 조회 실패: {str(e)}")
@@ -591,21 +723,8 @@ class CCXTClient:
     def get_order(self, symbol: str, order_id: str) -> Optional[Dict]:
         """주문 상세 조회"""
         try:
-            self._wait_for_rate_limit()
-            order = self.exchange.fetch_order(order_id, symbol)
-            
-            return {
-                'order_id': order['id'],
-                'symbol': order['symbol'],
-                'side': order['side'],
-                'type': order['type'],
-                'size': float(order.get('amount', 0)),
-                'price': float(order.get('price', 0) or 0),
-                'average': float(order.get('average', 0) or 0),
-                'filled': float(order.get('filled', 0)),
-                'status': order['status'],
-                'timestamp': order.get('timestamp')
-            }
+            order = self._request('fetch_order', order_id, symbol)
+            return parse_order_detail(order)
             
         except Exception as e:
             logger.error("CCXT", f"주문 조회 실패: {str(e)}")
@@ -613,33 +732,63 @@ class CCXTClient:
     
     # ========== 유틸리티 ==========
     
+    def refresh_markets(self) -> bool:
+        """마켓 정보를 다시 받아 공유 캐시(디스크 포함) 갱신"""
+        try:
+            markets = self._request('load_markets', True)
+            self.market_cache.update(markets)
+            return True
+        except Exception as e:
+            self.market_cache.release_refresh()
+            logger.error("CCXT", f"{self.exchange_id} 마켓 정보 갱신 실패: {str(e)}")
+            return False
+    
+    def _market_info(self, symbol: str) -> Optional[Dict]:
+        """
+        마켓 요약 조회 (정밀도/한도/계약 크기)
+        
+        캐시에 없으면 캐시가 비었거나 오래된 경우에만 바로 다시 받고,
+        TTL이 지난 캐시는 값을 그대로 쓰면서 백그라운드에서 갱신한다.
+        """
+        cache = self.market_cache
+        info = cache.lookup(symbol)
+        if info is None:
+            if not cache.is_loaded or cache.is_stale():
+                self.refresh_markets()
+                info = cache.lookup(symbol)
+        elif cache.claim_refresh():
+            threading.Thread(target=self.refresh_markets, name="MarketRefresh",
+                             daemon=True).start()
+        return info
+    
     def get_min_order_size(self, symbol: str) -> float:
         """최소 주문 수량 조회"""
         try:
-            self.exchange.load_markets()
-            market = self.exchange.market(symbol)
-            return float(market.get('limits', {}).get('amount', {}).get('min', 0.001))
-        except:
+            return float(self._market_info(symbol)['min_amount'])
+        except Exception:
             return 0.001
     
     def get_price_precision(self, symbol: str) -> int:
         """가격 소수점 자릿수 조회"""
         try:
-            self.exchange.load_markets()
-            market = self.exchange.market(symbol)
-            return int(market.get('precision', {}).get('price', 2))
-        except:
+            return int(self._market_info(symbol)['price_precision'])
+        except Exception:
             return 2
     
     def get_amount_precision(self, symbol: str) -> int:
         """수량 소수점 자릿수 조회"""
         try:
-            self.exchange.load_markets()
-            market = self.exchange.market(symbol)
-            return int(market.get('precision', {}).get('amount', 3))
-        except:
+            return int(self._market_info(symbol)['amount_precision'])
+        except Exception:
             return 3
     
+    def get_contract_size(self, symbol: str) -> float:
+        """계약 1개당 기초자산 수량 조회"""
+        try:
+            return float(self._market_info(symbol)['contract_size'] or 1.0)
+        except Exception:
+            return 1.0
+    
     def calculate_order_size(self, symbol: str, margin: float, 
                             leverage: int, price: float) -> float:
         """
@@ -656,13 +805,9 @@ class CCXTClient:
         """
         raw_size = (margin * leverage) / price
         
-        # 소수점 자릿수 조정
-        precision = self.get_amount_precision(symbol)
-        size = round(raw_size, precision)
-        
-        # 최소 수량 체크
-        min_size = self.get_min_order_size(symbol)
-        return max(size, min_size)
+        # 소수점 자릿수 조정 + 최소 수량 체크
+        return round_order_size(raw_size, self.get_amount_precision(symbol),
+                                self.get_min_order_size(symbol))
     
     def get_maker_fee(self) -> float:
         """메이커 수수료"""
@@ -682,12 +827,10 @@ class CCXTClient:
             {acct_lv, pos_mode, ...} 또는 None
         """
         try:
-            self._wait_for_rate_limit()
-            
             # 거래소별 설정 조회
             if self.exchange_id == 'okx':
                 # OKX 전용 API
-                config = self.exchange.private_get_account_config()
+                config = self._request('private_get_account_config')
                 data = config.get('data', [{}])[0] if config.get('data') else {}
                 return {
                     'acct_lv': data.get('acctLv', '1'),
@@ -697,7 +840,7 @@ class CCXTClient:
             elif self.exchange_id == 'binance':
                 # Binance
                 try:
-                    pos_mode = self.exchange.fapiPrivateGetPositionSideDual()
+                    pos_mode = self._request('fapiPrivateGetPositionSideDual')
                     return {
                         'pos_mode': 'long_short_mode' if pos_mode.get('dualSidePosition') else 'net_mode',
                         'acct_lv': '2'  # Binance는 선물 계정
@@ -707,7 +850,7 @@ class CCXTClient:
             elif self.exchange_id == 'bybit':
                 # Bybit
                 try:
-                    config = self.exchange.private_get_v5_account_info()
+                    config = self._request('private_get_v5_account_info')
                     data = config.get('result', {})
                     return {
                         'pos_mode': data.get('unifiedMarginStatus', 'unknown'),
@@ -734,16 +877,14 @@ class CCXTClient:
             성공 여부
         """
         try:
-            self._wait_for_rate_limit()
-            
             if self.exchange_id == 'okx':
                 # OKX
-                self.exchange.private_post_account_set_position_mode({
+                self._request('private_post_account_set_position_mode', {
                     'posMode': 'long_short_mode'
                 })
             elif self.exchange_id == 'binance':
                 # Binance
-                self.exchange.fapiPrivatePostPositionSideDual({
+                self._request('fapiPrivatePostPositionSideDual', {
                     'dualSidePosition': 'true'
                 })
             elif self.exchange_id == 'bybit':
@@ -751,7 +892,7 @@ class CCXTClient:
                 pass
             elif self.exchange_id == 'bitget':
                 # Bitget
-                self.exchange.private_post_api_mix_v1_account_setpositionmode({
+                self._request('private_post_api_mix_v1_account_setpositionmode', {
                     'positionMode': 'hedge_mode'
                 })
             
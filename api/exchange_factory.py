@@ -116,6 +116,47 @@ class ExchangeFactory:
             logger.error("ExchangeFactory", f"{exchange_id} 공개 클라이언트 생성 실패: {str(e)}")
             return None
     
+    def get_async_client(self, exchange_id: str, is_testnet: bool = False,
+                         public: bool = False):
+        """
+        비동기 거래소 클라이언트 조회 또는 생성 (공유 이벤트 루프)
+
+        Args:
+            exchange_id: 거래소 ID
+            is_testnet: 테스트넷 여부
+            public: 인증 없는 공개 API 전용 여부
+
+        Returns:
+            AsyncCCXTClient 인스턴스 또는 None
+            (다른 스레드에서는 client.sync로 동기 호출)
+        """
+        from api.async_ccxt_client import AsyncCCXTClient
+
+        network = 'testnet' if is_testnet else 'mainnet'
+        cache_key = f"{exchange_id}_async_{'public_' if public else ''}{network}"
+        if cache_key in self._clients:
+            return self._clients[cache_key]
+
+        creds = {} if public else self._get_credentials(exchange_id, is_testnet)
+        if creds is None:
+            logger.warning("ExchangeFactory", f"{exchange_id} 자격증명 없음")
+            return None
+
+        try:
+            client = AsyncCCXTClient(
+                exchange_id=exchange_id,
+                api_key=creds.get('api_key', ''),
+                secret=creds.get('secret', ''),
+                passphrase=creds.get('passphrase', ''),
+                is_testnet=is_testnet
+            )
+            self._clients[cache_key] = client
+            return client
+
+        except Exception as e:
+            logger.error("ExchangeFactory", f"{exchange_id} 비동기 클라이언트 생성 실패: {str(e)}")
+            return None
+
     def _get_credentials(self, exchange_id: str, is_testnet: bool) -> Optional[Dict]:
         """자격증명 조회"""
         # DB에서 조회
@@ -151,9 +192,9 @@ class ExchangeFactory:
             )
             
             # 캐시 무효화
-            cache_key = f"{exchange_id}_{'testnet' if is_testnet else 'mainnet'}"
-            if cache_key in self._clients:
-                del self._clients[cache_key]
+            network = 'testnet' if is_testnet else 'mainnet'
+            for cache_key in (f"{exchange_id}_{network}", f"{exchange_id}_async_{network}"):
+                self._clients.pop(cache_key, None)
             
             logger.info("ExchangeFactory", f"{exchange_id} 자격증명 저장 완료")
             return True
@@ -231,3 +272,12 @@ def get_public_client(exchange_id: str, is_testnet: bool = False) -> Optional[CC
     """공개 클라이언트 조회 (편의 함수)"""
     return get_exchange_factory().get_client_without_auth(exchange_id, is_testnet)
 
+
+def get_async_client(exchange_id: str, is_testnet: bool = False):
+    """비동기 거래소 클라이언트 조회 (편의 함수)"""
+    return get_exchange_factory().get_async_client(exchange_id, is_testnet)
+
+
+def get_async_public_client(exchange_id: str, is_testnet: bool = False):
+    """비동기 공개 클라이언트 조회 (편의 함수)"""
+    return get_exchange_factory().get_async_client(exchange_id, is_testnet, public=True)
@@ -0,0 +1,192 @@
+"""
+마켓 메타데이터 캐시
+거래소별 ccxt 마켓 정보(정밀도, 주문 한도, 계약 크기)를 디스크에 저장해 두고
+같은 거래소의 모든 클라이언트가 load_markets 왕복 없이 공유한다.
+"""
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from config.settings import MARKET_CACHE_DIR, MARKET_CACHE_TTL_HOURS
+from utils.logger import logger
+
+
+def market_summary(market: Dict) -> Dict:
+    """주문 계산에 쓰는 마켓 요약 (정밀도/한도/계약 크기)"""
+    precision = market.get('precision') or {}
+    limits = market.get('limits') or {}
+    amount_limits = limits.get('amount') or {}
+    cost_limits = limits.get('cost') or {}
+    return {
+        'price_precision': precision.get('price'),
+        'amount_precision': precision.get('amount'),
+        'min_amount': amount_limits.get('min'),
+        'max_amount': amount_limits.get('max'),
+        'min_cost': cost_limits.get('min'),
+        'contract_size': market.get('contractSize'),
+    }
+
+
+class MarketCache:
+    """
+    거래소별 마켓 메타데이터 캐시 (스레드 안전)
+
+    - lookup(symbol): 심볼 요약 O(1) 조회 (처음 조회 시 디스크 캐시 로드)
+    - attach(exchange): 새 ccxt 인스턴스에 캐시된 마켓을 넣어 load_markets 요청 생략
+    - update(markets): load_markets 결과 반영 후 디스크 저장
+    - TTL이 지나면 claim_refresh()로 한 클라이언트만 백그라운드 갱신을 맡는다
+    """
+
+    def __init__(self, exchange_id: str, is_testnet: bool = False,
+                 cache_dir: Path = None, ttl_hours: float = MARKET_CACHE_TTL_HOURS):
+        self.key = f"{exchange_id}_{'testnet' if is_testnet else 'mainnet'}"
+        self.path = Path(cache_dir or MARKET_CACHE_DIR) / f"{self.key}.json"
+        self.ttl = ttl_hours * 3600
+        self.fetched_at = 0.0
+
+        self._markets: Optional[Dict[str, Dict]] = None
+        self._summaries: Dict[str, Dict] = {}
+        self._disk_checked = False
+        self._refreshing = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        self._ensure_disk_loaded()
+        return self._markets is not None
+
+    def is_stale(self) -> bool:
+        return time.time() - self.fetched_at > self.ttl
+
+    # ========== 조회 ==========
+
+    def lookup(self, symbol: str) -> Optional[Dict]:
+        """심볼 요약 조회 (없으면 None)"""
+        self._ensure_disk_loaded()
+        return self._summaries.get(symbol)
+
+    def attach(self, exchange) -> bool:
+        """ccxt 인스턴스에 캐시된 마켓 설정 (이미 로드된 인스턴스는 그대로)"""
+        if exchange.markets or not self.is_loaded:
+            return False
+        try:
+            exchange.set_markets(self._markets)
+            return True
+        except Exception as e:
+            logger.warning("MarketCache", f"{self.key} 캐시 마켓 적용 실패: {str(e)}")
+            return False
+
+    # ========== 갱신 ==========
+
+    def update(self, markets: Dict[str, Dict]):
+        """load_markets 결과 반영 및 디스크 저장"""
+        if not markets:
+            self.release_refresh()
+            return
+
+        with self._lock:
+            self._set(markets, time.time())
+            self._refreshing = False
+        self._save()
+
+    def claim_refresh(self) -> bool:
+        """TTL이 지났고 아무도 갱신 중이 아니면 갱신 담당을 맡음"""
+        with self._lock:
+            if self._refreshing or not self.is_stale():
+                return False
+            self._refreshing = True
+            return True
+
+    def release_refresh(self):
+        """갱신 실패 시 담당 해제"""
+        with self._lock:
+            self._refreshing = False
+
+    def _set(self, markets: Dict[str, Dict], fetched_at: float):
+        self._markets = markets
+        self._summaries = {symbol: market_summary(market)
+                           for symbol, market in markets.items()}
+        self.fetched_at = fetched_at
+
+    # ========== 디스크 ==========
+
+    def _ensure_disk_loaded(self):
+        if not self._disk_checked:
+            self.load_from_disk()
+
+    def load_from_disk(self) -> bool:
+        """디스크 캐시 로드 (TTL과 무관하게 로드, 오래된 캐시는 갱신 대상)"""
+        with self._lock:
+            if self._disk_checked:
+                return self._markets is not None
+            self._disk_checked = True
+            if not self.path.exists():
+                return False
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                self._set(data['markets'], float(data.get('fetched_at', 0)))
+                return True
+            except Exception as e:
+                logger.warning("MarketCache", f"{self.key} 디스크 캐시 로드 실패: {str(e)}")
+                return False
+
+    def _save(self):
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".json.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({'fetched_at': self.fetched_at, 'markets': self._markets},
+                          f, default=str)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.warning("MarketCache", f"{self.key} 디스크 캐시 저장 실패: {str(e)}")
+
+
+_caches: Dict[str, MarketCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_market_cache(exchange_id: str, is_testnet: bool = False) -> MarketCache:
+    """거래소별 공유 마켓 캐시 조회 (없으면 생성)"""
+    key = f"{exchange_id}_{'testnet' if is_testnet else 'mainnet'}"
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = _caches[key] = MarketCache(exchange_id, is_testnet)
+        return cache
+
+
+def warmup_market_caches(exchange_ids: Iterable[str], is_testnet: bool = False):
+    """
+    시작 시 마켓 캐시 일괄 준비
+
+    디스크 캐시를 먼저 읽고, 없거나 TTL이 지난 거래소만 백그라운드 스레드에서
+    공개 클라이언트로 다시 받아 저장한다.
+    """
+    stale = []
+    for exchange_id in exchange_ids:
+        cache = get_market_cache(exchange_id, is_testnet)
+        cache.load_from_disk()
+        if cache.claim_refresh():
+            stale.append(exchange_id)
+
+    if not stale:
+        return
+
+    def refresh():
+        from api.ccxt_client import CCXTClient
+
+        for exchange_id in stale:
+            try:
+                client = CCXTClient(exchange_id, is_testnet=is_testnet)
+                client.refresh_markets()
+            except Exception as e:
+                get_market_cache(exchange_id, is_testnet).release_refresh()
+                logger.warning("MarketCache", f"{exchange_id} 마켓 캐시 준비 실패: {str(e)}")
+
+    threading.Thread(target=refresh, name="MarketCacheWarmup", daemon=True).start()
+    logger.info("MarketCache", f"마켓 캐시 갱신 시작: {', '.join(stale)}")
@@ -1,7 +1,6 @@
 """
 OKX REST API 클라이언트
 """
-import time
 import hmac
 import base64
 import hashlib
@@ -16,6 +15,7 @@ from config.settings import (
     OKX_API_BASE, OKX_RATE_LIMIT_PER_SECOND, 
     OKX_RATE_LIMIT_COOLDOWN
 )
+from api.rate_limiter import get_rate_limiter, retry_after_seconds
 from utils.logger import logger
 
 
@@ -28,10 +28,8 @@ class OKXClient:
         self.passphrase = passphrase
         self.base_url = OKX_API_BASE
         
-        # Rate Limiting
-        self.rate_limit_per_second = OKX_RATE_LIMIT_PER_SECOND
-        self.request_timestamps = []
-        self.cooldown_until = 0
+        # Rate Limiting (CCXT okx 클라이언트와 같은 토큰 버킷 공유)
+        self.rate_limiter = get_rate_limiter('okx', rate_limit_ms=1000 / OKX_RATE_LIMIT_PER_SECOND)
         
         # HTTP Session
         self.session = requests.Session()
@@ -46,27 +44,7 @@ class OKXClient:
     
     def _wait_for_rate_limit(self):
         """Rate Limit 대기"""
-        current_time = time.time()
-        
-        # Cooldown 체크
-        if current_time < self.cooldown_until:
-            wait_time = self.cooldown_until - current_time
-            logger.warning("OKX", f"Rate limit cooldown 중... {wait_time:.1f}초 대기")
-            time.sleep(wait_time)
-            current_time = time.time()
-        
-        # 최근 1초 이내 요청 수 체크
-        self.request_timestamps = [
-            ts for ts in self.request_timestamps 
-            if current_time - ts < 1.0
-        ]
-        
-        if len(self.request_timestamps) >= self.rate_limit_per_second:
-            sleep_time = 1.0 - (current_time - self.request_timestamps[0])
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-        
-        self.request_timestamps.append(time.time())
+        self.rate_limiter.acquire()
     
     def _generate_signature(self, timestamp: str, method: str, 
                           request_path: str, body: str = "") -> str:
@@ -124,7 +102,9 @@ class OKXClient:
             # 429 Rate Limit 처리
             if response.status_code == 429:
                 logger.error("OKX", "Rate limit 초과 (429)")
-                self.cooldown_until = time.time() + OKX_RATE_LIMIT_COOLDOWN
+                self.rate_limiter.penalize(
+                    retry_after_seconds(response.headers) or OKX_RATE_LIMIT_COOLDOWN
+                )
                 return None
             
             response.raise_for_status()
@@ -0,0 +1,166 @@
+"""
+거래소 요청 토큰 버킷
+같은 거래소를 쓰는 모든 클라이언트(공개/인증, 동기/비동기)가 하나의 예산을 공유한다.
+"""
+import asyncio
+import threading
+import time
+from typing import Dict, Mapping, Optional
+
+from config.exchanges import get_endpoint_weight
+from config.settings import (
+    RATE_LIMIT_DEFAULT_PER_SECOND, RATE_LIMIT_BURST_SECONDS,
+    RATE_LIMIT_BASE_COOLDOWN, RATE_LIMIT_MAX_COOLDOWN
+)
+from utils.logger import logger
+
+
+class TokenBucket:
+    """
+    토큰 버킷 (스레드 안전, 예약 방식)
+
+    - 초당 rate 토큰이 채워지고 최대 capacity까지 쌓여 순간 버스트를 허용
+    - reserve(weight)는 토큰을 먼저 차감하고 기다릴 시간만 돌려주므로
+      잠금은 계산 동안만 잡고 대기는 호출 측(time.sleep / asyncio.sleep)이 한다
+    - penalize(): 429 응답 시 cooldown_until까지 모든 요청을 멈추고 버킷을 비움
+    """
+
+    def __init__(self, name: str, rate: float, capacity: float):
+        self.name = name
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.cooldown_until = 0.0  # time.monotonic() 기준
+        self._updated = time.monotonic()
+        self._strikes = 0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, weight: float = 1.0) -> float:
+        """weight만큼 토큰 예약 후 대기해야 할 시간(초) 반환"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= weight
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            return max(wait, self.cooldown_until - now)
+
+    def set_rate(self, rate: float, capacity: float):
+        """충전 속도/버스트 변경 (쌓인 토큰은 새 capacity로 제한)"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = rate
+            self.capacity = capacity
+            self.tokens = min(self.tokens, capacity)
+
+    def _cooldown_remaining(self) -> float:
+        return self.cooldown_until - time.monotonic()
+
+    def acquire(self, weight: float = 1.0):
+        """토큰 확보까지 대기 (동기)"""
+        wait = self.reserve(weight)
+        while wait > 0:
+            if wait > 1:
+                logger.warning("RateLimit", f"{self.name} 요청 대기 {wait:.1f}초")
+            time.sleep(wait)
+            # 대기 중에 쿨다운이 걸렸으면 끝날 때까지 더 대기
+            wait = self._cooldown_remaining()
+
+    async def acquire_async(self, weight: float = 1.0):
+        """토큰 확보까지 대기 (이벤트 루프를 막지 않음)"""
+        wait = self.reserve(weight)
+        while wait > 0:
+            if wait > 1:
+                logger.warning("RateLimit", f"{self.name} 요청 대기 {wait:.1f}초")
+            await asyncio.sleep(wait)
+            wait = self._cooldown_remaining()
+
+    def penalize(self, retry_after: Optional[float] = None) -> float:
+        """
+        429 응답 반영
+
+        Args:
+            retry_after: Retry-After 헤더 값(초). 없으면 연속 429마다 두 배로 늘리는 대기
+
+        Returns:
+            적용한 쿨다운(초)
+        """
+        with self._lock:
+            now = time.monotonic()
+            # 직전 쿨다운이 끝난 직후 다시 429면 연속으로 본다
+            if now - self.cooldown_until < RATE_LIMIT_MAX_COOLDOWN:
+                self._strikes += 1
+            else:
+                self._strikes = 0
+
+            if retry_after is None:
+                retry_after = RATE_LIMIT_BASE_COOLDOWN * (2 ** self._strikes)
+            cooldown = min(max(retry_after, 0.0), RATE_LIMIT_MAX_COOLDOWN)
+
+            self.cooldown_until = max(self.cooldown_until, now + cooldown)
+            self._refill(now)
+            self.tokens = min(self.tokens, 0.0)
+
+        logger.warning("RateLimit", f"{self.name} 요청 한도 초과 - {cooldown:.1f}초 쿨다운")
+        return cooldown
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_rate_limiter(exchange_id: str, is_testnet: bool = False,
+                     rate_limit_ms: float = None) -> TokenBucket:
+    """
+    거래소별 공유 토큰 버킷 조회 (없으면 생성)
+
+    같은 버킷을 여러 클라이언트가 서로 다른 rate_limit_ms로 요청하면 가장 엄격한(느린)
+    속도로 맞추므로, 클라이언트 생성 순서와 무관하게 예산이 같다.
+
+    Args:
+        exchange_id: 거래소 ID
+        is_testnet: 테스트넷 여부 (테스트넷은 별도 예산)
+        rate_limit_ms: ccxt 거래소의 rateLimit (가중치 1 요청 간 최소 간격 ms)
+    """
+    key = f"{exchange_id}_{'testnet' if is_testnet else 'mainnet'}"
+    rate = 1000.0 / rate_limit_ms if rate_limit_ms else RATE_LIMIT_DEFAULT_PER_SECOND
+    capacity = max(1.0, rate * RATE_LIMIT_BURST_SECONDS)
+    with _buckets_lock:
+        bucket = _buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(key, rate, capacity)
+            _buckets[key] = bucket
+            logger.info("RateLimit",
+                        f"{key} 요청 예산: 초당 {rate:.1f} (버스트 {capacity:.0f})")
+        elif rate_limit_ms and rate < bucket.rate:
+            bucket.set_rate(rate, capacity)
+            logger.info("RateLimit",
+                        f"{key} 요청 예산 조정: 초당 {rate:.1f} (버스트 {capacity:.0f})")
+        return bucket
+
+
+def request_weight(exchange_id: str, method: str, *args) -> float:
+    """
+    ccxt 메서드 호출의 가중치
+
+    심볼 없이 전체를 조회하는 fetch_open_orders/fetch_positions는 ':all' 가중치를 쓴다.
+    """
+    if method in ('fetch_open_orders', 'fetch_positions') and not (args and args[0]):
+        return get_endpoint_weight(exchange_id, method + ':all')
+    return get_endpoint_weight(exchange_id, method)
+
+
+def retry_after_seconds(headers: Optional[Mapping]) -> Optional[float]:
+    """응답 헤더의 Retry-After(초) 값 (없거나 해석 불가면 None)"""
+    if not headers:
+        return None
+    for name, value in headers.items():
+        if name.lower() == 'retry-after':
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                return None
+    return None
@@ -0,0 +1,560 @@
+"""
+거래소별 WebSocket 어댑터
+허브(ws_hub)가 쓰는 거래소 규약(URL, 구독/로그인 메시지, 메시지 해석)을 거래소마다 구현한다.
+해석 결과는 거래소와 무관한 이벤트 dict로 통일한다.
+
+이벤트 형식:
+    ticker:    symbol, last, bid, ask, timestamp
+    kline:     symbol, timeframe, timestamp(ms), open, high, low, close, volume, closed
+    orders:    symbol, order_id, side, type, price, size, filled, average, status, timestamp
+    positions: symbol, side, size, entry_price, mark_price, unrealized_pnl, leverage, timestamp
+               (단방향 모드에서 포지션이 없으면 side는 None)
+"""
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from config.exchanges import parse_symbol, get_ws_endpoint
+from utils.logger import logger
+
+
+# 스트림 종류
+TICKER = 'ticker'
+KLINE = 'kline'
+ORDERS = 'orders'
+POSITIONS = 'positions'
+
+PUBLIC_STREAMS = (TICKER, KLINE)
+PRIVATE_STREAMS = (ORDERS, POSITIONS)
+
+
+class StreamTopic(NamedTuple):
+    """구독 단위 (비공개 스트림은 symbol/timeframe 없이 계정 전체)"""
+    stream: str
+    symbol: Optional[str] = None
+    timeframe: Optional[str] = None
+
+
+class StreamReset(Exception):
+    """서버가 연결을 다시 맺어야 한다고 알림 (listenKey 만료 등)"""
+
+
+def _float(value, default: Optional[float] = 0.0) -> Optional[float]:
+    try:
+        return float(value) if value not in (None, '') else default
+    except (TypeError, ValueError):
+        return default
+
+
+class StreamAdapter:
+    """
+    거래소 WebSocket 규약 베이스
+
+    연결(엔드포인트) 하나에 어댑터 하나가 붙는다.
+    비공개 엔드포인트는 client(AsyncCCXTClient)의 API 키로 로그인한다.
+    """
+
+    exchange_id = ''
+    ENDPOINTS = {TICKER: 'public', KLINE: 'public', ORDERS: 'private', POSITIONS: 'private'}
+    HEARTBEAT_INTERVAL: Optional[float] = None  # 앱 레벨 ping이 필요한 거래소만
+    TIMEFRAMES: Dict[str, str] = {}
+
+    def __init__(self, is_testnet: bool = False, client=None, url: str = None):
+        """
+        Args:
+            is_testnet: 테스트넷 여부
+            client: 비공개 스트림 인증용 AsyncCCXTClient
+            url: 엔드포인트 URL 직접 지정 (로컬 테스트 서버 등)
+        """
+        self.is_testnet = is_testnet
+        self.client = client
+        self.url = url
+
+        exchange = getattr(client, 'exchange', None)
+        self.api_key = getattr(exchange, 'apiKey', '') or ''
+        self.secret = getattr(exchange, 'secret', '') or ''
+        self.passphrase = getattr(exchange, 'password', '') or ''
+
+    # ========== 연결 ==========
+
+    @classmethod
+    def endpoint(cls, stream: str) -> str:
+        """스트림이 쓰는 엔드포인트 이름"""
+        return cls.ENDPOINTS[stream]
+
+    async def connect_url(self, endpoint: str) -> str:
+        """연결할 URL"""
+        return self.url or get_ws_endpoint(self.exchange_id, endpoint, self.is_testnet)
+
+    def login_message(self, endpoint: str) -> Optional[Dict]:
+        """연결 직후 보낼 로그인 메시지 (필요 없으면 None)"""
+        return None
+
+    def login_result(self, message) -> Optional[bool]:
+        """로그인 응답이면 성공 여부, 아니면 None"""
+        return None
+
+    def heartbeat_message(self):
+        """앱 레벨 ping 메시지"""
+        return None
+
+    async def keepalive(self, endpoint: str):
+        """연결 유지 작업 (바이낸스 listenKey 연장 등, 없으면 바로 반환)"""
+        return None
+
+    # ========== 구독 ==========
+
+    @staticmethod
+    def wire_topic(topic: StreamTopic) -> StreamTopic:
+        """거래소에 실제로 보내는 구독 단위 (비공개는 심볼 구분 없이 채널 하나)"""
+        if topic.stream in PRIVATE_STREAMS:
+            return StreamTopic(topic.stream)
+        return topic
+
+    def subscribe_messages(self, topics: List[StreamTopic],
+                           subscribe: bool = True) -> List[Dict]:
+        """구독/해제 메시지 목록"""
+        raise NotImplementedError
+
+    # ========== 메시지 해석 ==========
+
+    @staticmethod
+    def decode(raw) -> Optional[Dict]:
+        """수신 프레임 JSON 해석 ('pong' 등 텍스트 응답은 None)"""
+        if isinstance(raw, bytes):
+            raw = raw.decode('utf-8')
+        if not raw or raw[0] != '{':
+            return None
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return None
+
+    def parse(self, raw) -> List[Tuple[StreamTopic, Dict]]:
+        """수신 메시지를 (토픽, 이벤트) 목록으로 변환"""
+        message = self.decode(raw)
+        if message is None:
+            return []
+        return self.parse_message(message)
+
+    def parse_message(self, message: Dict) -> List[Tuple[StreamTopic, Dict]]:
+        raise NotImplementedError
+
+    # ========== 심볼 ==========
+
+    def market_id(self, symbol: str) -> str:
+        """통일 심볼 → 거래소 심볼 (BTC/USDT:USDT → BTCUSDT)"""
+        base, quote = parse_symbol(symbol)
+        return f"{base}{quote}"
+
+    def symbol_from_id(self, market_id: str) -> str:
+        """거래소 심볼 → 통일 심볼 (USDT 무기한 기준)"""
+        for quote in ('USDT', 'USDC'):
+            if market_id.endswith(quote) and len(market_id) > len(quote):
+                return f"{market_id[:-len(quote)]}/{quote}:{quote}"
+        return market_id
+
+    def kline_interval(self, timeframe: str) -> str:
+        return self.TIMEFRAMES.get(timeframe, timeframe)
+
+    def timeframe_from_interval(self, interval: str) -> str:
+        for timeframe, value in self.TIMEFRAMES.items():
+            if value == interval:
+                return timeframe
+        return interval
+
+
+class OKXStreamAdapter(StreamAdapter):
+    """OKX v5 (캔들은 business 엔드포인트)"""
+
+    exchange_id = 'okx'
+    ENDPOINTS = {TICKER: 'public', KLINE: 'business', ORDERS: 'private', POSITIONS: 'private'}
+    HEARTBEAT_INTERVAL = 25  # 30초 동안 메시지가 없으면 서버가 끊음
+    # 일봉은 UTC 기준 캔들 채널
+    TIMEFRAMES = {"1m": "1m", "5m": "5m", "15m": "15m", "1h": "1H", "4h": "4H", "1d": "1Dutc"}
+    ORDER_STATUS = {'live': 'open', 'partially_filled': 'open',
+                    'filled': 'closed', 'canceled': 'canceled', 'mmp_canceled': 'canceled'}
+
+    def market_id(self, symbol: str) -> str:
+        base, quote = parse_symbol(symbol)
+        return f"{base}-{quote}-SWAP"
+
+    def symbol_from_id(self, market_id: str) -> str:
+        parts = market_id.split('-')
+        if len(parts) >= 2:
+            return f"{parts[0]}/{parts[1]}:{parts[1]}"
+        return market_id
+
+    def login_message(self, endpoint: str) -> Optional[Dict]:
+        if endpoint != 'private':
+            return None
+        timestamp = str(int(time.time()))
+        mac = hmac.new(self.secret.encode('utf-8'),
+                       (timestamp + 'GET' + '/users/self/verify').encode('utf-8'),
+                       hashlib.sha256)
+        return {
+            "op": "login",
+            "args": [{
+                "apiKey": self.api_key,
+                "passphrase": self.passphrase,
+                "timestamp": timestamp,
+                "sign": base64.b64encode(mac.digest()).decode('utf-8'),
+            }]
+        }
+
+    def login_result(self, message) -> Optional[bool]:
+        if isinstance(message, dict) and message.get('event') in ('login', 'error'):
+            return message.get('event') == 'login' and str(message.get('code')) == '0'
+        return None
+
+    def heartbeat_message(self):
+        return 'ping'
+
+    def subscribe_messages(self, topics: List[StreamTopic],
+                           subscribe: bool = True) -> List[Dict]:
+        args = []
+        for topic in topics:
+            if topic.stream == TICKER:
+                args.append({"channel": "tickers", "instId": self.market_id(topic.symbol)})
+            elif topic.stream == KLINE:
+                args.append({"channel": f"candle{self.kline_interval(topic.timeframe)}",
+                             "instId": self.market_id(topic.symbol)})
+            elif topic.stream in PRIVATE_STREAMS:
+                args.append({"channel": topic.stream, "instType": "SWAP"})
+        if not args:
+            return []
+        return [{"op": "subscribe" if subscribe else "unsubscribe", "args": args}]
+
+    def parse_message(self, message: Dict) -> List[Tuple[StreamTopic, Dict]]:
+        arg = message.get('arg') or {}
+        channel = arg.get('channel', '')
+        data = message.get('data')
+        if not data or 'event' in message:
+            return []
+
+        events = []
+        if channel == 'tickers':
+            for item in data:
+                symbol = self.symbol_from_id(item.get('instId', ''))
+                events.append((StreamTopic(TICKER, symbol), {
+                    'symbol': symbol,
+                    'last': _float(item.get('last')),
+                    'bid': _float(item.get('bidPx'), None),
+                    'ask': _float(item.get('askPx'), None),
+                    'timestamp': int(_float(item.get('ts'))),
+                }))
+        elif channel.startswith('candle'):
+            symbol = self.symbol_from_id(arg.get('instId', ''))
+            timeframe = self.timeframe_from_interval(channel[len('candle'):])
+            for row in data:
+                events.append((StreamTopic(KLINE, symbol, timeframe), {
+                    'symbol': symbol,
+                    'timeframe': timeframe,
+                    'timestamp': int(row[0]),
+                    'open': _float(row[1]),
+                    'high': _float(row[2]),
+                    'low': _float(row[3]),
+                    'close': _float(row[4]),
+                    'volume': _float(row[5]),
+                    'closed': len(row) > 8 and row[8] == '1',
+                }))
+        elif channel == ORDERS:
+            for item in data:
+                symbol = self.symbol_from_id(item.get('instId', ''))
+                events.append((StreamTopic(ORDERS, symbol), {
+                    'symbol': symbol,
+                    'order_id': item.get('ordId', ''),
+                    'side': item.get('side', ''),
+                    'type': item.get('ordType', ''),
+                    'price': _float(item.get('px')),
+                    'size': _float(item.get('sz')),
+                    'filled': _float(item.get('accFillSz')),
+                    'average': _float(item.get('avgPx')),
+                    'status': self.ORDER_STATUS.get(item.get('state'), item.get('state', '')),
+                    'timestamp': int(_float(item.get('uTime'))),
+                }))
+        elif channel == POSITIONS:
+            for item in data:
+                symbol = self.symbol_from_id(item.get('instId', ''))
+                size = _float(item.get('pos'))
+                side = item.get('posSide', 'net')
+                if side not in ('long', 'short'):
+                    side = ('long' if size > 0 else 'short') if size else None
+                events.append((StreamTopic(POSITIONS, symbol), {
+                    'symbol': symbol,
+                    'side': side,
+                    'size': abs(size),
+                    'entry_price': _float(item.get('avgPx')),
+                    'mark_price': _float(item.get('markPx')),
+                    'unrealized_pnl': _float(item.get('upl')),
+                    'leverage': _float(item.get('lever'), 1),
+                    'timestamp': int(_float(item.get('uTime'))),
+                }))
+        return events
+
+
+class BinanceStreamAdapter(StreamAdapter):
+    """
+    바이낸스 USDT-M 선물
+
+    공개 스트림은 SUBSCRIBE 메서드로 한 연결에 다중화하고,
+    비공개 스트림은 REST로 받은 listenKey 주소로 연결해 계정 이벤트를 모두 받는다.
+    """
+
+    exchange_id = 'binance'
+    LISTEN_KEY_KEEPALIVE = 30 * 60  # listenKey는 60분 동안 연장하지 않으면 만료
+    TIMEFRAMES = {"1m": "1m", "5m": "5m", "15m": "15m", "1h": "1h", "4h": "4h", "1d": "1d"}
+    ORDER_STATUS = {'NEW': 'open', 'PARTIALLY_FILLED': 'open', 'FILLED': 'closed',
+                    'CANCELED': 'canceled', 'EXPIRED': 'canceled', 'REJECTED': 'rejected'}
+
+    def __init__(self, is_testnet: bool = False, client=None, url: str = None):
+        super().__init__(is_testnet, client, url)
+        self._request_id = 0
+
+    async def connect_url(self, endpoint: str) -> str:
+        url = await super().connect_url(endpoint)
+        if endpoint != 'private':
+            return url
+        response = await self.client._request('fapiPrivatePostListenKey')
+        return f"{url.rstrip('/')}/{response['listenKey']}"
+
+    async def keepalive(self, endpoint: str):
+        if endpoint != 'private':
+            return
+        while True:
+            await asyncio.sleep(self.LISTEN_KEY_KEEPALIVE)
+            try:
+                await self.client._request('fapiPrivatePutListenKey')
+            except Exception as e:
+                logger.warning("WebSocket", f"binance listenKey 연장 실패: {str(e)}")
+
+    def subscribe_messages(self, topics: List[StreamTopic],
+                           subscribe: bool = True) -> List[Dict]:
+        params = []
+        for topic in topics:
+            market_id = self.market_id(topic.symbol).lower() if topic.symbol else ''
+            if topic.stream == TICKER:
+                params.append(f"{market_id}@ticker")
+            elif topic.stream == KLINE:
+                params.append(f"{market_id}@kline_{self.kline_interval(topic.timeframe)}")
+            # 비공개 스트림은 listenKey 연결만으로 수신
+        if not params:
+            return []
+        self._request_id += 1
+        return [{"method": "SUBSCRIBE" if subscribe else "UNSUBSCRIBE",
+                 "params": params, "id": self._request_id}]
+
+    def parse_message(self, message: Dict) -> List[Tuple[StreamTopic, Dict]]:
+        event_type = message.get('e')
+        events = []
+
+        if event_type == '24hrTicker':
+            symbol = self.symbol_from_id(message.get('s', ''))
+            events.append((StreamTopic(TICKER, symbol), {
+                'symbol': symbol,
+                'last': _float(message.get('c')),
+                'bid': None,
+                'ask': None,
+                'timestamp': int(_float(message.get('E'))),
+            }))
+        elif event_type == 'kline':
+            kline = message.get('k') or {}
+            symbol = self.symbol_from_id(kline.get('s') or message.get('s', ''))
+            timeframe = self.timeframe_from_interval(kline.get('i', ''))
+            events.append((StreamTopic(KLINE, symbol, timeframe), {
+                'symbol': symbol,
+                'timeframe': timeframe,
+                'timestamp': int(_float(kline.get('t'))),
+                'open': _float(kline.get('o')),
+                'high': _float(kline.get('h')),
+                'low': _float(kline.get('l')),
+                'close': _float(kline.get('c')),
+                'volume': _float(kline.get('v')),
+                'closed': bool(kline.get('x')),
+            }))
+        elif event_type == 'ORDER_TRADE_UPDATE':
+            order = message.get('o') or {}
+            symbol = self.symbol_from_id(order.get('s', ''))
+            events.append((StreamTopic(ORDERS, symbol), {
+                'symbol': symbol,
+                'order_id': str(order.get('i', '')),
+                'side': order.get('S', '').lower(),
+                'type': order.get('o', '').lower(),
+                'price': _float(order.get('p')),
+                'size': _float(order.get('q')),
+                'filled': _float(order.get('z')),
+                'average': _float(order.get('ap')),
+                'status': self.ORDER_STATUS.get(order.get('X'), str(order.get('X', '')).lower()),
+                'timestamp': int(_float(order.get('T') or message.get('E'))),
+            }))
+        elif event_type == 'ACCOUNT_UPDATE':
+            for item in (message.get('a') or {}).get('P', []):
+                symbol = self.symbol_from_id(item.get('s', ''))
+                size = _float(item.get('pa'))
+                side = item.get('ps', 'BOTH').lower()
+                if side not in ('long', 'short'):
+                    side = ('long' if size > 0 else 'short') if size else None
+                events.append((StreamTopic(POSITIONS, symbol), {
+                    'symbol': symbol,
+                    'side': side,
+                    'size': abs(size),
+                    'entry_price': _float(item.get('ep')),
+                    'mark_price': None,  # ACCOUNT_UPDATE에는 마크 가격이 없음
+                    'unrealized_pnl': _float(item.get('up')),
+                    'leverage': None,
+                    'timestamp': int(_float(message.get('E'))),
+                }))
+        elif event_type == 'listenKeyExpired':
+            raise StreamReset("listenKey 만료")
+        return events
+
+
+class BybitStreamAdapter(StreamAdapter):
+    """바이비트 v5 (linear)"""
+
+    exchange_id = 'bybit'
+    HEARTBEAT_INTERVAL = 20  # 권장 ping 주기
+    TIMEFRAMES = {"1m": "1", "5m": "5", "15m": "15", "1h": "60", "4h": "240", "1d": "D"}
+    ORDER_STATUS = {'New': 'open', 'PartiallyFilled': 'open', 'Untriggered': 'open',
+                    'Filled': 'closed', 'Cancelled': 'canceled',
+                    'PartiallyFilledCanceled': 'canceled', 'Deactivated': 'canceled',
+                    'Rejected': 'rejected'}
+
+    def __init__(self, is_testnet: bool = False, client=None, url: str = None):
+        super().__init__(is_testnet, client, url)
+        # 티커 delta 메시지는 바뀐 필드만 오므로 심볼별 최신 값에 합친다
+        self._tickers: Dict[str, Dict] = {}
+
+    def login_message(self, endpoint: str) -> Optional[Dict]:
+        if endpoint != 'private':
+            return None
+        expires = int((time.time() + 10) * 1000)
+        signature = hmac.new(self.secret.encode('utf-8'),
+                             f"GET/realtime{expires}".encode('utf-8'),
+                             hashlib.sha256).hexdigest()
+        return {"op": "auth", "args": [self.api_key, expires, signature]}
+
+    def login_result(self, message) -> Optional[bool]:
+        if isinstance(message, dict) and message.get('op') == 'auth':
+            return bool(message.get('success'))
+        return None
+
+    def heartbeat_message(self):
+        return {"op": "ping"}
+
+    def subscribe_messages(self, topics: List[StreamTopic],
+                           subscribe: bool = True) -> List[Dict]:
+        args = []
+        for topic in topics:
+            if topic.stream == TICKER:
+                args.append(f"tickers.{self.market_id(topic.symbol)}")
+            elif topic.stream == KLINE:
+                args.append(f"kline.{self.kline_interval(topic.timeframe)}."
+                            f"{self.market_id(topic.symbol)}")
+            elif topic.stream == ORDERS:
+                args.append("order")
+            elif topic.stream == POSITIONS:
+                args.append("position")
+            if not subscribe and topic.stream == TICKER:
+                self._tickers.pop(self.market_id(topic.symbol), None)
+        if not args:
+            return []
+        return [{"op": "subscribe" if subscribe else "unsubscribe", "args": args}]
+
+    def parse_message(self, message: Dict) -> List[Tuple[StreamTopic, Dict]]:
+        topic_name = message.get('topic', '')
+        data = message.get('data')
+        if not topic_name or data is None:
+            return []
+
+        events = []
+        if topic_name.startswith('tickers.'):
+            market_id = topic_name.split('.', 1)[1]
+            if message.get('type') == 'snapshot':
+                self._tickers[market_id] = {}
+            ticker = self._tickers.setdefault(market_id, {})
+            ticker.update({k: v for k, v in data.items() if v not in (None, '')})
+            if 'lastPrice' not in ticker:
+                return []
+            symbol = self.symbol_from_id(market_id)
+            events.append((StreamTopic(TICKER, symbol), {
+                'symbol': symbol,
+                'last': _float(ticker.get('lastPrice')),
+                'bid': _float(ticker.get('bid1Price'), None),
+                'ask': _float(ticker.get('ask1Price'), None),
+                'timestamp': int(_float(message.get('ts'))),
+            }))
+        elif topic_name.startswith('kline.'):
+            _, interval, market_id = topic_name.split('.', 2)
+            symbol = self.symbol_from_id(market_id)
+            timeframe = self.timeframe_from_interval(interval)
+            for item in data:
+                events.append((StreamTopic(KLINE, symbol, timeframe), {
+                    'symbol': symbol,
+                    'timeframe': timeframe,
+                    'timestamp': int(_float(item.get('start'))),
+                    'open': _float(item.get('open')),
+                    'high': _float(item.get('high')),
+                    'low': _float(item.get('low')),
+                    'close': _float(item.get('close')),
+                    'volume': _float(item.get('volume')),
+                    'closed': bool(item.get('confirm')),
+                }))
+        elif topic_name == 'order':
+            for item in data:
+                if item.get('category', 'linear') != 'linear':
+                    continue
+                symbol = self.symbol_from_id(item.get('symbol', ''))
+                events.append((StreamTopic(ORDERS, symbol), {
+                    'symbol': symbol,
+                    'order_id': item.get('orderId', ''),
+                    'side': item.get('side', '').lower(),
+                    'type': item.get('orderType', '').lower(),
+                    'price': _float(item.get('price')),
+                    'size': _float(item.get('qty')),
+                    'filled': _float(item.get('cumExecQty')),
+                    'average': _float(item.get('avgPrice')),
+                    'status': self.ORDER_STATUS.get(item.get('orderStatus'),
+                                                    item.get('orderStatus', '')),
+                    'timestamp': int(_float(item.get('updatedTime'))),
+                }))
+        elif topic_name == 'position':
+            for item in data:
+                if item.get('category', 'linear') != 'linear':
+                    continue
+                symbol = self.symbol_from_id(item.get('symbol', ''))
+                side = {'Buy': 'long', 'Sell': 'short'}.get(item.get('side'))
+                if side is None:
+                    # 포지션 없음: 헤지 모드면 positionIdx로 방향 구분
+                    side = {1: 'long', 2: 'short'}.get(item.get('positionIdx'))
+                events.append((StreamTopic(POSITIONS, symbol), {
+                    'symbol': symbol,
+                    'side': side,
+                    'size': abs(_float(item.get('size'))),
+                    'entry_price': _float(item.get('entryPrice')),
+                    'mark_price': _float(item.get('markPrice')),
+                    'unrealized_pnl': _float(item.get('unrealisedPnl')),
+                    'leverage': _float(item.get('leverage'), 1),
+                    'timestamp': int(_float(item.get('updatedTime'))),
+                }))
+        return events
+
+
+# 거래소 ID → 어댑터 (새 거래소는 여기에 등록)
+STREAM_ADAPTERS = {
+    'okx': OKXStreamAdapter,
+    'binance': BinanceStreamAdapter,
+    'bybit': BybitStreamAdapter,
+}
+
+
+def get_stream_adapter_class(exchange_id: str):
+    """거래소 어댑터 클래스 조회"""
+    adapter_class = STREAM_ADAPTERS.get(exchange_id)
+    if adapter_class is None:
+        raise ValueError(f"WebSocket 미지원 거래소: {exchange_id}")
+    return adapter_class
@@ -0,0 +1,316 @@
+"""
+멀티 거래소 WebSocket 허브
+거래소/엔드포인트마다 연결 하나로 구독한 모든 심볼을 받아 구독자 콜백에 전달한다.
+연결은 공유 이벤트 루프(async_loop)에서 돌고, 끊기면 지수 백오프로 재연결한 뒤 전부 다시 구독한다.
+"""
+import asyncio
+import itertools
+import json
+from typing import Callable, Dict, List, Optional, Tuple
+
+import websockets
+
+from api.async_loop import async_loop
+from api.ws_adapters import (
+    StreamAdapter, StreamTopic, StreamReset, PRIVATE_STREAMS, get_stream_adapter_class
+)
+from config.settings import (
+    WS_PING_INTERVAL, WS_PING_TIMEOUT, WS_LOGIN_TIMEOUT,
+    WS_RECONNECT_BASE_DELAY, WS_RECONNECT_MAX_DELAY
+)
+from utils.logger import logger
+
+
+class Subscription:
+    """구독 핸들 (hub.unsubscribe(sub) 또는 sub.cancel()로 해제)"""
+
+    _ids = itertools.count(1)
+
+    def __init__(self, hub: "WebSocketHub", key: Tuple, topic: StreamTopic,
+                 callback: Callable[[Dict], None]):
+        self.id = next(self._ids)
+        self.hub = hub
+        self.key = key
+        self.topic = topic
+        self.callback = callback
+
+    def cancel(self):
+        self.hub.unsubscribe(self)
+
+
+class StreamConnection:
+    """
+    거래소 엔드포인트 하나의 WebSocket 연결 (루프 스레드 전용)
+
+    - 구독자가 생기면 연결하고 마지막 구독자가 빠지면 닫는다
+    - 같은 토픽은 거래소에 한 번만 구독하고 구독자들에게 나눠 준다
+    - 재연결 시 로그인 후 현재 토픽을 모두 다시 구독한다
+    """
+
+    def __init__(self, adapter: StreamAdapter, endpoint: str, name: str):
+        self.adapter = adapter
+        self.endpoint = endpoint
+        self.name = name
+
+        self.listeners: Dict[StreamTopic, List[Subscription]] = {}
+        self.ws = None
+        self.connected = asyncio.Event()
+        self.reconnects = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def wire_topics(self) -> List[StreamTopic]:
+        """거래소에 구독 중인 토픽"""
+        return list(dict.fromkeys(self.adapter.wire_topic(t) for t in self.listeners))
+
+    # ========== 구독 관리 ==========
+
+    def add(self, sub: Subscription):
+        wire = self.adapter.wire_topic(sub.topic)
+        is_new = wire not in self.wire_topics()
+        self.listeners.setdefault(sub.topic, []).append(sub)
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+        elif is_new and self.connected.is_set():
+            asyncio.ensure_future(self._send_all(self.adapter.subscribe_messages([wire])))
+
+    def remove(self, sub: Subscription):
+        subs = self.listeners.get(sub.topic, [])
+        if sub in subs:
+            subs.remove(sub)
+        if subs:
+            return
+        self.listeners.pop(sub.topic, None)
+
+        if not self.listeners:
+            self.close()
+            return
+        wire = self.adapter.wire_topic(sub.topic)
+        if wire not in self.wire_topics() and self.connected.is_set():
+            asyncio.ensure_future(
+                self._send_all(self.adapter.subscribe_messages([wire], subscribe=False))
+            )
+
+    def close(self):
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+    async def wait_closed(self):
+        task = self._task
+        self.close()
+        if task is not None:
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+    # ========== 연결 루프 ==========
+
+    async def _run(self):
+        delay = WS_RECONNECT_BASE_DELAY
+        while self.listeners:
+            try:
+                await self._session()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("WebSocket", f"{self.name} 연결 끊김: {str(e)}")
+
+            if self.connected.is_set():
+                # 정상적으로 붙어 있다가 끊긴 경우 대기 시간 초기화
+                delay = WS_RECONNECT_BASE_DELAY
+            self.connected.clear()
+            if not self.listeners:
+                break
+
+            logger.info("WebSocket", f"{self.name} {delay}초 후 재연결")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, WS_RECONNECT_MAX_DELAY)
+            self.reconnects += 1
+
+    async def _session(self):
+        url = await self.adapter.connect_url(self.endpoint)
+        async with websockets.connect(url, ping_interval=WS_PING_INTERVAL,
+                                      ping_timeout=WS_PING_TIMEOUT) as ws:
+            self.ws = ws
+            background = []
+            try:
+                await self._login()
+                # 구독 전송을 기다리는 동안 add()로 늘어난 토픽은 add()가 보내지 않으므로
+                # (connected 설정 전) 보낸 토픽과 다시 비교해 빠진 것이 없을 때까지 구독
+                sent = []
+                pending = self.wire_topics()
+                while pending:
+                    await self._send_all(self.adapter.subscribe_messages(pending))
+                    sent += pending
+                    pending = [t for t in self.wire_topics() if t not in sent]
+                self.connected.set()
+                logger.info("WebSocket", f"{self.name} 연결 (토픽 {len(self.wire_topics())}개)")
+
+                if self.adapter.HEARTBEAT_INTERVAL:
+                    background.append(asyncio.ensure_future(self._heartbeat()))
+                background.append(asyncio.ensure_future(self.adapter.keepalive(self.endpoint)))
+
+                async for raw in ws:
+                    self._dispatch(raw)
+            finally:
+                for task in background:
+                    task.cancel()
+                self.ws = None
+
+    async def _login(self):
+        message = self.adapter.login_message(self.endpoint)
+        if message is None:
+            return
+        await self._send(message)
+
+        async def wait_ack():
+            async for raw in self.ws:
+                result = self.adapter.login_result(self.adapter.decode(raw))
+                if result is not None:
+                    return result
+            return False
+
+        if not await asyncio.wait_for(wait_ack(), WS_LOGIN_TIMEOUT):
+            raise ConnectionError("로그인 실패")
+
+    async def _heartbeat(self):
+        message = self.adapter.heartbeat_message()
+        while True:
+            await asyncio.sleep(self.adapter.HEARTBEAT_INTERVAL)
+            await self._send(message)
+
+    async def _send(self, message):
+        if self.ws is None:
+            return
+        await self.ws.send(message if isinstance(message, str) else json.dumps(message))
+
+    async def _send_all(self, messages: List):
+        for message in messages:
+            await self._send(message)
+
+    def _dispatch(self, raw):
+        try:
+            events = self.adapter.parse(raw)
+        except StreamReset:
+            raise
+        except Exception as e:
+            logger.warning("WebSocket", f"{self.name} 메시지 해석 실패: {str(e)}")
+            return
+
+        for topic, event in events:
+            # 비공개 스트림은 계정 전체 구독자와 해당 심볼 구독자 모두에게 전달
+            targets = [topic]
+            if topic.stream in PRIVATE_STREAMS and topic.symbol:
+                targets.append(StreamTopic(topic.stream))
+            for target in targets:
+                for sub in list(self.listeners.get(target, ())):
+                    try:
+                        sub.callback(event)
+                    except Exception as e:
+                        logger.error("WebSocket", f"{self.name} 구독 콜백 오류: {str(e)}")
+
+
+class WebSocketHub:
+    """
+    거래소 WebSocket 허브 (싱글톤 ws_hub)
+
+    - subscribe(): 어느 스레드에서나 호출 가능, 콜백은 루프 스레드에서 실행되므로 짧게 처리
+      (Qt 위젯 갱신은 시그널로 넘길 것)
+    - 공개 스트림은 (거래소, 네트워크, 엔드포인트)마다, 비공개 스트림은 계정마다 연결 하나
+    - url_overrides로 엔드포인트 주소를 바꿔 로컬 테스트 서버에 붙일 수 있다
+      예: {('binance', 'public'): 'ws://127.0.0.1:8765'}
+    """
+
+    def __init__(self, url_overrides: Dict[Tuple[str, str], str] = None):
+        self.url_overrides = dict(url_overrides or {})
+        self._connections: Dict[Tuple, StreamConnection] = {}
+        self._closer_registered = False
+
+    def subscribe(self, exchange_id: str, stream: str, callback: Callable[[Dict], None],
+                  symbol: str = None, timeframe: str = None, is_testnet: bool = False,
+                  client=None) -> Subscription:
+        """
+        스트림 구독
+
+        Args:
+            exchange_id: 거래소 ID
+            stream: 'ticker' | 'kline' | 'orders' | 'positions'
+            callback: 정규화된 이벤트 dict를 받는 함수
+            symbol: 통일 심볼 (비공개 스트림은 생략 시 계정 전체)
+            timeframe: kline 타임프레임
+            is_testnet: 테스트넷 여부
+            client: 비공개 스트림 인증용 AsyncCCXTClient
+        """
+        adapter_class = get_stream_adapter_class(exchange_id)
+        endpoint = adapter_class.endpoint(stream)
+        if stream in PRIVATE_STREAMS:
+            if client is None:
+                raise ValueError("비공개 스트림은 인증된 client가 필요합니다")
+            account = client.exchange.apiKey
+        else:
+            if not symbol:
+                raise ValueError("공개 스트림은 symbol이 필요합니다")
+            account = ''
+
+        key = (exchange_id, is_testnet, endpoint, account)
+        sub = Subscription(self, key, StreamTopic(stream, symbol, timeframe), callback)
+        self._call_in_loop(self._add, sub, adapter_class, client)
+        return sub
+
+    def unsubscribe(self, sub: Subscription):
+        """구독 해제 (마지막 구독자면 연결 종료)"""
+        self._call_in_loop(self._remove, sub)
+
+    def is_connected(self, sub: Subscription) -> bool:
+        """구독이 붙은 연결이 현재 수신 중인지 여부"""
+        conn = self._connections.get(sub.key)
+        return conn is not None and conn.connected.is_set()
+
+    def connection(self, exchange_id: str, endpoint: str, is_testnet: bool = False,
+                   account: str = '') -> Optional[StreamConnection]:
+        """연결 조회 (상태 확인용)"""
+        return self._connections.get((exchange_id, is_testnet, endpoint, account))
+
+    async def close(self):
+        """모든 연결 종료"""
+        connections, self._connections = list(self._connections.values()), {}
+        for conn in connections:
+            conn.listeners.clear()
+            await conn.wait_closed()
+
+    # ========== 루프 스레드 ==========
+
+    def _call_in_loop(self, func, *args):
+        if async_loop.in_loop_thread():
+            func(*args)
+        else:
+            async_loop.loop.call_soon_threadsafe(func, *args)
+
+    def _add(self, sub: Subscription, adapter_class, client):
+        conn = self._connections.get(sub.key)
+        if conn is None:
+            exchange_id, is_testnet, endpoint, _ = sub.key
+            adapter = adapter_class(is_testnet, client,
+                                    self.url_overrides.get((exchange_id, endpoint)))
+            network = 'testnet' if is_testnet else 'mainnet'
+            conn = StreamConnection(adapter, endpoint, f"{exchange_id}_{network}/{endpoint}")
+            self._connections[sub.key] = conn
+
+            if not self._closer_registered:
+                self._closer_registered = True
+                async_loop.add_closer(self.close)
+        conn.add(sub)
+
+    def _remove(self, sub: Subscription):
+        conn = self._connections.get(sub.key)
+        if conn is None:
+            return
+        conn.remove(sub)
+        if not conn.listeners:
+            del self._connections[sub.key]
+
+
+# 전역 허브
+ws_hub = WebSocketHub()
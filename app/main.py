@@ -202,6 +202,20 @@ def main():
             print("[ERROR] Database initialization failed")
             sys.exit(1)
         print("DEBUG: Database initialized successfully")
+
+        # DB 쓰기 스레드 시작 (종료 시 남은 쓰기를 모두 저장)
+        from database.writer import db_writer
+        db_writer.start()
+        app.aboutToQuit.connect(db_writer.shutdown)
+
+        # 비동기 거래소 클라이언트 루프 (사용한 경우에만 세션/연결 정리)
+        from api.async_loop import async_loop
+        app.aboutToQuit.connect(async_loop.shutdown)
+
+        # 거래소 마켓 캐시 준비 (디스크 캐시 로드, 오래된 것은 백그라운드 갱신)
+        from api.market_cache import warmup_market_caches
+        from config.settings import DEFAULT_EXCHANGES
+        warmup_market_caches(DEFAULT_EXCHANGES)
     except Exception as e:
         print(f"DEBUG: Database initialization error: {e}")
         traceback.print_exc()
@@ -240,4 +254,7 @@ def main():
 
 
 if __name__ == "__main__":
+    # PyInstaller exe에서 최적화 워커 프로세스(spawn)가 GUI를 다시 띄우지 않도록 가장 먼저 호출
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -8,6 +8,7 @@ from typing import Dict, List, Optional, Callable
 from dataclasses import dataclass, field, asdict
 from PySide6.QtCore import QObject, Signal
 
+from backtest.vectorized import CandleArrays, EquityCurve, VectorizedBacktest, load_candle_arrays
 from database.repository import CandlesRepository, BacktestResultsRepository
 from config.exchanges import get_exchange_fee
 from utils.logger import logger
@@ -44,10 +45,19 @@ class BacktestConfig:
     # 수수료
     use_exchange_fee: bool = True
     custom_fee: float = 0.0005  # 0.05%
+
+    # 실행 방식: vectorized (NumPy 빠른 경로) 또는 loop (봉 단위 순회, 기준 구현)
+    engine: str = "vectorized"
     
     def to_dict(self) -> dict:
         return asdict(self)
 
+    def get_fee_rate(self) -> float:
+        """적용 수수료율 (거래소 taker 수수료 또는 직접 지정)"""
+        if self.use_exchange_fee:
+            return get_exchange_fee(self.exchange_id, 'taker')
+        return self.custom_fee
+
 
 @dataclass
 class Trade:
@@ -65,7 +75,8 @@ class Trade:
     martingale_level: int = 0
     
     def to_dict(self) -> dict:
-        return asdict(self)
+        # 필드가 모두 스칼라이므로 asdict의 재귀 복사 없이 변환
+        return dict(self.__dict__)
 
 
 @dataclass
@@ -113,6 +124,10 @@ class BacktestEngine(QObject):
         
         # 수수료
         self.fee_rate = 0.0
+
+        # 실행 중인 벡터화 백테스트 (중지 요청 전달용)
+        self._vectorized: Optional[VectorizedBacktest] = None
+        self._equity = None  # 빠른 경로 자산 배열
     
     def run(self, config: BacktestConfig) -> Optional[Dict]:
         """
@@ -137,33 +152,17 @@ class BacktestEngine(QObject):
             
             # 캔들 데이터 로드
             candles = self._load_candles()
-            if not candles:
+            if not len(candles):
                 self.error_occurred.emit("캔들 데이터가 없습니다.")
                 return None
             
             total_candles = len(candles)
             logger.info("Backtest", f"총 {total_candles}개 캔들 로드")
             
-            # 캔들 순회하며 백테스트
-            for i, candle in enumerate(candles):
-                if not self.is_running:
-                    logger.warning("Backtest", "백테스트 중단됨")
-                    break
-                
-                self._process_candle(candle, i)
-                
-                # 진행률 업데이트 (100개마다)
-                if i % 100 == 0:
-                    self.progress_updated.emit(
-                        f"처리 중: {candle['timestamp']}",
-                        i + 1,
-                        total_candles
-                    )
-            
-            # 열린 포지션 강제 청산 (백테스트 종료)
-            if self.position.is_open:
-                last_candle = candles[-1]
-                self._close_position(last_candle, "백테스트 종료")
+            if config.engine == "vectorized":
+                self._run_vectorized(candles)
+            else:
+                self._run_loop(candles)
             
             # 결과 계산
             result = self._calculate_results()
@@ -188,21 +187,70 @@ class BacktestEngine(QObject):
         finally:
             self.is_running = False
     
+    def _run_loop(self, candles: List[Dict]):
+        """봉 단위 순회 실행 (기준 구현)"""
+        total_candles = len(candles)
+
+        # 캔들 순회하며 백테스트
+        for i, candle in enumerate(candles):
+            if not self.is_running:
+                logger.warning("Backtest", "백테스트 중단됨")
+                break
+            
+            self._process_candle(candle, i)
+            
+            # 진행률 업데이트 (100개마다)
+            if i % 100 == 0:
+                self.progress_updated.emit(
+                    f"처리 중: {candle['timestamp']}",
+                    i + 1,
+                    total_candles
+                )
+        
+        # 열린 포지션 강제 청산 (백테스트 종료)
+        if self.position.is_open:
+            last_candle = candles[-1]
+            self._close_position(last_candle, "백테스트 종료")
+
+    def _run_vectorized(self, arrays: CandleArrays):
+        """NumPy 빠른 경로 실행 (순회 방식과 같은 거래/자산 곡선)"""
+        total_candles = len(arrays)
+
+        self._vectorized = VectorizedBacktest(self.config, self.fee_rate)
+        self.progress_updated.emit("벡터 연산 실행 중", 0, total_candles)
+
+        trades, capital, equity = self._vectorized.run(arrays)
+        self._vectorized = None
+
+        self.trades = trades
+        self.capital = capital
+        self._equity = equity
+        # 봉별 딕셔너리는 결과를 읽을 때 생성
+        count = len(equity)
+        self.equity_curve = EquityCurve(arrays.timestamps[:count], equity, arrays.close[:count])
+
+        if len(equity) < total_candles:
+            logger.warning("Backtest", "백테스트 중단됨")
+        self.progress_updated.emit("벡터 연산 완료", len(equity), total_candles)
+
     def _initialize(self):
         """백테스트 초기화"""
         self.capital = self.config.initial_capital
         self.position = Position()
         self.trades = []
         self.equity_curve = []
+        self._equity = None
         
         # 수수료 설정
-        if self.config.use_exchange_fee:
-            self.fee_rate = get_exchange_fee(self.config.exchange_id, 'taker')
-        else:
-            self.fee_rate = self.config.custom_fee
+        self.fee_rate = self.config.get_fee_rate()
     
-    def _load_candles(self) -> List[Dict]:
-        """캔들 데이터 로드"""
+    def _load_candles(self):
+        """캔들 데이터 로드 (빠른 경로는 컬럼 캐시 배열, 순회 방식은 딕셔너리 리스트)"""
+        if self.config.engine == "vectorized":
+            return load_candle_arrays(
+                self.candles_repo, self.config.exchange_id, self.config.symbol,
+                self.config.timeframe, self.config.start_date, self.config.end_date
+            )
         return self.candles_repo.get_candles_for_backtest(
             exchange_id=self.config.exchange_id,
             symbol=self.config.symbol,
@@ -450,12 +498,23 @@ class BacktestEngine(QObject):
         """결과 계산"""
         from backtest.metrics import BacktestMetrics
         
-        metrics = BacktestMetrics.calculate(
-            trades=self.trades,
-            equity_curve=self.equity_curve,
-            initial_capital=self.config.initial_capital,
-            final_capital=self.capital
-        )
+        if self._equity is not None:
+            # 빠른 경로: 자산 배열 그대로 사용
+            metrics = BacktestMetrics.calculate_from_arrays(
+                trades=self.trades,
+                equity=self._equity,
+                start_time=self.equity_curve[0]['timestamp'] if self.equity_curve else None,
+                end_time=self.equity_curve[-1]['timestamp'] if self.equity_curve else None,
+                initial_capital=self.config.initial_capital,
+                final_capital=self.capital
+            )
+        else:
+            metrics = BacktestMetrics.calculate(
+                trades=self.trades,
+                equity_curve=self.equity_curve,
+                initial_capital=self.config.initial_capital,
+                final_capital=self.capital
+            )
         
         return {
             'exchange_id': self.config.exchange_id,
@@ -478,4 +537,6 @@ class BacktestEngine(QObject):
     def stop(self):
         """백테스트 중지"""
         self.is_running = False
+        if self._vectorized:
+            self._vectorized.stop_requested = True
 
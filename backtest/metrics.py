@@ -2,9 +2,11 @@
 백테스트 성과 지표 계산
 """
 import math
-from typing import List, Dict
+from typing import List, Dict, Optional
 from datetime import datetime
 
+import numpy as np
+
 
 class BacktestMetrics:
     """백테스트 성과 지표 계산"""
@@ -21,6 +23,32 @@ class BacktestMetrics:
             initial_capital: 초기 자본
             final_capital: 최종 자본
         
+        Returns:
+            성과 지표 딕셔너리
+        """
+        equity = BacktestMetrics._equity_array(equity_curve)
+        start_time = equity_curve[0]['timestamp'] if equity_curve else None
+        end_time = equity_curve[-1]['timestamp'] if equity_curve else None
+
+        return BacktestMetrics.calculate_from_arrays(
+            trades, equity, start_time, end_time, initial_capital, final_capital
+        )
+
+    @staticmethod
+    def calculate_from_arrays(trades: List, equity: np.ndarray,
+                              start_time: Optional[str], end_time: Optional[str],
+                              initial_capital: float, final_capital: float) -> Dict:
+        """
+        모든 성과 지표 계산 (자산 곡선 배열 입력)
+
+        Args:
+            trades: 거래 리스트
+            equity: 봉별 자산 배열
+            start_time: 첫 봉 시각
+            end_time: 마지막 봉 시각
+            initial_capital: 초기 자본
+            final_capital: 최종 자본
+
         Returns:
             성과 지표 딕셔너리
         """
@@ -73,16 +101,20 @@ class BacktestMetrics:
         avg_martingale_level = sum(martingale_levels) / len(martingale_levels) if martingale_levels else 0
         
         # 최대 낙폭 (MDD)
-        max_drawdown = BacktestMetrics.calculate_max_drawdown(equity_curve)
+        max_drawdown = BacktestMetrics._max_drawdown(equity)
         
         # CAGR (연환산 수익률)
-        cagr = BacktestMetrics.calculate_cagr(equity_curve, initial_capital, final_capital)
+        cagr = 0
+        if len(equity) >= 2:
+            cagr = BacktestMetrics._cagr(start_time, end_time, initial_capital, final_capital)
         
+        returns = BacktestMetrics._returns(equity)
+
         # 샤프 비율
-        sharpe_ratio = BacktestMetrics.calculate_sharpe_ratio(equity_curve)
+        sharpe_ratio = BacktestMetrics._sharpe_ratio(returns)
         
         # 소르티노 비율
-        sortino_ratio = BacktestMetrics.calculate_sortino_ratio(equity_curve)
+        sortino_ratio = BacktestMetrics._sortino_ratio(returns)
         
         return {
             'total_return': round(total_return, 2),
@@ -102,6 +134,21 @@ class BacktestMetrics:
             'total_fees': round(total_fees, 2)
         }
     
+    @staticmethod
+    def _equity_array(equity_curve: List[Dict]) -> np.ndarray:
+        """자산 곡선 → 자산 배열"""
+        return np.fromiter((point['equity'] for point in equity_curve),
+                           dtype=np.float64, count=len(equity_curve))
+
+    @staticmethod
+    def _returns(equity: np.ndarray) -> np.ndarray:
+        """봉별 수익률 (직전 자산이 0 이하인 봉 제외)"""
+        if len(equity) < 2:
+            return np.empty(0)
+        prev = equity[:-1]
+        valid = prev > 0
+        return (equity[1:][valid] - prev[valid]) / prev[valid]
+
     @staticmethod
     def calculate_max_drawdown(equity_curve: List[Dict]) -> float:
         """
@@ -110,21 +157,21 @@ class BacktestMetrics:
         Returns:
             최대 낙폭 (%)
         """
-        if not equity_curve:
+        return BacktestMetrics._max_drawdown(BacktestMetrics._equity_array(equity_curve))
+
+    @staticmethod
+    def _max_drawdown(equity: np.ndarray) -> float:
+        """최대 낙폭 (%) - 자산 배열"""
+        if len(equity) == 0:
             return 0
-        
-        peak = equity_curve[0]['equity']
-        max_dd = 0
-        
-        for point in equity_curve:
-            equity = point['equity']
-            peak = max(peak, equity)
-            
-            if peak > 0:
-                dd = ((peak - equity) / peak) * 100
-                max_dd = max(max_dd, dd)
-        
-        return max_dd
+
+        peak = np.maximum.accumulate(equity)
+        positive = peak > 0
+        if not positive.any():
+            return 0
+
+        drawdown = ((peak[positive] - equity[positive]) / peak[positive]) * 100
+        return max(0, float(drawdown.max()))
     
     @staticmethod
     def calculate_cagr(equity_curve: List[Dict], initial_capital: float, 
@@ -137,12 +184,16 @@ class BacktestMetrics:
         """
         if not equity_curve or len(equity_curve) < 2:
             return 0
-        
+
+        return BacktestMetrics._cagr(equity_curve[0]['timestamp'], equity_curve[-1]['timestamp'],
+                                     initial_capital, final_capital)
+
+    @staticmethod
+    def _cagr(start_time: str, end_time: str, initial_capital: float,
+              final_capital: float) -> float:
+        """연환산 수익률 (%) - 시작/종료 시각"""
         try:
-            start_time = datetime.fromisoformat(equity_curve[0]['timestamp'])
-            end_time = datetime.fromisoformat(equity_curve[-1]['timestamp'])
-            
-            days = (end_time - start_time).days
+            days = (datetime.fromisoformat(end_time) - datetime.fromisoformat(start_time)).days
             if days <= 0:
                 return 0
             
@@ -175,31 +226,19 @@ class BacktestMetrics:
         Returns:
             샤프 비율
         """
-        if len(equity_curve) < 2:
-            return 0
-        
-        # 일일 수익률 계산
-        returns = []
-        for i in range(1, len(equity_curve)):
-            prev_equity = equity_curve[i-1]['equity']
-            curr_equity = equity_curve[i]['equity']
-            
-            if prev_equity > 0:
-                daily_return = (curr_equity - prev_equity) / prev_equity
-                returns.append(daily_return)
-        
-        if not returns:
-            return 0
-        
-        # 평균 수익률
-        avg_return = sum(returns) / len(returns)
-        
+        returns = BacktestMetrics._returns(BacktestMetrics._equity_array(equity_curve))
+        return BacktestMetrics._sharpe_ratio(returns, risk_free_rate)
+
+    @staticmethod
+    def _sharpe_ratio(returns: np.ndarray, risk_free_rate: float = 0.02) -> float:
+        """샤프 비율 - 수익률 배열"""
         # 표준편차
         if len(returns) < 2:
             return 0
         
-        variance = sum((r - avg_return) ** 2 for r in returns) / (len(returns) - 1)
-        std_dev = math.sqrt(variance)
+        # 평균 수익률
+        avg_return = float(returns.mean())
+        std_dev = float(returns.std(ddof=1))
         
         if std_dev == 0:
             return 0
@@ -223,33 +262,25 @@ class BacktestMetrics:
         Returns:
             소르티노 비율
         """
-        if len(equity_curve) < 2:
-            return 0
-        
-        # 일일 수익률 계산
-        returns = []
-        for i in range(1, len(equity_curve)):
-            prev_equity = equity_curve[i-1]['equity']
-            curr_equity = equity_curve[i]['equity']
-            
-            if prev_equity > 0:
-                daily_return = (curr_equity - prev_equity) / prev_equity
-                returns.append(daily_return)
-        
-        if not returns:
+        returns = BacktestMetrics._returns(BacktestMetrics._equity_array(equity_curve))
+        return BacktestMetrics._sortino_ratio(returns, risk_free_rate)
+
+    @staticmethod
+    def _sortino_ratio(returns: np.ndarray, risk_free_rate: float = 0.02) -> float:
+        """소르티노 비율 - 수익률 배열"""
+        if len(returns) == 0:
             return 0
         
         # 평균 수익률
-        avg_return = sum(returns) / len(returns)
+        avg_return = float(returns.mean())
         
         # 하방 편차 (음수 수익률만)
-        negative_returns = [r for r in returns if r < 0]
+        negative_returns = returns[returns < 0]
         
-        if not negative_returns:
+        if len(negative_returns) == 0:
             return float('inf') if avg_return > 0 else 0
         
-        downside_variance = sum(r ** 2 for r in negative_returns) / len(negative_returns)
-        downside_std = math.sqrt(downside_variance)
+        downside_std = math.sqrt(float(np.mean(negative_returns ** 2)))
         
         if downside_std == 0:
             return 0
@@ -0,0 +1,337 @@
+"""
+백테스트 파라미터 최적화
+마틴게일 DCA 설정을 그리드/랜덤 탐색으로 병렬 평가
+
+캔들 배열은 한 번만 로드해 공유 메모리에 올리고, 프로세스 풀의 각 워커는
+이를 읽기 전용으로 참조하며 벡터화 백테스트로 설정 묶음을 평가한다.
+"""
+import itertools
+import multiprocessing
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import replace
+from multiprocessing import shared_memory
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from PySide6.QtCore import QObject, Signal
+
+from backtest.engine import BacktestConfig
+from backtest.metrics import BacktestMetrics
+from backtest.vectorized import CandleArrays, VectorizedBacktest, load_candle_arrays
+from database.repository import CandlesRepository
+from config.settings import (
+    OPTIMIZER_MAX_WORKERS, OPTIMIZER_BATCH_SIZE, OPTIMIZER_TOP_N
+)
+from utils.logger import logger
+from utils.time_helper import time_helper
+
+# 탐색 가능한 BacktestConfig 필드
+TUNABLE_FIELDS = (
+    'tp_offset_pct', 'sl_offset_pct', 'martingale_steps',
+    'martingale_offset_pct', 'martingale_size_ratios', 'leverage'
+)
+
+# 순위 기준 (True: 낮을수록 좋음)
+RANK_METRICS = {
+    'sharpe_ratio': False,
+    'sortino_ratio': False,
+    'cagr': False,
+    'total_return': False,
+    'profit_factor': False,
+    'max_drawdown': True,
+}
+
+
+def grid_search_space(space: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """
+    그리드 탐색 조합
+
+    Args:
+        space: {필드: [후보값, ...]}
+    """
+    fields = list(space)
+    return [dict(zip(fields, values))
+            for values in itertools.product(*(space[f] for f in fields))]
+
+
+def random_search_space(space: Dict[str, Any], n_samples: int,
+                        seed: int = None) -> List[Dict[str, Any]]:
+    """
+    랜덤 탐색 조합
+
+    Args:
+        space: {필드: [후보값, ...] 또는 (최소, 최대)}
+            (최소, 최대) 튜플은 구간 내 균등 샘플 (둘 다 정수면 정수)
+        n_samples: 샘플 수
+        seed: 난수 시드
+    """
+    rng = random.Random(seed)
+
+    def sample(candidates):
+        if isinstance(candidates, tuple) and len(candidates) == 2:
+            low, high = candidates
+            if isinstance(low, int) and isinstance(high, int):
+                return rng.randint(low, high)
+            return rng.uniform(low, high)
+        return rng.choice(candidates)
+
+    return [{field: sample(candidates) for field, candidates in space.items()}
+            for _ in range(n_samples)]
+
+
+def make_combinations(space: Dict[str, Any], method: str = "grid",
+                      n_samples: int = 100, seed: int = None) -> List[Dict[str, Any]]:
+    """탐색 공간 검증 후 평가할 설정 조합 생성 (grid 또는 random)"""
+    unknown = [f for f in space if f not in TUNABLE_FIELDS]
+    if unknown:
+        raise ValueError(f"탐색할 수 없는 필드: {', '.join(unknown)}")
+
+    if method == "grid":
+        return grid_search_space(space)
+    return random_search_space(space, n_samples, seed)
+
+
+def rank_results(results: Iterable[Dict], rank_by: str = 'sharpe_ratio') -> List[Dict]:
+    """결과 정렬 (낙폭 한도로 조기 종료된 설정은 뒤로)"""
+    ascending = RANK_METRICS[rank_by]
+
+    def key(result):
+        value = result.get(rank_by) or 0
+        return (result.get('terminated', False), value if ascending else -value)
+
+    return sorted(results, key=key)
+
+
+class SharedCandleArrays:
+    """
+    프로세스 간 공유 캔들 배열
+
+    [open, high, low, close, epoch ms] 5행 float64 블록을 공유 메모리에 한 번 복사한다.
+    """
+
+    ROWS = 5
+
+    def __init__(self, candles: CandleArrays):
+        self.length = len(candles)
+
+        self._shm = shared_memory.SharedMemory(
+            create=True, size=max(1, self.ROWS * self.length * 8)
+        )
+        block = np.ndarray((self.ROWS, self.length), dtype=np.float64, buffer=self._shm.buf)
+        block[0] = candles.open
+        block[1] = candles.high
+        block[2] = candles.low
+        block[3] = candles.close
+        block[4] = candles.to_epoch_ms()
+        del block
+
+        self.name = self._shm.name
+
+    def close(self):
+        """공유 메모리 해제"""
+        self._shm.close()
+        self._shm.unlink()
+
+
+# ========== 워커 프로세스 ==========
+
+_worker = {}
+
+
+def _init_worker(shm_name: str, length: int, base_config: BacktestConfig, fee_rate: float,
+                 max_drawdown_pct: Optional[float]):
+    """워커 초기화: 공유 캔들 배열 연결 (읽기 전용)"""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    block = np.ndarray((SharedCandleArrays.ROWS, length), dtype=np.float64, buffer=shm.buf)
+    block.flags.writeable = False
+
+    _worker.update(
+        shm=shm,
+        # 최적화 결과에는 거래 목록을 포함하지 않으므로 거래 시각은 봉 번호로 대신한다
+        candles=CandleArrays(timestamps=range(length), open=block[0],
+                             high=block[1], low=block[2], close=block[3]),
+        epoch_ms=block[4],
+        base_config=base_config,
+        fee_rate=fee_rate,
+        max_drawdown_pct=max_drawdown_pct,
+    )
+
+
+def _evaluate_batch(params_list: List[Dict[str, Any]], start: int, end: int) -> List[Dict]:
+    """설정 묶음을 [start, end) 봉 구간에서 평가 (워커 프로세스)"""
+    candles = _worker['candles'].slice(start, end)
+    epoch_ms = _worker['epoch_ms'][start:end]
+    return [_evaluate(params, candles, epoch_ms) for params in params_list]
+
+
+def _format_epoch(epoch_ms: float) -> str:
+    return time_helper.format_kst(time_helper.timestamp_to_kst(int(epoch_ms)))
+
+
+def _evaluate(params: Dict[str, Any], candles: CandleArrays, epoch_ms: np.ndarray) -> Dict:
+    """단일 설정 평가"""
+    config = replace(_worker['base_config'], **params)
+    backtest = VectorizedBacktest(config, _worker['fee_rate'])
+    trades, capital, equity = backtest.run(candles, _worker['max_drawdown_pct'])
+
+    start_time = end_time = None
+    if len(equity):
+        start_time = _format_epoch(epoch_ms[0])
+        end_time = _format_epoch(epoch_ms[len(equity) - 1])
+
+    metrics = BacktestMetrics.calculate_from_arrays(
+        trades, equity, start_time, end_time, config.initial_capital, capital
+    )
+    return {
+        'params': params,
+        'final_capital': capital,
+        'terminated': backtest.terminated,
+        **metrics
+    }
+
+
+# ========== 최적화기 ==========
+
+class BacktestOptimizer(QObject):
+    """마틴게일 DCA 파라미터 병렬 최적화"""
+
+    # Signals
+    progress_updated = Signal(str, int, int)  # message, current, total
+    ranking_updated = Signal(list)  # 현재까지 상위 결과
+    optimization_completed = Signal(list)  # 전체 순위
+    error_occurred = Signal(str)
+
+    def __init__(self, max_workers: int = None, batch_size: int = None):
+        super().__init__()
+        self.candles_repo = CandlesRepository()
+        self.max_workers = max_workers or OPTIMIZER_MAX_WORKERS
+        self.batch_size = batch_size or OPTIMIZER_BATCH_SIZE
+        self.is_running = False
+
+    def run(self, base_config: BacktestConfig, space: Dict[str, Any],
+            method: str = "grid", n_samples: int = 100,
+            rank_by: str = 'sharpe_ratio', max_drawdown_cap: float = None,
+            seed: int = None, candles: CandleArrays = None) -> List[Dict]:
+        """
+        최적화 실행 (완료까지 블로킹)
+
+        Args:
+            base_config: 기준 설정 (탐색하지 않는 필드 값)
+            space: 탐색 공간 {TUNABLE_FIELDS 필드: 후보}
+            method: grid 또는 random
+            n_samples: random 샘플 수
+            rank_by: 순위 기준 (RANK_METRICS)
+            max_drawdown_cap: 낙폭 한도 (%) - 넘는 설정은 즉시 중단
+            seed: random 난수 시드
+            candles: 미리 로드한 캔들 배열 (없으면 base_config 기간 로드)
+
+        Returns:
+            순위순 결과 리스트
+        """
+        self.is_running = True
+        try:
+            # 잘못된 설정도 error_occurred로 알린다 (스레드 슬롯 밖으로 예외가 나가지 않게)
+            if rank_by not in RANK_METRICS:
+                raise ValueError(f"지원하지 않는 순위 기준: {rank_by}")
+            combinations = make_combinations(space, method, n_samples, seed)
+
+            if candles is None:
+                candles = self._load_candles(base_config)
+            if not candles or not combinations:
+                self.error_occurred.emit("캔들 데이터 또는 탐색할 설정이 없습니다.")
+                return []
+
+            logger.info("Optimizer",
+                       f"최적화 시작: {len(combinations)}개 설정, {len(candles)}개 캔들 "
+                       f"(기준: {rank_by})")
+
+            results = self.evaluate_windows(base_config, combinations, candles,
+                                            [(0, len(candles))], rank_by, max_drawdown_cap)[0]
+            ranked = rank_results(results, rank_by)
+
+            logger.info("Optimizer", f"최적화 완료: {len(ranked)}개 설정 평가")
+            self.optimization_completed.emit(ranked)
+            return ranked
+
+        except Exception as e:
+            import traceback
+            error_msg = f"최적화 실패: {str(e)}"
+            logger.error("Optimizer", error_msg, traceback.format_exc())
+            self.error_occurred.emit(error_msg)
+            return []
+        finally:
+            self.is_running = False
+
+    def _load_candles(self, config: BacktestConfig) -> Optional[CandleArrays]:
+        """기준 설정 기간의 캔들 배열 로드 (1회)"""
+        candles = load_candle_arrays(
+            self.candles_repo, config.exchange_id, config.symbol, config.timeframe,
+            config.start_date, config.end_date
+        )
+        return candles if len(candles) else None
+
+    def evaluate_windows(self, base_config: BacktestConfig, combinations: List[Dict],
+                         candles: CandleArrays, windows: List[Tuple[int, int]],
+                         rank_by: str = 'sharpe_ratio',
+                         max_drawdown_cap: Optional[float] = None) -> List[List[Dict]]:
+        """
+        프로세스 풀에서 (구간 × 설정 묶음) 병렬 평가 (결과 스트리밍)
+
+        모든 구간이 같은 공유 캔들 배열을 참조하므로 구간 수와 무관하게 한 번만 복사한다.
+
+        Args:
+            windows: [(시작 봉, 끝 봉)] 평가 구간 목록
+
+        Returns:
+            구간별 결과 리스트 (windows 순서)
+        """
+        shared = SharedCandleArrays(candles)
+        batches = [combinations[i:i + self.batch_size]
+                   for i in range(0, len(combinations), self.batch_size)]
+        total = len(combinations) * len(windows)
+        results = [[] for _ in windows]
+        completed = 0
+
+        try:
+            # Qt 스레드가 있는 프로세스에서 fork하지 않도록 spawn 사용
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(shared.name, shared.length, base_config,
+                          base_config.get_fee_rate(), max_drawdown_cap)
+            ) as executor:
+                futures = {
+                    executor.submit(_evaluate_batch, batch, start, end): window_index
+                    for window_index, (start, end) in enumerate(windows)
+                    for batch in batches
+                }
+
+                for future in as_completed(futures):
+                    if not self.is_running:
+                        for pending in futures:
+                            pending.cancel()
+                        logger.warning("Optimizer", "최적화 중단됨")
+                        break
+
+                    window_results = results[futures[future]]
+                    batch_results = future.result()
+                    window_results.extend(batch_results)
+                    completed += len(batch_results)
+
+                    if len(windows) == 1:
+                        self.ranking_updated.emit(
+                            rank_results(window_results, rank_by)[:OPTIMIZER_TOP_N]
+                        )
+                    self.progress_updated.emit(
+                        f"설정 평가 중: {completed}/{total}", completed, total
+                    )
+        finally:
+            shared.close()
+
+        return results
+
+    def stop(self):
+        """최적화 중지 (실행 중인 묶음은 끝까지 평가)"""
+        self.is_running = False
@@ -0,0 +1,453 @@
+"""
+벡터화 백테스트 (빠른 경로)
+BacktestEngine 순회 방식과 같은 거래/지표를 NumPy 배열 탐색으로 계산
+
+봉마다 Python 코드를 실행하는 대신, 포지션이 열려 있는 동안
+TP/SL/마틴게일 트리거가 처음 닿는 봉을 배열 탐색으로 찾고
+그 봉에서만 순회 방식과 같은 순서로 상태를 갱신한다.
+Numba가 설치되어 있으면 탐색 커널을 JIT 컴파일해 사용한다.
+"""
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from database.candle_cache import CandleCache, epoch_ms_to_kst_strings, kst_strings_to_epoch_ms
+from utils.time_helper import time_helper
+
+try:
+    from numba import njit
+except ImportError:  # Numba는 선택 의존성
+    njit = None
+
+
+# 청크 탐색 크기 (대부분의 거래는 진입 직후 청산되므로 작게 시작해 두 배씩 확장)
+_SCAN_CHUNK_MIN = 64
+_SCAN_CHUNK_MAX = 65536
+
+
+class EpochTimestamps(Sequence):
+    """
+    epoch ms 배열을 KST 문자열 시각 시퀀스로 제공
+
+    캐시에서 읽은 캔들은 문자열 시각을 미리 만들지 않고,
+    거래 기록/자산 곡선처럼 실제로 쓰는 봉만 변환한다.
+    """
+
+    _ITER_CHUNK = 65536
+
+    def __init__(self, epoch_ms: np.ndarray):
+        self.epoch_ms = epoch_ms
+
+    def __len__(self) -> int:
+        return len(self.epoch_ms)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return EpochTimestamps(self.epoch_ms[index])
+        return time_helper.format_kst(time_helper.timestamp_to_kst(int(self.epoch_ms[index])))
+
+    def __iter__(self):
+        for start in range(0, len(self.epoch_ms), self._ITER_CHUNK):
+            yield from epoch_ms_to_kst_strings(self.epoch_ms[start:start + self._ITER_CHUNK])
+
+
+class EquityCurve(Sequence):
+    """
+    자산 곡선 [{timestamp, equity, price}, ...] 시퀀스
+
+    빠른 경로 결과는 배열로만 들고 있다가 UI나 결과 저장처럼
+    실제로 읽는 곳에서만 봉별 딕셔너리를 만든다.
+    """
+
+    def __init__(self, timestamps: Sequence, equity: np.ndarray, prices: np.ndarray):
+        self.timestamps = timestamps
+        self.equity = equity
+        self.prices = prices
+
+    def __len__(self) -> int:
+        return len(self.equity)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return EquityCurve(self.timestamps[index], self.equity[index], self.prices[index])
+        return {'timestamp': self.timestamps[index], 'equity': float(self.equity[index]),
+                'price': float(self.prices[index])}
+
+    def __iter__(self):
+        for ts, eq, price in zip(self.timestamps, self.equity.tolist(), self.prices.tolist()):
+            yield {'timestamp': ts, 'equity': eq, 'price': price}
+
+
+@dataclass
+class CandleArrays:
+    """백테스트용 캔들 배열 (시간 오름차순)"""
+    timestamps: Sequence  # KST 문자열 시각
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    epoch_ms: Optional[np.ndarray] = None  # 캐시에서 읽은 경우 int64 epoch ms
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    @classmethod
+    def from_candles(cls, candles: List[Dict]) -> "CandleArrays":
+        """캔들 딕셔너리 리스트 → 배열"""
+        count = len(candles)
+
+        def column(name: str) -> np.ndarray:
+            return np.fromiter((c[name] for c in candles), dtype=np.float64, count=count)
+
+        return cls(
+            timestamps=[c['timestamp'] for c in candles],
+            open=column('open'),
+            high=column('high'),
+            low=column('low'),
+            close=column('close'),
+        )
+
+    @classmethod
+    def from_cache(cls, cached) -> "CandleArrays":
+        """CachedCandles(메모리 맵 뷰) → 배열 (복사 없음)"""
+        return cls(
+            timestamps=EpochTimestamps(cached.timestamp),
+            open=cached.open,
+            high=cached.high,
+            low=cached.low,
+            close=cached.close,
+            epoch_ms=cached.timestamp,
+        )
+
+    def to_epoch_ms(self) -> np.ndarray:
+        """봉 시각 epoch ms 배열"""
+        if self.epoch_ms is not None:
+            return self.epoch_ms
+        return kst_strings_to_epoch_ms(self.timestamps)
+
+    def slice(self, start: int, end: int) -> "CandleArrays":
+        """[start, end) 구간 (배열은 복사하지 않는 뷰)"""
+        return CandleArrays(
+            timestamps=self.timestamps[start:end],
+            open=self.open[start:end],
+            high=self.high[start:end],
+            low=self.low[start:end],
+            close=self.close[start:end],
+            epoch_ms=None if self.epoch_ms is None else self.epoch_ms[start:end],
+        )
+
+
+def load_candle_arrays(candles_repo, exchange_id: str, symbol: str, timeframe: str,
+                       start_time: str, end_time: str,
+                       cache: CandleCache = None) -> CandleArrays:
+    """
+    백테스트 구간 캔들 배열 로드 (컬럼 캐시 우선)
+
+    캐시가 없는 시계열은 DB 전체를 한 번 읽어 캐시를 만든 뒤부터 캐시에서 읽는다.
+    이후 캐시는 CandlesRepository 저장 시 함께 갱신된다.
+    """
+    cache = cache or getattr(candles_repo, 'candle_cache', None) or CandleCache()
+
+    if not cache.exists(exchange_id, symbol, timeframe):
+        columns = candles_repo.get_candle_columns(exchange_id, symbol, timeframe)
+        if len(columns['timestamp']):
+            cache.rebuild(exchange_id, symbol, timeframe, columns)
+
+    cached = cache.load(exchange_id, symbol, timeframe,
+                        time_helper.parse_kst_bound(start_time),
+                        time_helper.parse_kst_bound(end_time, upper=True))
+    if cached is None:
+        return CandleArrays.from_candles([])
+    return CandleArrays.from_cache(cached)
+
+
+def _first_event_numpy(high: np.ndarray, low: np.ndarray, start: int,
+                       high_level: float, low_level: float) -> int:
+    """start부터 high >= high_level 또는 low <= low_level인 첫 봉 (없으면 len)"""
+    n = len(high)
+    chunk = _SCAN_CHUNK_MIN
+
+    while start < n:
+        end = min(n, start + chunk)
+        hits = (high[start:end] >= high_level) | (low[start:end] <= low_level)
+        index = int(hits.argmax())
+        if hits[index]:
+            return start + index
+        start = end
+        chunk = min(chunk * 2, _SCAN_CHUNK_MAX)
+
+    return n
+
+
+if njit is not None:
+    @njit(cache=True, nogil=True)
+    def _first_event_numba(high, low, start, high_level, low_level):
+        for i in range(start, len(high)):
+            if high[i] >= high_level or low[i] <= low_level:
+                return i
+        return len(high)
+
+    _first_event = _first_event_numba
+else:
+    _first_event = _first_event_numpy
+
+
+class VectorizedBacktest:
+    """
+    마틴게일 DCA 전략 벡터화 실행기
+
+    BacktestEngine의 _open_position/_check_tp_sl/_check_martingale/
+    _close_position과 같은 식과 순서로 계산하므로 결과가 순회 방식과 같다.
+    """
+
+    def __init__(self, config, fee_rate: float):
+        """
+        Args:
+            config: BacktestConfig
+            fee_rate: 수수료율
+        """
+        self.config = config
+        self.fee_rate = fee_rate
+        self.is_long = config.direction == "LONG"
+        self.stop_requested = False
+        self.terminated = False  # 낙폭 한도 초과로 조기 종료됨
+
+    def run(self, candles: CandleArrays,
+            max_drawdown_pct: float = None) -> Tuple[list, float, np.ndarray]:
+        """
+        백테스트 실행
+
+        Args:
+            candles: 캔들 배열
+            max_drawdown_pct: 낙폭 한도 (%) - 넘는 봉에서 즉시 종료 (최적화용)
+
+        Returns:
+            (trades, 최종 자본, 봉별 자산 배열)
+            조기 종료 시 자산 배열은 한도를 넘은 봉까지만 포함한다.
+        """
+        config = self.config
+        is_long = self.is_long
+        leverage = config.leverage
+        fee_rate = self.fee_rate
+
+        high, low, close = candles.high, candles.low, candles.close
+        n = len(candles)
+        equity = np.empty(n)
+        trades = []
+
+        capital = config.initial_capital
+        peak = capital
+        index = 1  # 첫 봉 이후부터 진입
+
+        if n:
+            equity[0] = capital
+
+        while index < n:
+            if self.stop_requested:
+                return trades, capital, equity[:index]
+
+            # ===== 진입 (index 봉 종가) =====
+            price = float(close[index])
+            margin_per_trade = capital * 0.1
+            size = (margin_per_trade * leverage) / price
+            capital -= size * price * fee_rate
+
+            entry_time = candles.timestamps[index]
+            avg_price = price
+            total_size = size
+            level = 0
+            tp_price, sl_price = self._tp_sl(avg_price)
+            orders = self._martingale_orders(price) if config.martingale_enabled else []
+
+            segment_start = index
+            exit_reason = None
+            exit_price = 0.0
+
+            while True:
+                # 다음 이벤트 봉 탐색 (TP / SL / 미체결 마틴게일 트리거)
+                triggers = [o['trigger_price'] for o in orders if not o['filled']]
+                if is_long:
+                    low_level = max([sl_price] + triggers)
+                    event = _first_event(high, low, segment_start + 1, tp_price, low_level)
+                else:
+                    high_level = min([sl_price] + triggers)
+                    event = _first_event(high, low, segment_start + 1, high_level, tp_price)
+
+                # 이벤트 전까지 자산 (미실현 손익 반영)
+                self._fill_equity(equity, close, segment_start, event,
+                                  capital, avg_price, total_size)
+
+                if max_drawdown_pct is not None:
+                    breach, peak = self._check_drawdown(equity, segment_start, event,
+                                                        peak, max_drawdown_pct)
+                    if breach is not None:
+                        self.terminated = True
+                        return trades, capital, equity[:breach + 1]
+
+                if event >= n:
+                    break
+
+                segment_start = event
+
+                # 순회 방식과 같은 우선순위: TP → SL → 마틴게일
+                if is_long:
+                    if high[event] >= tp_price:
+                        exit_reason, exit_price = "TP", tp_price
+                    elif low[event] <= sl_price:
+                        exit_reason, exit_price = "SL", sl_price
+                else:
+                    if low[event] <= tp_price:
+                        exit_reason, exit_price = "TP", tp_price
+                    elif high[event] >= sl_price:
+                        exit_reason, exit_price = "SL", sl_price
+
+                if exit_reason:
+                    break
+
+                for order in orders:
+                    if order['filled']:
+                        continue
+                    trigger_price = order['trigger_price']
+                    if (low[event] <= trigger_price) if is_long else (high[event] >= trigger_price):
+                        add_size = size * order['size_ratio']
+                        capital -= add_size * trigger_price * fee_rate
+
+                        total_value = (total_size * avg_price) + (add_size * trigger_price)
+                        new_total_size = total_size + add_size
+                        avg_price = total_value / new_total_size
+                        total_size = new_total_size
+                        level = order['level']
+                        order['filled'] = True
+
+                        tp_price, sl_price = self._tp_sl(avg_price)
+
+            if exit_reason is None:
+                # 마지막 봉까지 열린 포지션 → 강제 청산 (자산 곡선 기록 이후)
+                capital, trade = self._close(capital, avg_price, total_size,
+                                             float(close[n - 1]), entry_time,
+                                             candles.timestamps[n - 1], "백테스트 종료", level)
+                trades.append(trade)
+                break
+
+            capital, trade = self._close(capital, avg_price, total_size, exit_price,
+                                         entry_time, candles.timestamps[segment_start],
+                                         exit_reason, level)
+            trades.append(trade)
+
+            # 청산 봉은 포지션 없는 자산으로 기록, 다음 봉에서 재진입
+            equity[segment_start] = capital
+            index = segment_start + 1
+
+            if max_drawdown_pct is not None:
+                breach, peak = self._check_drawdown(equity, segment_start, index,
+                                                    peak, max_drawdown_pct)
+                if breach is not None:
+                    self.terminated = True
+                    return trades, capital, equity[:breach + 1]
+
+        return trades, capital, equity
+
+    def _tp_sl(self, avg_price: float) -> Tuple[float, float]:
+        """평균가 기준 TP/SL 가격"""
+        config = self.config
+        if self.is_long:
+            return (avg_price * (1 + config.tp_offset_pct / 100),
+                    avg_price * (1 - config.sl_offset_pct / 100))
+        return (avg_price * (1 - config.tp_offset_pct / 100),
+                avg_price * (1 + config.sl_offset_pct / 100))
+
+    def _martingale_orders(self, entry_price: float) -> List[Dict]:
+        """진입가 기준 고정 마틴게일 사다리"""
+        config = self.config
+        orders = []
+        for i in range(config.martingale_steps):
+            ratio = config.martingale_size_ratios[i] if i < len(config.martingale_size_ratios) else 1
+            if self.is_long:
+                trigger_price = entry_price * (1 - (config.martingale_offset_pct * (i + 1)) / 100)
+            else:
+                trigger_price = entry_price * (1 + (config.martingale_offset_pct * (i + 1)) / 100)
+            orders.append({
+                'level': i + 1,
+                'trigger_price': trigger_price,
+                'size_ratio': ratio,
+                'filled': False
+            })
+        return orders
+
+    def _fill_equity(self, equity: np.ndarray, close: np.ndarray, start: int, end: int,
+                     capital: float, avg_price: float, total_size: float):
+        """[start, end) 봉 자산 = 자본 + 미실현 손익"""
+        end = min(end, len(close))
+        if start >= end:
+            return
+
+        segment = close[start:end]
+        if self.is_long:
+            pnl_pct = (segment - avg_price) / avg_price
+        else:
+            pnl_pct = (avg_price - segment) / avg_price
+
+        pnl_pct *= self.config.leverage
+        position_value = total_size * avg_price / self.config.leverage
+        equity[start:end] = capital + position_value * pnl_pct
+
+    @staticmethod
+    def _check_drawdown(equity: np.ndarray, start: int, end: int, peak: float,
+                        max_drawdown_pct: float):
+        """
+        [start, end) 구간 낙폭 검사
+
+        Returns:
+            (한도를 처음 넘은 봉 또는 None, 갱신된 최고 자산)
+        """
+        end = min(end, len(equity))
+        if start >= end:
+            return None, peak
+
+        segment = equity[start:end]
+        running_peak = np.maximum.accumulate(np.maximum(segment, peak))
+        positive = running_peak > 0
+        drawdown = np.zeros(len(segment))
+        drawdown[positive] = (running_peak[positive] - segment[positive]) / running_peak[positive] * 100
+
+        breached = np.flatnonzero(drawdown > max_drawdown_pct)
+        if len(breached):
+            return start + int(breached[0]), peak
+        return None, float(running_peak[-1])
+
+    def _close(self, capital: float, avg_price: float, total_size: float,
+               price: float, entry_time: str, exit_time: str, reason: str,
+               level: int):
+        """포지션 청산 → (자본, Trade)"""
+        from backtest.engine import Trade
+
+        leverage = self.config.leverage
+        if self.is_long:
+            pnl_pct = (price - avg_price) / avg_price
+        else:
+            pnl_pct = (avg_price - price) / avg_price
+
+        pnl_pct *= leverage
+        position_value = total_size * avg_price / leverage
+        pnl = position_value * pnl_pct
+
+        fee = total_size * price * self.fee_rate
+        capital -= fee
+        capital += pnl
+
+        trade = Trade(
+            entry_time=entry_time,
+            entry_price=avg_price,
+            exit_time=exit_time,
+            exit_price=price,
+            side="long" if self.is_long else "short",
+            size=total_size,
+            leverage=leverage,
+            pnl=pnl,
+            fees=fee * 2,
+            exit_reason=reason,
+            martingale_level=level
+        )
+        return capital, trade
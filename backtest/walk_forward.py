@@ -0,0 +1,244 @@
+"""
+워크포워드 백테스트
+구간을 학습(in-sample)/검증(out-of-sample) 롤링 윈도우로 나누어
+학습 구간마다 파라미터를 최적화하고, 검증 구간 결과를 이어 붙인다.
+"""
+from bisect import bisect_left
+from dataclasses import dataclass, asdict, replace
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from PySide6.QtCore import QObject, Signal
+
+from backtest.engine import BacktestConfig
+from backtest.metrics import BacktestMetrics
+from backtest.optimizer import BacktestOptimizer, make_combinations, rank_results, RANK_METRICS
+from backtest.vectorized import (
+    CandleArrays, EpochTimestamps, EquityCurve, VectorizedBacktest, load_candle_arrays
+)
+from database.repository import CandlesRepository, BacktestResultsRepository
+from utils.logger import logger
+from utils.time_helper import time_helper
+
+
+@dataclass
+class WalkForwardConfig:
+    """워크포워드 설정"""
+    in_sample_days: int = 90  # 학습 구간 길이
+    out_of_sample_days: int = 30  # 검증 구간 길이 (윈도우 이동 간격)
+
+    # 학습 구간 최적화
+    method: str = "grid"  # grid 또는 random
+    n_samples: int = 100
+    seed: Optional[int] = None
+    rank_by: str = "sharpe_ratio"
+    max_drawdown_cap: Optional[float] = None
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def split_windows(timestamps: Sequence, in_sample_days: int,
+                  out_of_sample_days: int) -> List[Tuple[int, int, int]]:
+    """
+    롤링 윈도우 분할 (검증 구간 길이만큼 이동)
+
+    Args:
+        timestamps: 시간 오름차순 캔들 시각 (KST 문자열 시퀀스)
+
+    Returns:
+        [(학습 시작 봉, 검증 시작 봉, 검증 끝 봉)] - 끝 봉은 미포함
+    """
+    if not timestamps:
+        return []
+
+    in_sample = timedelta(days=in_sample_days)
+    out_of_sample = timedelta(days=out_of_sample_days)
+    first = datetime.fromisoformat(timestamps[0])
+    last = datetime.fromisoformat(timestamps[-1])
+
+    def index_at(moment: datetime) -> int:
+        return bisect_left(timestamps, time_helper.format_kst(moment))
+
+    windows = []
+    window_start = first
+    while window_start + in_sample <= last:
+        oos_start = window_start + in_sample
+        start, split, end = (index_at(window_start), index_at(oos_start),
+                             index_at(oos_start + out_of_sample))
+        if split > start and end > split:
+            windows.append((start, split, end))
+        window_start += out_of_sample
+
+    return windows
+
+
+class WalkForwardBacktest(QObject):
+    """워크포워드 백테스트 (학습 구간 병렬 최적화 + 검증 구간 연결)"""
+
+    # Signals
+    progress_updated = Signal(str, int, int)  # message, current, total
+    window_completed = Signal(dict)  # 윈도우별 선택 파라미터/검증 성과
+    walk_forward_completed = Signal(dict)  # 최종 결과
+    error_occurred = Signal(str)
+
+    def __init__(self, max_workers: int = None):
+        super().__init__()
+        self.candles_repo = CandlesRepository()
+        self.results_repo = BacktestResultsRepository()
+        self.optimizer = BacktestOptimizer(max_workers=max_workers)
+        self.optimizer.progress_updated.connect(self.progress_updated.emit)
+        self.is_running = False
+
+    def run(self, base_config: BacktestConfig, space: Dict[str, Any],
+            wf_config: WalkForwardConfig = None) -> Optional[Dict]:
+        """
+        워크포워드 실행 (완료까지 블로킹)
+
+        Args:
+            base_config: 기준 설정 (전체 기간 start_date ~ end_date)
+            space: 학습 구간 탐색 공간 (TUNABLE_FIELDS)
+            wf_config: 워크포워드 설정
+
+        Returns:
+            검증 구간을 이어 붙인 백테스트 결과 (backtest_results 저장) 또는 None
+        """
+        wf_config = wf_config or WalkForwardConfig()
+        if wf_config.rank_by not in RANK_METRICS:
+            raise ValueError(f"지원하지 않는 순위 기준: {wf_config.rank_by}")
+        combinations = make_combinations(space, wf_config.method,
+                                         wf_config.n_samples, wf_config.seed)
+
+        self.is_running = True
+        self.optimizer.is_running = True
+
+        logger.info("WalkForward",
+                   f"워크포워드 시작: {base_config.exchange_id} {base_config.symbol} "
+                   f"{base_config.start_date} ~ {base_config.end_date} "
+                   f"(학습 {wf_config.in_sample_days}일 / 검증 {wf_config.out_of_sample_days}일)")
+
+        try:
+            # 전체 기간 캔들을 한 번만 로드해 모든 윈도우가 공유
+            candles = load_candle_arrays(
+                self.candles_repo, base_config.exchange_id, base_config.symbol,
+                base_config.timeframe, base_config.start_date, base_config.end_date
+            )
+            if not len(candles):
+                self.error_occurred.emit("캔들 데이터가 없습니다.")
+                return None
+
+            windows = split_windows(candles.timestamps, wf_config.in_sample_days,
+                                    wf_config.out_of_sample_days)
+            if not windows:
+                self.error_occurred.emit("학습/검증 구간을 만들 수 있을 만큼 데이터가 길지 않습니다.")
+                return None
+
+            logger.info("WalkForward",
+                       f"{len(windows)}개 윈도우 × {len(combinations)}개 설정 병렬 평가")
+
+            # 모든 학습 구간을 하나의 프로세스 풀에서 동시에 최적화
+            in_sample_results = self.optimizer.evaluate_windows(
+                base_config, combinations, candles,
+                [(start, split) for start, split, _ in windows],
+                wf_config.rank_by, wf_config.max_drawdown_cap
+            )
+            if not self.is_running:
+                logger.warning("WalkForward", "워크포워드 중단됨")
+                return None
+
+            result = self._run_out_of_sample(base_config, wf_config, candles,
+                                             windows, in_sample_results)
+
+            result['id'] = self.results_repo.insert_result(result)
+
+            logger.info("WalkForward",
+                       f"워크포워드 완료: 검증 수익률 {result['total_return']:.2f}%, "
+                       f"MDD {result['max_drawdown']:.2f}%")
+            self.walk_forward_completed.emit(result)
+            return result
+
+        except Exception as e:
+            import traceback
+            error_msg = f"워크포워드 실패: {str(e)}"
+            logger.error("WalkForward", error_msg, traceback.format_exc())
+            self.error_occurred.emit(error_msg)
+            return None
+        finally:
+            self.is_running = False
+            self.optimizer.is_running = False
+
+    def _run_out_of_sample(self, base_config: BacktestConfig, wf_config: WalkForwardConfig,
+                           candles: CandleArrays, windows: List[Tuple[int, int, int]],
+                           in_sample_results: List[List[Dict]]) -> Dict:
+        """윈도우별 최적 파라미터로 검증 구간 실행 후 자본을 이어 붙임"""
+        capital = base_config.initial_capital
+        fee_rate = base_config.get_fee_rate()
+        trades = []
+        equity_segments = []
+        window_summaries = []
+
+        for index, ((start, split, end), results) in enumerate(zip(windows, in_sample_results)):
+            ranked = rank_results(results, wf_config.rank_by)
+            if not ranked:
+                continue
+            best = ranked[0]
+
+            # 검증 구간은 직전 구간의 최종 자본으로 시작
+            config = replace(base_config, initial_capital=capital, **best['params'])
+            oos_trades, capital, equity = VectorizedBacktest(config, fee_rate).run(
+                candles.slice(split, end)
+            )
+            trades.extend(oos_trades)
+            equity_segments.append((split, equity))
+
+            summary = {
+                'window': index + 1,
+                'in_sample_start': candles.timestamps[start],
+                'out_of_sample_start': candles.timestamps[split],
+                'out_of_sample_end': candles.timestamps[end - 1],
+                'params': best['params'],
+                'in_sample_' + wf_config.rank_by: best.get(wf_config.rank_by),
+                'out_of_sample_capital': capital,
+            }
+            window_summaries.append(summary)
+            self.window_completed.emit(summary)
+
+        equity = np.concatenate([segment for _, segment in equity_segments]) \
+            if equity_segments else np.empty(0)
+        epoch_ms = candles.to_epoch_ms()
+        timestamps = EpochTimestamps(np.concatenate([epoch_ms[split:split + len(segment)]
+                                                     for split, segment in equity_segments])) \
+            if equity_segments else []
+        prices = np.concatenate([candles.close[split:split + len(segment)]
+                                 for split, segment in equity_segments]) \
+            if equity_segments else np.empty(0)
+
+        metrics = BacktestMetrics.calculate_from_arrays(
+            trades, equity,
+            timestamps[0] if timestamps else None,
+            timestamps[-1] if timestamps else None,
+            base_config.initial_capital, capital
+        )
+
+        strategy_config = base_config.to_dict()
+        strategy_config['walk_forward'] = {**wf_config.to_dict(), 'windows': window_summaries}
+
+        return {
+            'exchange_id': base_config.exchange_id,
+            'symbol': base_config.symbol,
+            'timeframe': base_config.timeframe,
+            'start_date': timestamps[0] if timestamps else base_config.start_date,
+            'end_date': timestamps[-1] if timestamps else base_config.end_date,
+            'strategy_config': strategy_config,
+            'initial_capital': base_config.initial_capital,
+            'final_capital': capital,
+            **metrics,
+            'trades': [t.to_dict() for t in trades],
+            'equity_curve': EquityCurve(timestamps, equity, prices)
+        }
+
+    def stop(self):
+        """워크포워드 중지"""
+        self.is_running = False
+        self.optimizer.stop()
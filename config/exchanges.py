@@ -43,6 +43,7 @@ SUPPORTED_EXCHANGES = {
         "futures_type": "swap",
         "symbol_format": "{base}/{quote}:USDT",
         "requires_passphrase": True,
+        "native_timeframes": True,  # 1D 봉이 UTC+8 기준이라 UTC 리샘플링과 경계가 다름
     },
     "bitget": {
         "name": "Bitget",
@@ -514,6 +515,69 @@ LEGACY_TIMEFRAME_MAP = {
     "1D": "1d",
 }
 
+# 요청 가중치 (ccxt rateLimit 1회 = 1, 표에 없는 메서드는 1)
+# 'method:all'은 심볼 없이 전체를 조회하는 호출
+ENDPOINT_WEIGHTS = {
+    "binance": {  # USDT-M 선물 API 가중치
+        "fetch_ohlcv": 5,  # limit 1000 기준
+        "fetch_balance": 5,
+        "fetch_positions": 5,
+        "fetch_positions:all": 5,
+        "fetch_open_orders:all": 40,
+        "load_markets": 10,
+        "create_orders": 5,
+    },
+    "bybit": {
+        "fetch_positions:all": 2,
+        "fetch_open_orders:all": 2,
+    },
+}
+
+# 일괄 주문(create_orders) 한 번에 보낼 수 있는 최대 주문 수
+BATCH_ORDER_LIMITS = {
+    "binance": 5,
+    "bybit": 10,
+    "okx": 20,
+    "bitget": 50,
+}
+
+# WebSocket 엔드포인트 (public: 시세, business: OKX 캔들, private: 주문/포지션)
+# 바이낸스 private는 listenKey를 뒤에 붙여 연결
+WS_ENDPOINTS = {
+    "okx": {
+        "mainnet": {
+            "public": "wss://ws.okx.com:8443/ws/v5/public",
+            "business": "wss://ws.okx.com:8443/ws/v5/business",
+            "private": "wss://ws.okx.com:8443/ws/v5/private",
+        },
+        "testnet": {  # Demo mode
+            "public": "wss://wspap.okx.com:8443/ws/v5/public",
+            "business": "wss://wspap.okx.com:8443/ws/v5/business",
+            "private": "wss://wspap.okx.com:8443/ws/v5/private",
+        },
+    },
+    "binance": {  # USDT-M 선물
+        "mainnet": {
+            "public": "wss://fstream.binance.com/ws",
+            "private": "wss://fstream.binance.com/ws",
+        },
+        "testnet": {
+            "public": "wss://stream.binancefuture.com/ws",
+            "private": "wss://stream.binancefuture.com/ws",
+        },
+    },
+    "bybit": {  # v5 linear
+        "mainnet": {
+            "public": "wss://stream.bybit.com/v5/public/linear",
+            "private": "wss://stream.bybit.com/v5/private",
+        },
+        "testnet": {
+            "public": "wss://stream-testnet.bybit.com/v5/public/linear",
+            "private": "wss://stream-testnet.bybit.com/v5/private",
+        },
+    },
+}
+
 
 def get_exchange_info(exchange_id: str) -> dict:
     """거래소 정보 조회"""
@@ -528,6 +592,16 @@ def get_exchange_fee(exchange_id: str, fee_type: str = "taker") -> float:
     return info.get("taker_fee", 0.0005)
 
 
+def get_endpoint_weight(exchange_id: str, method: str) -> float:
+    """거래소 요청 가중치 조회"""
+    return ENDPOINT_WEIGHTS.get(exchange_id, {}).get(method, 1)
+
+
+def get_batch_order_limit(exchange_id: str) -> int:
+    """일괄 주문 최대 개수 조회"""
+    return BATCH_ORDER_LIMITS.get(exchange_id, 5)
+
+
 def format_symbol(exchange_id: str, base: str, quote: str = "USDT") -> str:
     """거래소별 심볼 형식으로 변환"""
     info = get_exchange_info(exchange_id)
@@ -548,6 +622,16 @@ def parse_symbol(symbol: str) -> tuple:
     return symbol, "USDT"
 
 
+def uses_native_timeframes(exchange_id: str) -> bool:
+    """
+    상위 타임프레임을 거래소에서 직접 수집할지 여부
+
+    기본은 1분봉에서 로컬 생성. 거래소의 봉 경계(세션)가 UTC 정렬과 다르면
+    거래소 설정에 "native_timeframes": True 를 지정한다.
+    """
+    return bool(get_exchange_info(exchange_id).get("native_timeframes", False))
+
+
 def get_testnet_exchanges() -> list:
     """테스트넷 지원 거래소 목록"""
     return TESTNET_EXCHANGES
@@ -560,3 +644,8 @@ def get_futures_exchanges() -> list:
         if ex_data.get("has_futures")
     ]
 
+
+def get_ws_endpoint(exchange_id: str, endpoint: str, is_testnet: bool = False) -> str:
+    """WebSocket 엔드포인트 URL 조회 (없으면 빈 문자열)"""
+    network = "testnet" if is_testnet else "mainnet"
+    return WS_ENDPOINTS.get(exchange_id, {}).get(network, {}).get(endpoint, "")
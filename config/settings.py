@@ -27,6 +27,31 @@ DATA_DIR.mkdir(exist_ok=True)
 # 데이터베이스 경로
 DB_PATH = DATA_DIR / "trading_bot.db"
 
+# SQLite 연결 설정 (스레드별 연결마다 적용)
+SQLITE_BUSY_TIMEOUT_MS = 5000  # 다른 연결이 쓰는 중일 때 대기 시간
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",  # 읽기와 쓰기 동시 진행
+    "synchronous": "NORMAL",  # WAL에서는 체크포인트 시에만 fsync
+    "mmap_size": 268435456,  # 256MB 메모리 맵 읽기
+    "cache_size": -65536,  # 연결당 페이지 캐시 64MB (음수는 KB 단위)
+    "temp_store": "MEMORY",  # 정렬/임시 테이블을 메모리에서 처리
+}
+
+# DB 쓰기 스레드 (주문/포지션/로그 쓰기를 모아 한 트랜잭션으로 저장)
+DB_WRITER_FLUSH_INTERVAL_MS = 50  # 첫 작업 이후 더 모으는 최대 시간
+DB_WRITER_BATCH_SIZE = 500  # 한 트랜잭션에 담는 최대 작업 수
+DB_WRITER_MAX_QUEUE = 10000  # 대기 작업 상한 (가득 차면 호출 스레드가 대기)
+
+# 조회 결과를 나눠 읽는 단위 (BaseRepository.iter_rows)
+DB_FETCH_CHUNK_SIZE = 5000
+
+# 백테스트용 캔들 컬럼 캐시 (메모리 맵 파일)
+CANDLE_CACHE_DIR = DATA_DIR / "candle_cache"
+
+# 거래소 마켓 메타데이터 캐시 (정밀도/주문 한도/계약 크기)
+MARKET_CACHE_DIR = DATA_DIR / "market_cache"
+MARKET_CACHE_TTL_HOURS = 12  # 지나면 캐시 값을 쓰면서 백그라운드 갱신
+
 # 암호화된 자격증명 저장 경로
 CREDENTIALS_PATH = DATA_DIR / "credentials.enc"
 
@@ -69,6 +94,14 @@ LEGACY_SYMBOLS = [
 # 타임프레임 (CCXT 표준)
 TIMEFRAMES = ["1m", "5m", "15m", "1h", "4h", "1d"]
 
+# 타임프레임별 분 단위 길이
+TIMEFRAME_MINUTES = {"1m": 1, "5m": 5, "15m": 15, "1h": 60, "4h": 240, "1d": 1440}
+
+# 1분봉에서 로컬 생성하는 상위 타임프레임 (UTC 경계 정렬)
+BASE_TIMEFRAME = "1m"
+DERIVED_TIMEFRAMES = ["5m", "15m", "1h", "4h", "1d"]
+RESAMPLE_WINDOW_DAYS = 30  # 리샘플링 시 한 번에 읽는 1분봉 구간
+
 # 레거시 타임프레임 (OKX 전용)
 LEGACY_TIMEFRAMES = ["1m", "5m", "15m", "1H", "4H", "1D"]
 
@@ -78,6 +111,41 @@ DEFAULT_EXCHANGES = ["binance", "bybit", "okx", "bitget", "kucoin"]
 # 데이터 폴링 간격 (초)
 DATA_POLLING_INTERVAL = 10
 
+# 백필 스케줄러 설정
+BACKFILL_MAX_CONCURRENCY = 4  # 거래소별 동시 수집 작업 수 (심볼 × 타임프레임)
+
+# 거래소 요청 예산 (거래소별 공유 토큰 버킷)
+RATE_LIMIT_DEFAULT_PER_SECOND = 10  # ccxt rateLimit 정보가 없을 때 초당 요청 수
+RATE_LIMIT_BURST_SECONDS = 1.0  # 버스트 허용량 (초당 요청 수 × 초)
+RATE_LIMIT_BASE_COOLDOWN = 1.0  # Retry-After 없는 429 첫 쿨다운 (연속 시 두 배)
+RATE_LIMIT_MAX_COOLDOWN = 60  # 최대 쿨다운 (초)
+RATE_LIMIT_MAX_RETRIES = 2  # 429 후 쿨다운 뒤 재시도 횟수
+
+# 비동기 거래소 클라이언트 (공유 이벤트 루프)
+ASYNC_HTTP_POOL_SIZE = 100  # aiohttp 전체 동시 연결 수
+ASYNC_HTTP_POOL_PER_HOST = 20  # 거래소 호스트별 동시 연결 수
+ASYNC_CALL_TIMEOUT = 60  # 동기 파사드 호출 대기 한도 (초)
+
+# WebSocket 허브 (거래소별 연결 하나로 모든 심볼 구독)
+WS_PING_INTERVAL = 20  # 프로토콜 ping 간격 (초)
+WS_PING_TIMEOUT = 10  # pong 대기 한도 (초)
+WS_LOGIN_TIMEOUT = 10  # 비공개 채널 로그인 응답 대기 (초)
+WS_RECONNECT_BASE_DELAY = 1  # 재연결 첫 대기 (초, 실패마다 두 배)
+WS_RECONNECT_MAX_DELAY = 60  # 재연결 최대 대기 (초)
+
+# 자동매매 봇 모니터링 (이벤트 모드: 주문/포지션 푸시로 반응, REST는 안전망)
+BOT_EVENT_DRIVEN = True  # 봇 설정 'event_driven'으로 개별 지정 가능
+BOT_RECONCILE_INTERVAL = 30  # 스트림 연결 중 REST 포지션 대조 주기 (초)
+BOT_STREAM_DOWN_POLL_INTERVAL = 5  # 스트림 끊김/조회 실패 시 REST 조회 주기 (초)
+
+# 코루틴 봇 런타임 (계정별로 모든 심볼 봇을 공유 이벤트 루프에서 실행)
+BOT_ASYNC_RUNTIME = True  # False면 심볼마다 QThread + TradingBotWorker
+BOT_MAX_RESTARTS = 3  # 봇이 예외로 죽었을 때 재시작 횟수
+BOT_RESTART_DELAY = 5  # 첫 재시작 대기 (초, 재시작마다 두 배)
+
+# 계정 스냅샷 (거래소 계정별 포지션/미체결 주문 일괄 조회)
+ACCOUNT_SNAPSHOT_INTERVAL = 3  # 갱신 주기 (초)
+
 # 보조지표 기본 파라미터
 INDICATOR_PARAMS = {
     "MA": [20, 50, 100, 200],
@@ -87,15 +155,25 @@ INDICATOR_PARAMS = {
     "BOLLINGER": {"period": 20, "std_dev": 2}
 }
 
+# 보조지표 일괄 계산 (전체 시계열 벡터 계산)
+INDICATOR_BATCH_BARS = 20000  # 한 번에 계산/저장하는 봉 수
+INDICATOR_WARMUP_BARS = 500  # 구간 앞에 덧붙이는 워밍업 봉 수 (MA200, EMA 수렴)
+
 # 봇 설정
 BOT_INTERVALS = ["1m", "5m", "15m"]
 MAX_LEVERAGE = 20
 MIN_LEVERAGE = 1
 MAX_MARTINGALE_STEPS = 10
+BATCH_ORDER_MAX_WORKERS = 5  # 일괄 주문 미지원 거래소의 동시 개별 주문 수
 
 # 마틴게일 기본 사이즈 비율
 DEFAULT_MARTINGALE_RATIOS = [1, 1, 2, 4, 8, 16, 32, 64, 128, 256]
 
+# 백테스트 파라미터 최적화
+OPTIMIZER_MAX_WORKERS = None  # 프로세스 수 (None이면 CPU 코어 수)
+OPTIMIZER_BATCH_SIZE = 16  # 프로세스 작업 1건당 평가할 설정 수
+OPTIMIZER_TOP_N = 20  # 순위 갱신 시그널로 보내는 상위 결과 수
+
 # UI 설정
 WINDOW_TITLE = "Gr8 DIY"
 LOG_VIEW_MAX_LINES = 1000
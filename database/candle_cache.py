@@ -0,0 +1,334 @@
+"""
+캔들 컬럼 캐시
+(거래소, 심볼, 타임프레임)별 캔들을 컬럼 파일로 저장하고 메모리 맵으로 읽음
+
+- 컬럼: timestamp(int64 epoch ms), open/high/low/close/volume(float64)
+- 파일: {cache_dir}/{exchange}/{symbol}/{timeframe}/{generation}.{column}.bin + meta.json
+- 유효 행 수는 meta.json의 length로 관리 (파일 끝의 여분 바이트는 무시)
+- 값이 계속 바뀌는 진행 중인 봉은 담지 않는다 (마감된 뒤 덧붙여짐)
+- 캐시 끝 뒤의 봉은 파일 끝(읽는 쪽 메모리 맵 범위 밖)에 덧붙인다.
+  기존 행 값이 바뀌거나 중간에 새 시각이 끼면 새 generation 파일로 다시 쓴 뒤 meta를 교체한다.
+  유효 길이 안의 행은 한 번 쓰면 바꾸지 않으므로 읽는 쪽 메모리 맵은 실행 도중 바뀌지 않는다.
+"""
+import json
+import os
+import shutil
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config.settings import CANDLE_CACHE_DIR, TIMEZONE, TIMEFRAME_MINUTES
+from utils.logger import logger
+
+COLUMNS = (
+    ('timestamp', np.int64),
+    ('open', np.float64),
+    ('high', np.float64),
+    ('low', np.float64),
+    ('close', np.float64),
+    ('volume', np.float64),
+)
+
+META_FILE = "meta.json"
+
+
+@dataclass
+class CachedCandles:
+    """캐시된 캔들 컬럼 (메모리 맵 뷰, 읽기 전용)"""
+    timestamp: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+
+def kst_strings_to_epoch_ms(timestamps) -> np.ndarray:
+    """KST 문자열 시각 → epoch ms (벡터 변환)"""
+    kst_times = pd.to_datetime(pd.Series(timestamps)).dt.tz_localize(TIMEZONE)
+    return ((kst_times - pd.Timestamp(0, tz='UTC')) // pd.Timedelta(milliseconds=1)) \
+        .to_numpy(dtype=np.int64)
+
+
+def epoch_ms_to_kst_strings(epoch_ms: np.ndarray) -> List[str]:
+    """epoch ms → KST 문자열 시각 (YYYY-MM-DD HH:MM:SS, 벡터 변환)"""
+    if len(epoch_ms) == 0:
+        return []
+    kst_times = pd.to_datetime(np.asarray(epoch_ms, dtype=np.int64), unit='ms', utc=True) \
+        .tz_convert(TIMEZONE).tz_localize(None)
+    text = np.datetime_as_string(kst_times.to_numpy().astype('datetime64[s]'))
+    # 'YYYY-MM-DDTHH:MM:SS' 의 T(10번째 문자)를 공백으로 (UCS4 코드 배열에서 직접 치환)
+    chars = text.view(np.uint32).reshape(len(text), -1)
+    chars[:, 10] = ord(' ')
+    return text.tolist()
+
+
+class CandleCache:
+    """시계열별 컬럼 캔들 캐시"""
+
+    _locks: Dict[Tuple[str, str, str], threading.Lock] = {}
+    _locks_guard = threading.Lock()
+
+    def __init__(self, cache_dir: Path = None):
+        self.cache_dir = Path(cache_dir or CANDLE_CACHE_DIR)
+
+    # ========== 조회 ==========
+
+    def exists(self, exchange_id: str, symbol: str, timeframe: str) -> bool:
+        """캐시가 만들어진 시계열인지"""
+        return (self._series_dir(exchange_id, symbol, timeframe) / META_FILE).exists()
+
+    def load(self, exchange_id: str, symbol: str, timeframe: str,
+             start_ms: int = None, end_ms: int = None) -> Optional[CachedCandles]:
+        """
+        [start_ms, end_ms] 구간 캔들 (복사 없는 메모리 맵 뷰)
+
+        Returns:
+            캐시가 없으면 None
+        """
+        series_dir = self._series_dir(exchange_id, symbol, timeframe)
+        meta = self._read_meta(series_dir)
+        if meta is None:
+            return None
+
+        columns = self._map_columns(series_dir, meta)
+        timestamps = columns['timestamp']
+
+        # 정렬된 timestamp 이진 탐색
+        start = 0 if start_ms is None else int(np.searchsorted(timestamps, start_ms, 'left'))
+        end = len(timestamps) if end_ms is None else int(np.searchsorted(timestamps, end_ms, 'right'))
+
+        return CachedCandles(**{name: values[start:end] for name, values in columns.items()})
+
+    # ========== 쓰기 ==========
+
+    def rebuild(self, exchange_id: str, symbol: str, timeframe: str,
+                columns: Dict[str, np.ndarray]):
+        """시계열 전체를 다시 씀 (DB 전체 로드 결과로 캐시 생성)"""
+        key = (exchange_id, symbol, timeframe)
+        with self._lock(key):
+            self._rewrite(self._series_dir(*key),
+                          self._closed_rows(timeframe, self._normalize(columns)), list(key))
+
+    def write(self, exchange_id: str, symbol: str, timeframe: str,
+              columns: Dict[str, np.ndarray]) -> int:
+        """
+        캔들 병합 (같은 timestamp는 새 값으로 교체, 진행 중인 봉 제외)
+
+        캐시가 없는 시계열은 건너뛴다. 캐시는 rebuild()로 DB 전체를 담은 뒤부터
+        증분 갱신되므로 일부 구간만 담긴 캐시가 생기지 않는다.
+        값이 같은 기존 행은 건너뛰므로 같은 봉을 다시 저장해도 파일을 다시 쓰지 않는다.
+
+        Returns:
+            반영된 행 수
+        """
+        key = (exchange_id, symbol, timeframe)
+        series_dir = self._series_dir(*key)
+        incoming = self._closed_rows(timeframe, self._normalize(columns))
+        if len(incoming['timestamp']) == 0:
+            return 0
+
+        with self._lock(key):
+            meta = self._read_meta(series_dir)
+            if meta is None:
+                return 0
+
+            existing = self._map_columns(series_dir, meta)
+            length = meta['length']
+            timestamps = incoming['timestamp']
+
+            # 캐시 마지막 시각 이하인 행 중 새 시각이거나 값이 바뀐 행
+            inside = int(np.searchsorted(timestamps, existing['timestamp'][-1], 'right')) if length else 0
+            positions = np.searchsorted(existing['timestamp'], timestamps[:inside])
+            changed = existing['timestamp'][positions] != timestamps[:inside]
+            for name, _ in COLUMNS[1:]:
+                changed |= existing[name][positions] != incoming[name][:inside]
+            head = {name: values[:inside][changed] for name, values in incoming.items()}
+            tail = {name: values[inside:] for name, values in incoming.items()}
+
+            if len(head['timestamp']):
+                # 읽는 쪽이 보고 있는 행이 바뀜 → 병합 후 새 generation으로 다시 쓰기
+                merged = {name: np.concatenate([np.asarray(existing[name]), head[name], tail[name]])
+                          for name, _ in COLUMNS}
+                del existing
+                self._rewrite(series_dir, self._normalize(merged))
+            elif len(tail['timestamp']):
+                # 캐시 끝 뒤의 봉만 → 파일 끝에 덧붙이기
+                del existing
+                self._write_at(series_dir, meta, length, tail)
+
+        return len(head['timestamp']) + len(tail['timestamp'])
+
+    def write_candles(self, candles: List[Dict]) -> int:
+        """
+        캔들 딕셔너리 리스트 병합 (레포지토리 저장 형식)
+
+        timestamp_ms가 있으면 그대로, 없으면 KST 문자열 timestamp를 변환해 사용한다.
+        """
+        if not candles:
+            return 0
+
+        groups: Dict[Tuple[str, str, str], List[Dict]] = {}
+        for candle in candles:
+            key = (candle['exchange_id'], candle['symbol'], candle['timeframe'])
+            groups.setdefault(key, []).append(candle)
+
+        written = 0
+        for key, rows in groups.items():
+            if not self.exists(*key):
+                continue
+
+            if all('timestamp_ms' in row for row in rows):
+                timestamps = np.fromiter((row['timestamp_ms'] for row in rows),
+                                         dtype=np.int64, count=len(rows))
+            else:
+                timestamps = kst_strings_to_epoch_ms([row['timestamp'] for row in rows])
+
+            columns = {'timestamp': timestamps}
+            for name, dtype in COLUMNS[1:]:
+                columns[name] = np.fromiter((row[name] for row in rows), dtype=dtype, count=len(rows))
+            written += self.write(*key, columns)
+
+        return written
+
+    def prune_before(self, cutoff_ms: int):
+        """모든 시계열에서 cutoff 이전 캔들 삭제 (DB 보존 기간과 맞춤)"""
+        for meta_path in self.cache_dir.glob(f"*/*/*/{META_FILE}"):
+            series_dir = meta_path.parent
+            meta = self._read_meta(series_dir)
+            if meta is None:
+                continue
+
+            with self._lock(tuple(meta['key'])):
+                meta = self._read_meta(series_dir)
+                if meta is None:
+                    continue
+                columns = self._map_columns(series_dir, meta)
+                keep = int(np.searchsorted(columns['timestamp'], cutoff_ms, 'left'))
+                if keep == 0:
+                    continue
+                trimmed = {name: np.array(values[keep:]) for name, values in columns.items()}
+                del columns
+                self._rewrite(series_dir, trimmed)
+
+    def invalidate(self, exchange_id: str, symbol: str = None, timeframe: str = None):
+        """캐시 삭제 (다음 조회 시 DB에서 다시 생성)"""
+        path = self.cache_dir / self._safe(exchange_id)
+        if symbol:
+            path = path / self._safe(symbol)
+            if timeframe:
+                path = path / self._safe(timeframe)
+        shutil.rmtree(path, ignore_errors=True)
+
+    # ========== 내부 ==========
+
+    @classmethod
+    def _lock(cls, key: Tuple[str, str, str]) -> threading.Lock:
+        with cls._locks_guard:
+            if key not in cls._locks:
+                cls._locks[key] = threading.Lock()
+            return cls._locks[key]
+
+    @staticmethod
+    def _safe(name: str) -> str:
+        """경로에 쓸 수 없는 문자 치환 (BTC/USDT:USDT → BTC_USDT_USDT)"""
+        return "".join(c if c.isalnum() or c in "-." else "_" for c in name)
+
+    def _series_dir(self, exchange_id: str, symbol: str, timeframe: str) -> Path:
+        return self.cache_dir / self._safe(exchange_id) / self._safe(symbol) / self._safe(timeframe)
+
+    @staticmethod
+    def _read_meta(series_dir: Path) -> Optional[Dict]:
+        try:
+            with open(series_dir / META_FILE, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_meta(series_dir: Path, meta: Dict):
+        tmp_path = series_dir / (META_FILE + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, series_dir / META_FILE)
+
+    @staticmethod
+    def _column_path(series_dir: Path, generation: int, name: str) -> Path:
+        return series_dir / f"{generation}.{name}.bin"
+
+    def _map_columns(self, series_dir: Path, meta: Dict) -> Dict[str, np.ndarray]:
+        """컬럼 파일 메모리 맵 (유효 길이만큼)"""
+        length = meta['length']
+        columns = {}
+        for name, dtype in COLUMNS:
+            if length == 0:
+                columns[name] = np.empty(0, dtype=dtype)
+            else:
+                columns[name] = np.memmap(self._column_path(series_dir, meta['generation'], name),
+                                          dtype=dtype, mode='r', shape=(length,))
+        return columns
+
+    @staticmethod
+    def _normalize(columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """timestamp 오름차순 정렬 + 중복 timestamp는 마지막 값 유지"""
+        timestamps = np.asarray(columns['timestamp'], dtype=np.int64)
+        # 뒤집어서 unique → 각 timestamp의 마지막 등장 위치
+        _, reverse_index = np.unique(timestamps[::-1], return_index=True)
+        index = len(timestamps) - 1 - reverse_index
+        return {name: np.asarray(columns[name], dtype=dtype)[index] for name, dtype in COLUMNS}
+
+    @staticmethod
+    def _closed_rows(timeframe: str, columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """마감된 봉만 (정렬된 컬럼, 봉 시작 + 봉 길이 <= 현재)"""
+        minutes = TIMEFRAME_MINUTES.get(timeframe)
+        if not minutes:
+            return columns
+        open_from = int(time.time() * 1000) - minutes * 60 * 1000
+        end = int(np.searchsorted(columns['timestamp'], open_from, 'right'))
+        return {name: values[:end] for name, values in columns.items()}
+
+    def _write_at(self, series_dir: Path, meta: Dict, offset: int,
+                  columns: Dict[str, np.ndarray]):
+        """offset 행부터 덧쓰기 (파일 끝 확장), 이후 meta 길이 갱신"""
+        for name, dtype in COLUMNS:
+            path = self._column_path(series_dir, meta['generation'], name)
+            with open(path, "r+b" if path.exists() else "wb") as f:
+                f.seek(offset * np.dtype(dtype).itemsize)
+                f.write(columns[name].tobytes())
+
+        meta['length'] = offset + len(columns['timestamp'])
+        self._write_meta(series_dir, meta)
+
+    def _rewrite(self, series_dir: Path, columns: Dict[str, np.ndarray], key: List[str] = None):
+        """새 generation 파일로 전체 쓰기 후 meta 교체, 이전 파일 정리"""
+        series_dir.mkdir(parents=True, exist_ok=True)
+        old_meta = self._read_meta(series_dir)
+        generation = (old_meta['generation'] + 1) if old_meta else 0
+        key = key or old_meta['key']
+
+        for name, _ in COLUMNS:
+            columns[name].tofile(self._column_path(series_dir, generation, name))
+
+        self._write_meta(series_dir, {
+            'key': key,
+            'generation': generation,
+            'length': int(len(columns['timestamp'])),
+        })
+
+        # 이전 generation 파일 정리 (다른 스레드가 메모리 맵으로 열고 있으면 다음 기회에)
+        for path in series_dir.glob("*.bin"):
+            if not path.name.startswith(f"{generation}."):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+        logger.debug("CandleCache", f"{'/'.join(key)}: {len(columns['timestamp'])}행 기록")
@@ -0,0 +1,107 @@
+"""
+SQLite 연결 관리
+QSqlDatabase 연결은 만든 스레드에서만 쓸 수 있으므로 스레드마다 이름 있는 연결을 연다.
+"""
+import itertools
+import threading
+from typing import Dict, Optional
+
+from PySide6.QtSql import QSqlDatabase, QSqlQuery
+
+from config.settings import SQLITE_BUSY_TIMEOUT_MS, SQLITE_PRAGMAS
+from utils.logger import logger
+
+
+class ConnectionManager:
+    """
+    스레드별 QSqlDatabase 연결 관리
+
+    - 메인 스레드는 init_database가 연 기본 연결을 사용
+    - 그 외 스레드(QThread, 스레드 풀)는 처음 요청할 때 같은 DB 파일로 연결을 열고 pragma 적용
+    - 연결은 스레드 ident로 찾는다. QThread의 Python 스레드 상태는 호출마다 새로 만들어질 수
+      있어 threading.local에 둘 수 없다.
+    - 연결은 연 스레드에서만 닫을 수 있으므로 워커 스레드 진입점은 모두 끝날 때 (finally)
+      release()를 호출해야 한다.
+    """
+
+    CONNECTION_PREFIX = "thread_conn"
+
+    _db_path: Optional[str] = None
+    _lock = threading.Lock()
+    _counter = itertools.count(1)
+    _connections: Dict[int, str] = {}  # 스레드 ident → 연결 이름
+
+    @classmethod
+    def configure(cls, db_path: str):
+        """DB 경로 지정 (init_database에서 호출)"""
+        cls._db_path = db_path
+
+    @classmethod
+    def database(cls) -> Optional[QSqlDatabase]:
+        """현재 스레드의 열린 연결 (DB가 초기화되지 않았으면 None)"""
+        if threading.current_thread() is threading.main_thread():
+            db = QSqlDatabase.database()
+            return db if db.isOpen() else None
+
+        ident = threading.get_ident()
+        name = cls._connections.get(ident)
+        if name is not None:
+            db = QSqlDatabase.database(name, False)
+            if db.isOpen():
+                return db
+            # release() 없이 끝난 스레드의 연결 (ident 재사용). 다른 스레드 소유라
+            # 여기서 닫거나 제거하지 않고 매핑만 버린다.
+            logger.warning("DB", f"해제되지 않은 스레드 연결: {name} "
+                                 f"({threading.current_thread().name})")
+            cls._forget(ident, name)
+
+        return cls._open_thread_connection(ident)
+
+    @classmethod
+    def release(cls):
+        """현재 스레드의 연결 닫기 (스레드 작업이 끝날 때 호출)"""
+        if threading.current_thread() is threading.main_thread():
+            return
+
+        ident = threading.get_ident()
+        name = cls._connections.get(ident)
+        if name is not None:
+            QSqlDatabase.database(name, False).close()
+            cls._forget(ident, name)
+            QSqlDatabase.removeDatabase(name)
+
+    @staticmethod
+    def apply_pragmas(db: QSqlDatabase):
+        """연결 성능 설정 적용"""
+        for name, value in SQLITE_PRAGMAS.items():
+            query = QSqlQuery(db)
+            if not query.exec(f"PRAGMA {name} = {value}"):
+                logger.warning("DB", f"PRAGMA {name} 설정 실패: {query.lastError().text()}")
+
+    @classmethod
+    def _open_thread_connection(cls, ident: int) -> Optional[QSqlDatabase]:
+        db_path = cls._db_path or QSqlDatabase.database().databaseName()
+        if not db_path:
+            return None
+
+        name = f"{cls.CONNECTION_PREFIX}_{next(cls._counter)}"
+        db = QSqlDatabase.addDatabase("QSQLITE", name)
+        db.setDatabaseName(db_path)
+        db.setConnectOptions(f"QSQLITE_BUSY_TIMEOUT={SQLITE_BUSY_TIMEOUT_MS}")
+        if not db.open():
+            logger.error("DB", f"스레드 DB 연결 실패 ({name}): {db.lastError().text()}")
+            del db
+            QSqlDatabase.removeDatabase(name)
+            return None
+
+        cls.apply_pragmas(db)
+        with cls._lock:
+            cls._connections[ident] = name
+        logger.debug("DB", f"스레드 DB 연결 생성: {name} ({threading.current_thread().name})")
+        return db
+
+    @classmethod
+    def _forget(cls, ident: int, name: str):
+        with cls._lock:
+            if cls._connections.get(ident) == name:
+                del cls._connections[ident]
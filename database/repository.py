@@ -3,10 +3,17 @@
 CCXT 멀티 거래소 지원 버전
 """
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Tuple
 from PySide6.QtSql import QSqlQuery, QSqlDatabase
 import json
 
+import numpy as np
+
+from config.settings import DB_FETCH_CHUNK_SIZE
+from database.candle_cache import CandleCache, COLUMNS as CANDLE_COLUMNS
+from database.connection import ConnectionManager
+from database.writer import db_writer
+from database.schema import DatabaseSchema
 from utils.logger import logger
 from utils.time_helper import time_helper
 
@@ -14,23 +21,46 @@ from utils.time_helper import time_helper
 class BaseRepository:
     """기본 레포지토리 클래스"""
 
-    def __init__(self):
+    def __init__(self, connection_name: str = None):
+        """
+        Args:
+            connection_name: QSqlDatabase 연결 이름 (없으면 호출 스레드의 연결)
+        """
+        self.connection_name = connection_name
+
+    @property
+    def db(self) -> Optional[QSqlDatabase]:
+        """
+        쿼리에 사용할 연결
+
+        레포지토리는 만든 스레드와 다른 스레드(QThread 워커 등)에서도 쓰이므로
+        호출할 때마다 현재 스레드의 연결을 고른다. 열린 연결이 없으면 None.
+        """
         # 데이터베이스가 초기화되지 않았을 수 있으므로 안전하게 처리
         try:
-            self.db = QSqlDatabase.database()
-            if not self.db.isOpen():
-                self.db = None
+            if self.connection_name:
+                db = QSqlDatabase.database(self.connection_name)
+                return db if db.isOpen() else None
+            return ConnectionManager.database()
         except Exception:
-            self.db = None
+            return None
     
-    def execute_query(self, sql: str, params: tuple = ()) -> QSqlQuery:
-        """쿼리 실행"""
+    def execute_query(self, sql: str, params: tuple = (),
+                      forward_only: bool = False) -> QSqlQuery:
+        """
+        쿼리 실행
+
+        Args:
+            forward_only: 앞으로만 읽는 조회 (드라이버가 지난 행을 보관하지 않음)
+        """
         # 데이터베이스 연결이 없으면 빈 쿼리 반환
-        if self.db is None:
+        db = self.db
+        if db is None:
             logger.warning("DB", "데이터베이스 연결 없음 - 쿼리 실행 실패")
             return QSqlQuery()
 
-        query = QSqlQuery(self.db)
+        query = QSqlQuery(db)
+        query.setForwardOnly(forward_only)
         
         if params:
             # 파라미터가 있으면 prepare + bind
@@ -59,25 +89,230 @@ class BaseRepository:
                     logger.error("DB", f"Params: {params}")
         
         return query
-    
+
+    def enqueue_write(self, sql: str, params: tuple = ()):
+        """
+        결과가 필요 없는 쓰기 (DB 쓰기 스레드가 실행 중이면 큐에 넣고 바로 반환)
+
+        같은 쓰기 스레드를 거치므로 순서는 유지된다. 직후에 같은 데이터를 읽어야 하면
+        db_writer.flush()로 커밋을 기다린다. 고정 연결(connection_name)은 직접 실행.
+        """
+        if db_writer.is_running and not self.connection_name:
+            db_writer.enqueue(sql, params)
+        else:
+            self.execute_query(sql, params)
+
+    def enqueue_writes(self, sql: str, rows: List[tuple]):
+        """
+        같은 SQL 여러 행 쓰기 (한 트랜잭션)
+
+        쓰기 스레드가 실행 중이면 한 작업으로 넣고 바로 반환, 아니면 execute_batch로 실행.
+        """
+        if not rows:
+            return
+        if db_writer.is_running and not self.connection_name:
+            db_writer.enqueue_many(sql, rows)
+        else:
+            self.execute_batch(sql, [list(column) for column in zip(*rows)])
+
+    def execute_batch(self, sql: str, columns: List[list]) -> int:
+        """
+        배치 쿼리 실행 (prepare 1회 + execBatch + 단일 트랜잭션)
+
+        Args:
+            sql: 실행할 SQL (positional placeholder)
+            columns: 컬럼별 값 리스트 (placeholder 순서대로)
+
+        Returns:
+            변경된 행 수 (실패 시 -1)
+        """
+        db = self.db
+        if db is None:
+            logger.warning("DB", "데이터베이스 연결 없음 - 배치 실행 실패")
+            return -1
+
+        if not columns or not columns[0]:
+            return 0
+
+        if not db.transaction():
+            logger.error("DB", f"트랜잭션 시작 실패: {db.lastError().text()}")
+            return -1
+
+        changes_before = self._total_changes(db)
+
+        query = QSqlQuery(db)
+        if not query.prepare(sql):
+            logger.error("DB", f"배치 쿼리 준비 실패: {query.lastError().text()}")
+            logger.error("DB", f"SQL: {sql}")
+            db.rollback()
+            return -1
+
+        # 컬럼 단위 바인딩 (execBatch)
+        for values in columns:
+            query.addBindValue(values)
+
+        if not query.execBatch():
+            logger.error("DB", f"배치 실행 실패: {query.lastError().text()}")
+            logger.error("DB", f"SQL: {sql}")
+            db.rollback()
+            return -1
+
+        changes = self._total_changes(db) - changes_before
+
+        if not db.commit():
+            logger.error("DB", f"트랜잭션 커밋 실패: {db.lastError().text()}")
+            db.rollback()
+            return -1
+
+        return changes
+
+    @staticmethod
+    def _total_changes(db: QSqlDatabase) -> int:
+        """현재 연결의 누적 변경 행 수 (SQLite total_changes)"""
+        query = QSqlQuery(db)
+        if query.exec("SELECT total_changes()") and query.next():
+            return int(query.value(0))
+        return 0
+
     def fetch_one(self, sql: str, params: tuple = ()) -> Optional[Dict]:
         """단일 레코드 조회"""
-        query = self.execute_query(sql, params)
+        query = self.execute_query(sql, params, forward_only=True)
         if query.next():
-            record = query.record()
-            return {record.fieldName(i): query.value(i) 
-                   for i in range(record.count())}
+            names = self._field_names(query)
+            return dict(zip(names, map(query.value, range(len(names)))))
         return None
     
     def fetch_all(self, sql: str, params: tuple = ()) -> List[Dict]:
         """다중 레코드 조회"""
-        query = self.execute_query(sql, params)
-        results = []
-        while query.next():
-            record = query.record()
-            results.append({record.fieldName(i): query.value(i) 
-                          for i in range(record.count())})
-        return results
+        names, rows = self.fetch_rows(sql, params)
+        return [dict(zip(names, row)) for row in rows]
+
+    def fetch_rows(self, sql: str, params: tuple = ()) -> Tuple[List[str], List[tuple]]:
+        """
+        다중 레코드를 튜플로 조회
+
+        Returns:
+            (컬럼 이름 목록, 행 튜플 리스트)
+        """
+        names = None
+        rows = []
+        for names, chunk in self.iter_rows(sql, params):
+            rows.extend(chunk)
+        return names or [], rows
+
+    def iter_rows(self, sql: str, params: tuple = (),
+                  chunk_size: int = None) -> Iterator[Tuple[List[str], List[tuple]]]:
+        """
+        조회 결과를 chunk_size 행씩 나눠 읽는 제너레이터
+
+        컬럼 이름과 인덱스는 실행 직후 한 번만 구하고, 각 행은 튜플로 만든다.
+
+        Yields:
+            (컬럼 이름 목록, 행 튜플 리스트)
+        """
+        chunk_size = chunk_size or DB_FETCH_CHUNK_SIZE
+        query = self.execute_query(sql, params, forward_only=True)
+        if not query.isActive():
+            return
+
+        names = self._field_names(query)
+        indices = range(len(names))
+        value = query.value
+        advance = query.next
+
+        chunk = []
+        while advance():
+            chunk.append(tuple(map(value, indices)))
+            if len(chunk) >= chunk_size:
+                yield names, chunk
+                chunk = []
+        if chunk:
+            yield names, chunk
+
+    def fetch_columns(self, sql: str, params: tuple = (),
+                      dtypes: Dict[str, Any] = None) -> Dict[str, np.ndarray]:
+        """
+        다중 레코드를 컬럼별 NumPy 배열로 조회
+
+        Args:
+            dtypes: {컬럼: dtype} (없는 컬럼은 NumPy가 추론, NULL이 있으면 object)
+        """
+        names, rows = self.fetch_rows(sql, params)
+        return self._rows_to_columns(names, rows, dtypes)
+
+    @staticmethod
+    def _rows_to_columns(names: List[str], rows: List[tuple],
+                         dtypes: Dict[str, Any] = None) -> Dict[str, np.ndarray]:
+        """행 튜플 리스트를 컬럼별 배열로 변환"""
+        dtypes = dtypes or {}
+        if not names:
+            return {name: np.empty(0, dtype=dtype) for name, dtype in dtypes.items()}
+
+        values = list(zip(*rows)) if rows else [()] * len(names)
+        return {name: np.asarray(column, dtype=dtypes.get(name))
+                for name, column in zip(names, values)}
+
+    def fetch_structured(self, sql: str, params: tuple,
+                         dtype: np.dtype) -> np.ndarray:
+        """
+        다중 레코드를 NumPy 구조화 배열로 조회
+
+        Args:
+            dtype: SELECT 컬럼 순서와 같은 필드 순서의 구조화 dtype
+        """
+        dtype = np.dtype(dtype)
+        chunks = [np.array(chunk, dtype=dtype) for _, chunk in self.iter_rows(sql, params)]
+        return np.concatenate(chunks) if chunks else np.empty(0, dtype=dtype)
+
+    def iter_keyset(self, select: str, conditions: List[str], params: list, key: str,
+                    descending: bool = False,
+                    chunk_size: int = None) -> Iterator[Tuple[List[str], List[tuple]]]:
+        """
+        키셋 페이지네이션 조회 (WHERE key > 마지막 값 ORDER BY key LIMIT n)
+
+        페이지마다 쿼리를 새로 실행하므로 전체 결과를 메모리에 올리거나 읽기
+        트랜잭션을 오래 잡지 않는다. OFFSET과 달리 뒤 페이지도 인덱스 탐색 한 번.
+
+        Args:
+            select: WHERE 앞까지의 SELECT 문 (첫 컬럼이 key 값)
+            conditions: 고정 조건 (AND 결합)
+            key: 조건 안에서 유일한 정렬 키 컬럼
+            descending: 최신순 조회
+
+        Yields:
+            (컬럼 이름 목록, 행 튜플 리스트) - 마지막 페이지 외에는 chunk_size행
+        """
+        chunk_size = chunk_size or DB_FETCH_CHUNK_SIZE
+        operator, order = ("<", "DESC") if descending else (">", "ASC")
+        last = None
+
+        while True:
+            page_conditions = list(conditions)
+            page_params = list(params)
+            if last is not None:
+                page_conditions.append(f"{key} {operator} ?")
+                page_params.append(last)
+
+            where_clause = " AND ".join(page_conditions) if page_conditions else "1=1"
+            sql = f"""
+            {select}
+            WHERE {where_clause}
+            ORDER BY {key} {order} LIMIT ?
+            """
+            names, rows = self.fetch_rows(sql, tuple(page_params) + (chunk_size,))
+            if not rows:
+                return
+
+            yield names, rows
+            if len(rows) < chunk_size:
+                return
+            last = rows[-1][0]
+
+    @staticmethod
+    def _field_names(query: QSqlQuery) -> List[str]:
+        """실행된 쿼리의 컬럼 이름 (행마다 record()를 다시 만들지 않도록 1회 조회)"""
+        record = query.record()
+        return [record.fieldName(i) for i in range(record.count())]
 
 
 # ========== 거래소 관련 레포지토리 ==========
@@ -182,7 +417,7 @@ class SystemLogsRepository(BaseRepository):
         INSERT INTO system_logs (timestamp, level, module, message, stacktrace)
         VALUES (?, ?, ?, ?, ?)
         """
-        self.execute_query(sql, (timestamp, level, module, message, stacktrace))
+        self.enqueue_write(sql, (timestamp, level, module, message, stacktrace))
     
     def get_recent(self, limit: int = 1000, level_filter: str = None) -> List[Dict]:
         """최근 로그 조회"""
@@ -220,71 +455,212 @@ class SystemLogsRepository(BaseRepository):
 # ========== 캔들 데이터 레포지토리 ==========
 
 class CandlesRepository(BaseRepository):
-    """캔들 데이터 레포지토리 (거래소별)"""
-    
+    """
+    캔들 데이터 레포지토리 (거래소별)
+
+    저장은 series(거래소/심볼/타임프레임 → series_id) + candle_bars(series_id, ts epoch ms).
+    조회 결과와 인자는 기존과 같이 exchange_id/symbol/timeframe과 KST 문자열 timestamp를 쓴다.
+    """
+
+    # (exchange_id, symbol, timeframe) → series_id (series 행은 지우지 않으므로 계속 유효)
+    _series_ids: Dict[tuple, int] = {}
+
+    _TIMESTAMP_SQL = DatabaseSchema.KST_TIMESTAMP_SQL.format(ts="b.ts")
+    _SELECT_CANDLES = f"""
+        SELECT s.exchange_id, s.symbol, s.timeframe, {_TIMESTAMP_SQL} AS timestamp,
+               b.open, b.high, b.low, b.close, b.volume
+        FROM candle_bars b
+        JOIN series s ON s.series_id = b.series_id
+        """
+    # 키셋 페이지네이션용 (첫 컬럼이 키)
+    _SELECT_CANDLES_KEYED = f"""
+        SELECT b.ts, s.exchange_id, s.symbol, s.timeframe, {_TIMESTAMP_SQL} AS timestamp,
+               b.open, b.high, b.low, b.close, b.volume
+        FROM candle_bars b
+        JOIN series s ON s.series_id = b.series_id
+        """
+
+    def __init__(self, connection_name: str = None):
+        super().__init__(connection_name)
+        self.candle_cache = CandleCache()
+
+    def _series_id(self, exchange_id: str, symbol: str, timeframe: str,
+                   create: bool = False) -> Optional[int]:
+        """시계열 ID 조회 (create=True면 없을 때 생성)"""
+        key = (exchange_id, symbol, timeframe)
+        series_id = self._series_ids.get(key)
+        if series_id is not None:
+            return series_id
+
+        sql = "SELECT series_id FROM series WHERE exchange_id = ? AND symbol = ? AND timeframe = ?"
+        result = self.fetch_one(sql, key)
+        if result is None and create:
+            self.execute_query(
+                "INSERT OR IGNORE INTO series (exchange_id, symbol, timeframe) VALUES (?, ?, ?)", key
+            )
+            result = self.fetch_one(sql, key)
+
+        if result is None:
+            return None
+        self._series_ids[key] = result['series_id']
+        return result['series_id']
+
     def insert_candle(self, exchange_id: str, symbol: str, timeframe: str, 
                      timestamp: str, open_price: float, high: float, 
                      low: float, close: float, volume: float):
         """캔들 삽입 (중복 시 무시)"""
         sql = """
-        INSERT OR IGNORE INTO candles 
-        (exchange_id, symbol, timeframe, timestamp, open, high, low, close, volume)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        INSERT OR IGNORE INTO candle_bars
+        (series_id, ts, open, high, low, close, volume)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
         """
-        self.execute_query(sql, (exchange_id, symbol, timeframe, timestamp, 
+        series_id = self._series_id(exchange_id, symbol, timeframe, create=True)
+        self.execute_query(sql, (series_id, time_helper.parse_kst(timestamp),
                                 open_price, high, low, close, volume))
     
-    def insert_candles_batch(self, candles: List[Dict]):
-        """캔들 일괄 삽입"""
+    def insert_candles_batch(self, candles: List[Dict]) -> Dict[str, int]:
+        """
+        캔들 일괄 삽입 (단일 트랜잭션, 중복 시 무시)
+
+        Returns:
+            {'inserted': 삽입된 개수, 'ignored': 중복으로 무시된 개수}
+        """
+        if not candles:
+            return {'inserted': 0, 'ignored': 0}
+
         sql = """
-        INSERT OR IGNORE INTO candles 
-        (exchange_id, symbol, timeframe, timestamp, open, high, low, close, volume)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
-        for candle in candles:
-            self.execute_query(sql, (
-                candle['exchange_id'],
-                candle['symbol'],
-                candle['timeframe'],
-                candle['timestamp'],
-                candle['open'],
-                candle['high'],
-                candle['low'],
-                candle['close'],
-                candle['volume']
-            ))
+        INSERT OR IGNORE INTO candle_bars
+        (series_id, ts, open, high, low, close, volume)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """
+        columns = self._candle_columns(candles)
+        series_ids = set(columns[0])
+
+        # 카탈로그 트리거 변경까지 세는 total_changes 대신 카탈로그 개수 차이로 계산
+        before = self._catalog_counts(series_ids)
+        if self.execute_batch(sql, columns) < 0:
+            raise RuntimeError(f"캔들 일괄 저장 실패 ({len(candles)}개)")
+        after = self._catalog_counts(series_ids)
+        inserted = sum(after.get(sid, 0) - before.get(sid, 0) for sid in series_ids)
+
+        if inserted:
+            self._sync_cache_inserted(candles, columns[1])
+        return {'inserted': inserted, 'ignored': len(candles) - inserted}
+
+    def upsert_candles_batch(self, candles: List[Dict]) -> int:
+        """
+        캔들 일괄 삽입/갱신 (단일 트랜잭션, 기존 봉은 교체)
+
+        진행 중인 봉이나 로컬 생성 봉처럼 값이 바뀔 수 있는 캔들에 사용
+
+        Returns:
+            저장된 개수
+        """
+        if not candles:
+            return 0
+
+        sql = f"""
+        INSERT INTO candle_bars
+        (series_id, ts, open, high, low, close, volume)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        {DatabaseSchema.CANDLE_UPSERT_SQL}
+        """
+        if self.execute_batch(sql, self._candle_columns(candles)) < 0:
+            raise RuntimeError(f"캔들 일괄 갱신 실패 ({len(candles)}개)")
+
+        self._sync_cache(candles)
+        return len(candles)
+
+    def _sync_cache(self, candles: List[Dict]):
+        """저장된 캔들을 컬럼 캐시에 반영 (실패 시 캐시를 버려 다음 조회 때 재생성)"""
+        try:
+            self.candle_cache.write_candles(candles)
+        except Exception as e:
+            logger.warning("CandleCache", f"캐시 갱신 실패, 캐시 삭제: {str(e)}")
+            for exchange_id, symbol, timeframe in {
+                (c['exchange_id'], c['symbol'], c['timeframe']) for c in candles
+            }:
+                self.candle_cache.invalidate(exchange_id, symbol, timeframe)
+
+    def _sync_cache_inserted(self, candles: List[Dict], timestamps: List[int]):
+        """
+        INSERT OR IGNORE 결과를 컬럼 캐시에 반영
+
+        DB가 무시한 중복 봉의 값은 캐시에 넣지 않도록 저장 구간을 DB에서 다시 읽어 반영한다.
+        (값이 같은 기존 행은 캐시가 건너뛴다)
+        """
+        ranges: Dict[tuple, List[int]] = {}
+        for candle, ts in zip(candles, timestamps):
+            key = (candle['exchange_id'], candle['symbol'], candle['timeframe'])
+            bounds = ranges.setdefault(key, [ts, ts])
+            bounds[0], bounds[1] = min(bounds[0], ts), max(bounds[1], ts)
+
+        for key, (start_ms, end_ms) in ranges.items():
+            if not self.candle_cache.exists(*key):
+                continue
+            try:
+                self.candle_cache.write(
+                    *key, self.get_candle_columns_between(*key, start_ms, end_ms + 1)
+                )
+            except Exception as e:
+                logger.warning("CandleCache", f"캐시 갱신 실패, 캐시 삭제: {str(e)}")
+                self.candle_cache.invalidate(*key)
+
+    def _catalog_counts(self, series_ids) -> Dict[int, int]:
+        """시계열별 카탈로그 봉 개수"""
+        series_ids = list(series_ids)
+        if not series_ids:
+            return {}
+        sql = f"""
+        SELECT series_id, candle_count FROM series_catalog
+        WHERE series_id IN ({', '.join('?' * len(series_ids))})
+        """
+        _, rows = self.fetch_rows(sql, tuple(series_ids))
+        return dict(rows)
+
+    def _candle_columns(self, candles: List[Dict]) -> List[list]:
+        """캔들 dict 리스트 → execBatch 컬럼 리스트 (series_id, ts, OHLCV)"""
+        series_ids = [
+            self._series_id(c['exchange_id'], c['symbol'], c['timeframe'], create=True)
+            for c in candles
+        ]
+        timestamps = [
+            c['timestamp_ms'] if 'timestamp_ms' in c else time_helper.parse_kst(c['timestamp'])
+            for c in candles
+        ]
+        return [series_ids, timestamps] + [
+            [candle[f] for candle in candles] for f in ('open', 'high', 'low', 'close', 'volume')
+        ]
     
     def get_latest_timestamp(self, exchange_id: str, symbol: str, 
                             timeframe: str) -> Optional[str]:
         """최신 캔들 타임스탬프 조회"""
-        sql = """
-        SELECT timestamp FROM candles 
-        WHERE exchange_id = ? AND symbol = ? AND timeframe = ? 
-        ORDER BY timestamp DESC LIMIT 1
+        series_id = self._series_id(exchange_id, symbol, timeframe)
+        if series_id is None:
+            return None
+
+        sql = f"""
+        SELECT {self._TIMESTAMP_SQL} AS timestamp FROM candle_bars b
+        WHERE b.series_id = ?
+        ORDER BY b.ts DESC LIMIT 1
         """
-        result = self.fetch_one(sql, (exchange_id, symbol, timeframe))
+        result = self.fetch_one(sql, (series_id,))
         return result['timestamp'] if result else None
     
     def get_candles(self, exchange_id: str, symbol: str, timeframe: str, 
                    limit: int = 500, start_time: str = None, 
                    end_time: str = None) -> List[Dict]:
         """캔들 조회"""
-        conditions = ["exchange_id = ?", "symbol = ?", "timeframe = ?"]
-        params = [exchange_id, symbol, timeframe]
-        
-        if start_time:
-            conditions.append("timestamp >= ?")
-            params.append(start_time)
-        
-        if end_time:
-            conditions.append("timestamp <= ?")
-            params.append(end_time)
-        
+        series_id = self._series_id(exchange_id, symbol, timeframe)
+        if series_id is None:
+            return []
+
+        conditions, params = self._range_conditions(series_id, start_time, end_time)
         where_clause = " AND ".join(conditions)
         sql = f"""
-        SELECT * FROM candles 
+        {self._SELECT_CANDLES}
         WHERE {where_clause}
-        ORDER BY timestamp DESC LIMIT ?
+        ORDER BY b.ts DESC LIMIT ?
         """
         params.append(limit)
         return self.fetch_all(sql, tuple(params))
@@ -293,42 +669,208 @@ class CandlesRepository(BaseRepository):
                                  timeframe: str, start_time: str, 
                                  end_time: str) -> List[Dict]:
         """백테스트용 캔들 조회 (시간순 정렬)"""
+        series_id = self._series_id(exchange_id, symbol, timeframe)
+        if series_id is None:
+            return []
+
+        sql = f"""
+        {self._SELECT_CANDLES}
+        WHERE b.series_id = ? AND b.ts >= ? AND b.ts <= ?
+        ORDER BY b.ts ASC
+        """
+        return self.fetch_all(sql, (series_id,
+                                    time_helper.parse_kst_bound(start_time),
+                                    time_helper.parse_kst_bound(end_time, upper=True)))
+
+    def iter_candles(self, exchange_id: str, symbol: str, timeframe: str,
+                     start_time: str = None, end_time: str = None,
+                     descending: bool = False,
+                     chunk_size: int = None) -> Iterator[List[Dict]]:
+        """
+        구간 캔들을 chunk_size개씩 나눠 조회 (키셋 페이지네이션, 메모리 일정)
+
+        Yields:
+            캔들 딕셔너리 리스트 (get_candles와 같은 키, 시간순 또는 최신순)
+        """
+        series_id = self._series_id(exchange_id, symbol, timeframe)
+        if series_id is None:
+            return
+
+        conditions, params = self._range_conditions(series_id, start_time, end_time)
+        for names, rows in self.iter_keyset(self._SELECT_CANDLES_KEYED, conditions,
+                                            params, "b.ts",
+                                            descending, chunk_size):
+            names = names[1:]
+            yield [dict(zip(names, row[1:])) for row in rows]
+
+    def iter_candle_columns(self, exchange_id: str, symbol: str, timeframe: str,
+                            start_time: str = None, end_time: str = None,
+                            chunk_size: int = None) -> Iterator[Dict[str, np.ndarray]]:
+        """
+        구간 캔들을 chunk_size개씩 컬럼별 배열로 조회 (timestamp는 epoch ms, 시간순)
+        """
+        series_id = self._series_id(exchange_id, symbol, timeframe)
+        if series_id is None:
+            return
+
+        conditions, params = self._range_conditions(series_id, start_time, end_time)
+        select = """
+        SELECT b.ts AS timestamp, b.open, b.high, b.low, b.close, b.volume
+        FROM candle_bars b
+        """
+        dtypes = dict(CANDLE_COLUMNS)
+        for names, rows in self.iter_keyset(select, conditions, params, "b.ts",
+                                            chunk_size=chunk_size):
+            yield self._rows_to_columns(names, rows, dtypes)
+
+    @staticmethod
+    def _range_conditions(series_id: int, start_time: str = None,
+                          end_time: str = None) -> tuple:
+        """시계열 + KST 구간 조건 (조건 목록, 파라미터)"""
+        conditions = ["b.series_id = ?"]
+        params = [series_id]
+        if start_time:
+            conditions.append("b.ts >= ?")
+            params.append(time_helper.parse_kst_bound(start_time))
+        if end_time:
+            conditions.append("b.ts <= ?")
+            params.append(time_helper.parse_kst_bound(end_time, upper=True))
+        return conditions, params
+
+    def get_candle_columns(self, exchange_id: str, symbol: str,
+                           timeframe: str) -> Dict[str, np.ndarray]:
+        """시계열 전체 캔들을 컬럼별 배열로 조회 (timestamp는 epoch ms, 컬럼 캐시 생성용)"""
+        chunks = list(self.iter_candle_columns(exchange_id, symbol, timeframe))
+        if not chunks:
+            return {name: np.empty(0, dtype=dtype) for name, dtype in CANDLE_COLUMNS}
+        return {name: np.concatenate([chunk[name] for chunk in chunks])
+                for name, _ in CANDLE_COLUMNS}
+
+    def get_candle_columns_between(self, exchange_id: str, symbol: str, timeframe: str,
+                                start_ms: int, end_ms: int) -> Dict[str, np.ndarray]:
+        """[start_ms, end_ms) 구간 캔들을 컬럼별 배열로 조회 (timestamp는 epoch ms)"""
+        dtypes = dict(CANDLE_COLUMNS)
+        series_id = self._series_id(exchange_id, symbol, timeframe)
+        if series_id is None:
+            return {name: np.empty(0, dtype=dtype) for name, dtype in dtypes.items()}
+
         sql = """
-        SELECT * FROM candles 
-        WHERE exchange_id = ? AND symbol = ? AND timeframe = ? 
-        AND timestamp >= ? AND timestamp <= ?
-        ORDER BY timestamp ASC
+        SELECT ts AS timestamp, open, high, low, close, volume FROM candle_bars
+        WHERE series_id = ? AND ts >= ? AND ts < ?
+        ORDER BY ts ASC
         """
-        return self.fetch_all(sql, (exchange_id, symbol, timeframe, start_time, end_time))
+        return self.fetch_columns(sql, (series_id, start_ms, end_ms), dtypes)
     
+    _SELECT_CATALOG = f"""
+        SELECT s.symbol, s.timeframe,
+               {DatabaseSchema.KST_TIMESTAMP_SQL.format(ts="c.first_ts")} AS start_time,
+               {DatabaseSchema.KST_TIMESTAMP_SQL.format(ts="c.last_ts")} AS end_time,
+               c.candle_count, c.gap_count
+        FROM series_catalog c
+        JOIN series s ON s.series_id = c.series_id
+        """
+
     def get_data_range(self, exchange_id: str, symbol: str, 
                       timeframe: str) -> Optional[Dict]:
-        """데이터 범위 조회"""
-        sql = """
-        SELECT MIN(timestamp) as start_time, MAX(timestamp) as end_time, 
-               COUNT(*) as candle_count
-        FROM candles 
-        WHERE exchange_id = ? AND symbol = ? AND timeframe = ?
+        """데이터 범위 조회 (시계열 카탈로그, 캔들 행은 읽지 않음)"""
+        series_id = self._series_id(exchange_id, symbol, timeframe)
+        result = None
+        if series_id is not None:
+            result = self.fetch_one(f"{self._SELECT_CATALOG} WHERE c.series_id = ?",
+                                    (series_id,))
+        if result is None:
+            return {'start_time': None, 'end_time': None, 'candle_count': 0, 'gap_count': 0}
+
+        return {key: result[key] for key in
+                ('start_time', 'end_time', 'candle_count', 'gap_count')}
+
+    def find_gaps(self, exchange_id: str, symbol: str, timeframe: str,
+                  start_ms: int = None, end_ms: int = None) -> List[Tuple[int, int]]:
         """
-        return self.fetch_one(sql, (exchange_id, symbol, timeframe))
+        시계열 중간의 빠진 봉 구간 (윈도우 함수 한 번, 기본 키 순서로 인접 봉 간격 비교)
+
+        카탈로그의 gap_count가 0이면 캔들 행을 읽지 않는다.
+
+        Returns:
+            [(첫 빠진 봉 epoch ms, 마지막 빠진 봉 epoch ms)] 시간순
+        """
+        series_id = self._series_id(exchange_id, symbol, timeframe)
+        if series_id is None:
+            return []
+
+        catalog = self.fetch_one(
+            "SELECT period_ms, gap_count FROM series_catalog WHERE series_id = ?",
+            (series_id,)
+        )
+        if not catalog or not catalog['period_ms'] or not catalog['gap_count']:
+            return []
+        period_ms = catalog['period_ms']
+
+        conditions = ["series_id = ?"]
+        params = [series_id]
+        if start_ms is not None:
+            conditions.append("ts >= ?")
+            params.append(start_ms)
+        if end_ms is not None:
+            conditions.append("ts <= ?")
+            params.append(end_ms)
+
+        sql = f"""
+        SELECT prev_ts + ? AS gap_start, ts - ? AS gap_end
+        FROM (
+            SELECT ts, LAG(ts) OVER (ORDER BY ts) AS prev_ts
+            FROM candle_bars
+            WHERE {' AND '.join(conditions)}
+        )
+        WHERE ts - prev_ts > ?
+        """
+        _, rows = self.fetch_rows(sql, (period_ms, period_ms, *params, period_ms))
+        return [(int(gap_start), int(gap_end)) for gap_start, gap_end in rows]
+
+    def get_series_catalog(self, exchange_id: str) -> Dict[tuple, Dict]:
+        """
+        거래소의 모든 시계열 범위를 한 번에 조회
+
+        Returns:
+            {(symbol, timeframe): {'start_time', 'end_time', 'candle_count', 'gap_count'}}
+        """
+        rows = self.fetch_all(f"{self._SELECT_CATALOG} WHERE s.exchange_id = ?",
+                              (exchange_id,))
+        return {(row.pop('symbol'), row.pop('timeframe')): row for row in rows}
     
     def delete_old(self, days: int):
         """오래된 캔들 삭제"""
-        cutoff = time_helper.days_ago_kst(days)
-        cutoff_str = time_helper.format_kst(cutoff)
-        sql = "DELETE FROM candles WHERE timestamp < ?"
-        self.execute_query(sql, (cutoff_str,))
+        cutoff = time_helper.days_ago_kst(days).replace(microsecond=0)
+        cutoff_ms = time_helper.kst_to_timestamp(cutoff)
+        # series_id 조건을 주어 기본 키 (series_id, ts) 범위 삭제로 처리
+        sql = """
+        DELETE FROM candle_bars
+        WHERE series_id IN (SELECT series_id FROM series) AND ts < ?
+        """
+        self.execute_query(sql, (cutoff_ms,))
+        self.candle_cache.prune_before(cutoff_ms)
     
     def delete_exchange_data(self, exchange_id: str):
         """특정 거래소 데이터 삭제"""
-        sql = "DELETE FROM candles WHERE exchange_id = ?"
+        sql = """
+        DELETE FROM candle_bars
+        WHERE series_id IN (SELECT series_id FROM series WHERE exchange_id = ?)
+        """
         self.execute_query(sql, (exchange_id,))
+        self.candle_cache.invalidate(exchange_id)
 
 
 # ========== 보조지표 레포지토리 ==========
 
 class IndicatorsRepository(BaseRepository):
     """보조지표 레포지토리 (거래소별)"""
+
+    # timestamp 이후 지표 컬럼 (upsert 순서)
+    INDICATOR_COLUMNS = [
+        'ma_20', 'ma_50', 'ma_100', 'ma_200',
+        'macd', 'macd_signal', 'macd_hist', 'rsi', 'stoch_k', 'stoch_d',
+        'bb_upper', 'bb_middle', 'bb_lower'
+    ]
     
     def upsert_indicators(self, exchange_id: str, symbol: str, timeframe: str, 
                          timestamp: str, indicators: Dict):
@@ -350,6 +892,38 @@ class IndicatorsRepository(BaseRepository):
             indicators.get('bb_upper'), indicators.get('bb_middle'),
             indicators.get('bb_lower')
         ))
+
+    def upsert_indicators_batch(self, exchange_id: str, symbol: str, timeframe: str,
+                                rows: List[Dict]) -> int:
+        """
+        보조지표 일괄 삽입/업데이트 (단일 트랜잭션)
+
+        Args:
+            rows: [{'timestamp': ..., 'ma_20': ..., ...}] (없는 값은 None)
+
+        Returns:
+            저장된 행 수
+        """
+        if not rows:
+            return 0
+
+        sql = f"""
+        INSERT OR REPLACE INTO indicators
+        (exchange_id, symbol, timeframe, timestamp, {', '.join(self.INDICATOR_COLUMNS)})
+        VALUES ({', '.join('?' * (4 + len(self.INDICATOR_COLUMNS)))})
+        """
+        columns = [
+            [exchange_id] * len(rows),
+            [symbol] * len(rows),
+            [timeframe] * len(rows),
+            [row['timestamp'] for row in rows],
+        ]
+        columns.extend([row.get(name) for row in rows] for name in self.INDICATOR_COLUMNS)
+
+        result = self.execute_batch(sql, columns)
+        if result < 0:
+            raise RuntimeError(f"보조지표 일괄 저장 실패 ({exchange_id} {symbol} {timeframe})")
+        return result
     
     def get_latest(self, exchange_id: str, symbol: str,
                   timeframe: str) -> Optional[Dict]:
@@ -383,6 +957,31 @@ class IndicatorsRepository(BaseRepository):
         ORDER BY timestamp DESC
         """
         return self.fetch_all(sql, tuple(params))
+
+    def iter_indicators(self, exchange_id: str, symbol: str, timeframe: str,
+                        start_time: str = None, end_time: str = None,
+                        descending: bool = False,
+                        chunk_size: int = None) -> Iterator[List[Dict]]:
+        """
+        구간 지표를 chunk_size개씩 나눠 조회 (키셋 페이지네이션, 메모리 일정)
+
+        Yields:
+            지표 딕셔너리 리스트 (get_indicators_by_timestamp_range와 같은 키)
+        """
+        conditions = ["exchange_id = ?", "symbol = ?", "timeframe = ?"]
+        params = [exchange_id, symbol, timeframe]
+        if start_time:
+            conditions.append("timestamp >= ?")
+            params.append(start_time)
+        if end_time:
+            conditions.append("timestamp <= ?")
+            params.append(end_time)
+
+        for names, rows in self.iter_keyset("SELECT timestamp, * FROM indicators",
+                                            conditions, params, "timestamp",
+                                            descending, chunk_size):
+            names = names[1:]
+            yield [dict(zip(names, row[1:])) for row in rows]
     
     def delete_old(self, days: int):
         """오래된 지표 삭제"""
@@ -517,7 +1116,7 @@ class BotLogsRepository(BaseRepository):
         (timestamp, level, exchange_id, symbol, bot_id, category, message, payload)
         VALUES (?, ?, ?, ?, ?, ?, ?, ?)
         """
-        self.execute_query(sql, (timestamp, level, exchange_id, symbol, bot_id, 
+        self.enqueue_write(sql, (timestamp, level, exchange_id, symbol, bot_id, 
                                 category, message, payload))
     
     def get_logs(self, exchange_id: str = None, symbol: str = None, 
@@ -553,21 +1152,31 @@ class BotLogsRepository(BaseRepository):
 class OrdersRepository(BaseRepository):
     """주문 레포지토리"""
     
-    def insert_order(self, order: Dict):
-        """주문 삽입"""
-        sql = """
+    _INSERT_ORDER_SQL = """
         INSERT INTO orders
         (exchange_id, order_id, symbol, side, type, price, size, filled_size, 
          status, bot_id, position_id, related_order_type, is_testnet)
         VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """
-        self.execute_query(sql, (
+    
+    @staticmethod
+    def _order_params(order: Dict) -> tuple:
+        return (
             order['exchange_id'], order['order_id'], order['symbol'], order['side'],
             order['type'], order.get('price'), order['size'],
             order.get('filled_size', 0), order['status'],
             order.get('bot_id'), order.get('position_id'),
             order.get('related_order_type'), order.get('is_testnet', 0)
-        ))
+        )
+    
+    def insert_order(self, order: Dict):
+        """주문 삽입"""
+        self.enqueue_write(self._INSERT_ORDER_SQL, self._order_params(order))
+    
+    def insert_orders(self, orders: List[Dict]):
+        """주문 일괄 삽입 (한 트랜잭션)"""
+        self.enqueue_writes(self._INSERT_ORDER_SQL,
+                            [self._order_params(order) for order in orders])
     
     def update_order_status(self, exchange_id: str, order_id: str, status: str, 
                           filled_size: float = None):
@@ -578,13 +1187,13 @@ class OrdersRepository(BaseRepository):
             updated_at = datetime('now')
             WHERE exchange_id = ? AND order_id = ?
             """
-            self.execute_query(sql, (status, filled_size, exchange_id, order_id))
+            self.enqueue_write(sql, (status, filled_size, exchange_id, order_id))
         else:
             sql = """
             UPDATE orders SET status = ?, updated_at = datetime('now')
             WHERE exchange_id = ? AND order_id = ?
             """
-            self.execute_query(sql, (status, exchange_id, order_id))
+            self.enqueue_write(sql, (status, exchange_id, order_id))
     
     def get_order(self, exchange_id: str, order_id: str) -> Optional[Dict]:
         """주문 조회"""
@@ -622,7 +1231,7 @@ class PositionsRepository(BaseRepository):
         WHERE id = ?
         """
         params = list(updates.values()) + [position_id]
-        self.execute_query(sql, tuple(params))
+        self.enqueue_write(sql, tuple(params))
     
     def get_open_position(self, exchange_id: str, symbol: str) -> Optional[Dict]:
         """열린 포지션 조회"""
@@ -640,7 +1249,7 @@ class PositionsRepository(BaseRepository):
         SET is_closed = 1, realized_pnl = ?, closed_at = datetime('now')
         WHERE id = ?
         """
-        self.execute_query(sql, (realized_pnl, position_id))
+        self.enqueue_write(sql, (realized_pnl, position_id))
 
 
 # ========== 거래 내역 레포지토리 ==========
@@ -656,7 +1265,7 @@ class TradesHistoryRepository(BaseRepository):
          pnl, fees, entry_time, exit_time, exit_reason, bot_id, is_testnet)
         VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """
-        self.execute_query(sql, (
+        self.enqueue_write(sql, (
             trade['exchange_id'], trade['symbol'], trade['side'], 
             trade['entry_price'], trade['exit_price'], trade['size'], 
             trade['leverage'], trade['pnl'], trade['fees'], 
@@ -668,6 +1277,18 @@ class TradesHistoryRepository(BaseRepository):
     def get_trades(self, exchange_id: str = None, symbol: str = None, 
                   start_date: str = None, end_date: str = None) -> List[Dict]:
         """거래 내역 조회"""
+        where_clause, params = self._trade_filters(exchange_id, symbol, start_date, end_date)
+        sql = f"""
+        SELECT * FROM trades_history
+        WHERE {where_clause}
+        ORDER BY exit_time DESC
+        """
+        return self.fetch_all(sql, params)
+
+    @staticmethod
+    def _trade_filters(exchange_id: str = None, symbol: str = None,
+                       start_date: str = None, end_date: str = None) -> tuple:
+        """거래 내역 조회 조건 (WHERE 절, 파라미터)"""
         conditions = []
         params = []
         
@@ -688,19 +1309,20 @@ class TradesHistoryRepository(BaseRepository):
             params.append(end_date)
         
         where_clause = " AND ".join(conditions) if conditions else "1=1"
-        sql = f"""
-        SELECT * FROM trades_history
-        WHERE {where_clause}
-        ORDER BY exit_time DESC
-        """
-        return self.fetch_all(sql, tuple(params))
+        return where_clause, tuple(params)
     
     def get_statistics(self, exchange_id: str = None, symbol: str = None, 
                       start_date: str = None, end_date: str = None) -> Dict:
-        """거래 통계 조회"""
-        trades = self.get_trades(exchange_id, symbol, start_date, end_date)
+        """거래 통계 조회 (pnl 컬럼만 배열로 읽어 계산)"""
+        where_clause, params = self._trade_filters(exchange_id, symbol, start_date, end_date)
+        sql = f"""
+        SELECT pnl FROM trades_history
+        WHERE {where_clause}
+        ORDER BY exit_time ASC
+        """
+        pnl = self.fetch_columns(sql, params, {'pnl': np.float64})['pnl']
         
-        if not trades:
+        if not len(pnl):
             return {
                 "total_trades": 0,
                 "total_profit": 0,
@@ -711,36 +1333,26 @@ class TradesHistoryRepository(BaseRepository):
                 "max_drawdown": 0
             }
         
-        total_profit = sum(t['pnl'] for t in trades if t['pnl'] > 0)
-        total_loss = sum(t['pnl'] for t in trades if t['pnl'] < 0)
-        win_count = sum(1 for t in trades if t['pnl'] > 0)
+        total_profit = float(pnl[pnl > 0].sum())
+        total_loss = float(pnl[pnl < 0].sum())
+        win_count = int((pnl > 0).sum())
         
-        # 최대 연속 손실
-        max_consecutive_losses = 0
-        current_losses = 0
-        for trade in trades:
-            if trade['pnl'] < 0:
-                current_losses += 1
-                max_consecutive_losses = max(max_consecutive_losses, current_losses)
-            else:
-                current_losses = 0
+        # 최대 연속 손실 (손실 구간의 시작/끝 위치 차이)
+        edges = np.diff(np.concatenate(([0], (pnl < 0).astype(np.int8), [0])))
+        runs = np.flatnonzero(edges == -1) - np.flatnonzero(edges == 1)
+        max_consecutive_losses = int(runs.max()) if len(runs) else 0
         
-        # 최대 드로다운 (간단 계산)
-        cumulative = 0
-        peak = 0
-        max_dd = 0
-        for trade in reversed(trades):
-            cumulative += trade['pnl']
-            peak = max(peak, cumulative)
-            dd = peak - cumulative
-            max_dd = max(max_dd, dd)
+        # 최대 드로다운 (간단 계산, 누적 손익 기준)
+        cumulative = np.cumsum(pnl)
+        peak = np.maximum.accumulate(np.maximum(cumulative, 0))
+        max_dd = float(max((peak - cumulative).max(), 0))
         
         return {
-            "total_trades": len(trades),
+            "total_trades": len(pnl),
             "total_profit": total_profit,
             "total_loss": total_loss,
             "net_pnl": total_profit + total_loss,
-            "win_rate": (win_count / len(trades) * 100) if trades else 0,
+            "win_rate": win_count / len(pnl) * 100,
             "max_consecutive_losses": max_consecutive_losses,
             "max_drawdown": max_dd
         }
@@ -776,7 +1388,7 @@ class BacktestResultsRepository(BaseRepository):
             result.get('max_martingale_level'), result.get('avg_martingale_level'),
             result.get('total_fees'),
             json.dumps(result.get('trades', [])),
-            json.dumps(result.get('equity_curve', []))
+            json.dumps(list(result.get('equity_curve', [])))  # 빠른 경로는 여기서 딕셔너리 생성
         ))
         return query.lastInsertId()
     
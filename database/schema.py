@@ -3,20 +3,33 @@
 CCXT 멀티 거래소 지원 버전
 """
 from PySide6.QtSql import QSqlDatabase, QSqlQuery
+
+from config.settings import SQLITE_BUSY_TIMEOUT_MS, TIMEFRAME_MINUTES, LEGACY_TIMEFRAMES
+from database.connection import ConnectionManager
 from utils.logger import logger
 
 
 class DatabaseSchema:
     """데이터베이스 스키마 관리"""
     
-    # 현재 스키마 버전
-    SCHEMA_VERSION = 2
+    # 현재 스키마 버전 (PRAGMA user_version)
+    SCHEMA_VERSION = 4
+
+    # candle_bars.ts(epoch ms, UTC) → KST 문자열 (Asia/Seoul은 서머타임 없음)
+    KST_TIMESTAMP_SQL = "strftime('%Y-%m-%d %H:%M:%S', {ts} / 1000, 'unixepoch', '+9 hours')"
+    # KST 문자열 → epoch ms
+    KST_EPOCH_MS_SQL = "((CAST(strftime('%s', {text}) AS INTEGER) - 32400) * 1000)"
+    # 기존 봉 교체 (REPLACE는 삭제 트리거 없이 삽입 트리거만 실행되어 카탈로그 개수가 틀어짐)
+    CANDLE_UPSERT_SQL = """ON CONFLICT (series_id, ts) DO UPDATE SET
+        open = excluded.open, high = excluded.high, low = excluded.low,
+        close = excluded.close, volume = excluded.volume"""
     
     @staticmethod
     def init_database(db_path: str) -> bool:
         """데이터베이스 초기화"""
         db = QSqlDatabase.addDatabase("QSQLITE")
         db.setDatabaseName(db_path)
+        db.setConnectOptions(f"QSQLITE_BUSY_TIMEOUT={SQLITE_BUSY_TIMEOUT_MS}")
         
         if not db.open():
             logger.error("DB", f"데이터베이스 연결 실패: {db.lastError().text()}")
@@ -24,11 +37,131 @@ class DatabaseSchema:
         
         logger.info("DB", f"데이터베이스 연결 성공: {db_path}")
         
+        # WAL 등 연결 설정 + 다른 스레드 연결이 같은 DB를 열도록 경로 등록
+        ConnectionManager.apply_pragmas(db)
+        ConnectionManager.configure(db_path)
+        
+        # 이전 버전 스키마 변환 (테이블 생성 전에 실행해야 candles 뷰와 충돌하지 않음)
+        if not DatabaseSchema._migrate(db):
+            return False
+        
         # 테이블 생성
         DatabaseSchema._create_tables()
+        DatabaseSchema._backfill_series_catalog()
+        QSqlQuery().exec(f"PRAGMA user_version = {DatabaseSchema.SCHEMA_VERSION}")
         
         return True
     
+    # ========== 마이그레이션 ==========
+    
+    @staticmethod
+    def _migrate(db: QSqlDatabase) -> bool:
+        """스키마 버전별 마이그레이션"""
+        query = QSqlQuery()
+        query.exec("PRAGMA user_version")
+        version = query.value(0) if query.next() else 0
+        
+        query.exec("SELECT type FROM sqlite_master WHERE name = 'candles'")
+        legacy_candles = query.next() and query.value(0) == "table"
+        
+        if version < 3 and legacy_candles:
+            if not DatabaseSchema._migrate_candles_v3(db):
+                return False
+        
+        if version < 4:
+            # v4: candles 뷰 삽입 트리거를 카탈로그 트리거와 맞는 UPSERT로 다시 생성
+            query.exec("DROP TRIGGER IF EXISTS candles_insert")
+        return True
+    
+    @staticmethod
+    def _migrate_candles_v3(db: QSqlDatabase) -> bool:
+        """
+        v3: candles 테이블을 series + candle_bars로 변환 (기존 데이터 그대로 이전)
+        
+        문자열 timestamp → INTEGER epoch ms, (exchange_id, symbol, timeframe) → series_id.
+        기존 candles 이름은 같은 컬럼을 보여주는 뷰로 대체한다.
+        timestamp를 해석할 수 없는 행은 candles_unparsed 테이블로 옮겨 두고 건너뛴다.
+        (잘못된 행 하나 때문에 마이그레이션이 실패해 앱이 시작되지 않는 일이 없도록)
+        """
+        logger.info("DB", "스키마 v3 마이그레이션 시작 (candles → candle_bars)")
+        
+        epoch_ms = DatabaseSchema.KST_EPOCH_MS_SQL.format(text="c.timestamp")
+        query = QSqlQuery()
+        query.exec(f"SELECT COUNT(*) FROM candles c WHERE {epoch_ms} IS NULL")
+        unparsed = query.value(0) if query.next() else 0
+        
+        statements = DatabaseSchema._table_series() + DatabaseSchema._table_candle_bars()
+        if unparsed:
+            statements.append(f"""CREATE TABLE IF NOT EXISTS candles_unparsed AS
+                                  SELECT * FROM candles c WHERE {epoch_ms} IS NULL""")
+        statements += [
+            """INSERT OR IGNORE INTO series (exchange_id, symbol, timeframe)
+               SELECT DISTINCT exchange_id, symbol, timeframe FROM candles""",
+            f"""INSERT OR REPLACE INTO candle_bars (series_id, ts, open, high, low, close, volume)
+                SELECT s.series_id, {epoch_ms}, c.open, c.high, c.low, c.close, c.volume
+                FROM candles c
+                JOIN series s ON s.exchange_id = c.exchange_id
+                             AND s.symbol = c.symbol
+                             AND s.timeframe = c.timeframe
+                WHERE {epoch_ms} IS NOT NULL""",
+            "DROP TABLE candles",
+        ]
+        
+        db.transaction()
+        for sql in statements:
+            query = QSqlQuery()
+            if not query.exec(sql):
+                db.rollback()
+                logger.error("DB", f"스키마 v3 마이그레이션 실패: {query.lastError().text()}")
+                logger.error("DB", f"SQL: {sql}")
+                return False
+        
+        if not db.commit():
+            logger.error("DB", f"스키마 v3 마이그레이션 커밋 실패: {db.lastError().text()}")
+            return False
+        
+        if unparsed:
+            logger.warning("DB", f"스키마 v3 마이그레이션: timestamp를 해석할 수 없는 캔들 "
+                                 f"{unparsed}개 건너뜀 (candles_unparsed 테이블에 보관)")
+        
+        # 삭제된 페이지 회수 (트랜잭션 밖에서만 가능)
+        QSqlQuery().exec("VACUUM")
+        logger.info("DB", "스키마 v3 마이그레이션 완료")
+        return True
+    
+    @staticmethod
+    def _backfill_series_catalog():
+        """
+        v4: 카탈로그 행이 없는 시계열을 candle_bars 집계로 채움
+
+        이후에는 candle_bars 트리거가 증분 갱신하므로 카탈로그가 없던 DB를
+        처음 열 때만 실제 집계가 일어난다.
+        """
+        query = QSqlQuery()
+        sql = f"""
+        INSERT OR IGNORE INTO series_catalog
+            (series_id, period_ms, first_ts, last_ts, candle_count)
+        SELECT s.series_id, {DatabaseSchema._period_ms_sql("s.timeframe")},
+               MIN(b.ts), MAX(b.ts), COUNT(b.ts)
+        FROM series s
+        LEFT JOIN candle_bars b ON b.series_id = s.series_id
+        WHERE s.series_id NOT IN (SELECT series_id FROM series_catalog)
+        GROUP BY s.series_id
+        """
+        if not query.exec(sql):
+            logger.error("DB", f"시계열 카탈로그 채우기 실패: {query.lastError().text()}")
+        elif query.numRowsAffected() > 0:
+            logger.info("DB", f"시계열 카탈로그 생성: {query.numRowsAffected()}개 시계열")
+
+    @staticmethod
+    def _period_ms_sql(timeframe: str) -> str:
+        """타임프레임 문자열 → 봉 간격(ms) SQL 식 (모르는 타임프레임은 NULL)"""
+        minutes = dict(TIMEFRAME_MINUTES)
+        minutes.update({tf: TIMEFRAME_MINUTES[tf.lower()] for tf in LEGACY_TIMEFRAMES
+                        if tf.lower() in TIMEFRAME_MINUTES})
+        cases = " ".join(f"WHEN '{tf}' THEN {m * 60000}" for tf, m in minutes.items())
+        return f"CASE {timeframe} {cases} END"
+
     @staticmethod
     def _create_tables():
         """모든 테이블 생성"""
@@ -38,6 +171,9 @@ class DatabaseSchema:
             DatabaseSchema._table_exchange_credentials(),
             
             # 데이터 관련
+            DatabaseSchema._table_series(),
+            DatabaseSchema._table_candle_bars(),
+            DatabaseSchema._table_series_catalog(),
             DatabaseSchema._table_candles(),
             DatabaseSchema._table_indicators(),
             DatabaseSchema._table_active_symbols(),
@@ -113,25 +249,117 @@ class DatabaseSchema:
     # ========== 데이터 관련 테이블 ==========
     
     @staticmethod
-    def _table_candles() -> list:
-        """캔들 데이터 (거래소별)"""
+    def _table_series() -> list:
+        """시계열 (거래소/심볼/타임프레임 → series_id)"""
         return [
-            """CREATE TABLE IF NOT EXISTS candles (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
+            """CREATE TABLE IF NOT EXISTS series (
+                series_id INTEGER PRIMARY KEY,
                 exchange_id TEXT NOT NULL,
                 symbol TEXT NOT NULL,
                 timeframe TEXT NOT NULL,
-                timestamp DATETIME NOT NULL,
+                UNIQUE(exchange_id, symbol, timeframe)
+            )"""
+        ]
+    
+    @staticmethod
+    def _table_candle_bars() -> list:
+        """캔들 데이터 (시계열별, 기본 키가 곧 구간 조회 인덱스)"""
+        return [
+            """CREATE TABLE IF NOT EXISTS candle_bars (
+                series_id INTEGER NOT NULL,
+                ts INTEGER NOT NULL,
                 open REAL NOT NULL,
                 high REAL NOT NULL,
                 low REAL NOT NULL,
                 close REAL NOT NULL,
                 volume REAL NOT NULL,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(exchange_id, symbol, timeframe, timestamp)
+                PRIMARY KEY (series_id, ts)
+            ) WITHOUT ROWID"""
+        ]
+    
+    @staticmethod
+    def _table_series_catalog() -> list:
+        """
+        시계열 카탈로그 (시계열별 첫/마지막 봉, 봉 개수, 빠진 봉 수)
+
+        candle_bars 삽입/삭제 트리거가 증분 갱신하므로 데이터 화면과 범위 조회가
+        캔들 행을 읽지 않는다. gap_count는 첫~마지막 봉 사이에 비어 있는 봉 수.
+        """
+        period_ms = DatabaseSchema._period_ms_sql("NEW.timeframe")
+        return [
+            """CREATE TABLE IF NOT EXISTS series_catalog (
+                series_id INTEGER PRIMARY KEY,
+                period_ms INTEGER,
+                first_ts INTEGER,
+                last_ts INTEGER,
+                candle_count INTEGER NOT NULL DEFAULT 0,
+                gap_count INTEGER GENERATED ALWAYS AS (
+                    CASE WHEN candle_count > 0 AND period_ms > 0
+                         THEN (last_ts - first_ts) / period_ms + 1 - candle_count
+                         ELSE 0 END
+                ) VIRTUAL
             )""",
-            "CREATE INDEX IF NOT EXISTS idx_candles_exchange_symbol_tf ON candles(exchange_id, symbol, timeframe)",
-            "CREATE INDEX IF NOT EXISTS idx_candles_timestamp ON candles(timestamp DESC)"
+            f"""CREATE TRIGGER IF NOT EXISTS series_catalog_series_insert
+                AFTER INSERT ON series
+                BEGIN
+                    INSERT OR IGNORE INTO series_catalog (series_id, period_ms)
+                    VALUES (NEW.series_id, {period_ms});
+                END""",
+            """CREATE TRIGGER IF NOT EXISTS series_catalog_series_delete
+                AFTER DELETE ON series
+                BEGIN
+                    DELETE FROM series_catalog WHERE series_id = OLD.series_id;
+                END""",
+            # 중복 무시(INSERT OR IGNORE)된 행은 트리거가 실행되지 않음
+            """CREATE TRIGGER IF NOT EXISTS series_catalog_bar_insert
+                AFTER INSERT ON candle_bars
+                BEGIN
+                    UPDATE series_catalog SET
+                        first_ts = MIN(COALESCE(first_ts, NEW.ts), NEW.ts),
+                        last_ts = MAX(COALESCE(last_ts, NEW.ts), NEW.ts),
+                        candle_count = candle_count + 1
+                    WHERE series_id = NEW.series_id;
+                END""",
+            # 끝 봉이 지워질 때만 기본 키로 새 끝 봉 조회
+            """CREATE TRIGGER IF NOT EXISTS series_catalog_bar_delete
+                AFTER DELETE ON candle_bars
+                BEGIN
+                    UPDATE series_catalog SET
+                        first_ts = CASE WHEN OLD.ts = first_ts
+                            THEN (SELECT MIN(ts) FROM candle_bars WHERE series_id = OLD.series_id)
+                            ELSE first_ts END,
+                        last_ts = CASE WHEN OLD.ts = last_ts
+                            THEN (SELECT MAX(ts) FROM candle_bars WHERE series_id = OLD.series_id)
+                            ELSE last_ts END,
+                        candle_count = candle_count - 1
+                    WHERE series_id = OLD.series_id;
+                END""",
+        ]
+
+    @staticmethod
+    def _table_candles() -> list:
+        """candles 호환 뷰 (v2 컬럼: exchange_id, symbol, timeframe, KST timestamp)"""
+        timestamp = DatabaseSchema.KST_TIMESTAMP_SQL.format(ts="b.ts")
+        epoch_ms = DatabaseSchema.KST_EPOCH_MS_SQL.format(text="NEW.timestamp")
+        return [
+            f"""CREATE VIEW IF NOT EXISTS candles AS
+                SELECT s.exchange_id, s.symbol, s.timeframe,
+                       {timestamp} AS timestamp,
+                       b.open, b.high, b.low, b.close, b.volume
+                FROM candle_bars b
+                JOIN series s ON s.series_id = b.series_id""",
+            # 뷰에 직접 INSERT하는 기존 스크립트 호환
+            f"""CREATE TRIGGER IF NOT EXISTS candles_insert INSTEAD OF INSERT ON candles
+                BEGIN
+                    INSERT OR IGNORE INTO series (exchange_id, symbol, timeframe)
+                    VALUES (NEW.exchange_id, NEW.symbol, NEW.timeframe);
+                    INSERT INTO candle_bars (series_id, ts, open, high, low, close, volume)
+                    SELECT series_id, {epoch_ms}, NEW.open, NEW.high, NEW.low, NEW.close, NEW.volume
+                    FROM series
+                    WHERE exchange_id = NEW.exchange_id AND symbol = NEW.symbol
+                      AND timeframe = NEW.timeframe
+                    {DatabaseSchema.CANDLE_UPSERT_SQL};
+                END"""
         ]
     
     @staticmethod
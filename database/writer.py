@@ -0,0 +1,169 @@
+"""
+DB 쓰기 스레드
+호출 스레드는 쓰기 작업을 큐에 넣고 바로 돌아가며,
+단일 쓰기 스레드가 작업을 모아 한 트랜잭션으로 저장한다.
+"""
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import List, Optional, Tuple
+
+from PySide6.QtSql import QSqlDatabase, QSqlQuery
+
+from config.settings import (
+    DB_WRITER_FLUSH_INTERVAL_MS, DB_WRITER_BATCH_SIZE, DB_WRITER_MAX_QUEUE
+)
+from database.connection import ConnectionManager
+from utils.logger import logger
+
+
+class DatabaseWriter(threading.Thread):
+    """
+    단일 쓰기 스레드 (쓰기 묶음 처리)
+
+    - enqueue(sql, params): 결과가 필요 없는 쓰기 (INSERT/UPDATE)
+    - enqueue_many(sql, rows): 여러 행을 나누지 않고 한 묶음으로 쓰기
+    - 첫 작업 후 flush_interval_ms 동안 또는 batch_size개까지 모아 한 트랜잭션으로 커밋
+    - 같은 SQL이 연속되면 execBatch 한 번으로 실행
+    - 큐가 가득 차면 enqueue가 대기 (호출 측 속도 제한)
+    - flush(): 그때까지 넣은 작업이 커밋될 때까지 대기 (쓰기 직후 읽어야 할 때)
+    """
+
+    def __init__(self, flush_interval_ms: int = DB_WRITER_FLUSH_INTERVAL_MS,
+                 batch_size: int = DB_WRITER_BATCH_SIZE,
+                 max_queue: int = DB_WRITER_MAX_QUEUE):
+        super().__init__(name="DatabaseWriter", daemon=True)
+        self.flush_interval = flush_interval_ms / 1000.0
+        self.batch_size = batch_size
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue)
+        self._stopping = False
+
+    @property
+    def is_running(self) -> bool:
+        return self.is_alive() and not self._stopping
+
+    # ========== 호출 측 ==========
+
+    def enqueue(self, sql: str, params: tuple = ()):
+        """쓰기 작업 추가 (큐가 가득 차면 빈자리가 날 때까지 대기)"""
+        self._queue.put((sql, tuple(params)))
+
+    def enqueue_many(self, sql: str, rows: List[tuple]):
+        """같은 SQL 여러 행을 한 작업으로 추가 (항상 같은 트랜잭션에 커밋)"""
+        if rows:
+            self._queue.put([(sql, tuple(params)) for params in rows])
+
+    def flush(self, timeout: float = None) -> bool:
+        """지금까지 추가된 작업이 모두 커밋될 때까지 대기"""
+        if not self.is_alive():
+            return True
+        marker = Future()
+        self._queue.put(marker)
+        try:
+            marker.result(timeout)
+            return True
+        except Exception:
+            return False
+
+    def shutdown(self, timeout: float = None):
+        """남은 작업을 모두 저장한 뒤 종료"""
+        if not self.is_alive():
+            return
+        self._stopping = True
+        self._queue.put(None)
+        self.join(timeout)
+
+    # ========== 쓰기 스레드 ==========
+
+    def run(self):
+        logger.info("DBWriter", "DB 쓰기 스레드 시작")
+        stop = False
+        while not stop:
+            batch, markers, stop = self._collect()
+            if batch:
+                self._write(batch)
+            for marker in markers:
+                marker.set_result(True)
+
+        ConnectionManager.release()
+        logger.info("DBWriter", "DB 쓰기 스레드 종료")
+
+    def _collect(self) -> Tuple[List[Tuple[str, tuple]], List[Future], bool]:
+        """첫 작업을 기다린 뒤 시간/개수 한도까지 추가로 모음"""
+        batch, markers = [], []
+        item = self._queue.get()
+        deadline = time.monotonic() + self.flush_interval
+
+        while True:
+            if item is None:
+                return batch, markers, True
+            if isinstance(item, Future):
+                # 마커 이전 작업은 이번 묶음에서 커밋되므로 바로 끊어도 된다
+                markers.append(item)
+                return batch, markers, False
+
+            if isinstance(item, list):
+                batch.extend(item)
+            else:
+                batch.append(item)
+            if len(batch) >= self.batch_size:
+                return batch, markers, False
+
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=max(remaining, 0)) if remaining > 0 \
+                    else self._queue.get_nowait()
+            except queue.Empty:
+                return batch, markers, False
+
+    def _write(self, batch: List[Tuple[str, tuple]]):
+        """묶음을 한 트랜잭션으로 저장 (실패 시 작업별로 다시 시도)"""
+        db = ConnectionManager.database()
+        if db is None:
+            logger.error("DBWriter", f"데이터베이스 연결 없음 - 쓰기 {len(batch)}건 버림")
+            return
+
+        if db.transaction():
+            error = self._execute_runs(db, batch)
+            if error is None and db.commit():
+                return
+            db.rollback()
+            logger.warning("DBWriter", f"묶음 쓰기 실패, 개별 재시도: {error or db.lastError().text()}")
+
+        # 문제 작업만 건너뛰도록 하나씩 자동 커밋으로 실행
+        for sql, params in batch:
+            error = self._execute_runs(db, [(sql, params)])
+            if error:
+                logger.error("DBWriter", f"쓰기 실패: {error}\nSQL: {sql}\nParams: {params}")
+
+    @staticmethod
+    def _execute_runs(db: QSqlDatabase, batch: List[Tuple[str, tuple]]) -> Optional[str]:
+        """연속된 같은 SQL을 execBatch로 실행 (오류 메시지 또는 None)"""
+        start = 0
+        while start < len(batch):
+            sql = batch[start][0]
+            end = start + 1
+            while end < len(batch) and batch[end][0] == sql:
+                end += 1
+
+            rows = [params for _, params in batch[start:end]]
+            query = QSqlQuery(db)
+            if rows[0]:
+                if not query.prepare(sql):
+                    return query.lastError().text()
+                for column in zip(*rows):
+                    query.addBindValue(list(column))
+                if not query.execBatch():
+                    return query.lastError().text()
+            else:
+                for _ in rows:
+                    if not query.exec(sql):
+                        return query.lastError().text()
+            start = end
+
+        return None
+
+
+# 전역 쓰기 스레드 (앱 시작 시 start, 종료 시 shutdown)
+db_writer = DatabaseWriter()
@@ -56,6 +56,49 @@ class IndicatorCalculator:
 
         return indicators
 
+    def calculate_series(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        전체 시계열 보조지표 일괄 계산 (봉마다 한 행)
+
+        Args:
+            df: 시간 오름차순 캔들 (high/low/close 컬럼)
+
+        Returns:
+            DataFrame (df와 같은 인덱스, indicators 테이블 컬럼명, 계산 불가 구간은 NaN)
+        """
+        close = df['close'].to_numpy(dtype=np.float64)
+        high = df['high'].to_numpy(dtype=np.float64)
+        low = df['low'].to_numpy(dtype=np.float64)
+
+        series = {}
+
+        for period in self.params["MA"]:
+            series[f'ma_{period}'] = talib.SMA(close, timeperiod=period)
+
+        macd_params = self.params["MACD"]
+        series['macd'], series['macd_signal'], series['macd_hist'] = talib.MACD(
+            close, fastperiod=macd_params["fast"], slowperiod=macd_params["slow"],
+            signalperiod=macd_params["signal"]
+        )
+
+        series['rsi'] = talib.RSI(close, timeperiod=self.params["RSI"]["period"])
+
+        stoch_params = self.params["STOCH"]
+        series['stoch_k'], series['stoch_d'] = talib.STOCH(
+            high, low, close,
+            fastk_period=stoch_params["k_period"],
+            slowk_period=stoch_params.get("smooth", 3),
+            slowd_period=stoch_params["d_period"]
+        )
+
+        bb_params = self.params["BOLLINGER"]
+        series['bb_upper'], series['bb_middle'], series['bb_lower'] = talib.BBANDS(
+            close, timeperiod=bb_params["period"],
+            nbdevup=bb_params["std_dev"], nbdevdn=bb_params["std_dev"]
+        )
+
+        return pd.DataFrame(series, index=df.index)
+
     def calculate_ma(self, close: pd.Series, periods: List[int] = None) -> Dict[str, float]:
         """이동평균선 (MA)"""
         if periods is None:
@@ -0,0 +1,348 @@
+"""
+증분 보조지표 계산기
+시계열별 상태를 유지하며 새 봉/진행 중인 봉 갱신마다 O(1)로 지표 갱신
+
+TA-Lib 기본 설정과 같은 값을 낸다 (SMA 시드 EMA, Wilder 평활, 모표준편차).
+각 구성요소는 확정된 봉까지의 상태만 보관하고, 마지막 봉(진행 중일 수 있음)은
+확정 상태에 더해 미리 계산한다. 같은 봉이 다시 들어오면 확정 상태에서 다시 계산하고,
+다음 봉이 들어올 때 비로소 이전 봉을 확정한다.
+"""
+import math
+from collections import deque
+from typing import Dict, Optional
+
+from config.settings import INDICATOR_PARAMS
+
+# TA-Lib TA_IS_ZERO 기준
+_EPSILON = 0.00000001
+
+
+class _Sma:
+    """단순 이동평균 (직전 period-1개 확정값 + 현재값)"""
+
+    # 누적 합 오차를 막기 위해 주기적으로 다시 합산
+    _RESUM_INTERVAL = 10000
+
+    def __init__(self, period: int):
+        self.period = period
+        self._window = deque()
+        self._total = 0.0
+        self._commits = 0
+
+    def value(self, x: float) -> Optional[float]:
+        if len(self._window) < self.period - 1:
+            return None
+        return (self._total + x) / self.period
+
+    def commit(self, x: float):
+        self._window.append(x)
+        self._total += x
+        if len(self._window) > self.period - 1:
+            self._total -= self._window.popleft()
+
+        self._commits += 1
+        if self._commits % self._RESUM_INTERVAL == 0:
+            self._total = math.fsum(self._window)
+
+
+class _Ema:
+    """지수 이동평균 (첫 값은 period개 SMA로 시드, TA-Lib 방식)"""
+
+    def __init__(self, period: int):
+        self.period = period
+        self.k = 2.0 / (period + 1)
+        self._count = 0
+        self._seed_total = 0.0
+        self._ema = None
+
+    def value(self, x: float) -> Optional[float]:
+        if self._ema is None:
+            if self._count < self.period - 1:
+                return None
+            return (self._seed_total + x) / self.period
+        return (x - self._ema) * self.k + self._ema
+
+    def commit(self, x: float):
+        result = self.value(x)
+        self._count += 1
+        if result is None:
+            self._seed_total += x
+        else:
+            self._ema = result
+
+
+class _Macd:
+    """
+    MACD (TA-Lib 정렬)
+
+    TA-Lib은 빠른 EMA를 느린 EMA와 같은 봉(slow-1)에서 시작하도록
+    처음 slow-fast개 봉을 건너뛴다. 세 출력 모두 시그널이 생긴 봉부터 나온다.
+    """
+
+    def __init__(self, fast: int, slow: int, signal: int):
+        if fast > slow:
+            fast, slow = slow, fast
+        self._fast_skip = slow - fast
+        self._fast = _Ema(fast)
+        self._slow = _Ema(slow)
+        self._signal = _Ema(signal)
+        self._count = 0
+
+    def _line(self, x: float) -> Optional[float]:
+        slow = self._slow.value(x)
+        if slow is None:
+            return None
+        return self._fast.value(x) - slow
+
+    def value(self, x: float):
+        line = self._line(x)
+        if line is None:
+            return None, None, None
+        signal = self._signal.value(line)
+        if signal is None:
+            return None, None, None
+        return line, signal, line - signal
+
+    def commit(self, x: float):
+        line = self._line(x)
+        if line is not None:
+            self._signal.commit(line)
+        if self._count >= self._fast_skip:
+            self._fast.commit(x)
+        self._slow.commit(x)
+        self._count += 1
+
+
+class _WilderRsi:
+    """RSI (Wilder 평활, TA-Lib 방식)"""
+
+    def __init__(self, period: int):
+        self.period = period
+        self._prev_close = None
+        self._diffs = 0
+        self._gain_total = 0.0
+        self._loss_total = 0.0
+        self._avg_gain = None
+        self._avg_loss = None
+
+    def _averages(self, x: float):
+        if self._prev_close is None:
+            return None, None
+        diff = x - self._prev_close
+        gain = diff if diff > 0 else 0.0
+        loss = -diff if diff < 0 else 0.0
+
+        if self._avg_gain is None:
+            if self._diffs < self.period - 1:
+                return None, None
+            return ((self._gain_total + gain) / self.period,
+                    (self._loss_total + loss) / self.period)
+
+        n = self.period
+        return ((self._avg_gain * (n - 1) + gain) / n,
+                (self._avg_loss * (n - 1) + loss) / n)
+
+    def value(self, x: float) -> Optional[float]:
+        avg_gain, avg_loss = self._averages(x)
+        if avg_gain is None:
+            return None
+        total = avg_gain + avg_loss
+        if -_EPSILON < total < _EPSILON:
+            return 0.0
+        return 100.0 * avg_gain / total
+
+    def commit(self, x: float):
+        avg_gain, avg_loss = self._averages(x)
+        if self._prev_close is not None:
+            if avg_gain is None:
+                diff = x - self._prev_close
+                self._gain_total += max(diff, 0.0)
+                self._loss_total += max(-diff, 0.0)
+                self._diffs += 1
+            else:
+                self._avg_gain, self._avg_loss = avg_gain, avg_loss
+        self._prev_close = x
+
+
+class _Bollinger:
+    """볼린저 밴드 (SMA ± k × 모표준편차)"""
+
+    def __init__(self, period: int, std_dev: float):
+        self.period = period
+        self.std_dev = std_dev
+        self._window = deque()
+        self._total = 0.0
+        self._total_sq = 0.0
+
+    def value(self, x: float):
+        if len(self._window) < self.period - 1:
+            return None, None, None
+        mean = (self._total + x) / self.period
+        variance = (self._total_sq + x * x) / self.period - mean * mean
+        std = math.sqrt(variance) if variance >= _EPSILON else 0.0
+        return mean + self.std_dev * std, mean, mean - self.std_dev * std
+
+    def commit(self, x: float):
+        self._window.append(x)
+        self._total += x
+        self._total_sq += x * x
+        if len(self._window) > self.period - 1:
+            old = self._window.popleft()
+            self._total -= old
+            self._total_sq -= old * old
+            if not self._window:
+                self._total = self._total_sq = 0.0
+
+
+class _Stochastic:
+    """Slow Stochastic (Fast %K → SMA → SMA)"""
+
+    def __init__(self, k_period: int, smooth: int, d_period: int):
+        self.k_period = k_period
+        self._highs = deque(maxlen=k_period - 1)
+        self._lows = deque(maxlen=k_period - 1)
+        self._slow_k = _Sma(smooth)
+        self._slow_d = _Sma(d_period)
+
+    def _fast_k(self, high: float, low: float, close: float) -> Optional[float]:
+        if len(self._highs) < self.k_period - 1:
+            return None
+        highest = max(high, max(self._highs, default=high))
+        lowest = min(low, min(self._lows, default=low))
+        diff = (highest - lowest) / 100.0
+        return (close - lowest) / diff if diff != 0 else 0.0
+
+    def value(self, high: float, low: float, close: float):
+        fast_k = self._fast_k(high, low, close)
+        if fast_k is None:
+            return None, None
+        slow_k = self._slow_k.value(fast_k)
+        if slow_k is None:
+            return None, None
+        slow_d = self._slow_d.value(slow_k)
+        if slow_d is None:
+            return None, None
+        return slow_k, slow_d
+
+    def commit(self, high: float, low: float, close: float):
+        fast_k = self._fast_k(high, low, close)
+        if fast_k is not None:
+            slow_k = self._slow_k.value(fast_k)
+            if slow_k is not None:
+                self._slow_d.commit(slow_k)
+            self._slow_k.commit(fast_k)
+        if self.k_period > 1:
+            self._highs.append(high)
+            self._lows.append(low)
+
+
+class _Atr:
+    """ATR (True Range의 Wilder 평활, TA-Lib 방식)"""
+
+    def __init__(self, period: int):
+        self.period = period
+        self._prev_close = None
+        self._count = 0
+        self._tr_total = 0.0
+        self._atr = None
+
+    def value(self, high: float, low: float, close: float) -> Optional[float]:
+        if self._prev_close is None:
+            return None
+        tr = max(high - low, abs(high - self._prev_close), abs(low - self._prev_close))
+
+        if self._atr is None:
+            if self._count < self.period - 1:
+                return None
+            return (self._tr_total + tr) / self.period
+        return (self._atr * (self.period - 1) + tr) / self.period
+
+    def commit(self, high: float, low: float, close: float):
+        if self._prev_close is not None:
+            result = self.value(high, low, close)
+            if result is None:
+                self._tr_total += max(high - low, abs(high - self._prev_close),
+                                      abs(low - self._prev_close))
+                self._count += 1
+            else:
+                self._atr = result
+        self._prev_close = close
+
+
+class IncrementalIndicators:
+    """
+    단일 시계열(거래소/심볼/타임프레임)의 증분 보조지표
+
+    사용법:
+        state = IncrementalIndicators()
+        for candle in history:           # 시간 오름차순
+            state.update(candle['timestamp'], candle['high'], candle['low'], candle['close'])
+        values = state.update(ts, high, low, close)  # 새 봉 또는 진행 중인 봉 갱신
+    """
+
+    ATR_PERIOD = 14
+
+    def __init__(self, params: Dict = None):
+        params = params or INDICATOR_PARAMS
+
+        self._mas = {period: _Sma(period) for period in params["MA"]}
+        macd = params["MACD"]
+        self._macd = _Macd(macd["fast"], macd["slow"], macd["signal"])
+        self._rsi = _WilderRsi(params["RSI"]["period"])
+        stoch = params["STOCH"]
+        self._stoch = _Stochastic(stoch["k_period"], stoch.get("smooth", 3), stoch["d_period"])
+        bollinger = params["BOLLINGER"]
+        self._bollinger = _Bollinger(bollinger["period"], bollinger["std_dev"])
+        self._atr = _Atr(self.ATR_PERIOD)
+
+        self.last_timestamp = None
+        self._pending = None  # (high, low, close) 아직 확정되지 않은 마지막 봉
+        self._values = {}
+
+    @property
+    def values(self) -> Dict[str, Optional[float]]:
+        """마지막 봉 기준 지표 값 (indicators 테이블 컬럼명 + atr)"""
+        return dict(self._values)
+
+    def update(self, timestamp, high: float, low: float,
+               close: float) -> Dict[str, Optional[float]]:
+        """
+        봉 반영
+
+        - timestamp가 마지막 봉보다 크면 마지막 봉을 확정하고 새 봉으로 계산
+        - 같으면 진행 중인 봉의 갱신으로 보고 다시 계산
+        - 더 작으면 무시 (지난 봉은 변경할 수 없음)
+
+        Returns:
+            마지막 봉 기준 지표 값
+        """
+        if self.last_timestamp is not None:
+            if timestamp < self.last_timestamp:
+                return self.values
+            if timestamp > self.last_timestamp:
+                self._commit(*self._pending)
+
+        self.last_timestamp = timestamp
+        self._pending = (float(high), float(low), float(close))
+        self._values = self._evaluate(*self._pending)
+        return self.values
+
+    def _commit(self, high: float, low: float, close: float):
+        """확정된 봉을 상태에 반영"""
+        for ma in self._mas.values():
+            ma.commit(close)
+        self._macd.commit(close)
+        self._rsi.commit(close)
+        self._stoch.commit(high, low, close)
+        self._bollinger.commit(close)
+        self._atr.commit(high, low, close)
+
+    def _evaluate(self, high: float, low: float, close: float) -> Dict[str, Optional[float]]:
+        """확정 상태 + 마지막 봉으로 지표 계산 (상태 변경 없음)"""
+        values = {f'ma_{period}': ma.value(close) for period, ma in self._mas.items()}
+        values['macd'], values['macd_signal'], values['macd_hist'] = self._macd.value(close)
+        values['rsi'] = self._rsi.value(close)
+        values['stoch_k'], values['stoch_d'] = self._stoch.value(high, low, close)
+        values['bb_upper'], values['bb_middle'], values['bb_lower'] = self._bollinger.value(close)
+        values['atr'] = self._atr.value(high, low, close)
+        return values
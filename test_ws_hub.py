@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+WebSocket 허브 테스트 (로컬 websockets 서버를 바이낸스 공개 엔드포인트 대신 사용)
+
+- 구독: 한 연결로 여러 토픽 SUBSCRIBE
+- 수신: 거래소 메시지 → 정규화된 이벤트로 구독자에게 전달
+- 재연결: 서버가 연결을 끊으면 다시 연결해 같은 토픽 재구독
+"""
+import json
+import sys
+import threading
+import time
+
+# 프로젝트 모듈 경로 추가
+sys.path.insert(0, '.')
+
+import websockets
+
+from api.async_loop import async_loop
+from api.ws_adapters import TICKER, KLINE
+from api.ws_hub import WebSocketHub
+
+
+class StandInServer:
+    """바이낸스 선물 공개 스트림 흉내 (SUBSCRIBE 기록, 메시지 전송, 연결 끊기)"""
+
+    def __init__(self):
+        self.server = None
+        self.connections = []
+        self.subscriptions = []  # 연결별 구독한 params 집합
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        port = self.server.sockets[0].getsockname()[1]
+        return f"ws://127.0.0.1:{port}"
+
+    async def start(self):
+        self.server = await websockets.serve(self._handler, "127.0.0.1", 0)
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _handler(self, ws, *args):
+        with self._lock:
+            self.connections.append(ws)
+            params = set()
+            self.subscriptions.append(params)
+
+        try:
+            async for raw in ws:
+                message = json.loads(raw)
+                if message.get('method') == 'SUBSCRIBE':
+                    with self._lock:
+                        params.update(message['params'])
+                elif message.get('method') == 'UNSUBSCRIBE':
+                    with self._lock:
+                        params.difference_update(message['params'])
+                await ws.send(json.dumps({"result": None, "id": message.get('id')}))
+        except websockets.ConnectionClosed:
+            pass
+
+    def push(self, message: dict):
+        """마지막 연결로 메시지 전송"""
+        async_loop.run(self.connections[-1].send(json.dumps(message)))
+
+    def drop(self):
+        """서버 쪽에서 마지막 연결 끊기"""
+        async_loop.run(self.connections[-1].close())
+
+
+def wait_until(predicate, timeout: float = 10.0) -> bool:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def ticker_message(price: str) -> dict:
+    return {"e": "24hrTicker", "E": 1700000000000, "s": "BTCUSDT", "c": price}
+
+
+def kline_message(close: str) -> dict:
+    return {"e": "kline", "E": 1700000000000, "s": "ETHUSDT",
+            "k": {"t": 1699999980000, "s": "ETHUSDT", "i": "1m", "o": "1", "h": "3",
+                  "l": "0.5", "c": close, "v": "10", "x": False}}
+
+
+def test_ws_hub():
+    """구독, 정규화된 이벤트 전달, 서버 끊김 후 재구독"""
+    server = StandInServer()
+    async_loop.run(server.start())
+    hub = WebSocketHub(url_overrides={('binance', 'public'): server.url})
+
+    tickers, klines = [], []
+    subs = [
+        hub.subscribe('binance', TICKER, tickers.append, symbol='BTC/USDT:USDT'),
+        hub.subscribe('binance', KLINE, klines.append, symbol='ETH/USDT:USDT', timeframe='1m'),
+    ]
+    expected = {'btcusdt@ticker', 'ethusdt@kline_1m'}
+
+    try:
+        # 1. 한 연결로 두 토픽 구독
+        assert wait_until(lambda: server.subscriptions and server.subscriptions[-1] == expected), \
+            f"구독 실패: {server.subscriptions}"
+        assert wait_until(lambda: all(hub.is_connected(sub) for sub in subs))
+        assert len(server.connections) == 1
+        print(f"✅ 구독: {sorted(server.subscriptions[-1])}")
+
+        # 2. 정규화된 이벤트 전달
+        server.push(ticker_message("101.5"))
+        server.push(kline_message("2.5"))
+        assert wait_until(lambda: tickers and klines)
+        assert tickers[-1] == {'symbol': 'BTC/USDT:USDT', 'last': 101.5, 'bid': None,
+                               'ask': None, 'timestamp': 1700000000000}
+        assert klines[-1] == {'symbol': 'ETH/USDT:USDT', 'timeframe': '1m',
+                              'timestamp': 1699999980000, 'open': 1.0, 'high': 3.0,
+                              'low': 0.5, 'close': 2.5, 'volume': 10.0, 'closed': False}
+        print(f"✅ 수신: {tickers[-1]}")
+
+        # 3. 서버가 끊으면 재연결 후 같은 토픽 재구독
+        server.drop()
+        assert wait_until(lambda: len(server.connections) == 2
+                          and server.subscriptions[-1] == expected), \
+            f"재구독 실패: {server.subscriptions}"
+        assert wait_until(lambda: all(hub.is_connected(sub) for sub in subs))
+
+        server.push(ticker_message("102"))
+        assert wait_until(lambda: tickers[-1]['last'] == 102.0)
+        print(f"✅ 재연결 후 재구독: {sorted(server.subscriptions[-1])}")
+    finally:
+        for sub in subs:
+            sub.cancel()
+        async_loop.run(hub.close())
+        async_loop.run(server.stop())
+
+
+if __name__ == "__main__":
+    test_ws_hub()
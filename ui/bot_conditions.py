@@ -12,11 +12,15 @@ from qfluentwidgets import (
 )
 
 from database.repository import BotConfigsRepository, ActiveSymbolsRepository
-from config.settings import BOT_INTERVALS, MAX_LEVERAGE, MAX_MARTINGALE_STEPS, CREDENTIALS_PATH
+from config.settings import (
+    BOT_INTERVALS, MAX_LEVERAGE, MAX_MARTINGALE_STEPS, CREDENTIALS_PATH, BOT_ASYNC_RUNTIME
+)
 from config.exchanges import SUPPORTED_EXCHANGES, ALL_EXCHANGE_IDS, DEFAULT_EXCHANGE_ID, DEFAULT_SYMBOLS
 from utils.logger import logger
 from utils.crypto import CredentialManager
+from api.account_snapshot import get_snapshot_poller
 from api.exchange_factory import get_exchange_factory
+from workers.bot_runtime import BotHandle, get_bot_runtime
 from workers.trading_bot import TradingBotWorker
 
 
@@ -36,6 +40,7 @@ class BotConditionsWidget(QWidget):
         
         self.bot_threads = {}
         self.bot_workers = {}
+        self._runtimes = []  # 시그널을 연결한 코루틴 봇 런타임
         
         self._init_ui()
         
@@ -489,15 +494,18 @@ class BotConditionsWidget(QWidget):
                 InfoBar.warning("심볼 선택 필요", "최소 1개 심볼 체크", parent=self)
                 return
             
-            # 기존 포지션 확인
+            # 기존 포지션 확인 (계정 전체 한 번 조회)
+            snapshot = get_snapshot_poller(ccxt_client).get(max_age=0)
             for symbol in selected_symbols:
-                positions = ccxt_client.get_positions(symbol)
+                positions = snapshot.positions_for(symbol)
                 if positions:
                     for pos in positions:
                         if pos.get('size', 0) > 0 and (pos.get('entry_price', 0) > 0 or pos.get('mark_price', 0) > 0):
                             InfoBar.error("포지션 존재", f"{symbol}에 이미 포지션이 있습니다", duration=-1, parent=self)
                             return
             
+            runtime = self._get_runtime(ccxt_client)
+            
             started_count = 0
             for symbol in selected_symbols:
                 config = self.bot_configs_repo.get_config(self.exchange_id, symbol)
@@ -507,6 +515,14 @@ class BotConditionsWidget(QWidget):
                 
                 config['exchange_id'] = self.exchange_id
                 
+                if runtime is not None:
+                    # 공유 이벤트 루프에서 코루틴으로 실행
+                    runtime.start_bot(config)
+                    self.bot_workers[symbol] = BotHandle(runtime, config, ccxt_client)
+                    self.bot_configs_repo.set_active(self.exchange_id, symbol, True)
+                    started_count += 1
+                    continue
+                
                 bot_thread = QThread()
                 bot_worker = TradingBotWorker(ccxt_client, config)
                 bot_worker.moveToThread(bot_thread)
@@ -556,7 +572,7 @@ class BotConditionsWidget(QWidget):
             del self.bot_threads[symbol]
             del self.bot_workers[symbol]
         
-        if len(self.bot_threads) == 0:
+        if not self.bot_workers:
             self._reset_run_button()
     
     def _validate_settings(self) -> bool:
@@ -602,11 +618,34 @@ class BotConditionsWidget(QWidget):
             self.bot_threads[symbol].quit()
             self.bot_threads[symbol].wait()
             del self.bot_threads[symbol]
-            del self.bot_workers[symbol]
+        self.bot_workers.pop(symbol, None)
         
-        if len(self.bot_threads) == 0:
+        if not self.bot_workers:
             self._reset_run_button()
     
+    def _get_runtime(self, ccxt_client):
+        """계정의 코루틴 봇 런타임 (비활성화됐거나 비동기 클라이언트가 없으면 None)"""
+        if not BOT_ASYNC_RUNTIME:
+            return None
+        
+        async_client = get_exchange_factory().get_async_client(
+            self.exchange_id, getattr(ccxt_client, 'is_testnet', False)
+        )
+        if not async_client:
+            logger.warning("Bot", f"{self.exchange_id} 비동기 클라이언트 없음 - 스레드 모드")
+            return None
+        
+        runtime = get_bot_runtime(async_client)
+        if runtime not in self._runtimes:
+            runtime.position_opened.connect(self._on_position_opened)
+            runtime.order_placed.connect(self._on_order_placed)
+            runtime.error_occurred.connect(self._on_bot_error)
+            runtime.bot_stopped.connect(self._on_bot_stopped)
+            runtime.existing_position_found.connect(self._on_existing_position)
+            runtime.position_closed.connect(self._on_position_closed)
+            self._runtimes.append(runtime)
+        return runtime
+    
     def _reset_run_button(self):
         """버튼 리셋"""
         self.run_btn.setEnabled(True)
@@ -641,6 +680,11 @@ class BotConditionsWidget(QWidget):
             # 먼저 모든 봇을 비활성화 (안전)
             logger.info("Bot", f"{len(all_configs)}개 봇 설정 발견 - 포지션 확인 중...")
             
+            # 계정 전체 포지션 한 번 조회
+            snapshot = get_snapshot_poller(ccxt_client).get(max_age=0)
+            
+            runtime = self._get_runtime(ccxt_client)
+            
             restored_count = 0
             for config in all_configs:
                 symbol = config['symbol']
@@ -649,7 +693,7 @@ class BotConditionsWidget(QWidget):
                 self.bot_configs_repo.set_active(self.exchange_id, symbol, False)
                 
                 # 포지션 확인
-                positions = ccxt_client.get_positions(symbol)
+                positions = snapshot.positions_for(symbol)
                 has_position = False
                 actual_size = 0
                 
@@ -675,6 +719,13 @@ class BotConditionsWidget(QWidget):
                 
                 config['exchange_id'] = self.exchange_id
                 
+                if runtime is not None:
+                    # 모니터링부터 시작
+                    runtime.start_bot(config, restore=True)
+                    self.bot_workers[symbol] = BotHandle(runtime, config, ccxt_client)
+                    restored_count += 1
+                    continue
+                
                 bot_thread = QThread()
                 bot_worker = TradingBotWorker(ccxt_client, config)
                 bot_worker.moveToThread(bot_thread)
@@ -689,7 +740,7 @@ class BotConditionsWidget(QWidget):
                 bot_worker.existing_position_found.connect(self._on_existing_position)
                 bot_worker.position_closed.connect(self._on_position_closed)
                 
-                bot_thread.started.connect(bot_worker._monitoring_loop)
+                bot_thread.started.connect(bot_worker.resume_monitoring)
                 
                 self.bot_threads[symbol] = bot_thread
                 self.bot_workers[symbol] = bot_worker
@@ -6,6 +6,7 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt, QTimer
 from qfluentwidgets import SubtitleLabel, PushButton, InfoBar, InfoBarPosition
+from api.account_snapshot import get_snapshot_poller
 from database.repository import PositionsRepository, OrdersRepository
 from config.exchanges import SUPPORTED_EXCHANGES
 from utils.logger import logger
@@ -20,6 +21,7 @@ class BotMonitoringWidget(QWidget):
         self.orders_repo = OrdersRepository()
         
         self.bot_workers = {}
+        self._pollers = {}  # id(client) -> SnapshotPoller (봇이 쓰는 계정별 스냅샷)
         
         self._init_ui()
         
@@ -85,11 +87,31 @@ class BotMonitoringWidget(QWidget):
     def _refresh_data(self):
         """데이터 새로고침"""
         try:
+            self._sync_pollers()
             self._refresh_positions()
             self._refresh_orders()
         except Exception as e:
             logger.error("Monitoring", f"새로고침 실패: {str(e)}")
     
+    def _sync_pollers(self):
+        """실행 중인 봇의 계정 스냅샷 구독 (봇이 없어진 계정은 해제)"""
+        clients = {id(worker.client): worker.client for worker in self.bot_workers.values()}
+        
+        for key in list(self._pollers):
+            if key not in clients:
+                self._pollers.pop(key).release()
+        
+        for key, client in clients.items():
+            if key not in self._pollers:
+                poller = get_snapshot_poller(client)
+                poller.acquire()
+                self._pollers[key] = poller
+    
+    def _latest_snapshot(self, worker):
+        """봇 계정의 마지막 스냅샷 (UI 스레드에서 조회하지 않음, 아직 없으면 None)"""
+        poller = self._pollers.get(id(worker.client))
+        return poller.snapshot if poller else None
+    
     def _refresh_positions(self):
         """포지션 새로고침"""
         self.position_table.setRowCount(0)
@@ -97,11 +119,11 @@ class BotMonitoringWidget(QWidget):
         if not self.bot_workers:
             return
         
-        # 각 봇의 클라이언트로 포지션 조회
+        # 각 봇 계정의 공유 스냅샷에서 심볼 포지션 조회
         for symbol, worker in self.bot_workers.items():
             try:
-                client = worker.client
-                positions = client.get_positions(symbol)
+                snapshot = self._latest_snapshot(worker)
+                positions = snapshot.positions_for(symbol) if snapshot else []
                 
                 if not positions:
                     continue
@@ -183,11 +205,11 @@ class BotMonitoringWidget(QWidget):
         if not self.bot_workers:
             return
         
-        # 각 봇의 클라이언트로 주문 조회
+        # 각 봇 계정의 공유 스냅샷에서 심볼 주문 조회
         for symbol, worker in self.bot_workers.items():
             try:
-                client = worker.client
-                orders = client.get_open_orders(symbol)
+                snapshot = self._latest_snapshot(worker)
+                orders = snapshot.open_orders_for(symbol) if snapshot else []
                 
                 if not orders:
                     continue
@@ -212,7 +234,7 @@ class BotMonitoringWidget(QWidget):
                     self.order_table.setItem(row, 3, QTableWidgetItem(f"{price:.2f}"))
                     
                     # 수량
-                    size = order.get('amount', 0)
+                    size = order.get('size', 0)
                     self.order_table.setItem(row, 4, QTableWidgetItem(f"{size:.4f}"))
                     
                     # 상태
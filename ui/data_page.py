@@ -14,7 +14,7 @@ from qfluentwidgets import (
 )
 from datetime import datetime
 
-from database.repository import CandlesRepository, ActiveSymbolsRepository, BaseRepository, IndicatorsRepository
+from database.repository import CandlesRepository, ActiveSymbolsRepository, IndicatorsRepository
 from config.settings import TIMEFRAMES, DATA_RETENTION_DAYS
 from config.exchanges import (
     SUPPORTED_EXCHANGES, ALL_EXCHANGE_IDS, DEFAULT_EXCHANGE_ID,
@@ -585,29 +585,24 @@ class DataPage(QWidget):
         symbols = self.symbols_repo.get_active_symbols(self.view_exchange_id)
         active_timeframes = self._get_active_timeframes()
 
+        # 시계열 카탈로그 한 번 조회 (캔들 행은 읽지 않음)
+        catalog = self.candles_repo.get_series_catalog(self.view_exchange_id)
+
         row = 0
-        from config.settings import TIMEFRAMES
         for sym in symbols:
             for tf in active_timeframes:  # 필터링된 타임프레임만 표시
-                latest = self.candles_repo.get_latest_timestamp(self.view_exchange_id, sym, tf)
-
-                # 실제 개수를 먼저 조회 (쿼리 개수 제한 없음)
-                base_repo = BaseRepository()
-                sql = """
-                SELECT COUNT(*) as count FROM candles
-                WHERE exchange_id = ? AND symbol = ? AND timeframe = ?
-                """
-                result = base_repo.fetch_one(sql, (self.view_exchange_id, sym, tf))
-                actual_count = result['count'] if result else 0
-
-                # 데이터 조회 (최대 999999개)
-                candles = self.candles_repo.get_candles(self.view_exchange_id, sym, tf, limit=999999)
+                entry = catalog.get((sym, tf), {})
+                latest = entry.get('end_time')
+                actual_count = entry.get('candle_count', 0)
 
                 self.data_table.insertRow(row)
                 self.data_table.setItem(row, 0, QTableWidgetItem(sym))
                 self.data_table.setItem(row, 1, QTableWidgetItem(tf))
                 self.data_table.setItem(row, 2, QTableWidgetItem(latest or "-"))
-                self.data_table.setItem(row, 3, QTableWidgetItem(str(actual_count)))
+                count_item = QTableWidgetItem(str(actual_count))
+                if entry.get('gap_count'):
+                    count_item.setToolTip(f"빠진 봉 {entry['gap_count']}개")
+                self.data_table.setItem(row, 3, count_item)
                 row += 1
 
     def _show_detailed_data(self, item):
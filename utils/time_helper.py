@@ -44,6 +44,22 @@ class TimeHelper:
             dt = self.kst.localize(dt)
         return int(dt.timestamp() * 1000)
     
+    def parse_kst(self, text: str) -> int:
+        """KST 문자열 시각('YYYY-MM-DD[ HH:MM[:SS]]')을 Unix timestamp(ms)로 변환"""
+        return self.kst_to_timestamp(datetime.fromisoformat(text.strip()))
+    
+    def parse_kst_bound(self, text: str, upper: bool = False) -> int:
+        """
+        조회 경계 KST 문자열을 Unix timestamp(ms)로 변환
+        
+        문자열 비교(timestamp <= '2024-06-01')와 같은 범위가 되도록
+        날짜만 준 종료 경계는 그날 00:00:00을 포함하지 않는다.
+        """
+        bound = self.parse_kst(text)
+        if upper and len(text.strip()) < len("YYYY-MM-DD HH:MM:SS"):
+            bound -= 1
+        return bound
+    
     def format_kst(self, dt: datetime, fmt: str = "%Y-%m-%d %H:%M:%S") -> str:
         """KST datetime을 문자열로 포맷"""
         return dt.strftime(fmt)
@@ -0,0 +1,238 @@
+"""
+백필 스케줄러
+(거래소, 심볼, 타임프레임) 작업을 병렬로 수집
+"""
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Callable, Dict, List
+
+from PySide6.QtSql import QSqlDatabase
+
+from api.exchange_factory import get_public_client
+from database.connection import ConnectionManager
+from database.repository import CandlesRepository, IndicatorsRepository
+from workers.candle_resampler import get_fetch_timeframes, get_derived_timeframes
+from utils.logger import logger
+from config.settings import (
+    TIMEFRAMES, BASE_TIMEFRAME, BACKFILL_MAX_CONCURRENCY, SQLITE_BUSY_TIMEOUT_MS
+)
+
+
+class DatabaseThread(threading.Thread):
+    """
+    SQLite 연결을 단독 소유하는 DB 스레드
+
+    QSqlDatabase 연결은 생성한 스레드에서만 사용할 수 있으므로,
+    수집 스레드들은 repository() 프록시를 통해 이 스레드에 작업을 위임한다.
+    """
+
+    CONNECTION_NAME = "backfill_writer"
+
+    def __init__(self):
+        super().__init__(name="BackfillDatabaseThread", daemon=True)
+        # 기본 연결의 DB 경로는 생성 스레드에서 미리 읽어둔다
+        self.db_path = QSqlDatabase.database().databaseName()
+        self._queue: "queue.Queue" = queue.Queue()
+        self._ready = threading.Event()
+        self._repos = {}
+
+    def run(self):
+        db = QSqlDatabase.addDatabase("QSQLITE", self.CONNECTION_NAME)
+        db.setDatabaseName(self.db_path)
+        db.setConnectOptions(f"QSQLITE_BUSY_TIMEOUT={SQLITE_BUSY_TIMEOUT_MS}")
+        if not db.open():
+            logger.error("BackfillDB", f"DB 연결 실패: {db.lastError().text()}")
+        else:
+            ConnectionManager.apply_pragmas(db)
+
+        self._repos = {
+            'candles': CandlesRepository(self.CONNECTION_NAME),
+            'indicators': IndicatorsRepository(self.CONNECTION_NAME),
+        }
+        self._ready.set()
+
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+
+            future, repo_name, method, args, kwargs = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = getattr(self._repos[repo_name], method)(*args, **kwargs)
+                future.set_result(result)
+            except Exception as e:
+                future.set_exception(e)
+
+        # 연결 정리 (참조를 모두 해제한 뒤 제거)
+        self._repos = {}
+        db.close()
+        del db
+        QSqlDatabase.removeDatabase(self.CONNECTION_NAME)
+
+    def submit(self, repo_name: str, method: str, *args, **kwargs) -> Future:
+        """레포지토리 메서드 실행 예약"""
+        future = Future()
+        self._queue.put((future, repo_name, method, args, kwargs))
+        return future
+
+    def repository(self, repo_name: str) -> "RepositoryProxy":
+        """이 스레드에서 실행되는 레포지토리 프록시"""
+        self._ready.wait()
+        return RepositoryProxy(self, repo_name)
+
+    def shutdown(self):
+        """대기 중인 작업을 모두 처리한 뒤 종료"""
+        self._queue.put(None)
+        self.join()
+
+
+class RepositoryProxy:
+    """레포지토리 메서드 호출을 DB 스레드로 전달 (결과까지 대기)"""
+
+    def __init__(self, db_thread: DatabaseThread, repo_name: str):
+        self._db_thread = db_thread
+        self._repo_name = repo_name
+
+    def __getattr__(self, method: str):
+        def call(*args, **kwargs):
+            return self._db_thread.submit(self._repo_name, method, *args, **kwargs).result()
+        return call
+
+
+class BackfillScheduler:
+    """
+    병렬 백필 스케줄러
+
+    - 거래소 간: 완전 병렬 (요청 제한은 클라이언트의 거래소별 공유 토큰 버킷)
+    - 거래소 내: 심볼 × 타임프레임 작업을 max_concurrency개까지 동시 실행
+    - DB 쓰기: 단일 DatabaseThread가 전담
+    """
+
+    def __init__(self, max_concurrency: int = None):
+        self.max_concurrency = max_concurrency or BACKFILL_MAX_CONCURRENCY
+        self.collectors = {}
+        self.is_running = False
+
+    def run(self, exchanges_symbols: Dict[str, List[str]], start_date: datetime,
+            timeframes: List[str] = None, clients: Dict = None,
+            on_progress: Callable[[str, int, int], None] = None,
+            on_error: Callable[[str, str], None] = None,
+            on_exchange_completed: Callable[[str], None] = None):
+        """
+        백필 실행 (모든 작업 완료까지 블로킹)
+
+        Args:
+            exchanges_symbols: {exchange_id: [symbol1, symbol2, ...]}
+            start_date: 시작 날짜 (KST)
+            timeframes: 수집할 타임프레임 (기본: TIMEFRAMES)
+            clients: {exchange_id: CCXTClient} (없으면 공개 클라이언트 사용)
+            on_progress: (message, completed, total) 집계 진행률 콜백
+            on_error: (exchange_id, error_msg) 콜백
+            on_exchange_completed: (exchange_id) 거래소 완료 콜백
+        """
+        from workers.data_collector import DataCollectorWorker
+
+        self.is_running = True
+        timeframes = timeframes or TIMEFRAMES
+        clients = clients or {}
+
+        db_thread = DatabaseThread()
+        db_thread.start()
+
+        executors = []
+        futures = {}
+        remaining = {}
+
+        try:
+            for exchange_id, symbols in exchanges_symbols.items():
+                client = clients.get(exchange_id) or get_public_client(exchange_id)
+                if not client:
+                    if on_error:
+                        on_error(exchange_id, f"{exchange_id} 클라이언트 생성 실패")
+                    continue
+
+                # 거래소별 수집기 (중지 플래그 공유)
+                collector = DataCollectorWorker(exchange_id=exchange_id, client=client)
+                collector.is_running = True
+                collector.candles_repo = db_thread.repository('candles')
+                collector.indicators_repo = db_thread.repository('indicators')
+                self.collectors[exchange_id] = collector
+
+                executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrency,
+                    thread_name_prefix=f"backfill-{exchange_id}"
+                )
+                executors.append(executor)
+
+                # 상위 타임프레임은 1분봉 수집 후 로컬 생성
+                fetch_timeframes = get_fetch_timeframes(exchange_id, timeframes)
+                derived_timeframes = get_derived_timeframes(exchange_id, timeframes)
+
+                remaining[exchange_id] = len(symbols) * len(fetch_timeframes)
+                for symbol in symbols:
+                    for timeframe in fetch_timeframes:
+                        future = executor.submit(
+                            self._run_task, collector, client, exchange_id,
+                            symbol, timeframe, start_date,
+                            derived_timeframes if timeframe == BASE_TIMEFRAME else []
+                        )
+                        futures[future] = (exchange_id, symbol, timeframe)
+
+            total_tasks = len(futures)
+            logger.info("BackfillScheduler",
+                       f"백필 시작: {len(self.collectors)}개 거래소, {total_tasks}개 작업 "
+                       f"(거래소별 동시 {self.max_concurrency}개)")
+
+            completed = 0
+            for future in as_completed(futures):
+                exchange_id, symbol, timeframe = futures[future]
+                completed += 1
+
+                try:
+                    future.result()
+                    message = f"{exchange_id} {symbol} {timeframe} 수집 완료"
+                except Exception as e:
+                    import traceback
+                    message = f"{exchange_id} {symbol} {timeframe} 수집 실패"
+                    error_msg = f"{symbol} {timeframe} 수집 실패: {str(e)}"
+                    logger.error("BackfillScheduler", error_msg, traceback.format_exc())
+                    if on_error:
+                        on_error(exchange_id, error_msg)
+
+                if on_progress:
+                    on_progress(message, completed, total_tasks)
+
+                remaining[exchange_id] -= 1
+                if remaining[exchange_id] == 0 and on_exchange_completed:
+                    on_exchange_completed(exchange_id)
+
+        finally:
+            for executor in executors:
+                executor.shutdown(wait=True)
+            db_thread.shutdown()
+            self.collectors = {}
+            self.is_running = False
+
+        logger.info("BackfillScheduler", "백필 완료")
+
+    def _run_task(self, collector, client, exchange_id: str, symbol: str,
+                  timeframe: str, start_date: datetime,
+                  derived_timeframes: List[str]):
+        """단일 (심볼, 타임프레임) 수집 작업 (+ 상위 타임프레임 생성)"""
+        if not self.is_running or not collector.is_running:
+            return
+        repaired = collector._collect_candles(client, exchange_id, symbol, timeframe, start_date)
+
+        if derived_timeframes and collector.is_running:
+            collector._update_derived_timeframes(exchange_id, symbol, derived_timeframes,
+                                                 repaired)
+
+    def stop(self):
+        """모든 작업 중지"""
+        self.is_running = False
+        for collector in list(self.collectors.values()):
+            collector.stop()
@@ -6,6 +6,8 @@ from PySide6.QtCore import QObject, Signal, QThread
 from typing import Dict, Optional
 
 from backtest.engine import BacktestEngine, BacktestConfig
+from backtest.optimizer import BacktestOptimizer
+from database.connection import ConnectionManager
 from utils.logger import logger
 
 
@@ -54,6 +56,7 @@ class BacktestWorker(QObject):
             self.error_occurred.emit(error_msg)
         finally:
             self.is_running = False
+            ConnectionManager.release()
     
     def _on_completed(self, result: dict):
         """백테스트 완료 처리"""
@@ -133,3 +136,81 @@ class BacktestRunner:
         """실행 중 여부"""
         return self.thread is not None and self.thread.isRunning()
 
+
+
+class OptimizerRunner:
+    """파라미터 최적화 러너 (스레드 관리)"""
+
+    def __init__(self):
+        self.thread: Optional[QThread] = None
+        self.optimizer: Optional[BacktestOptimizer] = None
+
+    def start(self, base_config: BacktestConfig, space: Dict, on_progress=None,
+              on_ranking=None, on_completed=None, on_error=None, **options):
+        """
+        최적화 시작 (새 스레드에서, 평가는 프로세스 풀)
+
+        Args:
+            base_config: 기준 설정
+            space: 탐색 공간
+            on_progress: 진행 콜백 (message, current, total)
+            on_ranking: 순위 갱신 콜백 (상위 결과 리스트)
+            on_completed: 완료 콜백 (전체 순위)
+            on_error: 에러 콜백 (error_msg)
+            **options: BacktestOptimizer.run 옵션 (method, rank_by, max_drawdown_cap 등)
+        """
+        self.stop()
+
+        self.thread = QThread()
+        self.optimizer = BacktestOptimizer()
+        self.optimizer.moveToThread(self.thread)
+
+        if on_progress:
+            self.optimizer.progress_updated.connect(on_progress)
+        if on_ranking:
+            self.optimizer.ranking_updated.connect(on_ranking)
+        if on_completed:
+            self.optimizer.optimization_completed.connect(on_completed)
+        if on_error:
+            self.optimizer.error_occurred.connect(on_error)
+
+        self.thread.started.connect(lambda: self._run(base_config, space, options))
+        self.optimizer.optimization_completed.connect(self._cleanup)
+        self.optimizer.error_occurred.connect(self._cleanup)
+
+        self.thread.start()
+        logger.info("OptimizerRunner", "최적화 스레드 시작")
+
+    def _run(self, base_config: BacktestConfig, space: Dict, options: Dict):
+        """최적화 실행 (최적화 스레드)"""
+        try:
+            self.optimizer.run(base_config, space, **options)
+        except Exception as e:
+            # run() 밖에서 난 오류 (잘못된 옵션 등)도 완료/오류 시그널로 스레드 정리
+            import traceback
+            error_msg = f"최적화 실행 중 오류: {str(e)}"
+            logger.error("OptimizerRunner", error_msg, traceback.format_exc())
+            self.optimizer.error_occurred.emit(error_msg)
+        finally:
+            ConnectionManager.release()
+
+    def stop(self):
+        """최적화 중지"""
+        if self.optimizer:
+            self.optimizer.stop()
+
+        if self.thread and self.thread.isRunning():
+            self.thread.quit()
+            self.thread.wait(5000)
+
+        self.thread = None
+        self.optimizer = None
+
+    def _cleanup(self, *args):
+        """스레드 정리"""
+        if self.thread:
+            self.thread.quit()
+
+    def is_running(self) -> bool:
+        """실행 중 여부"""
+        return self.thread is not None and self.thread.isRunning()
@@ -0,0 +1,625 @@
+"""
+코루틴 봇 런타임
+계정 하나의 모든 심볼 봇을 공유 이벤트 루프(async_loop)에서 코루틴으로 실행한다.
+심볼 수만큼 QThread를 만들지 않고, 봇마다 asyncio Task 하나로 취소/감시한다.
+"""
+import asyncio
+from typing import Dict, List, Optional
+
+from PySide6.QtCore import QObject, Signal
+
+from api.account_snapshot import get_async_snapshot_poller
+from api.async_loop import async_loop
+from api.ws_adapters import STREAM_ADAPTERS, ORDERS, POSITIONS
+from api.ws_hub import ws_hub
+from config.settings import (
+    BOT_EVENT_DRIVEN, BOT_RECONCILE_INTERVAL, BOT_STREAM_DOWN_POLL_INTERVAL,
+    ACCOUNT_SNAPSHOT_INTERVAL, BOT_MAX_RESTARTS, BOT_RESTART_DELAY
+)
+from database.connection import ConnectionManager
+from database.repository import OrdersRepository, PositionsRepository, TradesHistoryRepository
+from database.writer import db_writer
+from utils.logger import logger
+from utils.time_helper import time_helper
+from workers.trading_bot import entry_order_size, tp_sl_prices, martingale_legs
+
+
+def _run_db(func, *args):
+    """실행기 스레드에서 DB 작업 실행 후 그 스레드의 연결 닫기 (실행기 스레드는 풀에서 재사용)"""
+    try:
+        return func(*args)
+    finally:
+        ConnectionManager.release()
+
+
+class AsyncTradingBot:
+    """
+    심볼 하나의 자동매매 봇 (코루틴)
+
+    흐름은 TradingBotWorker와 같다: 기존 포지션 정리 → 레버리지 → 시장가 진입(TP/SL)
+    → 마틴게일 → 모니터링 → 청산 후 자동 재실행.
+    시그널은 runtime을 통해 UI로 전달된다.
+    """
+
+    def __init__(self, runtime: "BotRuntime", config: Dict):
+        self.runtime = runtime
+        self.client = runtime.client  # AsyncCCXTClient
+        self.snapshots = get_async_snapshot_poller(runtime.client)
+        self.config = config
+        self.symbol = config['symbol']
+        self.exchange_id = config.get('exchange_id', runtime.exchange_id)
+        self.pos_side = "long" if config['direction'] == "LONG" else "short"
+
+        self.orders_repo = OrdersRepository()
+        self.positions_repo = PositionsRepository()
+        self.trades_repo = TradesHistoryRepository()
+
+        # 상태
+        self.is_running = False
+        self.auto_restart = True
+        self.in_position = False  # 진입 후 청산 전 (감독자 재시작 시 모니터링부터)
+        self.position_id = None
+        self.entry_order_id = None
+        self.martingale_level = 0
+        self.martingale_order_ids: List[str] = []
+        self.entry_time = None
+        self.entry_price = 0.0
+        self.position_size = 0.0
+        self.last_pnl = 0.0
+        self.last_mark_price = 0.0
+
+        # 이벤트 모드 (주문/포지션 푸시)
+        self._events: Optional[asyncio.Queue] = None
+        self._subscriptions = []
+
+    def _error(self, message: str, detail: str = None):
+        logger.error("BotRuntime", message, detail)
+        self.runtime.error_occurred.emit(self.symbol, message)
+
+    def _db_write(self, write, *args):
+        """
+        결과가 필요 없는 DB 쓰기 (루프 스레드에서 SQLite I/O를 하지 않는다)
+
+        레포지토리 쓰기는 DB 쓰기 스레드 큐에 넣고 바로 돌아온다.
+        쓰기 스레드가 없으면 직접 실행되므로 실행기 스레드로 넘긴다.
+        """
+        if db_writer.is_running:
+            write(*args)
+        else:
+            asyncio.get_running_loop().run_in_executor(None, _run_db, write, *args)
+
+    # ========== 실행 ==========
+
+    async def run(self, restore: bool = False):
+        """
+        거래 루프
+
+        Args:
+            restore: 이미 열린 포지션을 모니터링부터 시작 (자동 복원/재시작)
+        """
+        self.is_running = True
+        self._start_streams()
+        try:
+            if restore:
+                await self._restore_position()
+                await self._monitor()
+
+            while self.is_running and self.auto_restart:
+                logger.info("BotRuntime", f"{self.symbol} 새 사이클 시작 - {self.config['direction']}")
+
+                if not await self._close_existing_positions():
+                    break
+                if not await self._set_leverage():
+                    break
+                if not await self._open_position():
+                    break
+
+                await asyncio.sleep(1)  # API 인증 안정화
+                if self.config.get('martingale_enabled'):
+                    await self._setup_martingale_orders()
+
+                await self._monitor()
+
+                if self.is_running and self.auto_restart:
+                    logger.info("BotRuntime", f"{self.symbol} 포지션 종료 - 3초 후 재시작")
+                    await asyncio.sleep(3)
+        finally:
+            self._stop_streams()
+            self.is_running = False
+
+    def _start_streams(self):
+        if not self.config.get('event_driven', BOT_EVENT_DRIVEN):
+            return
+        if self.exchange_id not in STREAM_ADAPTERS:
+            return
+
+        # 콜백은 같은 루프 스레드에서 불리므로 큐에 바로 넣는다
+        events = asyncio.Queue()
+        try:
+            for stream in (POSITIONS, ORDERS):
+                self._subscriptions.append(ws_hub.subscribe(
+                    self.exchange_id, stream,
+                    lambda event, stream=stream: events.put_nowait((stream, event)),
+                    symbol=self.symbol, is_testnet=self.client.is_testnet, client=self.client
+                ))
+            self._events = events
+        except Exception as e:
+            logger.warning("BotRuntime", f"{self.symbol} 스트림 구독 실패 - 스냅샷 모드: {str(e)}")
+            self._stop_streams()
+
+    def _stop_streams(self):
+        for sub in self._subscriptions:
+            sub.cancel()
+        self._subscriptions = []
+        self._events = None
+
+    async def _positions(self) -> List[Dict]:
+        """이 봇 방향의 열린 포지션 (심볼 단위 조회, 방금 한 주문 결과를 봐야 하는 곳용)"""
+        return [pos for pos in await self.client.get_positions(self.symbol)
+                if pos.get('side', self.pos_side) == self.pos_side and pos.get('size', 0) > 0]
+
+    async def _restore_position(self):
+        """
+        이미 열린 포지션으로 진입 정보 채우기 (청산 시 거래 내역에 기록된다)
+
+        감독자 재시작이면 같은 봇이 진입 정보를 이미 갖고 있으므로 수량/마크 가격만 갱신한다.
+        """
+        self.in_position = True
+        positions = await self._positions()
+        if not positions:
+            return
+
+        pos = positions[0]
+        self.position_size = pos['size']
+        self.last_mark_price = pos.get('mark_price') or self.last_mark_price
+        if self.entry_time is None:
+            # 실제 진입 시각은 알 수 없어 복원 시각으로 기록
+            self.entry_price = pos.get('entry_price') or 0.0
+            self.entry_time = time_helper.format_kst(time_helper.now_kst())
+
+    # ========== 진입 ==========
+
+    async def _close_existing_positions(self) -> bool:
+        """기존 포지션 강제 청산"""
+        positions = await self._positions()
+        if not positions:
+            logger.info("BotRuntime", f"{self.symbol} 기존 포지션 없음 - 정상 진행")
+            return True
+
+        logger.warning("BotRuntime", f"{self.symbol} 기존 포지션 발견 - 강제 청산 시작")
+        for pos in positions:
+            close_side = "sell" if pos['side'] == "long" else "buy"
+            await self.client.place_market_order(symbol=self.symbol, side=close_side,
+                                                 size=pos['size'], pos_side=pos['side'],
+                                                 reduce_only=True)
+
+        self.runtime.existing_position_found.emit(
+            self.symbol,
+            f"기존 포지션이 발견되어 강제 청산했습니다.\n"
+            f"청산된 포지션: {len(positions)}개\n"
+            f"봇을 새로 시작합니다."
+        )
+
+        await asyncio.sleep(2)
+        if await self._positions():
+            self._error(f"{self.symbol} 포지션 청산 실패 - 봇 실행 중단")
+            return False
+        return True
+
+    async def _set_leverage(self) -> bool:
+        leverage = self.config['leverage']
+        if await self.client.set_leverage(symbol=self.symbol, leverage=leverage,
+                                          margin_mode=self.config['margin_mode']):
+            logger.info("BotRuntime", f"{self.symbol} 레버리지 {leverage}x 설정 완료")
+            return True
+        self._error(f"{self.symbol} 레버리지 설정 실패")
+        return False
+
+    async def _open_position(self) -> bool:
+        """시장가 진입 (TP/SL 포함)"""
+        ticker = await self.client.get_ticker(self.symbol)
+        if not ticker:
+            self._error(f"{self.symbol} 현재가 조회 실패")
+            return False
+
+        current_price = float(ticker['last'])
+        size = entry_order_size(self.symbol, float(self.config['max_margin']),
+                                self.config['leverage'], current_price)
+        side = "buy" if self.pos_side == "long" else "sell"
+        tp_price, sl_price = tp_sl_prices(self.config['direction'], current_price,
+                                          self.config['tp_offset_pct'],
+                                          self.config.get('sl_offset_pct'))
+
+        logger.info("BotRuntime", f"{self.symbol} 시장가 진입: {side} {size} @ {current_price:.2f}")
+        order = await self.client.place_order_with_tp_sl(
+            symbol=self.symbol, side=side, size=size,
+            tp_price=tp_price, sl_price=sl_price, pos_side=self.pos_side
+        )
+        if not order:
+            self._error(f"{self.symbol} 진입 주문 실패 (수량: {size}, 가격: {current_price:.2f})")
+            return False
+
+        self.entry_order_id = order['order_id']
+        self._db_write(self.orders_repo.insert_order, {
+            'exchange_id': self.exchange_id,
+            'order_id': self.entry_order_id,
+            'symbol': self.symbol,
+            'side': side,
+            'type': 'market',
+            'size': size,
+            'status': 'filled'
+        })
+        # 삽입 id가 필요하므로 실행기 스레드에서 기다린다
+        self.position_id = await asyncio.get_running_loop().run_in_executor(
+            None, _run_db, self.positions_repo.insert_position, {
+                'exchange_id': self.exchange_id,
+                'symbol': self.symbol,
+                'side': self.pos_side,
+                'size': size,
+                'avg_price': current_price,
+                'leverage': self.config['leverage']
+            }
+        )
+
+        self.in_position = True
+        self.entry_time = time_helper.format_kst(time_helper.now_kst())
+        self.entry_price = current_price
+        self.position_size = size
+        self.martingale_level = 0
+
+        self.runtime.position_opened.emit(self.symbol, self.pos_side, size)
+        return True
+
+    async def _setup_martingale_orders(self):
+        """마틴게일 지정가 일괄 주문"""
+        ticker = await self.client.get_ticker(self.symbol)
+        if not ticker:
+            logger.error("BotRuntime", f"{self.symbol} 마틴게일 설정 실패 - 현재가 조회 실패")
+            return
+
+        legs = martingale_legs(self.config, float(ticker['last']))
+        results = await self.client.place_limit_orders(legs)
+
+        placed_orders = []
+        for i, (leg, order) in enumerate(zip(legs, results)):
+            if not order:
+                logger.error("BotRuntime", f"{self.symbol} 마틴 {i+1}단계 주문 실패")
+                continue
+            self.martingale_order_ids.append(order['order_id'])
+            placed_orders.append({
+                'exchange_id': self.exchange_id,
+                'order_id': order['order_id'],
+                'symbol': self.symbol,
+                'side': leg['side'],
+                'type': 'limit',
+                'price': leg['price'],
+                'size': leg['size'],
+                'status': 'open',
+                'position_id': self.position_id,
+                'related_order_type': f'martingale_{i+1}'
+            })
+
+        self._db_write(self.orders_repo.insert_orders, placed_orders)
+        logger.info("BotRuntime",
+                    f"{self.symbol} 마틴게일 {len(placed_orders)}/{len(legs)}단계 주문 완료")
+
+    # ========== 모니터링 ==========
+
+    async def _monitor(self):
+        """
+        포지션 모니터링
+
+        스트림 구독 중이면 푸시 이벤트에 바로 반응하고 스냅샷 대조는 안전망으로만 한다.
+        스트림이 없으면 공유 스냅샷을 주기마다 확인한다.
+        """
+        loop = asyncio.get_running_loop()
+        events = self._events or asyncio.Queue()
+        while not events.empty():
+            events.get_nowait()
+
+        retry_count = 0
+        max_retries = 3
+        next_reconcile = loop.time()
+        logger.info("BotRuntime", f"{self.symbol} 모니터링 시작")
+
+        while self.is_running:
+            wait = next_reconcile - loop.time()
+            if wait > 0:
+                try:
+                    stream, event = await asyncio.wait_for(events.get(), wait)
+                except asyncio.TimeoutError:
+                    continue
+
+                if stream == ORDERS:
+                    self._on_order_event(event)
+                    continue
+                if event.get('side') not in (self.pos_side, None):
+                    continue
+                if event.get('size', 0) == 0:
+                    logger.info("BotRuntime", f"{self.symbol} 포지션 청산 이벤트 수신")
+                    await self._handle_position_closed()
+                    return
+
+                self.position_size = event['size']
+                self.last_pnl = event.get('unrealized_pnl') or 0.0
+                if event.get('mark_price'):
+                    self.last_mark_price = event['mark_price']
+                continue
+
+            # 스냅샷 대조
+            if not self._subscriptions:
+                interval = ACCOUNT_SNAPSHOT_INTERVAL
+            elif all(ws_hub.is_connected(sub) for sub in self._subscriptions):
+                interval = BOT_RECONCILE_INTERVAL
+            else:
+                interval = BOT_STREAM_DOWN_POLL_INTERVAL
+            next_reconcile = loop.time() + interval
+
+            try:
+                snapshot = await self.snapshots.get()
+                positions = [pos for pos in snapshot.positions_for(self.symbol)
+                             if pos.get('side', self.pos_side) == self.pos_side]
+            except Exception as e:
+                logger.error("BotRuntime", f"{self.symbol} 포지션 대조 중 오류: {str(e)}")
+                positions = []
+
+            if not positions:
+                retry_count += 1
+                if retry_count >= max_retries:
+                    logger.warning("BotRuntime", f"{self.symbol} 포지션 조회 실패 {max_retries}회 - 봇 중지")
+                    self.is_running = False
+                    return
+                next_reconcile = loop.time() + BOT_STREAM_DOWN_POLL_INTERVAL
+                continue
+
+            retry_count = 0
+            pos_data = positions[0]
+            if pos_data.get('size', 0) == 0:
+                logger.info("BotRuntime", f"{self.symbol} 포지션 청산 확인 (스냅샷 대조)")
+                await self._handle_position_closed()
+                return
+
+            self.position_size = pos_data['size']
+            self.last_pnl = pos_data.get('unrealized_pnl', 0)
+            self.last_mark_price = pos_data.get('mark_price', 0)
+
+    def _on_order_event(self, event: Dict):
+        """봇이 낸 주문의 체결/취소 반영"""
+        order_id = event.get('order_id')
+        status = event.get('status')
+        tracked = [self.entry_order_id] + self.martingale_order_ids
+        if not order_id or order_id not in tracked or status not in ('closed', 'canceled'):
+            return
+
+        if status == 'closed' and order_id in self.martingale_order_ids:
+            self.martingale_level += 1
+            logger.info("BotRuntime",
+                        f"{self.symbol} 마틴 {self.martingale_level}단계 체결: "
+                        f"{event.get('filled')} @ {event.get('average')}")
+            self.runtime.order_placed.emit(self.symbol, f"martingale_{self.martingale_level}",
+                                           event.get('side', ''), event.get('average') or 0.0)
+
+        self._db_write(
+            self.orders_repo.update_order_status, self.exchange_id, order_id,
+            'filled' if status == 'closed' else 'canceled', event.get('filled')
+        )
+
+    async def _handle_position_closed(self):
+        """포지션 청산(TP/SL 체결) 후 처리"""
+        self.in_position = False
+        self._save_trade_history("TP/SL")
+        await self._cancel_all_pending_orders()
+        self.runtime.position_closed.emit(self.symbol, self.last_pnl)
+
+        if not self.auto_restart:
+            self.is_running = False
+
+    # ========== 중지/정리 ==========
+
+    async def close_out(self):
+        """미체결 주문 취소 후 포지션 시장가 청산 (청산 모드 중지)"""
+        await self._cancel_all_pending_orders()
+        for pos in await self._positions():
+            close_side = "sell" if pos['side'] == "long" else "buy"
+            logger.info("BotRuntime", f"{self.symbol} 포지션 청산: {pos['side']} {pos['size']}")
+            await self.client.place_market_order(symbol=self.symbol, side=close_side,
+                                                 size=pos['size'], pos_side=pos['side'],
+                                                 reduce_only=True)
+        if self.in_position:
+            self.in_position = False
+            self._save_trade_history("수동 청산")
+
+    async def _cancel_all_pending_orders(self):
+        """마틴게일 및 남은 미체결 주문 취소"""
+        order_ids = list(self.martingale_order_ids)
+        self.martingale_order_ids = []
+        try:
+            open_orders = await self.client.get_open_orders(self.symbol)
+            order_ids += [order['order_id'] for order in open_orders
+                          if order['order_id'] not in order_ids]
+        except Exception as e:
+            logger.error("BotRuntime", f"{self.symbol} 미체결 주문 조회 실패: {str(e)}")
+
+        await asyncio.gather(*(self.client.cancel_order(self.symbol, order_id)
+                               for order_id in order_ids), return_exceptions=True)
+        logger.info("BotRuntime", f"{self.symbol} 미체결 주문 {len(order_ids)}개 취소")
+
+    def _save_trade_history(self, exit_reason: str):
+        try:
+            self._db_write(self.trades_repo.insert_trade, {
+                'exchange_id': self.exchange_id,
+                'symbol': self.symbol,
+                'side': self.config['direction'].lower(),
+                'entry_price': self.entry_price,
+                'exit_price': self.last_mark_price,
+                'size': self.position_size,
+                'leverage': self.config.get('leverage', 1),
+                'pnl': self.last_pnl,
+                'fees': 0.0,
+                'entry_time': self.entry_time or time_helper.format_kst(time_helper.now_kst()),
+                'exit_time': time_helper.format_kst(time_helper.now_kst()),
+                'exit_reason': exit_reason
+            })
+            logger.info("BotRuntime",
+                        f"{self.symbol} 거래 내역 저장: PNL {self.last_pnl:.2f} USDT, {exit_reason}")
+        except Exception as e:
+            logger.error("BotRuntime", f"{self.symbol} 거래 내역 저장 실패: {str(e)}")
+
+
+class BotHandle:
+    """
+    UI용 봇 핸들 (bot_workers 항목)
+
+    TradingBotWorker와 같은 client/config/stop_trading 인터페이스를 제공해
+    모니터링 위젯이 실행 방식과 무관하게 다룰 수 있게 한다.
+    client는 모니터링 위젯의 계정 스냅샷용 동기 클라이언트다.
+    """
+
+    def __init__(self, runtime: "BotRuntime", config: Dict, client=None):
+        self.runtime = runtime
+        self.config = config
+        self.client = client
+
+    def stop_trading(self, clean_mode: bool = True):
+        self.runtime.stop_bot(self.config['symbol'], clean_mode)
+
+
+class BotRuntime(QObject):
+    """
+    계정 하나의 코루틴 봇 런타임
+
+    - start_bot()/stop_bot()은 UI 스레드에서 호출, 실제 작업은 루프 스레드의 Task
+    - 봇이 예외로 죽으면 감독 코루틴이 BOT_RESTART_DELAY부터 두 배씩 늘려 최대
+      BOT_MAX_RESTARTS회 다시 시작한다 (진입 상태였으면 모니터링부터)
+    - 시그널은 루프 스레드에서 발생하고 Qt가 수신 측(UI) 스레드로 전달한다
+    """
+
+    position_opened = Signal(str, str, float)  # symbol, side, size
+    order_placed = Signal(str, str, str, float)  # symbol, order_type, side, price
+    error_occurred = Signal(str, str)  # symbol, error_msg
+    bot_stopped = Signal(str)  # symbol
+    existing_position_found = Signal(str, str)  # symbol, message
+    position_closed = Signal(str, float)  # symbol, pnl
+
+    def __init__(self, client):
+        """
+        Args:
+            client: AsyncCCXTClient (인증된 계정)
+        """
+        super().__init__()
+        self.client = client
+        self.exchange_id = client.exchange_id
+        self.bots: Dict[str, AsyncTradingBot] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._stopping = set()  # 중지(청산) 처리 중인 심볼
+
+    # ========== UI 스레드 API ==========
+
+    def start_bot(self, config: Dict, restore: bool = False):
+        """봇 시작 (이미 실행 중인 심볼은 무시)"""
+        async_loop.loop.call_soon_threadsafe(self._start, dict(config), restore)
+
+    def stop_bot(self, symbol: str, clean_mode: bool = True):
+        """봇 중지 (clean_mode면 주문 취소 및 포지션 청산)"""
+        async_loop.submit(self._stop(symbol, clean_mode))
+
+    def stop_all(self, clean_mode: bool = True):
+        for symbol in list(self.bots):
+            self.stop_bot(symbol, clean_mode)
+
+    def is_running(self, symbol: str) -> bool:
+        task = self._tasks.get(symbol)
+        return task is not None and not task.done()
+
+    # ========== 루프 스레드 ==========
+
+    def _start(self, config: Dict, restore: bool):
+        symbol = config['symbol']
+        if self.is_running(symbol):
+            logger.warning("BotRuntime", f"{symbol} 이미 실행 중")
+            return
+        if symbol in self._stopping:
+            # 이전 봇의 청산 주문과 겹치지 않도록 중지가 끝난 뒤에만 시작
+            message = f"{symbol} 이전 봇 중지 처리 중 - 완료 후 다시 실행하세요"
+            logger.warning("BotRuntime", message)
+            self.error_occurred.emit(symbol, message)
+            return
+        bot = AsyncTradingBot(self, config)
+        self.bots[symbol] = bot
+        self._tasks[symbol] = asyncio.ensure_future(self._supervise(bot, restore))
+        logger.info("BotRuntime", f"{symbol} 봇 시작 (실행 중 {len(self._tasks)}개)")
+
+    async def _supervise(self, bot: AsyncTradingBot, restore: bool):
+        symbol = bot.symbol
+        restarts = 0
+        try:
+            while True:
+                try:
+                    await bot.run(restore=restore)
+                    break
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    import traceback
+                    restarts += 1
+                    if restarts > BOT_MAX_RESTARTS:
+                        bot._error(f"{symbol} 봇 실행 실패 ({BOT_MAX_RESTARTS}회 재시작 후 중지): {str(e)}",
+                                   traceback.format_exc())
+                        break
+                    delay = BOT_RESTART_DELAY * 2 ** (restarts - 1)
+                    logger.error("BotRuntime", f"{symbol} 봇 오류 - {delay}초 후 재시작 "
+                                               f"({restarts}/{BOT_MAX_RESTARTS}): {str(e)}",
+                                 traceback.format_exc())
+                    await asyncio.sleep(delay)
+                    restore = bot.in_position
+                    bot.auto_restart = True
+        finally:
+            if self._tasks.get(symbol) is asyncio.current_task():
+                del self._tasks[symbol]
+                self.bots.pop(symbol, None)
+            logger.info("BotRuntime", f"{symbol} 봇 종료")
+            # 중지 요청이면 _stop이 청산을 마친 뒤 알린다
+            if symbol not in self._stopping:
+                self.bot_stopped.emit(symbol)
+
+    async def _stop(self, symbol: str, clean_mode: bool):
+        bot = self.bots.get(symbol)
+        task = self._tasks.get(symbol)
+        if bot is None or symbol in self._stopping:
+            return
+
+        self._stopping.add(symbol)
+        try:
+            bot.auto_restart = False
+            bot.is_running = False
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+
+            if clean_mode:
+                logger.info("BotRuntime", f"{symbol} 봇 중지 (청산 모드)")
+                try:
+                    await bot.close_out()
+                except Exception as e:
+                    import traceback
+                    logger.error("BotRuntime", f"{symbol} 청산 중 오류: {str(e)}",
+                                 traceback.format_exc())
+            else:
+                logger.info("BotRuntime", f"{symbol} 봇 중지 (유지 모드)")
+        finally:
+            self._stopping.discard(symbol)
+            self.bot_stopped.emit(symbol)
+
+
+_runtimes: Dict[int, BotRuntime] = {}
+
+
+def get_bot_runtime(client) -> BotRuntime:
+    """비동기 클라이언트(계정)별 봇 런타임 조회 (없으면 생성, UI 스레드에서 호출)"""
+    runtime = _runtimes.get(id(client))
+    if runtime is None or runtime.client is not client:
+        runtime = _runtimes[id(client)] = BotRuntime(client)
+    return runtime
@@ -0,0 +1,226 @@
+"""
+캔들 리샘플러
+저장된 1분봉으로 상위 타임프레임(5m/15m/1h/4h/1d) 캔들 생성
+"""
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config.exchanges import uses_native_timeframes
+from config.settings import (
+    TIMEZONE, TIMEFRAME_MINUTES, BASE_TIMEFRAME, DERIVED_TIMEFRAMES,
+    RESAMPLE_WINDOW_DAYS
+)
+from utils.logger import logger
+from utils.time_helper import time_helper
+
+MINUTE_MS = 60 * 1000
+DAY_MS = 24 * 60 * MINUTE_MS
+
+
+def get_fetch_timeframes(exchange_id: str, timeframes: List[str]) -> List[str]:
+    """거래소에서 직접 수집해야 하는 타임프레임"""
+    if uses_native_timeframes(exchange_id):
+        return list(timeframes)
+
+    fetch = [tf for tf in timeframes if tf not in DERIVED_TIMEFRAMES]
+    if get_derived_timeframes(exchange_id, timeframes) and BASE_TIMEFRAME not in fetch:
+        fetch.insert(0, BASE_TIMEFRAME)
+    return fetch
+
+
+def get_derived_timeframes(exchange_id: str, timeframes: List[str]) -> List[str]:
+    """1분봉에서 로컬 생성하는 타임프레임"""
+    if uses_native_timeframes(exchange_id):
+        return []
+    return [tf for tf in timeframes if tf in DERIVED_TIMEFRAMES]
+
+
+def resample_ohlcv(timestamps_ms: np.ndarray, opens: np.ndarray, highs: np.ndarray,
+                   lows: np.ndarray, closes: np.ndarray, volumes: np.ndarray,
+                   period_ms: int) -> pd.DataFrame:
+    """
+    OHLCV 벡터 리샘플링 (UTC epoch 기준 봉 경계)
+
+    입력은 시간 오름차순이어야 한다.
+
+    Returns:
+        DataFrame (index: 봉 시작 epoch ms, columns: open/high/low/close/volume/count)
+        count는 봉에 들어간 입력 캔들 수
+    """
+    buckets = timestamps_ms - (timestamps_ms % period_ms)
+
+    # 봉 경계 위치 (정렬된 입력이므로 값이 바뀌는 지점)
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(buckets)] - 1
+
+    return pd.DataFrame({
+        'open': opens[starts],
+        'high': np.maximum.reduceat(highs, starts),
+        'low': np.minimum.reduceat(lows, starts),
+        'close': closes[ends],
+        'volume': np.add.reduceat(volumes, starts),
+        'count': ends - starts + 1,
+    }, index=buckets[starts])
+
+
+class CandleResampler:
+    """1분봉 → 상위 타임프레임 캔들 생성 (증분 갱신)"""
+
+    def __init__(self, candles_repo):
+        """
+        Args:
+            candles_repo: CandlesRepository (또는 DB 스레드 프록시)
+        """
+        self.candles_repo = candles_repo
+
+    def update(self, exchange_id: str, symbol: str, timeframes: List[str] = None,
+               pending_gaps: List[Tuple[int, int]] = None) -> Dict[str, int]:
+        """
+        상위 타임프레임 캔들 생성/갱신
+
+        타임프레임마다 자기 마지막 봉(진행 중일 수 있음)부터 다시 계산하므로
+        새 1분봉이 들어올 때마다 호출하면 증분 갱신된다.
+
+        Args:
+            pending_gaps: 아직 복구될 수 있는 1분봉 빈 구간 [(시작 ms, 끝 ms)]
+                (이 구간에 걸쳐 1분봉이 빠진 봉은 복구될 때까지 저장하지 않음)
+
+        Returns:
+            {timeframe: 저장된 캔들 수}
+        """
+        timeframes = timeframes or DERIVED_TIMEFRAMES
+        saved = {tf: 0 for tf in timeframes}
+
+        data_range = self.candles_repo.get_data_range(exchange_id, symbol, BASE_TIMEFRAME)
+        if not data_range or not data_range.get('start_time'):
+            return saved
+
+        end_ms = time_helper.kst_to_timestamp(time_helper.now_kst())
+        for tf in timeframes:
+            start_ms = self._resume_from(exchange_id, symbol, tf, data_range['start_time'])
+            saved.update(self.resample_range(exchange_id, symbol, start_ms, end_ms, [tf],
+                                             pending_gaps))
+
+        logger.info("Resampler",
+                   f"{exchange_id} {symbol} 상위 타임프레임 생성: "
+                   + ", ".join(f"{tf}={n}" for tf, n in saved.items()))
+        return saved
+
+    def resample_range(self, exchange_id: str, symbol: str, start_ms: int, end_ms: int,
+                       timeframes: List[str] = None,
+                       pending_gaps: List[Tuple[int, int]] = None) -> Dict[str, int]:
+        """
+        [start_ms, end_ms] 구간을 포함하는 상위 봉 다시 생성
+
+        뒤늦게 채워진 1분봉 구간(빈 구간 복구)을 상위 타임프레임에 반영할 때 사용
+
+        Returns:
+            {timeframe: 저장된 캔들 수}
+        """
+        timeframes = timeframes or DERIVED_TIMEFRAMES
+        saved = {tf: 0 for tf in timeframes}
+
+        # 가장 긴 봉 단위로 정렬된 구간이므로 어떤 상위 봉도 구간 경계를 넘지 않는다
+        # (구간 길이는 1일의 배수라 모든 상위 봉 길이의 배수)
+        align_ms = max(TIMEFRAME_MINUTES[tf] for tf in timeframes) * MINUTE_MS
+        window_ms = RESAMPLE_WINDOW_DAYS * DAY_MS
+        window_start = start_ms - (start_ms % align_ms)
+
+        while window_start <= end_ms:
+            window_end = min(window_start + window_ms, end_ms - (end_ms % align_ms) + align_ms)
+            frame = self._load_base_candles(exchange_id, symbol, window_start, window_end)
+
+            if frame is not None:
+                for tf in timeframes:
+                    saved[tf] += self._save_resampled(exchange_id, symbol, tf, frame, start_ms,
+                                                      pending_gaps)
+
+            window_start = window_end
+
+        return saved
+
+    def _resume_from(self, exchange_id: str, symbol: str, timeframe: str,
+                     base_start_time: str) -> int:
+        """timeframe을 다시 계산할 시점 (epoch ms, 그 타임프레임의 마지막 봉 시작)"""
+        latest = self.candles_repo.get_latest_timestamp(exchange_id, symbol, timeframe)
+        if latest:
+            return time_helper.kst_to_timestamp(datetime.fromisoformat(latest))
+
+        # 한 번도 생성되지 않은 타임프레임 → 1분봉 처음 이후 첫 봉 경계부터
+        # (수집 시작 전 부분이 빠진 첫 봉은 만들지 않음)
+        start_ms = time_helper.kst_to_timestamp(datetime.fromisoformat(base_start_time))
+        period_ms = TIMEFRAME_MINUTES[timeframe] * MINUTE_MS
+        return start_ms + (-start_ms % period_ms)
+
+    def _load_base_candles(self, exchange_id: str, symbol: str,
+                           start_ms: int, end_ms: int) -> Optional[pd.DataFrame]:
+        """[start_ms, end_ms) 구간 1분봉 로드"""
+        columns = self.candles_repo.get_candle_columns_between(
+            exchange_id, symbol, BASE_TIMEFRAME, start_ms, end_ms
+        )
+        if not len(columns['timestamp']):
+            return None
+
+        columns['timestamp_ms'] = columns.pop('timestamp')
+        return pd.DataFrame(columns)
+
+    def _save_resampled(self, exchange_id: str, symbol: str, timeframe: str,
+                        frame: pd.DataFrame, since_ms: int,
+                        pending_gaps: List[Tuple[int, int]] = None) -> int:
+        """
+        1분봉 구간을 timeframe으로 리샘플링하여 저장
+
+        since_ms 이전에 끝난 봉은 바뀌지 않았으므로 저장하지 않는다.
+        1분봉이 빠진 봉은 있는 1분봉으로 만들되(점검, 거래 없음, 확정된 빈 구간),
+        아직 복구될 수 있는 빈 구간에 걸친 마감 봉만 복구 후 다시 생성할 때까지 보류한다.
+        """
+        period_ms = TIMEFRAME_MINUTES[timeframe] * MINUTE_MS
+
+        bars = resample_ohlcv(
+            frame['timestamp_ms'].to_numpy(),
+            frame['open'].to_numpy(dtype=np.float64),
+            frame['high'].to_numpy(dtype=np.float64),
+            frame['low'].to_numpy(dtype=np.float64),
+            frame['close'].to_numpy(dtype=np.float64),
+            frame['volume'].to_numpy(dtype=np.float64),
+            period_ms
+        )
+
+        now_ms = time_helper.kst_to_timestamp(time_helper.now_kst())
+        open_bar_ms = now_ms - (now_ms % period_ms)
+        starts = bars.index.to_numpy()
+        keep = starts + period_ms > since_ms
+        if pending_gaps:
+            partial = ((bars['count'].to_numpy() < TIMEFRAME_MINUTES[timeframe])
+                       & (starts < open_bar_ms))
+            for gap_start, gap_end in pending_gaps:
+                keep &= ~(partial & (starts <= gap_end) & (starts + period_ms > gap_start))
+        bars = bars[keep]
+        if bars.empty:
+            return 0
+
+        timestamps = (
+            pd.to_datetime(bars.index, unit='ms', utc=True)
+            .tz_convert(TIMEZONE)
+            .strftime("%Y-%m-%d %H:%M:%S")
+        )
+
+        candles = [{
+            'exchange_id': exchange_id,
+            'symbol': symbol,
+            'timeframe': timeframe,
+            'timestamp': ts,
+            'open': float(o),
+            'high': float(h),
+            'low': float(l),
+            'close': float(c),
+            'volume': float(v),
+        } for ts, o, h, l, c, v in zip(
+            timestamps, bars['open'], bars['high'], bars['low'],
+            bars['close'], bars['volume']
+        )]
+
+        return self.candles_repo.upsert_candles_batch(candles)
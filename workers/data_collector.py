@@ -3,19 +3,60 @@
 CCXT 멀티 거래소 지원 버전
 """
 import time
+from collections import deque
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterator, Tuple
+
+import numpy as np
+import pandas as pd
 from PySide6.QtCore import QObject, Signal, QThread
 
 from api.ccxt_client import CCXTClient
 from api.exchange_factory import get_public_client, get_exchange_factory
+from database.connection import ConnectionManager
 from database.repository import (
     CandlesRepository, IndicatorsRepository, ActiveSymbolsRepository
 )
 from indicators.calculator import IndicatorCalculator
+from indicators.incremental import IncrementalIndicators
+from workers.backfill_scheduler import BackfillScheduler
+from workers.candle_resampler import (
+    CandleResampler, DAY_MS, get_fetch_timeframes, get_derived_timeframes
+)
 from utils.logger import logger
 from utils.time_helper import time_helper
-from config.settings import TIMEFRAMES, DATA_RETENTION_DAYS, DATA_POLLING_INTERVAL
+from config.settings import (
+    TIMEFRAMES, TIMEFRAME_MINUTES, BASE_TIMEFRAME, DATA_RETENTION_DAYS,
+    DATA_POLLING_INTERVAL, INDICATOR_BATCH_BARS, INDICATOR_WARMUP_BARS
+)
+
+
+class _TimestampDeduper:
+    """
+    크기 제한 타임스탬프 중복 필터
+
+    페이지는 시간순으로 도착하므로 중복은 최근 페이지 경계에서만 발생한다.
+    가장 오래된 항목부터 밀어내 최근 max_size개만 기억한다.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._seen = set()
+        self._order = deque()
+        self.duplicates = 0
+
+    def add(self, timestamp_ms: int) -> bool:
+        """새 타임스탬프면 True, 중복이면 False"""
+        ts = int(timestamp_ms)
+        if ts in self._seen:
+            self.duplicates += 1
+            return False
+
+        self._seen.add(ts)
+        self._order.append(ts)
+        if len(self._order) > self.max_size:
+            self._seen.discard(self._order.popleft())
+        return True
 
 
 class DataCollectorWorker(QObject):
@@ -25,6 +66,10 @@ class DataCollectorWorker(QObject):
     progress_updated = Signal(str, int, int)  # message, current, total
     collection_completed = Signal()
     error_occurred = Signal(str)
+
+    # 요청해도 채워지지 않은 빈 구간 {(거래소, 심볼, 타임프레임): [(시작 ms, 끝 ms)]}
+    # 백필마다 워커를 새로 만들므로 프로세스 단위로 공유
+    _known_holes: Dict[tuple, List[Tuple[int, int]]] = {}
     
     def __init__(self, exchange_id: str = None, client: CCXTClient = None):
         """
@@ -40,9 +85,12 @@ class DataCollectorWorker(QObject):
         self.candles_repo = CandlesRepository()
         self.indicators_repo = IndicatorsRepository()
         self.symbols_repo = ActiveSymbolsRepository()
+        self.indicator_calc = IndicatorCalculator()
+        self._indicator_states: Dict[tuple, IncrementalIndicators] = {}
         
         self.is_running = False
         self.is_realtime_enabled = False
+        self._scheduler = None
     
     def _get_client(self) -> Optional[CCXTClient]:
         """클라이언트 조회"""
@@ -74,8 +122,6 @@ class DataCollectorWorker(QObject):
             start_date: 시작 날짜 (KST)
             exchange_id: 거래소 ID (선택, 없으면 self.exchange_id 사용)
         """
-        self.is_running = True
-        
         ex_id = exchange_id or self.exchange_id
         if not ex_id:
             self.error_occurred.emit("거래소가 지정되지 않았습니다.")
@@ -90,53 +136,39 @@ class DataCollectorWorker(QObject):
             self.error_occurred.emit(f"{ex_id} 클라이언트 생성 실패")
             return
         
-        logger.info("DataCollector", f"데이터 백필 시작: {ex_id}, {len(symbols)}개 심볼")
-        print("="*60)
-        print(f"[WORKER] 데이터 백필 시작: {ex_id}, {len(symbols)}개 심볼")
-        print(f"[WORKER] 수집할 타임프레임: {TIMEFRAMES}")
-        print(f"[WORKER] 시작 날짜: {start_date}")
-        print(f"[WORKER] 전체 작업량: {len(symbols)}개 심볼 × {len(TIMEFRAMES)}개 타임프레임 = {len(symbols) * len(TIMEFRAMES)}개 작업")
-        print("="*60)
-
-        total_tasks = len(symbols) * len(TIMEFRAMES)
-        current_task = 0
-        
-        for symbol in symbols:
-            for timeframe in TIMEFRAMES:
-                if not self.is_running:
-                    logger.warning("DataCollector", "데이터 백필 중단됨")
-                    break
-                
-                current_task += 1
-                print(f"[WORKER] ({current_task}/{total_tasks}) {ex_id} {symbol} {timeframe} 수집 시작...")
-                self.progress_updated.emit(
-                    f"{ex_id} {symbol} {timeframe} 수집 시작",
-                    current_task,
-                    total_tasks
-                )
-                
-                try:
-                    self._collect_candles(
-                        client, ex_id, symbol, timeframe, 
-                        start_date, current_task, total_tasks
-                    )
-                except Exception as e:
-                    import traceback
-                    error_msg = f"{symbol} {timeframe} 수집 실패: {str(e)}"
-                    logger.error("DataCollector", error_msg, traceback.format_exc())
-                    self.error_occurred.emit(error_msg)
-        
-        self.is_running = False
-        logger.info("DataCollector", "데이터 백필 완료")
-        print("="*60)
-        print(f"[WORKER] 데이터 백필 완료! {ex_id}")
-        print("="*60)
+        logger.info("DataCollector",
+                   f"데이터 백필 시작: {ex_id}, {len(symbols)}개 심볼, "
+                   f"수집 타임프레임 {get_fetch_timeframes(ex_id, TIMEFRAMES)}, "
+                   f"시작 날짜 {start_date}")
+
+        self.is_running = True
+        self._scheduler = BackfillScheduler()
+
+        try:
+            self._scheduler.run(
+                {ex_id: symbols},
+                start_date,
+                clients={ex_id: client},
+                on_progress=self.progress_updated.emit,
+                on_error=lambda ex, msg: self.error_occurred.emit(msg)
+            )
+        finally:
+            self._scheduler = None
+            self.is_running = False
+            ConnectionManager.release()
+
+        logger.info("DataCollector", f"데이터 백필 완료: {ex_id}")
         self.collection_completed.emit()
     
     def _collect_candles(self, client: CCXTClient, exchange_id: str,
                         symbol: str, timeframe: str, start_date: datetime, 
                         current_task: int = 0, total_tasks: int = 0):
-        """캔들 데이터 수집"""
+        """
+        캔들 데이터 수집 (스트리밍)
+
+        페이지를 받는 즉시 timestamp_ms 기준으로 중복 제거 후 DB에 저장하므로
+        수집 기간과 무관하게 CPU는 선형, 메모리는 페이지 크기로 제한된다.
+        """
         try:
             # 최신 타임스탬프 조회
             latest_ts_str = self.candles_repo.get_latest_timestamp(
@@ -165,24 +197,219 @@ class DataCollectorWorker(QObject):
                         traceback.format_exc())
             return
         
-        # CCXT로 캔들 조회 (페이지네이션)
-        all_candles = []
-        since_ms = from_timestamp
+        # OKX 1분봉은 더 작은 limit 사용
+        limit = 300 if (exchange_id == "okx" and timeframe == "1m") else 1000
+
+        # 최근 페이지 경계의 중복만 걸러내면 되므로 윈도우 크기로 제한
+        dedup = _TimestampDeduper(max_size=limit * 2)
+
+        page_count = 0
+        received_total = 0
+        inserted_total = 0
+        ignored_total = 0
+
+        for page in self._iter_candle_pages(client, exchange_id, symbol,
+                                            timeframe, from_timestamp, limit):
+            page_count += 1
+            received_total += len(page)
+
+            rows = [self._candle_row(exchange_id, symbol, timeframe, candle)
+                    for candle in page if dedup.add(candle['timestamp_ms'])]
+
+            if len(rows) < len(page):
+                logger.info("DataCollector",
+                           f"{symbol} {timeframe} 페이지 {page_count}: "
+                           f"{len(rows)}개 신규, {len(page) - len(rows)}개 중복 스킵")
+
+            if not rows:
+                continue
+
+            # 페이지 단위 즉시 저장
+            try:
+                stats = self._write_candles(rows)
+            except Exception as e:
+                logger.error("DataCollector",
+                           f"{symbol} {timeframe} 페이지 {page_count} 저장 실패: {str(e)}")
+                break
+
+            inserted_total += stats['inserted']
+            ignored_total += stats['ignored']
+
+            # UI 업데이트 (매 5페이지마다)
+            if total_tasks > 0 and page_count % 5 == 0:
+                self.progress_updated.emit(
+                    f"{exchange_id} {symbol} {timeframe} 수집 및 저장 중... "
+                    f"(페이지 {page_count}, {inserted_total}개 저장 완료)",
+                    current_task,
+                    total_tasks
+                )
+
+        logger.info("DataCollector",
+                   f"{exchange_id} {symbol} {timeframe}: {page_count}페이지, "
+                   f"{received_total}개 수신, {inserted_total}개 저장 "
+                   f"(중복 {ignored_total + dedup.duplicates}개 무시)")
+
+        # 중간에 빠진 구간 복구 (실패한 페이지, 저장 실패 후 중단, 거래소 장애 등)
+        repaired = self._fill_gaps(client, exchange_id, symbol, timeframe, limit)
+
+        if inserted_total == 0 and not repaired:
+            logger.warning("DataCollector", f"{symbol} {timeframe}: 수집된 캔들 없음")
+            return repaired
+
+        # 보조지표 계산
+        try:
+            if total_tasks > 0:
+                self.progress_updated.emit(
+                    f"{exchange_id} {symbol} {timeframe} 지표 계산 중...",
+                    current_task,
+                    total_tasks
+                )
+            
+            self._calculate_and_save_indicators(exchange_id, symbol, timeframe,
+                                                since=self._repaired_since(repaired))
+            
+        except Exception as e:
+            import traceback
+            logger.error("DataCollector", 
+                        f"{symbol} {timeframe} 지표 계산 실패: {str(e)}", 
+                        traceback.format_exc())
+
+        return repaired
+
+    @staticmethod
+    def _candle_row(exchange_id: str, symbol: str, timeframe: str, candle: Dict) -> Dict:
+        """API 캔들 → 저장용 행"""
+        return {
+            "exchange_id": exchange_id,
+            "symbol": symbol,
+            "timeframe": timeframe,
+            "timestamp": candle['timestamp'],
+            "open": candle['open'],
+            "high": candle['high'],
+            "low": candle['low'],
+            "close": candle['close'],
+            "volume": candle['volume']
+        }
+
+    def _fill_gaps(self, client: CCXTClient, exchange_id: str, symbol: str,
+                   timeframe: str, limit: int) -> List[Tuple[int, int]]:
+        """
+        빠진 봉 구간만 골라 다시 요청
+
+        구간마다 since=첫 빠진 봉, limit=빠진 봉 수(최대 limit)로 요청하고 구간 끝을
+        지나면 멈추므로 짧은 구간은 요청 1번으로 끝난다. 조회가 정상적으로 끝났는데도
+        거래소가 봉을 주지 않은 부분 구간만 기억해 두고 다시 요청하지 않는다.
+        (API 오류, 중지, 저장 실패로 끊긴 구간은 다음에 다시 시도)
+
+        Returns:
+            봉이 채워졌거나 빈 봉이 확정된 구간 [(시작 ms, 끝 ms)] (지표/상위 봉 재계산 구간)
+        """
+        known_holes = self._known_holes.setdefault((exchange_id, symbol, timeframe), [])
+        gaps = self._pending_gaps(exchange_id, symbol, timeframe)
+        if not gaps:
+            return []
+
+        period_ms = TIMEFRAME_MINUTES[timeframe] * 60 * 1000
+        logger.info("DataCollector",
+                   f"{exchange_id} {symbol} {timeframe}: 빈 구간 {len(gaps)}개 복구 시작 "
+                   f"(빠진 봉 {sum((end - start) // period_ms + 1 for start, end in gaps)}개)")
+
+        repaired = []
+        for gap_start, gap_end in gaps:
+            if not self.is_running:
+                break
+
+            missing = (gap_end - gap_start) // period_ms + 1
+            status = {}
+            received = []
+            saved = True
+            for page in self._iter_candle_pages(client, exchange_id, symbol, timeframe,
+                                                gap_start, min(limit, missing),
+                                                until_ms=gap_end, status=status):
+                rows = [self._candle_row(exchange_id, symbol, timeframe, candle)
+                        for candle in page if gap_start <= candle['timestamp_ms'] <= gap_end]
+                if not rows:
+                    continue
+                try:
+                    self._write_candles(rows)
+                except Exception as e:
+                    logger.error("DataCollector",
+                               f"{symbol} {timeframe} 빈 구간 저장 실패: {str(e)}")
+                    saved = False
+                    break
+                received.extend(candle['timestamp_ms'] for candle in page
+                                if gap_start <= candle['timestamp_ms'] <= gap_end)
+
+            settled = saved and status.get('complete') and len(set(received)) < missing
+            if settled:
+                # 정상 조회에서 거래소가 주지 않은 봉 → 거래소에도 없는 봉으로 보고 다시 요청하지 않음
+                known_holes.extend(self._unfilled_ranges(gap_start, gap_end, period_ms, received))
+            if received or settled:
+                repaired.append((gap_start, gap_end))
+
+        logger.info("DataCollector",
+                   f"{exchange_id} {symbol} {timeframe}: 빈 구간 {len(repaired)}/{len(gaps)}개 복구")
+        return repaired
+
+    def _pending_gaps(self, exchange_id: str, symbol: str, timeframe: str,
+                      start_ms: int = None) -> List[Tuple[int, int]]:
+        """아직 복구될 수 있는 빈 구간 (거래소에도 없는 것으로 확정된 구간 제외)"""
+        known_holes = self._known_holes.get((exchange_id, symbol, timeframe), [])
+        return [
+            (gap_start, gap_end)
+            for gap_start, gap_end in self.candles_repo.find_gaps(exchange_id, symbol, timeframe,
+                                                                  start_ms=start_ms)
+            if not any(start <= gap_start and gap_end <= end for start, end in known_holes)
+        ]
+
+    @staticmethod
+    def _unfilled_ranges(gap_start: int, gap_end: int, period_ms: int,
+                         received: List[int]) -> List[Tuple[int, int]]:
+        """[gap_start, gap_end] 중 받은 봉이 없는 연속 구간 [(시작 ms, 끝 ms)]"""
+        expected = np.arange(gap_start, gap_end + 1, period_ms, dtype=np.int64)
+        holes = expected[~np.isin(expected, np.asarray(received, dtype=np.int64))]
+        if not len(holes):
+            return []
+        breaks = np.flatnonzero(np.diff(holes) != period_ms)
+        starts = np.r_[holes[0], holes[breaks + 1]]
+        ends = np.r_[holes[breaks], holes[-1]]
+        return [(int(start), int(end)) for start, end in zip(starts, ends)]
+
+    @staticmethod
+    def _repaired_since(repaired: List[Tuple[int, int]]) -> Optional[datetime]:
+        """복구된 구간이 포함된 첫 날(UTC 0시, KST) - 지표/상위 봉을 다시 계산할 시점"""
+        if not repaired:
+            return None
+        day_ms = 24 * 60 * 60 * 1000
+        start_ms = min(start for start, _ in repaired)
+        return time_helper.timestamp_to_kst(start_ms - start_ms % day_ms).replace(tzinfo=None)
+
+    def _iter_candle_pages(self, client: CCXTClient, exchange_id: str,
+                           symbol: str, timeframe: str, since_ms: int,
+                           limit: int, until_ms: int = None,
+                           status: Dict = None) -> Iterator[List[Dict]]:
+        """
+        캔들 페이지 순회 (CCXT 페이지네이션)
+
+        Args:
+            until_ms: 이 시각 이후 봉을 받으면 중단 (없으면 마지막 페이지까지)
+            status: 넘기면 거래소 데이터 끝까지 정상 조회했을 때 status['complete'] = True
+                    (API 오류, 중지, 호출 측 중단이면 설정하지 않음)
+        """
+        status = {} if status is None else status
         page_count = 0
         consecutive_empty_pages = 0
         max_empty_pages = 3  # 연속 3페이지가 비었으면 중단
-
-        # OKX 1분봉은 더 작은 limit 사용
-        limit = 300 if (exchange_id == "okx" and timeframe == "1m") else 1000
+        failed_pages = 0  # 빈 페이지 중 조회 실패(None) 수
 
         while True:
             if not self.is_running:
                 logger.warning("DataCollector", f"{symbol} {timeframe} 수집 중단")
-                break
+                return
 
             try:
-                logger.info("DataCollector",
-                           f"{symbol} {timeframe} API 요청: since={since_ms}, limit={limit}")
+                logger.debug("DataCollector",
+                            f"{symbol} {timeframe} API 요청: since={since_ms}, limit={limit}")
 
                 candles = client.get_candles(
                     symbol=symbol,
@@ -192,199 +419,134 @@ class DataCollectorWorker(QObject):
                 )
 
                 page_count += 1
-
-                # UI 업데이트 (매 5페이지마다)
-                if total_tasks > 0 and page_count % 5 == 0:
-                    self.progress_updated.emit(
-                        f"{exchange_id} {symbol} {timeframe} 수집 중 (페이지 {page_count})",
-                        current_task,
-                        total_tasks
-                    )
-
-                logger.info("DataCollector",
-                           f"{symbol} {timeframe} 페이지 {page_count}: "
-                           f"{len(candles) if candles else 0}개 캔들")
+                logger.debug("DataCollector",
+                            f"{symbol} {timeframe} 페이지 {page_count}: "
+                            f"{len(candles) if candles else 0}개 캔들")
 
             except Exception as e:
                 import traceback
                 logger.error("DataCollector",
                             f"{symbol} {timeframe} API 호출 실패: {str(e)}",
                             traceback.format_exc())
-                break
+                return
 
             if not candles:
                 consecutive_empty_pages += 1
+                if candles is None:
+                    failed_pages += 1
                 logger.info("DataCollector",
                            f"{symbol} {timeframe}: 빈 페이지 {consecutive_empty_pages}/{max_empty_pages}")
 
                 if consecutive_empty_pages >= max_empty_pages:
                     logger.info("DataCollector",
                                f"{symbol} {timeframe}: 연속 빈 페이지로 수집 완료")
-                    break
-                else:
-                    # 다음 시도를 위해 잠시 대기
-                    time.sleep(1)
-                    continue
-            else:
-                consecutive_empty_pages = 0  # 빈 페이지 초기화
-            
-            # 캔들 변환 및 중복 확인
-            new_candles_count = 0
-            duplicate_count = 0
-
-            for candle in candles:
-                # 중복 타임스탬프 확인 (방지책)
-                candle_timestamp = candle['timestamp']
+                    status['complete'] = failed_pages == 0
+                    return
 
-                # 이미 있는 타임스탬프면 건너뛰
-                if any(c['timestamp'] == candle_timestamp for c in all_candles):
-                    duplicate_count += 1
-                    continue
+                # 다음 시도를 위해 잠시 대기
+                time.sleep(1)
+                continue
 
-                all_candles.append({
-                    "exchange_id": exchange_id,
-                    "symbol": symbol,
-                    "timeframe": timeframe,
-                    "timestamp": candle['timestamp'],
-                    "open": candle['open'],
-                    "high": candle['high'],
-                    "low": candle['low'],
-                    "close": candle['close'],
-                    "volume": candle['volume']
-                })
-                new_candles_count += 1
-
-            if duplicate_count > 0:
-                logger.info("DataCollector",
-                           f"{symbol} {timeframe} 페이지 {page_count}: "
-                           f"{new_candles_count}개 신규, {duplicate_count}개 중복 스킵")
+            consecutive_empty_pages = 0
+            failed_pages = 0
 
-            # 중간 저장 (10,000개 단위)
-            if len(all_candles) >= 10000:
-                try:
-                    # 진행률 업데이트 (페이지 50개마다 업데이트)
-                    if page_count % 50 == 0 or page_count < 10:
-                        saved_count = 10000
-                        self.progress_updated.emit(
-                            f"{exchange_id} {symbol} {timeframe} 수집 및 저장 중... (총 {page_count}페이지, {saved_count * (page_count // 50 + 1)}개 저장 완료)",
-                            current_task,
-                            total_tasks
-                        )
-
-                    self.candles_repo.insert_candles_batch(all_candles)
-                    logger.info("DataCollector",
-                               f"{symbol} {timeframe}: 중간 저장 {len(all_candles)}개 캔들")
-
-                    # 메모리 초기화
-                    all_candles = []
+            yield candles
 
-                    # 짧은 대기로 DB 부하 완화
-                    time.sleep(0.5)
+            if until_ms is not None and candles[-1]['timestamp_ms'] >= until_ms:
+                status['complete'] = True
+                return
 
-                except Exception as e:
-                    logger.error("DataCollector",
-                               f"{symbol} {timeframe} 중간 저장 실패: {str(e)}")
-                    # 저장 실패해도 계속 진행 (메모리 초기화하여 중복 방지)
-                    all_candles = []
-                    break
-
-            # 다음 페이지 처리
             # limit보다 적게 받았으면 마지막 페이지로 간주
             if len(candles) < limit:
                 logger.info("DataCollector",
                            f"{symbol} {timeframe}: 마지막 페이지 도달 ({len(candles)} < {limit})")
-                break
+                status['complete'] = True
+                return
 
-            # 다음 페이지 요청을 위한 시간 계산
-            if candles and len(candles) > 0:
-                # 마지막 캔들 시간 + 1ms (timestamp_ms 또는 timestamp)
-                if 'timestamp_ms' in candles[-1]:
-                    since_ms = candles[-1]['timestamp_ms'] + 1
-                elif 'timestamp' in candles[-1]:
-                    # timestamp는 밀리초 단위라고 가정
-                    since_ms = candles[-1]['timestamp'] + 1
-                else:
-                    # 기존 로직을 1분 증가
-                    since_ms += 60 * 1000
-
-                # 다음 요청까지의 대기 (레이트 리밋 준수)
-                if exchange_id == "okx" and timeframe == "1m":
-                    time.sleep(0.2)  # OKX 1분봉은 더 긴 대기
-                else:
-                    time.sleep(0.1)  # 기본 레이트 리밋
-        
-        # DB 저장
-        if all_candles:
-            try:
-                # DB 저장 중 표시
-                if total_tasks > 0:
-                    total_pages = page_count if page_count > 0 else 1
-                    self.progress_updated.emit(
-                        f"{exchange_id} {symbol} {timeframe} 최종 저장 중... (총 {total_pages}페이지, {len(all_candles)}개 캔들)",
-                        current_task,
-                        total_tasks
-                    )
-                
-                self.candles_repo.insert_candles_batch(all_candles)
-                logger.info("DataCollector", 
-                           f"{exchange_id} {symbol} {timeframe}: {len(all_candles)}개 캔들 저장")
-                
-                # 보조지표 계산
-                if total_tasks > 0:
-                    self.progress_updated.emit(
-                        f"{exchange_id} {symbol} {timeframe} 지표 계산 중...",
-                        current_task,
-                        total_tasks
-                    )
-                
-                self._calculate_and_save_indicators(exchange_id, symbol, timeframe)
-                
-            except Exception as e:
-                import traceback
-                logger.error("DataCollector", 
-                            f"{symbol} {timeframe} DB 저장 실패: {str(e)}", 
-                            traceback.format_exc())
-        else:
-            logger.warning("DataCollector", f"{symbol} {timeframe}: 수집된 캔들 없음")
+            # 다음 페이지: 마지막 캔들 시간 + 1ms
+            next_since = candles[-1]['timestamp_ms'] + 1
+            if next_since <= since_ms:
+                logger.warning("DataCollector",
+                              f"{symbol} {timeframe}: 페이지 커서가 진행하지 않음 - 수집 종료")
+                return
+            since_ms = next_since
+
+    def _write_candles(self, rows: List[Dict]) -> Dict[str, int]:
+        """캔들 저장 (페이지 단위)"""
+        return self.candles_repo.insert_candles_batch(rows)
     
-    def _calculate_and_save_indicators(self, exchange_id: str, 
-                                       symbol: str, timeframe: str):
-        """보조지표 계산 및 저장"""
-        # 최근 250개 캔들 조회
-        candles = self.candles_repo.get_candles(
-            exchange_id, symbol, timeframe, limit=250
-        )
-
-        # 최소 개수 조정 (일봉은 7개만 있어도 계산 가능하도록)
-        min_required = 20 if timeframe == "1d" else 50
-
-        if len(candles) < min_required:
-            logger.warning("DataCollector",
-                          f"{exchange_id} {symbol} {timeframe}: 지표 계산 불가 (캔들 부족: {len(candles)}/{min_required})")
-            return
-        
-        # 최신 캔들 기준으로 지표 계산
-        candles.reverse()  # 오래된 순으로 정렬
-        indicators = IndicatorCalculator.calculate_all_indicators(candles)
-        
-        if indicators:
-            latest_candle = candles[-1]
-            self.indicators_repo.upsert_indicators(
-                exchange_id,
-                symbol,
-                timeframe,
-                latest_candle['timestamp'],
-                indicators
+    def _calculate_and_save_indicators(self, exchange_id: str,
+                                       symbol: str, timeframe: str,
+                                       full: bool = False,
+                                       since: datetime = None) -> int:
+        """
+        보조지표 일괄 계산 및 저장 (봉마다 한 행)
+
+        마지막으로 저장된 지표 시점부터(full이면 처음부터) 전체 시계열을
+        INDICATOR_BATCH_BARS 단위 구간으로 벡터 계산한다. 각 구간 앞에는
+        INDICATOR_WARMUP_BARS개 봉을 덧붙여 이동평균/EMA가 수렴한 값만 저장한다.
+        since가 있으면 그 시점부터 다시 계산한다 (복구된 빈 구간 이후 값 갱신).
+
+        Returns:
+            저장된 지표 행 수
+        """
+        data_range = self.candles_repo.get_data_range(exchange_id, symbol, timeframe)
+        if not data_range or not data_range.get('candle_count'):
+            return 0
+
+        start = datetime.fromisoformat(data_range['start_time'])
+        end = datetime.fromisoformat(data_range['end_time'])
+
+        if not full:
+            latest = self.indicators_repo.get_latest(exchange_id, symbol, timeframe)
+            if latest and latest.get('timestamp'):
+                # 마지막 지표 봉(진행 중이었을 수 있음)부터 다시 계산
+                start = max(start, datetime.fromisoformat(latest['timestamp']))
+            if since is not None:
+                start = max(datetime.fromisoformat(data_range['start_time']), min(start, since))
+
+        bar = timedelta(minutes=TIMEFRAME_MINUTES[timeframe])
+        saved = 0
+        window_start = start
+
+        while window_start <= end:
+            window_end = window_start + bar * INDICATOR_BATCH_BARS
+            rows = self.candles_repo.get_candles_for_backtest(
+                exchange_id, symbol, timeframe,
+                time_helper.format_kst(window_start - bar * INDICATOR_WARMUP_BARS),
+                time_helper.format_kst(window_end - timedelta(seconds=1))
             )
-            logger.info("DataCollector",
-                       f"{exchange_id} {symbol} {timeframe}: 지표 계산 완료 - "
-                       f"MA20={indicators.get('ma_20', 'N/A')}, "
-                       f"RSI={indicators.get('rsi', 'N/A')}, "
-                       f"MACD={indicators.get('macd', 'N/A')}")
-        else:
-            logger.warning("DataCollector",
-                          f"{exchange_id} {symbol} {timeframe}: 지표 계산 실패 (결과 없음)")
-    
+
+            if rows:
+                candles = pd.DataFrame(rows)
+                series = self.indicator_calc.calculate_series(candles)
+                series['timestamp'] = candles['timestamp']
+
+                # 워밍업 구간은 저장하지 않음
+                series = series[candles['timestamp'] >= time_helper.format_kst(window_start)]
+                series = series.astype(object).where(series.notna(), None)
+
+                saved += self.indicators_repo.upsert_indicators_batch(
+                    exchange_id, symbol, timeframe, series.to_dict('records')
+                )
+
+            window_start = window_end
+
+        logger.debug("DataCollector",
+                    f"{exchange_id} {symbol} {timeframe}: 지표 {saved}개 저장")
+        return saved
+
+    def recalculate_indicators(self, exchange_id: str, symbols: List[str],
+                               timeframes: List[str] = None):
+        """저장된 전체 캔들로 보조지표 재계산 (일괄 모드)"""
+        for symbol in symbols:
+            for timeframe in timeframes or TIMEFRAMES:
+                saved = self._calculate_and_save_indicators(
+                    exchange_id, symbol, timeframe, full=True
+                )
+                logger.info("DataCollector",
+                           f"{exchange_id} {symbol} {timeframe}: 지표 재계산 완료 ({saved}개)")
+
     def realtime_update(self, exchange_id: str, symbols: List[str]):
         """실시간 데이터 업데이트 (주기적 호출)"""
         if not self.is_realtime_enabled:
@@ -394,41 +556,128 @@ class DataCollectorWorker(QObject):
         if not client:
             return
         
+        fetch_timeframes = get_fetch_timeframes(exchange_id, TIMEFRAMES)
+        derived_timeframes = get_derived_timeframes(exchange_id, TIMEFRAMES)
+
         for symbol in symbols:
-            for timeframe in TIMEFRAMES:
+            for timeframe in fetch_timeframes:
                 if not self.is_running:
                     break
                 
                 try:
-                    # 최신 캔들만 가져오기
+                    # 직전 봉(확정값) + 진행 중인 봉
                     candles = client.get_candles(
                         symbol=symbol,
                         timeframe=timeframe,
-                        limit=1
+                        limit=2
                     )
                     
                     if candles:
-                        candle = candles[0]
-                        self.candles_repo.insert_candle(
-                            exchange_id,
-                            symbol,
-                            timeframe,
-                            candle['timestamp'],
-                            candle['open'],
-                            candle['high'],
-                            candle['low'],
-                            candle['close'],
-                            candle['volume']
-                        )
+                        candles = sorted(candles, key=lambda c: c['timestamp'])
+                        # 진행 중인 봉은 값이 바뀌므로 교체 저장
+                        self.candles_repo.upsert_candles_batch([{
+                            'exchange_id': exchange_id,
+                            'symbol': symbol,
+                            'timeframe': timeframe,
+                            'timestamp': candle['timestamp'],
+                            'open': candle['open'],
+                            'high': candle['high'],
+                            'low': candle['low'],
+                            'close': candle['close'],
+                            'volume': candle['volume']
+                        } for candle in candles])
                         
-                        # 지표 재계산
-                        self._calculate_and_save_indicators(exchange_id, symbol, timeframe)
+                        # 지표 증분 갱신
+                        self._update_indicators_incremental(exchange_id, symbol, timeframe, candles)
+
+                        # 1분봉 기반 상위 타임프레임 증분 갱신
+                        if timeframe == BASE_TIMEFRAME and derived_timeframes:
+                            # 실시간 갱신은 최근 봉만 다시 계산하므로 최근 이틀의 빈 구간만 확인
+                            now_ms = time_helper.kst_to_timestamp(time_helper.now_kst())
+                            pending = self._pending_gaps(exchange_id, symbol, timeframe,
+                                                         start_ms=now_ms - 2 * DAY_MS)
+                            saved = CandleResampler(self.candles_repo).update(
+                                exchange_id, symbol, derived_timeframes, pending
+                            )
+                            for derived, count in saved.items():
+                                if count > 0:
+                                    recent = self.candles_repo.get_candles(
+                                        exchange_id, symbol, derived, limit=2
+                                    )
+                                    recent.reverse()
+                                    self._update_indicators_incremental(
+                                        exchange_id, symbol, derived, recent
+                                    )
                     
                 except Exception as e:
                     logger.error("DataCollector", 
                                f"{exchange_id} {symbol} {timeframe} 실시간 업데이트 실패: {str(e)}")
                 
                 time.sleep(0.05)  # Rate limit
+
+    def _update_indicators_incremental(self, exchange_id: str, symbol: str,
+                                       timeframe: str, candles: List[Dict]):
+        """
+        시계열별 증분 지표 상태에 최신 봉 반영 후 저장
+
+        Args:
+            candles: 최신 캔들 (시간 오름차순, 진행 중인 봉 포함)
+        """
+        if not candles:
+            return
+
+        key = (exchange_id, symbol, timeframe)
+        state = self._indicator_states.get(key)
+        first_ts = candles[0]['timestamp']
+
+        # 상태가 없거나 봉이 빠졌으면 저장된 캔들로 다시 채움
+        bar = timedelta(minutes=TIMEFRAME_MINUTES[timeframe])
+        if state is None or state.last_timestamp is None or (
+            datetime.fromisoformat(first_ts) - datetime.fromisoformat(state.last_timestamp) > bar
+        ):
+            state = IncrementalIndicators()
+            history = self.candles_repo.get_candles(
+                exchange_id, symbol, timeframe, limit=INDICATOR_WARMUP_BARS
+            )
+            for candle in reversed(history):
+                if candle['timestamp'] < first_ts:
+                    state.update(candle['timestamp'], candle['high'],
+                                 candle['low'], candle['close'])
+            self._indicator_states[key] = state
+
+        rows = []
+        for candle in candles:
+            values = state.update(candle['timestamp'], candle['high'],
+                                  candle['low'], candle['close'])
+            values['timestamp'] = candle['timestamp']
+            rows.append(values)
+
+        self.indicators_repo.upsert_indicators_batch(exchange_id, symbol, timeframe, rows)
+
+    def _update_derived_timeframes(self, exchange_id: str, symbol: str,
+                                   timeframes: List[str],
+                                   repaired: List[Tuple[int, int]] = None):
+        """
+        1분봉으로 상위 타임프레임 생성 후 지표 계산
+
+        Args:
+            repaired: 복구됐거나 빈 봉이 확정된 1분봉 구간 (해당 상위 봉도 다시 생성)
+        """
+        resampler = CandleResampler(self.candles_repo)
+        pending = self._pending_gaps(exchange_id, symbol, BASE_TIMEFRAME)
+        saved = resampler.update(exchange_id, symbol, timeframes, pending)
+
+        for gap_start, gap_end in repaired or []:
+            for timeframe, count in resampler.resample_range(
+                exchange_id, symbol, gap_start, gap_end, timeframes, pending
+            ).items():
+                saved[timeframe] += count
+
+        since = self._repaired_since(repaired)
+        for timeframe, count in saved.items():
+            if count > 0:
+                self._calculate_and_save_indicators(exchange_id, symbol, timeframe,
+                                                    since=since)
     
     def run_continuous(self, exchange_id: str, symbols: List[str], 
                       interval_seconds: int = None):
@@ -439,17 +688,22 @@ class DataCollectorWorker(QObject):
         logger.info("DataCollector", 
                    f"{exchange_id} 지속적 데이터 수집 시작 (간격: {interval}초)")
         
-        while self.is_running:
-            if self.is_realtime_enabled:
-                self.realtime_update(exchange_id, symbols)
-            
-            time.sleep(interval)
-        
+        try:
+            while self.is_running:
+                if self.is_realtime_enabled:
+                    self.realtime_update(exchange_id, symbols)
+
+                time.sleep(interval)
+        finally:
+            ConnectionManager.release()
+
         logger.info("DataCollector", "데이터 수집 중지")
     
     def stop(self):
         """워커 중지"""
         self.is_running = False
+        if self._scheduler:
+            self._scheduler.stop()
 
 
 class MultiExchangeDataCollector(QObject):
@@ -462,7 +716,7 @@ class MultiExchangeDataCollector(QObject):
     
     def __init__(self):
         super().__init__()
-        self.workers: Dict[str, DataCollectorWorker] = {}
+        self.scheduler: Optional[BackfillScheduler] = None
         self.is_running = False
     
     def collect_all_exchanges(self, exchanges_symbols: Dict[str, List[str]], 
@@ -475,39 +729,29 @@ class MultiExchangeDataCollector(QObject):
             start_date: 시작 날짜
         """
         self.is_running = True
-        
-        total_exchanges = len(exchanges_symbols)
-        completed = 0
-        
-        for exchange_id, symbols in exchanges_symbols.items():
-            if not self.is_running:
-                break
-            
-            logger.info("MultiCollector", f"{exchange_id} 수집 시작")
-            
-            worker = DataCollectorWorker(exchange_id=exchange_id)
-            worker.progress_updated.connect(
-                lambda msg, cur, tot, ex=exchange_id: 
-                self.progress_updated.emit(f"{ex}: {msg}", cur, tot)
-            )
-            worker.error_occurred.connect(
-                lambda err, ex=exchange_id: self.error_occurred.emit(ex, err)
+        self.scheduler = BackfillScheduler()
+
+        logger.info("MultiCollector", f"{len(exchanges_symbols)}개 거래소 병렬 수집 시작")
+
+        try:
+            self.scheduler.run(
+                exchanges_symbols,
+                start_date,
+                on_progress=self.progress_updated.emit,
+                on_error=self.error_occurred.emit,
+                on_exchange_completed=self.collection_completed.emit
             )
-            
-            self.workers[exchange_id] = worker
-            
-            try:
-                worker.backfill_data(symbols, start_date, exchange_id)
-                completed += 1
-                self.collection_completed.emit(exchange_id)
-            except Exception as e:
-                self.error_occurred.emit(exchange_id, str(e))
-        
-        self.is_running = False
+        except Exception as e:
+            import traceback
+            logger.error("MultiCollector", f"병렬 수집 실패: {str(e)}", traceback.format_exc())
+        finally:
+            self.is_running = False
+            ConnectionManager.release()
+
         self.all_completed.emit()
     
     def stop(self):
         """모든 워커 중지"""
         self.is_running = False
-        for worker in self.workers.values():
-            worker.stop()
+        if self.scheduler:
+            self.scheduler.stop()
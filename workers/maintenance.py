@@ -4,6 +4,7 @@ Maintenance Worker
 import time
 from PySide6.QtCore import QObject, Signal
 
+from database.connection import ConnectionManager
 from database.repository import (
     CandlesRepository, IndicatorsRepository, 
     SystemLogsRepository, BotLogsRepository
@@ -56,10 +57,13 @@ class MaintenanceWorker(QObject):
         self.is_running = True
         logger.info("Maintenance", "유지보수 워커 시작 (1분 주기)")
         
-        while self.is_running:
-            self.cleanup_old_data()
-            time.sleep(interval_seconds)
-        
+        try:
+            while self.is_running:
+                self.cleanup_old_data()
+                time.sleep(interval_seconds)
+        finally:
+            ConnectionManager.release()
+
         logger.info("Maintenance", "유지보수 워커 중지")
     
     def stop(self):
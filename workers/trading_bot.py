@@ -2,12 +2,21 @@
 자동매매 봇 워커
 CCXT 멀티 거래소 지원 버전
 """
+import queue
 import time
 from typing import Dict, Optional
 from PySide6.QtCore import QObject, Signal
 from datetime import datetime
 
+from api.account_snapshot import get_snapshot_poller
 from api.ccxt_client import CCXTClient
+from api.exchange_factory import get_exchange_factory
+from api.ws_adapters import STREAM_ADAPTERS, ORDERS, POSITIONS
+from api.ws_hub import ws_hub
+from config.settings import (
+    BOT_EVENT_DRIVEN, BOT_RECONCILE_INTERVAL, BOT_STREAM_DOWN_POLL_INTERVAL
+)
+from database.connection import ConnectionManager
 from database.repository import (
     BotConfigsRepository, OrdersRepository, 
     PositionsRepository, BotLogsRepository, TradesHistoryRepository
@@ -16,6 +25,68 @@ from utils.logger import logger
 from utils.time_helper import time_helper
 
 
+def entry_order_size(symbol: str, margin: float, leverage: float, price: float) -> float:
+    """증거금 기반 진입 수량 (수량 = 증거금 * 레버리지 / 가격, 심볼별 최소 단위 적용)"""
+    raw_size = (margin * leverage) / price
+    if "BTC" in symbol or "ETH" in symbol:
+        # BTC/ETH는 소수점 많이 허용
+        return max(0.01, round(raw_size, 2))  # 최소 0.01
+    if "SOL" in symbol:
+        return max(0.1, round(raw_size, 1))  # 최소 0.1
+    # 기타 코인은 정수 또는 소수점 1자리
+    return max(1, round(raw_size, 1))  # 최소 1
+
+
+def tp_sl_prices(direction: str, price: float, tp_offset: float,
+                 sl_offset: Optional[float]) -> tuple:
+    """기준가 대비 TP/SL 가격 (SL 미설정 시 None)"""
+    if direction == "LONG":
+        tp_price = price * (1 + tp_offset / 100)
+        sl_price = price * (1 - sl_offset / 100) if sl_offset else None
+    else:
+        tp_price = price * (1 - tp_offset / 100)
+        sl_price = price * (1 + sl_offset / 100) if sl_offset else None
+    return tp_price, sl_price
+
+
+def martingale_legs(config: Dict, entry_price: float) -> list:
+    """
+    마틴게일 지정가 주문 목록
+    
+    단계마다 offset_pct씩 불리한 방향으로 떨어진 가격에
+    초기 수량 x (1, 1, 2, 4, 8, ...) 비율로 추가 진입한다.
+    """
+    symbol = config['symbol']
+    direction = config['direction']
+    steps = config['martingale_steps']
+    offset_pct = config['martingale_offset_pct']
+    
+    initial_size = entry_order_size(symbol, float(config['max_margin']),
+                                    config['leverage'], entry_price)
+    size_ratios = [1, 1] + [2 ** i for i in range(steps - 2)] if steps > 2 else [1] * steps
+    
+    side = "buy" if direction == "LONG" else "sell"
+    pos_side = "long" if direction == "LONG" else "short"
+    
+    legs = []
+    for i in range(steps):
+        if direction == "LONG":
+            # 롱: 가격이 하락할 때 추가 매수
+            trigger_price = entry_price * (1 - (offset_pct * (i + 1)) / 100)
+        else:
+            # 숏: 가격이 상승할 때 추가 매도
+            trigger_price = entry_price * (1 + (offset_pct * (i + 1)) / 100)
+        
+        legs.append({
+            'symbol': symbol,
+            'side': side,
+            'size': initial_size * size_ratios[i],
+            'price': trigger_price,
+            'pos_side': pos_side
+        })
+    return legs
+
+
 class TradingBotWorker(QObject):
     """자동매매 봇 워커 (CCXT)"""
     
@@ -30,6 +101,7 @@ class TradingBotWorker(QObject):
     def __init__(self, client: CCXTClient, config: Dict):
         super().__init__()
         self.client = client  # CCXT 클라이언트
+        self.snapshots = get_snapshot_poller(client)  # 계정 공유 포지션/주문 스냅샷
         self.config = config
         self.exchange_id = config.get('exchange_id', 'okx')
         self.is_running = False
@@ -51,6 +123,10 @@ class TradingBotWorker(QObject):
         # 제어
         self.auto_restart = True  # 익절/손절 후 자동 재실행
         self.stop_mode = None  # None, 'clean' (청산), 'keep' (유지)
+        
+        # 이벤트 모드 (주문/포지션 푸시 구독)
+        self._events: Optional[queue.Queue] = None
+        self._subscriptions = []
     
     def start_trading(self):
         """거래 시작"""
@@ -59,6 +135,7 @@ class TradingBotWorker(QObject):
         
         try:
             logger.info("TradingBot", f"{symbol} 봇 시작")
+            self._start_streams()
             
             # 자동 재실행 루프
             while self.is_running and self.auto_restart:
@@ -107,6 +184,73 @@ class TradingBotWorker(QObject):
             logger.error("TradingBot", error_msg, traceback.format_exc())
             self.error_occurred.emit(symbol, error_msg)
             self.is_running = False
+        finally:
+            self._stop_streams()
+            ConnectionManager.release()
+
+    def resume_monitoring(self):
+        """이미 열린 포지션 모니터링부터 시작 (봇 복원, 스트림 구독 포함)"""
+        self.is_running = True
+        symbol = self.config['symbol']
+
+        try:
+            logger.info("TradingBot", f"{symbol} 봇 복원 - 모니터링 시작")
+            self._start_streams()
+            self._monitoring_loop()
+        except Exception as e:
+            import traceback
+            error_msg = f"{symbol} 봇 모니터링 실패: {str(e)}"
+            logger.error("TradingBot", error_msg, traceback.format_exc())
+            self.error_occurred.emit(symbol, error_msg)
+            self.is_running = False
+        finally:
+            self._stop_streams()
+            ConnectionManager.release()
+    
+    def _start_streams(self) -> bool:
+        """주문/포지션 푸시 구독 (지원 거래소이고 이벤트 모드일 때)"""
+        symbol = self.config['symbol']
+        if not self.config.get('event_driven', BOT_EVENT_DRIVEN):
+            return False
+        if self.exchange_id not in STREAM_ADAPTERS:
+            logger.info("TradingBot", f"{symbol} {self.exchange_id} 스트림 미지원 - 폴링 모드")
+            return False
+        
+        try:
+            async_client = get_exchange_factory().get_async_client(
+                self.exchange_id, getattr(self.client, 'is_testnet', False)
+            )
+            if not async_client:
+                return False
+            
+            # 콜백은 이벤트 루프 스레드에서 불리므로 큐에 넣기만 한다
+            self._events = queue.Queue()
+            self._subscriptions = [
+                ws_hub.subscribe(self.exchange_id, stream,
+                                 lambda event, stream=stream: self._events.put((stream, event)),
+                                 symbol=symbol, is_testnet=async_client.is_testnet,
+                                 client=async_client)
+                for stream in (POSITIONS, ORDERS)
+            ]
+            logger.info("TradingBot", f"{symbol} 주문/포지션 스트림 구독 - 이벤트 모드")
+            return True
+            
+        except Exception as e:
+            logger.warning("TradingBot", f"{symbol} 스트림 구독 실패 - 폴링 모드: {str(e)}")
+            self._events = None
+            self._subscriptions = []
+            return False
+    
+    def _stop_streams(self):
+        """스트림 구독 해제"""
+        for sub in self._subscriptions:
+            sub.cancel()
+        self._subscriptions = []
+    
+    def _streams_connected(self) -> bool:
+        return bool(self._subscriptions) and all(
+            ws_hub.is_connected(sub) for sub in self._subscriptions
+        )
     
     def _check_and_close_existing_positions(self) -> bool:
         """기존 포지션 확인 및 강제 청산"""
@@ -247,38 +391,21 @@ class TradingBotWorker(QObject):
             
             current_price = float(ticker['last'])
             
-            # 주문 수량 계산 (증거금 기반)
-            # 수량 = (증거금 * 레버리지) / 가격
-            raw_size = (max_margin * leverage) / current_price
-            
-            # 최소 주문 수량 적용 (심볼별)
-            # OKX는 일반적으로 계약 1개가 최소 단위
-            if "BTC" in symbol or "ETH" in symbol:
-                # BTC/ETH는 소수점 많이 허용
-                size = max(0.01, round(raw_size, 2))  # 최소 0.01
-            elif "SOL" in symbol:
-                size = max(0.1, round(raw_size, 1))  # 최소 0.1
-            else:
-                # 기타 코인은 정수 또는 소수점 1자리
-                size = max(1, round(raw_size, 1))  # 최소 1
+            # 주문 수량 계산 (증거금 기반, 심볼별 최소 단위 적용)
+            size = entry_order_size(symbol, max_margin, leverage, current_price)
             
             logger.info("TradingBot", 
-                       f"{symbol} 수량 계산: raw={raw_size:.4f}, adjusted={size}")
+                       f"{symbol} 수량 계산: raw={(max_margin * leverage) / current_price:.4f}, "
+                       f"adjusted={size}")
             
             # 주문 파라미터
             side = "buy" if direction == "LONG" else "sell"
             pos_side = "long" if direction == "LONG" else "short"
             
             # TP/SL 가격 미리 계산
-            tp_offset = self.config['tp_offset_pct']
-            sl_offset = self.config.get('sl_offset_pct')
-            
-            if direction == "LONG":
-                tp_trigger = current_price * (1 + tp_offset / 100)
-                sl_trigger = current_price * (1 - sl_offset / 100) if sl_offset else None
-            else:
-                tp_trigger = current_price * (1 - tp_offset / 100)
-                sl_trigger = current_price * (1 + sl_offset / 100) if sl_offset else None
+            tp_trigger, sl_trigger = tp_sl_prices(direction, current_price,
+                                                  self.config['tp_offset_pct'],
+                                                  self.config.get('sl_offset_pct'))
             
             logger.info("TradingBot", 
                        f"{symbol} 시장가 진입: {side} {size} @ {current_price:.2f}")
@@ -398,14 +525,8 @@ class TradingBotWorker(QObject):
                     return False
             
             # TP/SL 가격 계산
-            if direction == "LONG":
-                tp_price = current_price * (1 + tp_offset / 100)
-                sl_price = current_price * (1 - sl_offset / 100) if sl_offset else None
-                tp_side = "sell"
-            else:  # SHORT
-                tp_price = current_price * (1 - tp_offset / 100)
-                sl_price = current_price * (1 + sl_offset / 100) if sl_offset else None
-                tp_side = "buy"
+            tp_price, sl_price = tp_sl_prices(direction, current_price, tp_offset, sl_offset)
+            tp_side = "sell" if direction == "LONG" else "buy"
             
             pos_side = "long" if direction == "LONG" else "short"
             
@@ -486,8 +607,6 @@ class TradingBotWorker(QObject):
         symbol = self.config['symbol']
         direction = self.config['direction']
         steps = self.config['martingale_steps']
-        offset_pct = self.config['martingale_offset_pct']
-        margin_mode = self.config['margin_mode']
         
         try:
             logger.info("TradingBot", f"{symbol} 마틴게일 설정 시작 - {steps}단계")
@@ -500,69 +619,45 @@ class TradingBotWorker(QObject):
             
             entry_price = float(ticker['last'])
             
-            # 초기 포지션 수량
-            initial_size = float(self.config['max_margin']) * self.config['leverage'] / entry_price
-            if "BTC" in symbol or "ETH" in symbol:
-                initial_size = max(0.01, round(initial_size, 2))
-            elif "SOL" in symbol:
-                initial_size = max(0.1, round(initial_size, 1))
-            else:
-                initial_size = max(1, round(initial_size, 1))
-            
-            # 사이즈 비율 (1, 1, 2, 4, 8, ...)
-            size_ratios = [1, 1] + [2 ** i for i in range(steps - 2)] if steps > 2 else [1] * steps
-            
             side = "buy" if direction == "LONG" else "sell"
-            pos_side = "long" if direction == "LONG" else "short"
             
-            # 각 단계별 주문 생성
-            for i in range(steps):
-                # 마틴게일 가격 계산
-                if direction == "LONG":
-                    # 롱: 가격이 하락할 때 추가 매수
-                    trigger_price = entry_price * (1 - (offset_pct * (i + 1)) / 100)
-                else:
-                    # 숏: 가격이 상승할 때 추가 매도
-                    trigger_price = entry_price * (1 + (offset_pct * (i + 1)) / 100)
-                
-                # 마틴게일 수량 (비율 적용)
-                martin_size = initial_size * size_ratios[i]
-                
+            # 각 단계별 주문 (가격이 움직이기 전에 한 번에 제출)
+            legs = martingale_legs(self.config, entry_price)
+            for i, leg in enumerate(legs):
                 logger.info("TradingBot", 
-                           f"{symbol} 마틴 {i+1}단계: {side} {martin_size} @ {trigger_price:.2f} "
-                           f"(비율: {size_ratios[i]}x)")
+                           f"{symbol} 마틴 {i+1}단계: {side} {leg['size']} @ {leg['price']:.2f}")
+            
+            # 지정가 일괄 주문
+            results = self.client.place_limit_orders(legs)
+            
+            # 단계별 결과 정리 후 DB에 한 번에 저장
+            placed_orders = []
+            for i, (leg, order) in enumerate(zip(legs, results)):
+                if not order:
+                    logger.error("TradingBot", f"{symbol} 마틴 {i+1}단계 주문 실패")
+                    continue
                 
-                # 지정가 주문
-                order = self.client.place_limit_order(
-                    symbol=symbol,
-                    side=side,
-                    size=martin_size,
-                    price=trigger_price,
-                    pos_side=pos_side
-                )
+                order_id = order['order_id']
+                self.martingale_order_ids.append(order_id)
+                logger.info("TradingBot", f"{symbol} 마틴 {i+1}단계 주문 생성: {order_id}")
                 
-                if order:
-                    order_id = order['order_id']
-                    self.martingale_order_ids.append(order_id)
-                    logger.info("TradingBot", f"{symbol} 마틴 {i+1}단계 주문 생성: {order_id}")
-                    
-                    # DB 저장
-                    self.orders_repo.insert_order({
-                        'exchange_id': self.config['exchange_id'],
-                        'order_id': order_id,
-                        'symbol': symbol,
-                        'side': side,
-                        'type': 'limit',
-                        'price': trigger_price,
-                        'size': martin_size,
-                        'status': 'open',
-                        'position_id': self.position_id,
-                        'related_order_type': f'martingale_{i+1}'
-                    })
-                else:
-                    logger.error("TradingBot", f"{symbol} 마틴 {i+1}단계 주문 실패")
+                placed_orders.append({
+                    'exchange_id': self.config['exchange_id'],
+                    'order_id': order_id,
+                    'symbol': symbol,
+                    'side': side,
+                    'type': 'limit',
+                    'price': leg['price'],
+                    'size': leg['size'],
+                    'status': 'open',
+                    'position_id': self.position_id,
+                    'related_order_type': f'martingale_{i+1}'
+                })
             
-            logger.info("TradingBot", f"{symbol} 마틴게일 {steps}단계 주문 완료")
+            self.orders_repo.insert_orders(placed_orders)
+            
+            logger.info("TradingBot",
+                       f"{symbol} 마틴게일 {len(placed_orders)}/{steps}단계 주문 완료")
             
         except Exception as e:
             import traceback
@@ -570,7 +665,20 @@ class TradingBotWorker(QObject):
             logger.error("TradingBot", error_msg, traceback.format_exc())
     
     def _monitoring_loop(self):
-        """모니터링 루프"""
+        """모니터링 루프 (스트림 구독 중이면 이벤트 모드)"""
+        if self._events is not None:
+            self._event_monitoring_loop()
+            return
+        
+        # 폴링 중에는 계정 스냅샷을 주기적으로 갱신 (계정당 한 스레드가 전체 심볼 조회)
+        self.snapshots.acquire()
+        try:
+            self._polling_loop()
+        finally:
+            self.snapshots.release()
+    
+    def _polling_loop(self):
+        """폴링 모니터링 루프 (공유 스냅샷을 1초마다 확인)"""
         symbol = self.config['symbol']
         retry_count = 0
         max_retries = 3
@@ -580,7 +688,7 @@ class TradingBotWorker(QObject):
         while self.is_running:
             try:
                 # 포지션 상태 확인
-                position = self.client.get_positions(symbol)
+                position = self.snapshots.get().positions_for(symbol)
                 
                 if not position or len(position) == 0:
                     # 조회 실패 시 재시도
@@ -602,41 +710,8 @@ class TradingBotWorker(QObject):
                 pos_size = pos_data.get('size', 0)
                 
                 if pos_size == 0:
-                    logger.info("TradingBot", f"{symbol} 포지션 청산됨 (TP/SL 체결)")
-                    
-                    # 청산 시 PNL 저장 (마지막으로 조회한 포지션 정보 사용)
-                    # 이전 루프에서 pos_data가 있었으므로 마지막 PNL 사용 가능
-                    # 하지만 이미 청산되었으므로 포지션 조회 불가
-                    # 대신 이전에 저장한 정보 사용
-                    
-                    # 청산 시간
-                    exit_time = time_helper.format_kst(time_helper.now_kst())
-                    
-                    # 거래 내역 저장
-                    try:
-                        self._save_trade_history(exit_time, "TP/SL")
-                        logger.info("TradingBot", f"{symbol} 거래 내역 저장 성공")
-                    except Exception as e:
-                        import traceback
-                        logger.error("TradingBot", f"{symbol} 거래 내역 저장 실패: {str(e)}", 
-                                   traceback.format_exc())
-                    
-                    # 미체결 마틴게일 주문 모두 취소
-                    self._cancel_all_pending_orders()
-                    
-                    # PNL 정보는 저장된 값 사용
-                    pnl = getattr(self, 'last_pnl', 0.0)
-                    
-                    self.position_closed.emit(symbol, pnl)
-                    
-                    # 자동 재실행 모드면 루프 계속, 아니면 종료
-                    if self.auto_restart:
-                        logger.info("TradingBot", f"{symbol} 자동 재실행 모드 - 다시 진입 준비")
-                        break  # 모니터링 루프 탈출 → start_trading 루프로 돌아감
-                    else:
-                        self.is_running = False
-                        self.bot_stopped.emit(symbol)
-                        break
+                    self._handle_position_closed()
+                    break  # 모니터링 루프 탈출 → start_trading 루프로 돌아감
                 
                 # PNL 저장 (청산 시 사용)
                 self.last_pnl = pos_data.get('unrealized_pnl', 0)
@@ -662,6 +737,138 @@ class TradingBotWorker(QObject):
                     break
                 time.sleep(5)
     
+    def _event_monitoring_loop(self):
+        """
+        이벤트 모니터링 루프
+        
+        포지션/주문 푸시에 바로 반응하고, REST 포지션 조회는 안전망으로만
+        스트림 연결 중 BOT_RECONCILE_INTERVAL마다 (끊김/실패 시 더 자주) 한다.
+        """
+        symbol = self.config['symbol']
+        pos_side = "long" if self.config['direction'] == "LONG" else "short"
+        retry_count = 0
+        max_retries = 3
+        
+        # 이전 사이클 이벤트 버림 (진입 직후 상태는 첫 REST 대조로 확인)
+        while not self._events.empty():
+            self._events.get_nowait()
+        next_reconcile = time.monotonic()
+        
+        logger.info("TradingBot", f"{symbol} 모니터링 시작 (이벤트 모드)")
+        
+        while self.is_running:
+            wait = next_reconcile - time.monotonic()
+            if wait > 0:
+                try:
+                    item = self._events.get(timeout=wait)
+                except queue.Empty:
+                    continue
+                if item is None:  # stop_trading 깨우기
+                    continue
+                
+                stream, event = item
+                if stream == ORDERS:
+                    self._on_order_event(event)
+                    continue
+                if event.get('side') not in (pos_side, None):
+                    continue
+                
+                if event.get('size', 0) == 0:
+                    logger.info("TradingBot", f"{symbol} 포지션 청산 이벤트 수신")
+                    self._handle_position_closed()
+                    break
+                
+                self.position_size = event['size']
+                self.last_pnl = event.get('unrealized_pnl') or 0.0
+                if event.get('mark_price'):
+                    self.last_mark_price = event['mark_price']
+                continue
+            
+            # REST 대조 (안전망)
+            interval = (BOT_RECONCILE_INTERVAL if self._streams_connected()
+                        else BOT_STREAM_DOWN_POLL_INTERVAL)
+            next_reconcile = time.monotonic() + interval
+            try:
+                positions = [pos for pos in self.snapshots.get().positions_for(symbol)
+                             if pos.get('side', pos_side) == pos_side]
+            except Exception as e:
+                logger.error("TradingBot", f"{symbol} 포지션 대조 중 오류: {str(e)}")
+                positions = []
+            
+            if not positions:
+                retry_count += 1
+                if retry_count >= max_retries:
+                    logger.warning("TradingBot", f"{symbol} 포지션 조회 실패 {max_retries}회 - 봇 중지")
+                    self.is_running = False
+                    self.bot_stopped.emit(symbol)
+                    break
+                logger.warning("TradingBot", f"{symbol} 포지션 조회 실패 - 재시도 {retry_count}/{max_retries}")
+                next_reconcile = time.monotonic() + BOT_STREAM_DOWN_POLL_INTERVAL
+                continue
+            
+            retry_count = 0
+            pos_data = positions[0]
+            if pos_data.get('size', 0) == 0:
+                logger.info("TradingBot", f"{symbol} 포지션 청산 확인 (REST 대조)")
+                self._handle_position_closed()
+                break
+            
+            self.last_pnl = pos_data.get('unrealized_pnl', 0)
+            self.last_mark_price = pos_data.get('mark_price', 0)
+            logger.debug("TradingBot",
+                       f"{symbol} 포지션 대조 - 포지션: {pos_data['size']}, "
+                       f"가격: {self.last_mark_price:.2f}, PNL: {self.last_pnl:.2f}")
+    
+    def _on_order_event(self, event: Dict):
+        """주문 푸시 처리 (봇이 낸 주문의 체결/취소만 반영)"""
+        order_id = event.get('order_id')
+        status = event.get('status')
+        tracked = [self.entry_order_id, self.tp_order_id, self.sl_order_id] + self.martingale_order_ids
+        if not order_id or order_id not in tracked or status not in ('closed', 'canceled'):
+            return
+        
+        symbol = self.config['symbol']
+        if status == 'closed' and order_id in self.martingale_order_ids:
+            self.martingale_level += 1
+            logger.info("TradingBot",
+                       f"{symbol} 마틴 {self.martingale_level}단계 체결: "
+                       f"{event.get('filled')} @ {event.get('average')}")
+        
+        self.orders_repo.update_order_status(
+            self.exchange_id, order_id,
+            'filled' if status == 'closed' else 'canceled', event.get('filled')
+        )
+    
+    def _handle_position_closed(self):
+        """포지션 청산(TP/SL 체결) 후 처리"""
+        symbol = self.config['symbol']
+        logger.info("TradingBot", f"{symbol} 포지션 청산됨 (TP/SL 체결)")
+        
+        # 이미 청산되어 포지션 조회가 안 되므로 마지막으로 받은 PNL/가격 사용
+        exit_time = time_helper.format_kst(time_helper.now_kst())
+        
+        # 거래 내역 저장
+        try:
+            self._save_trade_history(exit_time, "TP/SL")
+            logger.info("TradingBot", f"{symbol} 거래 내역 저장 성공")
+        except Exception as e:
+            import traceback
+            logger.error("TradingBot", f"{symbol} 거래 내역 저장 실패: {str(e)}", 
+                       traceback.format_exc())
+        
+        # 미체결 마틴게일 주문 모두 취소
+        self._cancel_all_pending_orders()
+        
+        pnl = getattr(self, 'last_pnl', 0.0)
+        self.position_closed.emit(symbol, pnl)
+        
+        # 자동 재실행 모드면 start_trading 루프가 다시 진입, 아니면 종료
+        if self.auto_restart:
+            logger.info("TradingBot", f"{symbol} 자동 재실행 모드 - 다시 진입 준비")
+        else:
+            self.is_running = False
+            self.bot_stopped.emit(symbol)
+    
     def stop_trading(self, clean_mode: bool = True):
         """
         거래 중지
@@ -669,6 +876,8 @@ class TradingBotWorker(QObject):
         """
         self.auto_restart = False
         self.is_running = False
+        if self._events is not None:
+            self._events.put(None)  # 이벤트 대기 중인 모니터링 루프 깨우기
         
         symbol = self.config['symbol']
         
@@ -780,10 +989,10 @@ class TradingBotWorker(QObject):
             open_orders = self.client.get_open_orders(symbol)
             if open_orders:
                 for order in open_orders:
-                    order_id = order.get('id')
+                    order_id = order.get('order_id')
                     if order_id:
                         try:
-                            self.client.cancel_order(symbol, ord_id=order_id)
+                            self.client.cancel_order(symbol, order_id)
                             logger.debug("TradingBot", f"{symbol} 주문 취소: {order_id}")
                         except:
                             pass